@@ -25,7 +25,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles:
     - Startup validation (environment variables and service connections)
     - Database initialization with retries
-    - Background task startup (user session sync, audit log worker, pool metrics)
+    - Background task startup (user session sync, audit log workers, pool metrics,
+      audit partition maintenance, pagination count reconciliation)
     - Prometheus metrics initialization
     - Graceful shutdown with audit log flushing and task cancellation
 
@@ -33,9 +34,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     - Validates required settings and service connections (fail-fast)
     - Sets up the database and tables
     - Creates user session background task
-    - Starts audit log background worker
+    - Starts audit log background workers
     - Starts Redis pool metrics collection task
     - Starts database pool metrics collection task
+    - Starts audit partition maintenance task
+    - Starts pagination count reconciliation task
     - Initializes Prometheus metrics
 
     Shutdown operations:
@@ -69,13 +72,38 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     logger.info("Created task for user session")
 
-    # Start audit log background worker
+    # Start audit log background workers
     from app.utils.audit_logger import audit_log_worker
 
-    background_tasks.append(
-        create_task(audit_log_worker(), name="audit_worker")
+    for worker_id in range(app_settings.AUDIT_WORKERS):
+        background_tasks.append(
+            create_task(
+                audit_log_worker(worker_id), name=f"audit_worker_{worker_id}"
+            )
+        )
+    logger.info(
+        f"Started {app_settings.AUDIT_WORKERS} audit log background workers"
     )
-    logger.info("Started audit log background worker")
+
+    # Start Redis Streams audit consumers (unless run via cli.py)
+    if (
+        app_settings.AUDIT_TRANSPORT == "redis"
+        and app_settings.AUDIT_STREAM_CONSUMER_IN_APP
+    ):
+        from app.utils.audit_stream import (
+            audit_stream_consumer,
+            default_consumer_name,
+        )
+
+        consumer = default_consumer_name()
+        for worker_id in range(app_settings.AUDIT_WORKERS):
+            background_tasks.append(
+                create_task(
+                    audit_stream_consumer(f"{consumer}-{worker_id}"),
+                    name=f"audit_stream_consumer_{worker_id}",
+                )
+            )
+        logger.info("Started Redis Streams audit consumers")
 
     # Start Redis pool metrics collection task
     background_tasks.append(
@@ -91,6 +119,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     logger.info("Started database pool metrics collection task")
 
+    # Start audit log partition maintenance task
+    from app.tasks.audit_partition_task import audit_partition_task
+
+    background_tasks.append(
+        create_task(audit_partition_task(), name="audit_partitions")
+    )
+    logger.info("Started audit partition maintenance task")
+
+    # Start pagination count reconciliation task
+    from app.tasks.pagination_count_task import pagination_count_reconcile_task
+
+    background_tasks.append(
+        create_task(
+            pagination_count_reconcile_task(), name="pagination_counts"
+        )
+    )
+    logger.info("Started pagination count reconciliation task")
+
     # Initialize app info metric
     import sys
 
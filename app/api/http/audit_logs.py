@@ -1,20 +1,43 @@
 """HTTP endpoints for querying audit logs."""
 
-from datetime import datetime
-from typing import Any
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import ColumnElement, func, literal_column
 from sqlmodel import select
 
 from fastapi_keycloak_rbac.dependencies import require_roles
+from app.exceptions import ValidationError
 from app.models.user_action import UserAction
+from app.models.user_action_rollup import UserActionRollup
+from app.schemas.audit import (
+    AuditRollupPoint,
+    AuditRollupTotal,
+    AuditTimeSeries,
+    RollupDimension,
+)
 from app.security.roles import Role
+from app.schemas.fieldsets import dump_page, parse_fields
+from app.schemas.filters import UserActionFilters
 from app.schemas.response import PaginatedResponseModel
 from app.settings import app_settings
 from app.storage.db import async_session, get_paginated_results
+from app.storage.export import export_query, ndjson_response
+from app.utils.error_handler import handle_http_errors
 
 router = APIRouter()
 
+# Most recent first; id breaks ties between same-timestamp entries. Ids
+# follow write order, which lags the action by batching, several writers
+# and stream retries, so they are not a substitute for timestamp. Served
+# by idx_user_actions_timestamp_id and, per user, idx_user_recent
+AUDIT_LOG_ORDER = ["-timestamp", "-id"]
+
+# Exports run oldest first, over the same index
+AUDIT_EXPORT_ORDER = ["timestamp", "id"]
+
 
 @router.get(
     "/audit-logs",
@@ -22,6 +45,7 @@ router = APIRouter()
     summary="Get paginated audit logs",
     dependencies=[Depends(require_roles(Role.ADMIN))],
 )
+@handle_http_errors
 async def get_audit_logs_endpoint(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(
@@ -30,6 +54,11 @@ async def get_audit_logs_endpoint(
         le=100,
         description="Items per page",
     ),
+    cursor: str | None = Query(
+        None,
+        description="Keyset cursor (next_cursor/prev_cursor from a "
+        "previous response; empty for the first page)",
+    ),
     user_id: str | None = Query(None, description="Filter by user ID"),
     username: str | None = Query(None, description="Filter by username"),
     action_type: str | None = Query(None, description="Filter by action type"),
@@ -38,13 +67,21 @@ async def get_audit_logs_endpoint(
         None,
         description="Filter by outcome (success, error, permission_denied)",
     ),
+    role: str | None = Query(
+        None, description="Filter by a role the user had at the time"
+    ),
     start_date: datetime | None = Query(
         None, description="Filter by start date (ISO 8601)"
     ),
     end_date: datetime | None = Query(
         None, description="Filter by end date (ISO 8601)"
     ),
-) -> PaginatedResponseModel[UserAction]:
+    fields: str | None = Query(
+        None,
+        description="Comma-separated columns to return, e.g. "
+        "timestamp,username,action_type,outcome (default: all)",
+    ),
+) -> PaginatedResponseModel[UserAction] | JSONResponse:
     """
     Retrieve paginated audit logs with optional filters.
 
@@ -54,41 +91,37 @@ async def get_audit_logs_endpoint(
     Args:
         page: Page number (default: 1).
         per_page: Number of items per page (default: 20, max: 100).
+        cursor: Keyset cursor; when given, page is ignored and pages are
+            read by seeking on (timestamp, id) instead of OFFSET.
         user_id: Filter logs by Keycloak user ID.
-        username: Filter logs by username.
+        username: Filter logs by username (case-insensitive substring).
         action_type: Filter logs by action type (e.g., GET, POST, WS:PkgID).
-        resource: Filter logs by resource (e.g., /api/authors, Author:123).
+        resource: Filter logs by resource prefix (e.g., /api/authors).
         outcome: Filter logs by outcome (success, error, permission_denied).
+        role: Filter logs by a role in ``user_roles`` (e.g., admin).
         start_date: Filter logs from this date (inclusive).
         end_date: Filter logs until this date (inclusive).
+        fields: Columns to load and return (``id`` is always included);
+            leaving out ``request_data`` and ``user_agent`` keeps list
+            views small.
 
     Returns:
         Paginated response containing audit log entries and metadata.
+        On large tables ``meta.total`` is a planner estimate
+        (``meta.estimated`` is true).
     """
 
-    # Build filters dictionary
-    filters = {}
-    if user_id:
-        filters["user_id"] = user_id
-    if username:
-        filters["username"] = username
-    if action_type:
-        filters["action_type"] = action_type
-    if resource:
-        filters["resource"] = resource
-    if outcome:
-        filters["outcome"] = outcome
-
-    # Custom filter function for date range
-    def apply_date_filters(stmt: Any) -> Any:
-        """Apply date range filters to the query."""
-        if start_date:
-            stmt = stmt.where(UserAction.timestamp >= start_date)
-        if end_date:
-            stmt = stmt.where(UserAction.timestamp <= end_date)
-        # Order by timestamp descending (most recent first)
-        stmt = stmt.order_by(UserAction.timestamp.desc())  # type: ignore[attr-defined]
-        return stmt
+    fieldset = parse_fields(UserAction.__name__, fields)
+    filters = UserActionFilters(
+        user_id=user_id,
+        username=username,
+        action_type=action_type,
+        resource=resource,
+        outcome=outcome,
+        role=role,
+        timestamp_after=start_date,
+        timestamp_before=end_date,
+    )
 
     # Get paginated results
     items, meta = await get_paginated_results(
@@ -96,12 +129,285 @@ async def get_audit_logs_endpoint(
         page,
         per_page,
         filters=filters,
-        apply_filters=apply_date_filters if (start_date or end_date) else None,  # type: ignore[arg-type]
+        cursor=cursor,
+        order_by=AUDIT_LOG_ORDER,
+        count_mode="estimated",
+        fields=fieldset,
     )
 
+    if fieldset is not None:
+        return JSONResponse(dump_page(items, meta, fieldset))
     return PaginatedResponseModel(items=items, meta=meta)
 
 
+@router.get(
+    "/audit-logs/export",
+    summary="Export audit logs as NDJSON",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@handle_http_errors
+async def export_audit_logs_endpoint(
+    user_id: str | None = Query(None, description="Filter by user ID"),
+    username: str | None = Query(None, description="Filter by username"),
+    action_type: str | None = Query(None, description="Filter by action type"),
+    resource: str | None = Query(None, description="Filter by resource"),
+    outcome: str | None = Query(
+        None,
+        description="Filter by outcome (success, error, permission_denied)",
+    ),
+    role: str | None = Query(
+        None, description="Filter by a role the user had at the time"
+    ),
+    start_date: datetime | None = Query(
+        None, description="Filter by start date (ISO 8601)"
+    ),
+    end_date: datetime | None = Query(
+        None, description="Filter by end date (ISO 8601)"
+    ),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated columns to export (default: all)",
+    ),
+    gzip: bool = Query(False, description="Gzip the export"),
+) -> StreamingResponse:
+    """
+    Stream every matching audit log entry as NDJSON, oldest first.
+
+    Ordered by ``(timestamp, id)``, :data:`AUDIT_LOG_ORDER` reversed.
+
+    Takes the filters of ``/audit-logs`` but has no page size limit: rows
+    are read through a server-side cursor and streamed, so memory use does
+    not depend on the size of the export (see ``app.storage.export``).
+
+    Args:
+        user_id: Filter logs by Keycloak user ID.
+        username: Filter logs by username (case-insensitive substring).
+        action_type: Filter logs by action type (e.g., GET, POST, WS:PkgID).
+        resource: Filter logs by resource prefix (e.g., /api/authors).
+        outcome: Filter logs by outcome (success, error, permission_denied).
+        role: Filter logs by a role in ``user_roles`` (e.g., admin).
+        start_date: Filter logs from this date (inclusive).
+        end_date: Filter logs until this date (inclusive).
+        fields: Columns to export (``id`` is always included).
+        gzip: Compress on the fly (``audit-logs.ndjson.gz``).
+
+    Returns:
+        Streaming ``audit-logs.ndjson`` download, one entry per line.
+    """
+    fieldset = parse_fields(UserAction.__name__, fields)
+    filters = UserActionFilters(
+        user_id=user_id,
+        username=username,
+        action_type=action_type,
+        resource=resource,
+        outcome=outcome,
+        role=role,
+        timestamp_after=start_date,
+        timestamp_before=end_date,
+    )
+    return ndjson_response(
+        export_query(UserAction, filters, fieldset, AUDIT_EXPORT_ORDER),
+        "audit-logs",
+        fieldset,
+        gzip=gzip,
+    )
+
+
+def rollup_range(
+    start_date: datetime | None, end_date: datetime | None
+) -> tuple[datetime, datetime]:
+    """
+    Resolve the time range of a rollup query (default: the last 24h).
+
+    Raises:
+        ValidationError: If the range ends before it starts.
+    """
+    end = end_date or datetime.now(UTC)
+    start = start_date or end - timedelta(days=1)
+    if start > end:
+        raise ValidationError("start_date must not be after end_date")
+    return start, end
+
+
+def rollup_conditions(
+    start: datetime, end: datetime, **filters: str | None
+) -> list[ColumnElement[bool]]:
+    """WHERE conditions on the rollups: minute range plus exact filters."""
+    conditions = [
+        UserActionRollup.minute >= start,  # type: ignore[operator]
+        UserActionRollup.minute <= end,  # type: ignore[operator]
+    ]
+    for column, value in filters.items():
+        if value is not None:
+            conditions.append(getattr(UserActionRollup, column) == value)
+    return conditions
+
+
+@router.get(
+    "/audit-logs/timeseries",
+    response_model=AuditTimeSeries,
+    summary="Get audit log counts over time",
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@handle_http_errors
+async def get_audit_timeseries_endpoint(
+    bucket: Literal["minute", "hour", "day"] = Query(
+        "hour", description="Bucket width"
+    ),
+    group_by: RollupDimension | None = Query(
+        None, description="Split into one series per value of a dimension"
+    ),
+    user_id: str | None = Query(None, description="Filter by user ID"),
+    action_type: str | None = Query(None, description="Filter by action type"),
+    outcome: str | None = Query(
+        None,
+        description="Filter by outcome (success, error, permission_denied)",
+    ),
+    start_date: datetime | None = Query(
+        None, description="Start of the range (ISO 8601, default: 24h ago)"
+    ),
+    end_date: datetime | None = Query(
+        None, description="End of the range (ISO 8601, default: now)"
+    ),
+) -> AuditTimeSeries:
+    """
+    Count audit log entries per time bucket from the per-minute rollups.
+
+    Reads ``user_action_rollups`` instead of ``user_actions``, so the cost
+    depends on the number of distinct (minute, action type, outcome,
+    user) keys in the range, not on the number of entries.
+
+    Args:
+        bucket: Bucket width (minute, hour or day; UTC).
+        group_by: Dimension to split the counts by (one series each).
+        user_id: Only count entries of this user.
+        action_type: Only count entries of this action type.
+        outcome: Only count entries with this outcome.
+        start_date: Start of the range (inclusive, default: 24h ago).
+        end_date: End of the range (inclusive, default: now).
+
+    Returns:
+        Points ordered by bucket, at most ``AUDIT_ROLLUP_MAX_POINTS``.
+
+    Raises:
+        ValidationError: If the range ends before it starts.
+    """
+    start, end = rollup_range(start_date, end_date)
+    # Inlined (bucket is one of three literals), so SELECT and GROUP BY
+    # render the same expression instead of two bind parameters
+    keys: list[Any] = [
+        func.date_trunc(
+            literal_column(f"'{bucket}'"),
+            UserActionRollup.minute,
+            literal_column("'UTC'"),
+        )
+    ]
+    if group_by is not None:
+        keys.append(getattr(UserActionRollup, group_by))
+    labels = ["bucket", "key"][: len(keys)]
+    limit = app_settings.AUDIT_ROLLUP_MAX_POINTS
+
+    stmt = (
+        select(
+            *(key.label(label) for key, label in zip(keys, labels)),
+            func.sum(UserActionRollup.count).label("count"),
+        )
+        .where(
+            *rollup_conditions(
+                start,
+                end,
+                user_id=user_id,
+                action_type=action_type,
+                outcome=outcome,
+            )
+        )
+        .group_by(*keys)
+        .order_by(*keys)
+        .limit(limit + 1)
+    )
+    async with async_session() as session:
+        rows = (await session.execute(stmt)).mappings().all()
+
+    return AuditTimeSeries(
+        bucket=bucket,
+        group_by=group_by,
+        start=start,
+        end=end,
+        points=[AuditRollupPoint(**row) for row in rows[:limit]],
+        truncated=len(rows) > limit,
+    )
+
+
+@router.get(
+    "/audit-logs/top",
+    response_model=list[AuditRollupTotal],
+    summary="Get the most frequent users, action types or outcomes",
+    dependencies=[Depends(require_roles(Role.ADMIN))],
+)
+@handle_http_errors
+async def get_audit_top_endpoint(
+    by: RollupDimension = Query(..., description="Dimension to rank"),
+    limit: int = Query(10, ge=1, le=100, description="Values to return"),
+    user_id: str | None = Query(None, description="Filter by user ID"),
+    action_type: str | None = Query(None, description="Filter by action type"),
+    outcome: str | None = Query(
+        None,
+        description="Filter by outcome (success, error, permission_denied)",
+    ),
+    start_date: datetime | None = Query(
+        None, description="Start of the range (ISO 8601, default: 24h ago)"
+    ),
+    end_date: datetime | None = Query(
+        None, description="End of the range (ISO 8601, default: now)"
+    ),
+) -> list[AuditRollupTotal]:
+    """
+    Rank the values of a dimension by their number of audit log entries.
+
+    For example ``by=user_id&outcome=permission_denied`` lists the users
+    with the most denied actions. Served from the per-minute rollups.
+
+    Args:
+        by: Dimension to rank (user_id, action_type or outcome).
+        limit: Number of values to return (default: 10, max: 100).
+        user_id: Only count entries of this user.
+        action_type: Only count entries of this action type.
+        outcome: Only count entries with this outcome.
+        start_date: Start of the range (inclusive, default: 24h ago).
+        end_date: End of the range (inclusive, default: now).
+
+    Returns:
+        Values with their counts, most frequent first.
+
+    Raises:
+        ValidationError: If the range ends before it starts.
+    """
+    start, end = rollup_range(start_date, end_date)
+    key = getattr(UserActionRollup, by)
+    total = func.sum(UserActionRollup.count)
+
+    stmt = (
+        select(key.label("key"), total.label("count"))
+        .where(
+            *rollup_conditions(
+                start,
+                end,
+                user_id=user_id,
+                action_type=action_type,
+                outcome=outcome,
+            )
+        )
+        .group_by(key)
+        .order_by(total.desc(), key)
+        .limit(limit)
+    )
+    async with async_session() as session:
+        rows = (await session.execute(stmt)).mappings().all()
+
+    return [AuditRollupTotal(**row) for row in rows]
+
+
 @router.get(
     "/audit-logs/{log_id}",
     response_model=UserAction,
@@ -130,6 +436,7 @@ async def get_audit_log_by_id_endpoint(log_id: int) -> UserAction | None:
     summary="Get audit logs for a specific user",
     dependencies=[Depends(require_roles(Role.ADMIN))],
 )
+@handle_http_errors
 async def get_user_audit_logs_endpoint(
     user_id: str,
     page: int = Query(1, ge=1, description="Page number"),
@@ -139,13 +446,23 @@ async def get_user_audit_logs_endpoint(
         le=100,
         description="Items per page",
     ),
+    cursor: str | None = Query(
+        None,
+        description="Keyset cursor (next_cursor/prev_cursor from a "
+        "previous response; empty for the first page)",
+    ),
     start_date: datetime | None = Query(
         None, description="Filter by start date (ISO 8601)"
     ),
     end_date: datetime | None = Query(
         None, description="Filter by end date (ISO 8601)"
     ),
-) -> PaginatedResponseModel[UserAction]:
+    fields: str | None = Query(
+        None,
+        description="Comma-separated columns to return, e.g. "
+        "timestamp,username,action_type,outcome (default: all)",
+    ),
+) -> PaginatedResponseModel[UserAction] | JSONResponse:
     """
     Retrieve all audit logs for a specific user.
 
@@ -153,31 +470,37 @@ async def get_user_audit_logs_endpoint(
         user_id: Keycloak user ID to retrieve logs for.
         page: Page number (default: 1).
         per_page: Number of items per page (default: 20, max: 100).
+        cursor: Keyset cursor; when given, page is ignored and pages are
+            read by seeking on (timestamp, id) instead of OFFSET.
         start_date: Filter logs from this date (inclusive).
         end_date: Filter logs until this date (inclusive).
+        fields: Columns to load and return (``id`` is always included);
+            leaving out ``request_data`` and ``user_agent`` keeps list
+            views small.
 
     Returns:
         Paginated response containing the user's audit log entries.
     """
 
-    # Custom filter function for date range
-    def apply_date_filters(stmt: Any) -> Any:
-        """Apply date range filters to the query."""
-        if start_date:
-            stmt = stmt.where(UserAction.timestamp >= start_date)
-        if end_date:
-            stmt = stmt.where(UserAction.timestamp <= end_date)
-        # Order by timestamp descending (most recent first)
-        stmt = stmt.order_by(UserAction.timestamp.desc())  # type: ignore[attr-defined]
-        return stmt
+    fieldset = parse_fields(UserAction.__name__, fields)
+    filters = UserActionFilters(
+        user_id=user_id,
+        timestamp_after=start_date,
+        timestamp_before=end_date,
+    )
 
     # Get paginated results
     items, meta = await get_paginated_results(
         UserAction,
         page,
         per_page,
-        filters={"user_id": user_id},
-        apply_filters=apply_date_filters if (start_date or end_date) else None,  # type: ignore[arg-type]
+        filters=filters,
+        cursor=cursor,
+        order_by=AUDIT_LOG_ORDER,
+        count_mode="estimated",
+        fields=fieldset,
     )
 
+    if fieldset is not None:
+        return JSONResponse(dump_page(items, meta, fieldset))
     return PaginatedResponseModel(items=items, meta=meta)
@@ -13,26 +13,41 @@ Example:
     return await command.execute(input_data)
 """
 
-from typing import Any
-
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.commands.author_commands import (
+    BulkCreateAuthorsCommand,
+    BulkCreateAuthorsInput,
+    BulkDeleteAuthorsCommand,
+    BulkDeleteAuthorsInput,
+    BulkUpdateAuthorsCommand,
+    BulkUpdateAuthorsInput,
+    BulkUpsertAuthorsCommand,
+    BulkUpsertAuthorsInput,
+    BulkWriteResult,
     CreateAuthorCommand,
     CreateAuthorInput,
     DeleteAuthorCommand,
     GetAuthorsCommand,
     GetAuthorsInput,
+    ImportAuthorsCommand,
+    ImportAuthorsInput,
     UpdateAuthorCommand,
     UpdateAuthorInput,
 )
+from app.constants import MAX_PAGE_SIZE
 from app.dependencies import AuthorRepoDep, ReadAuthorRepoDep
 from fastapi_keycloak_rbac.dependencies import require_roles
 from app.security.roles import Role
 from app.models.author import Author
+from app.schemas.fieldsets import dump_fields, dump_page, parse_fields
+from app.schemas.filters import AuthorFilters
 from app.schemas.response import PaginatedResponseModel
 from app.settings import app_settings
 from app.storage.db import get_paginated_results
+from app.storage.export import export_query, ndjson_response
+from app.storage.search import SearchMode
 from app.utils.error_handler import handle_http_errors
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -51,7 +66,14 @@ async def get_authors(
     id: int | None = None,
     name: str | None = None,
     search: str | None = None,
-) -> list[Author]:
+    search_mode: SearchMode = "substring",
+    limit: int | None = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Max search results"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated columns to return (default: all)"
+    ),
+) -> list[Author] | JSONResponse:
     """
     Get all authors with optional filtering.
 
@@ -65,19 +87,36 @@ async def get_authors(
         repo: Author repository (injected via dependency).
         id: Optional author ID filter.
         name: Optional exact name filter.
-        search: Optional name search term (case-insensitive).
+        search: Optional text to search names for (case-insensitive);
+            results are ranked best match first.
+        search_mode: "substring" (contains) or "similar" (typo-tolerant).
+        limit: Maximum number of search results.
+        fields: Optional comma-separated columns to return (``id`` is
+            always included).
 
     Returns:
         List of authors matching filters.
 
     Example:
-        GET /authors?search=John
+        GET /authors?search=john&limit=5
+        GET /authors?search=jhon&search_mode=similar
         GET /authors?id=1
         GET /authors?name=John%20Doe
+        GET /authors?fields=name
     """
+    fieldset = parse_fields(Author.__name__, fields)
     command = GetAuthorsCommand(repo)
-    input_data = GetAuthorsInput(id=id, name=name, search_term=search)
-    return await command.execute(input_data)
+    input_data = GetAuthorsInput(
+        id=id,
+        name=name,
+        search_term=search,
+        search_mode=search_mode,
+        limit=limit,
+    )
+    authors = await command.execute(input_data)
+    if fieldset is None:
+        return authors
+    return JSONResponse([dump_fields(a, fieldset, "json") for a in authors])
 
 
 @router.post(
@@ -121,6 +160,211 @@ async def create_author(
     return await command.execute(author_data)
 
 
+@router.post(
+    "/bulk",
+    response_model=list[Author],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many authors",
+    description="Create authors in one batch with multi-row INSERT",
+    dependencies=[Depends(require_roles(Role.CREATE_AUTHOR))],
+)
+@handle_http_errors
+async def bulk_create_authors(
+    authors_data: BulkCreateAuthorsInput,
+    repo: AuthorRepoDep,
+) -> list[Author]:
+    """
+    Create many authors at once.
+
+    Names are inserted with one multi-row INSERT ... RETURNING per batch,
+    instead of three round trips per author; the unique index on
+    author.name rejects existing names. Either every author is created or
+    none is.
+
+    Requires role: create-author
+
+    Args:
+        authors_data: Names of the authors to create (at most
+            MAX_BULK_SIZE).
+        repo: Author repository (injected via dependency).
+
+    Returns:
+        Created authors with generated IDs, in request order.
+
+    Raises:
+        HTTPException: 409 if a name is repeated or already exists.
+
+    Example:
+        POST /authors/bulk
+        {
+            "names": ["Ann", "Bob"]
+        }
+    """
+    command = BulkCreateAuthorsCommand(repo)
+    return await command.execute(authors_data)
+
+
+@router.patch(
+    "/bulk",
+    response_model=BulkWriteResult,
+    summary="Rename many authors",
+    description="Rename authors in one batch with executemany UPDATE",
+    dependencies=[Depends(require_roles(Role.UPDATE_AUTHOR))],
+)
+@handle_http_errors
+async def bulk_update_authors(
+    authors_data: BulkUpdateAuthorsInput,
+    repo: AuthorRepoDep,
+) -> BulkWriteResult:
+    """
+    Rename many authors at once.
+
+    Existence is checked with one query and the new names are written
+    with one executemany UPDATE per batch. Either every author is renamed
+    or none is.
+
+    Requires role: update-author
+
+    Args:
+        authors_data: Author IDs and new names (at most MAX_BULK_SIZE).
+        repo: Author repository (injected via dependency).
+
+    Returns:
+        Number of authors renamed.
+
+    Raises:
+        HTTPException: 404 if an author does not exist, 409 if an ID or
+            name is repeated or a name belongs to another author.
+
+    Example:
+        PATCH /authors/bulk
+        {
+            "authors": [{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bob"}]
+        }
+    """
+    command = BulkUpdateAuthorsCommand(repo)
+    return await command.execute(authors_data)
+
+
+@router.put(
+    "/bulk",
+    response_model=list[Author],
+    summary="Create missing authors",
+    description="Create the missing authors in one batch with upserts",
+    dependencies=[Depends(require_roles(Role.CREATE_AUTHOR))],
+)
+@handle_http_errors
+async def bulk_upsert_authors(
+    authors_data: BulkUpsertAuthorsInput,
+    repo: AuthorRepoDep,
+) -> list[Author]:
+    """
+    Create the authors that do not exist yet and return all of them.
+
+    One INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING per batch;
+    existing authors are left unchanged. Safe to retry.
+
+    Requires role: create-author
+
+    Args:
+        authors_data: Names of the authors (at most MAX_BULK_SIZE).
+        repo: Author repository (injected via dependency).
+
+    Returns:
+        Existing and created authors, in request order.
+
+    Raises:
+        HTTPException: 409 if a name is repeated.
+
+    Example:
+        PUT /authors/bulk
+        {
+            "names": ["Ann", "Bob"]
+        }
+    """
+    command = BulkUpsertAuthorsCommand(repo)
+    return await command.execute(authors_data)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkWriteResult,
+    summary="Delete many authors",
+    description="Delete authors in one batch with DELETE ... RETURNING",
+    dependencies=[Depends(require_roles(Role.DELETE_AUTHOR))],
+)
+@handle_http_errors
+async def bulk_delete_authors(
+    authors_data: BulkDeleteAuthorsInput,
+    repo: AuthorRepoDep,
+) -> BulkWriteResult:
+    """
+    Delete many authors at once.
+
+    IDs that do not exist are ignored, so the request can be retried.
+
+    Requires role: delete-author
+
+    Args:
+        authors_data: IDs of the authors to delete (at most
+            MAX_BULK_SIZE).
+        repo: Author repository (injected via dependency).
+
+    Returns:
+        Number of authors deleted.
+
+    Example:
+        POST /authors/bulk/delete
+        {
+            "ids": [1, 2, 3]
+        }
+    """
+    command = BulkDeleteAuthorsCommand(repo)
+    return await command.execute(authors_data)
+
+
+@router.post(
+    "/import",
+    response_model=BulkWriteResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import authors",
+    description="Import many authors with binary COPY",
+    dependencies=[Depends(require_roles(Role.CREATE_AUTHOR))],
+)
+@handle_http_errors
+async def import_authors(
+    authors_data: ImportAuthorsInput,
+    repo: AuthorRepoDep,
+) -> BulkWriteResult:
+    """
+    Import many authors with the driver's binary COPY.
+
+    Faster than POST /authors/bulk for large imports, but returns only
+    the number of authors created, not their IDs. Either every author is
+    imported or none is.
+
+    Requires role: create-author
+
+    Args:
+        authors_data: Names of the authors (at most MAX_IMPORT_SIZE).
+        repo: Author repository (injected via dependency).
+
+    Returns:
+        Number of authors imported.
+
+    Raises:
+        HTTPException: 409 if a name is repeated or already exists.
+
+    Example:
+        POST /authors/import
+        {
+            "names": ["Ann", "Bob"]
+        }
+    """
+    command = ImportAuthorsCommand(repo)
+    return await command.execute(authors_data)
+
+
 @router.put(
     "/{author_id}",
     response_model=Author,
@@ -206,7 +450,11 @@ async def get_paginated_authors(
     cursor: str | None = None,
     id: int | None = None,
     name: str | None = None,
-) -> PaginatedResponseModel[Author]:
+    name_prefix: str | None = None,
+    fields: str | None = Query(
+        None, description="Comma-separated columns to return (default: all)"
+    ),
+) -> PaginatedResponseModel[Author] | JSONResponse:
     """
     Get paginated list of authors with offset or cursor pagination.
 
@@ -224,7 +472,10 @@ async def get_paginated_authors(
         per_page: Items per page.
         cursor: Base64 cursor from previous response - used for cursor pagination.
         id: Optional author ID filter.
-        name: Optional name filter.
+        name: Optional name filter (case-insensitive partial match).
+        name_prefix: Optional name prefix filter (case-sensitive).
+        fields: Optional comma-separated columns to load and return
+            (``id`` is always included).
 
     Returns:
         Paginated response with items and metadata.
@@ -238,12 +489,12 @@ async def get_paginated_authors(
 
         Cursor pagination (next page):
             GET /authors/paginated?per_page=10&cursor=MjA=
+
+        Sparse fieldset:
+            GET /authors/paginated?fields=name
     """
-    filters: dict[str, Any] = {}
-    if id is not None:
-        filters["id"] = id
-    if name is not None:
-        filters["name"] = name
+    filters = AuthorFilters(id=id, name=name, name_prefix=name_prefix)
+    fieldset = parse_fields(Author.__name__, fields)
 
     items, meta = await get_paginated_results(
         Author,
@@ -251,6 +502,63 @@ async def get_paginated_authors(
         per_page=per_page,
         cursor=cursor,
         filters=filters,
+        prefetch=True,
+        fields=fieldset,
     )
 
+    if fieldset is not None:
+        return JSONResponse(dump_page(items, meta, fieldset))
     return PaginatedResponseModel(items=items, meta=meta)
+
+
+@router.get(
+    "/export",
+    summary="Export authors as NDJSON",
+    description="Stream every author through a server-side cursor",
+    response_class=StreamingResponse,
+    dependencies=[Depends(require_roles(Role.GET_AUTHORS))],
+)
+@handle_http_errors
+async def export_authors(
+    id: int | None = None,
+    name: str | None = None,
+    name_prefix: str | None = None,
+    fields: str | None = Query(
+        None, description="Comma-separated columns to export (default: all)"
+    ),
+    gzip: bool = Query(False, description="Gzip the export"),
+) -> StreamingResponse:
+    """
+    Stream every matching author as NDJSON, in id order.
+
+    Unlike ``GET /authors``, rows are never loaded all at once: they are
+    read through a server-side cursor and streamed, so memory use does not
+    depend on the number of authors.
+
+    Requires role: get-authors
+
+    Args:
+        id: Optional author ID filter.
+        name: Optional name filter (case-insensitive partial match).
+        name_prefix: Optional name prefix filter (case-sensitive).
+        fields: Optional comma-separated columns to export (``id`` is
+            always included).
+        gzip: Compress on the fly (``authors.ndjson.gz``).
+
+    Returns:
+        Streaming ``authors.ndjson`` download, one author per line.
+
+    Example:
+        GET /authors/export?gzip=true
+    """
+    fieldset = parse_fields(Author.__name__, fields)
+    return ndjson_response(
+        export_query(
+            Author,
+            AuthorFilters(id=id, name=name, name_prefix=name_prefix),
+            fieldset,
+        ),
+        "authors",
+        fieldset,
+        gzip=gzip,
+    )
@@ -0,0 +1,167 @@
+"""
+Audit policies for successful WebSocket requests.
+
+Every WebSocket request used to produce one ``user_actions`` row. For
+read-only PkgIDs polled several times a second, those rows dominate the
+audit writes while adding little value, so handlers can declare how their
+successful requests are audited when they register::
+
+    @pkg_router.register(PkgID.GET_AUTHORS, audit=AuditPolicy.sampled(0.1))
+
+Failed requests and permission denials are always logged in full,
+whatever the policy; policies only decide which successes are written as
+their own row. The others are counted per connection and PkgID and written
+as one summary row per ``interval``, weighted by their count in the
+rollups, so ``user_action_rollups`` still counts every request.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Literal, get_args
+
+# always: one row per request (default)
+# sampled: each success is written with probability ``rate``, the others
+#   are summarized
+# aggregate: successes are summarized only
+AuditMode = Literal["always", "sampled", "aggregate"]
+
+
+@dataclass(frozen=True, slots=True)
+class AuditPolicy:
+    """
+    How successful requests of a PkgID are audited.
+
+    Attributes:
+        mode: Audit mode, see :data:`AuditMode`.
+        rate: For ``sampled``, probability of writing a success.
+        interval: Seconds summarized by one row of the successes that are
+            not written individually.
+    """
+
+    mode: AuditMode = "always"
+    rate: float = 1.0
+    interval: float = 60.0
+
+    def __post_init__(self) -> None:
+        """Reject unknown modes, rates outside (0, 1] and bad intervals."""
+        if self.mode not in get_args(AuditMode):
+            raise ValueError(f"Unknown audit mode: {self.mode}")
+        if not 0 < self.rate <= 1:
+            raise ValueError(
+                f"Audit sample rate must be in (0, 1]: {self.rate}"
+            )
+        if self.interval <= 0:
+            raise ValueError(
+                f"Audit aggregation interval must be positive: {self.interval}"
+            )
+
+    @classmethod
+    def always(cls) -> "AuditPolicy":
+        """Log every request."""
+        return cls()
+
+    @classmethod
+    def sampled(cls, rate: float, interval: float = 60.0) -> "AuditPolicy":
+        """Log a ``rate`` fraction of successes, summarize the others."""
+        return cls(mode="sampled", rate=rate, interval=interval)
+
+    @classmethod
+    def aggregate(cls, interval: float = 60.0) -> "AuditPolicy":
+        """Summarize successes per ``interval`` seconds, log failures."""
+        return cls(mode="aggregate", interval=interval)
+
+    def should_log(self) -> bool:
+        """
+        Decide whether a success is written as its own row.
+
+        Successes that are not are counted by :class:`AuditAggregator`
+        instead.
+        """
+        if self.mode == "always":
+            return True
+        if self.mode == "sampled":
+            return random.random() < self.rate
+        return False
+
+
+@dataclass(slots=True)
+class AuditWindow:
+    """
+    Successes of one PkgID counted since ``started``.
+
+    Attributes:
+        started: Monotonic start of the window.
+        since: Wall-clock start of the window, for the summary row.
+        interval: Seconds after ``started`` at which the window closes.
+        count: Successful requests in the window.
+        duration_ms: Total processing time of those requests.
+    """
+
+    started: float
+    since: datetime
+    interval: float
+    count: int = 0
+    duration_ms: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        """``request_data`` of the summary row."""
+        return {
+            "aggregated": self.count,
+            "since": self.since.isoformat(),
+            "total_duration_ms": self.duration_ms,
+        }
+
+
+@dataclass(slots=True)
+class AuditAggregator:
+    """
+    Per-connection windows of successes not written individually.
+
+    A window opens on the first success of a PkgID and is closed by
+    :meth:`expire` once it is ``interval`` seconds old; the consumer calls
+    it on every incoming message, so a window is written with the first
+    message after it expires, whatever its PkgID or outcome. Windows still
+    open when the connection ends are closed by :meth:`drain`, so every
+    success is accounted for in some row.
+    """
+
+    windows: dict[str, AuditWindow] = field(default_factory=dict)
+
+    def add(self, action_type: str, duration_ms: int, interval: float) -> None:
+        """
+        Count a success in the open window of its action type.
+
+        Args:
+            action_type: Audit action type of the request (``WS:<PkgID>``).
+            duration_ms: Processing time of the request.
+            interval: Window length of the PkgID's policy, used if the
+                success opens a window.
+        """
+        window = self.windows.get(action_type)
+        if window is None:
+            window = self.windows[action_type] = AuditWindow(
+                started=time.monotonic(),
+                since=datetime.now(UTC),
+                interval=interval,
+            )
+        window.count += 1
+        window.duration_ms += duration_ms
+
+    def expire(self) -> dict[str, AuditWindow]:
+        """Close and return the windows open for their interval or longer."""
+        now = time.monotonic()
+        expired = {
+            action_type: window
+            for action_type, window in self.windows.items()
+            if now - window.started >= window.interval
+        }
+        for action_type in expired:
+            del self.windows[action_type]
+        return expired
+
+    def drain(self) -> dict[str, AuditWindow]:
+        """Close and return all open windows, by action type."""
+        windows, self.windows = self.windows, {}
+        return windows
@@ -43,10 +43,21 @@ class PkgID(IntEnum):
         GET_AUTHORS (1): Request to retrieve authors (Repository + Command pattern)
         GET_PAGINATED_AUTHORS (2): Request to retrieve paginated author list
         CREATE_AUTHOR (3): Request to create author (Repository + Command pattern)
+        BULK_CREATE_AUTHORS (4): Request to create many authors in one batch
+        BULK_UPDATE_AUTHORS (5): Request to rename many authors in one batch
+        BULK_DELETE_AUTHORS (6): Request to delete many authors in one batch
+        BULK_UPSERT_AUTHORS (7): Request to create the missing ones of many
+            authors
+        IMPORT_AUTHORS (8): Request to import many authors with binary COPY
         UNREGISTERED_HANDLER (999): Test-only PkgID with no registered handler
     """
 
     GET_AUTHORS = 1
     GET_PAGINATED_AUTHORS = 2
     CREATE_AUTHOR = 3
+    BULK_CREATE_AUTHORS = 4
+    BULK_UPDATE_AUTHORS = 5
+    BULK_DELETE_AUTHORS = 6
+    BULK_UPSERT_AUTHORS = 7
+    IMPORT_AUTHORS = 8
     UNREGISTERED_HANDLER = 999  # For testing handler not found scenarios
@@ -7,15 +7,17 @@ from google.protobuf.message import DecodeError
 from pydantic import ValidationError
 from starlette import status
 
+from app.api.ws.audit_policy import AuditAggregator, AuditWindow
+from app.api.ws.constants import PkgID, RSPCode
 from app.api.ws.formats import select_message_format_strategy
 from app.api.ws.handlers import load_handlers
 from app.api.ws.websocket import PackageAuthWebSocketEndpoint
 from app.logging import logger, set_log_context
 from app.routing import pkg_router
 from app.settings import app_settings
-from app.types import RequestId, UserId, Username
+from app.types import AuditOutcome, RequestId, UserId, Username
 from app.utils.audit_logger import log_user_action
-from app.utils.metrics import MetricsCollector
+from app.utils.metrics import MetricsCollector, audit_ws_events_unlogged_total
 from app.utils.rate_limiter import rate_limiter
 
 load_handlers()  # type: ignore[no-untyped-call]
@@ -31,6 +33,7 @@ class Web(PackageAuthWebSocketEndpoint):
     The `Web` class inherits from `PackageAuthWebSocketEndpoint` and implements the following methods:
 
     - `on_receive`: Called when data is received on the WebSocket connection. Logs the received data, creates a `RequestModel` instance from the data, handles the request using the `pkg_router`, and sends the response back to the client.
+    - `on_disconnect`: Writes the audit summaries still open on the connection before cleaning up.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -52,6 +55,9 @@ class Web(PackageAuthWebSocketEndpoint):
         # Select and initialize strategy
         self.format_strategy = select_message_format_strategy(format_name)
 
+        # Successes summarized by the PkgIDs' audit policies
+        self.audit_aggregator = AuditAggregator()
+
         logger.debug(
             f"WebSocket initialized with {self.format_strategy.format_name} format"
         )
@@ -69,7 +75,8 @@ class Web(PackageAuthWebSocketEndpoint):
         2. Deserializes data using the connection's format strategy
         3. Routes the request through pkg_router with user authentication
         4. Serializes and sends the response using the same format strategy
-        5. Logs audit trail for all operations (including errors)
+        5. Logs audit trail for all operations (including errors); successes
+           follow the PkgID's audit policy
         6. Closes the connection on validation or critical errors
 
         Args:
@@ -84,6 +91,12 @@ class Web(PackageAuthWebSocketEndpoint):
         # Track received message
         MetricsCollector.record_ws_message_received()
 
+        # Write expired audit summaries on any message, so counts do not
+        # wait in memory for a later success of the same PkgID
+        await self._log_audit_summaries(
+            websocket, self.audit_aggregator.expire()
+        )
+
         # Check message rate limit (fail-open on errors)
         try:
             rate_limit_key = f"ws_msg:user:{self.user.username}"
@@ -157,14 +170,27 @@ class Web(PackageAuthWebSocketEndpoint):
                 )
                 return  # Connection is closed, nothing more to do
 
-            # Log successful WebSocket action
+            outcome: AuditOutcome = (
+                "success"
+                if response.status_code == RSPCode.OK
+                else "permission_denied"
+                if response.status_code == RSPCode.PERMISSION_DENIED
+                else "error"
+            )
+            # Failures are always logged; successes follow the policy
+            if outcome == "success" and not await self._audit_success(
+                websocket, request.pkg_id, duration_ms
+            ):
+                return
+
+            # Log WebSocket action
             await log_user_action(
                 user_id=UserId(self.user.id),
                 username=Username(self.user.username),
                 user_roles=self.user.roles,
                 action_type=f"WS:{request.pkg_id.name}",
                 resource=f"WebSocket:{request.pkg_id.name}",
-                outcome="success" if response.status_code == 0 else "error",
+                outcome=outcome,
                 ip_address=websocket.client.host if websocket.client else None,
                 request_id=(
                     RequestId(self.correlation_id)
@@ -231,3 +257,88 @@ class Web(PackageAuthWebSocketEndpoint):
             )
 
             await websocket.close()
+
+    async def on_disconnect(self, websocket, close_code):  # type: ignore[no-untyped-def]
+        """
+        Write the connection's open audit summaries, then clean up.
+
+        Args:
+            websocket: The WebSocket connection instance
+            close_code: The close code of the connection
+        """
+        await self._log_audit_summaries(
+            websocket, self.audit_aggregator.drain()
+        )
+        await super().on_disconnect(websocket, close_code)
+
+    async def _audit_success(
+        self, websocket: Any, pkg_id: PkgID, duration_ms: int
+    ) -> bool:
+        """
+        Apply the PkgID's audit policy to a successful request.
+
+        Args:
+            websocket: The WebSocket connection instance
+            pkg_id: Package ID of the request
+            duration_ms: Processing time of the request
+
+        Returns:
+            True if the request should be written as its own audit row.
+        """
+        policy = pkg_router.get_audit_policy(pkg_id)
+        if policy.should_log():
+            return True
+
+        # Summarized per interval, so rollups still count every success
+        audit_ws_events_unlogged_total.labels(policy=policy.mode).inc()
+        self.audit_aggregator.add(
+            f"WS:{pkg_id.name}", duration_ms, policy.interval
+        )
+        return False
+
+    async def _log_audit_summaries(
+        self, websocket: Any, windows: dict[str, AuditWindow]
+    ) -> None:
+        """
+        Log the summary rows of closed aggregation windows.
+
+        Args:
+            websocket: The WebSocket connection instance
+            windows: Closed windows, by action type
+        """
+        for action_type, window in windows.items():
+            await self._log_audit_summary(websocket, action_type, window)
+
+    async def _log_audit_summary(
+        self, websocket: Any, action_type: str, window: AuditWindow
+    ) -> None:
+        """
+        Log one row summarizing the successes of an aggregation window.
+
+        The row is stamped with the window start. ``request_data`` holds
+        the number of requests and ``duration_ms`` their mean processing
+        time; the row is weighted by the number of requests in the
+        rollups.
+
+        Args:
+            websocket: The WebSocket connection instance
+            action_type: Audit action type (``WS:<PkgID>``)
+            window: The closed window
+        """
+        await log_user_action(
+            user_id=UserId(self.user.id),
+            username=Username(self.user.username),
+            user_roles=self.user.roles,
+            action_type=action_type,
+            resource=f"WebSocket:{action_type.removeprefix('WS:')}",
+            outcome="success",
+            ip_address=websocket.client.host if websocket.client else None,
+            request_id=(
+                RequestId(self.correlation_id) if self.correlation_id else None
+            ),
+            request_data=window.summary(),
+            response_status=RSPCode.OK,
+            duration_ms=window.duration_ms // window.count,
+            weight=window.count,
+            timestamp=window.since,
+        )
@@ -15,18 +15,31 @@ Key Benefits:
 
 from pydantic import ValidationError
 
+from app.api.ws.audit_policy import AuditPolicy
 from app.api.ws.constants import PkgID
 from app.api.ws.validation import validator
 from app.commands.author_commands import (
+    BulkCreateAuthorsCommand,
+    BulkCreateAuthorsInput,
+    BulkDeleteAuthorsCommand,
+    BulkDeleteAuthorsInput,
+    BulkUpdateAuthorsCommand,
+    BulkUpdateAuthorsInput,
+    BulkUpsertAuthorsCommand,
+    BulkUpsertAuthorsInput,
     CreateAuthorCommand,
     CreateAuthorInput,
     GetAuthorsCommand,
     GetAuthorsInput,
+    ImportAuthorsCommand,
+    ImportAuthorsInput,
 )
+from app.constants import MAX_BULK_SIZE, MAX_IMPORT_SIZE
 from app.models.author import Author
 from app.repositories.author_repository import AuthorRepository
 from app.routing import pkg_router
 from app.security.roles import Role
+from app.schemas.fieldsets import dump_fields, parse_fields
 from app.schemas.filters import AuthorFilters
 from app.schemas.generic_typing import JsonSchemaType
 from app.schemas.request import RequestModel
@@ -45,6 +58,12 @@ get_authors_schema: JsonSchemaType = {
         "id": {"type": "integer"},
         "name": {"type": "string"},
         "search_term": {"type": "string"},
+        "search_mode": {"type": "string", "enum": ["substring", "similar"]},
+        "limit": {"type": "integer", "minimum": 1},
+        "fields": {  # Sparse fieldset: columns to return
+            "type": "array",
+            "items": {"type": "string"},
+        },
     },
     "additionalProperties": False,
 }
@@ -55,6 +74,9 @@ get_authors_schema: JsonSchemaType = {
     json_schema=get_authors_schema,
     validator_callback=validator,
     roles=[Role.GET_AUTHORS],
+    # Read-only and polled: write a sample of the successes in full and
+    # summarize the rest
+    audit=AuditPolicy.sampled(0.1),
 )
 @handle_ws_errors
 async def get_authors_handler(request: RequestModel) -> ResponseModel[Author]:
@@ -69,7 +91,10 @@ async def get_authors_handler(request: RequestModel) -> ResponseModel[Author]:
         {
             "id": int (optional),
             "name": str (optional),
-            "search_term": str (optional)
+            "search_term": str (optional),
+            "search_mode": "substring" | "similar" (optional),
+            "limit": int (optional, top-k search results),
+            "fields": list[str] (optional) - Columns to return, e.g. ["name"]
         }
 
     Response Data: List of author objects.
@@ -93,7 +118,9 @@ async def get_authors_handler(request: RequestModel) -> ResponseModel[Author]:
         command = GetAuthorsCommand(repo)
 
         # Parse input from request data
-        input_data = GetAuthorsInput(**(request.data or {}))
+        data = dict(request.data or {})
+        fieldset = parse_fields(Author.__name__, data.pop("fields", None))
+        input_data = GetAuthorsInput(**data)
 
         # Execute command (same business logic as HTTP handler!)
         authors = await command.execute(input_data)
@@ -101,7 +128,7 @@ async def get_authors_handler(request: RequestModel) -> ResponseModel[Author]:
         return ResponseModel(
             pkg_id=request.pkg_id,
             req_id=request.req_id,
-            data=[author.model_dump() for author in authors],
+            data=[dump_fields(author, fieldset) for author in authors],
         )
 
 
@@ -128,6 +155,10 @@ get_paginated_authors_schema: JsonSchemaType = {
             "type": "array",
             "items": {"type": "string"},
         },
+        "fields": {  # Sparse fieldset: columns to return
+            "type": "array",
+            "items": {"type": "string"},
+        },
     },
     "additionalProperties": False,
 }
@@ -138,6 +169,9 @@ get_paginated_authors_schema: JsonSchemaType = {
     json_schema=get_paginated_authors_schema,
     validator_callback=validator,
     roles=[Role.GET_AUTHORS],
+    # Read-only and polled: write a sample of the successes in full and
+    # summarize the rest
+    audit=AuditPolicy.sampled(0.1),
 )
 @handle_ws_errors
 async def get_paginated_authors_handler(
@@ -155,7 +189,8 @@ async def get_paginated_authors_handler(
             "per_page": int (default: 20),
             "filters": dict (optional) - e.g., {"id": 1, "name": "John"},
             "cursor": str (optional) - For cursor-based pagination,
-            "eager_load": list[str] (optional) - Relationships to load, e.g., ["books"]
+            "eager_load": list[str] (optional) - Relationships to load, e.g., ["books"],
+            "fields": list[str] (optional) - Columns to load and return
         }
 
     Response Data: List of author objects with pagination metadata.
@@ -198,6 +233,7 @@ async def get_paginated_authors_handler(
     per_page = data.get("per_page")
     cursor = data.get("cursor")
     eager_load = data.get("eager_load")
+    fieldset = parse_fields(Author.__name__, data.get("fields"))
 
     # Parse filters with type-safe Pydantic schema
     filters = None
@@ -222,12 +258,14 @@ async def get_paginated_authors_handler(
             filters=filters,
             cursor=cursor,
             eager_load=eager_load,
+            prefetch=True,
+            fields=fieldset,
         )
 
     return ResponseModel(
         pkg_id=request.pkg_id,
         req_id=request.req_id,
-        data=[author.model_dump() for author in authors],
+        data=[dump_fields(author, fieldset) for author in authors],
         meta=meta,
     )
 
@@ -289,3 +327,283 @@ async def create_author_handler(
                 req_id=request.req_id,
                 data=author.model_dump(),
             )
+
+
+# ============================================================================
+# BULK CREATE AUTHORS
+# ============================================================================
+
+bulk_create_authors_schema: JsonSchemaType = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "names": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1},
+            "minItems": 1,
+            "maxItems": MAX_BULK_SIZE,
+        },
+    },
+    "required": ["names"],
+    "additionalProperties": False,
+}
+
+
+@pkg_router.register(
+    PkgID.BULK_CREATE_AUTHORS,
+    json_schema=bulk_create_authors_schema,
+    validator_callback=validator,
+    roles=[Role.CREATE_AUTHOR],
+)
+@handle_ws_errors
+async def bulk_create_authors_handler(
+    request: RequestModel,
+) -> ResponseModel[Author]:
+    """
+    WebSocket handler to create many authors in one batch.
+
+    Uses the same BulkCreateAuthorsCommand as POST /authors/bulk: one
+    multi-row INSERT ... RETURNING per batch.
+
+    Request Data:
+        {
+            "names": list[str] (required, 1..MAX_BULK_SIZE names)
+        }
+
+    Response Data: List of created author objects, in request order.
+    """
+    async with async_session() as session:
+        async with session.begin():
+            repo = AuthorRepository(session)
+            command = BulkCreateAuthorsCommand(repo)
+            input_data = BulkCreateAuthorsInput(**(request.data or {}))
+            authors = await command.execute(input_data)
+
+            return ResponseModel(
+                pkg_id=request.pkg_id,
+                req_id=request.req_id,
+                data=[author.model_dump() for author in authors],
+            )
+
+
+# ============================================================================
+# BULK UPDATE AUTHORS
+# ============================================================================
+
+bulk_update_authors_schema: JsonSchemaType = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "authors": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string", "minLength": 1},
+                },
+                "required": ["id", "name"],
+                "additionalProperties": False,
+            },
+            "minItems": 1,
+            "maxItems": MAX_BULK_SIZE,
+        },
+    },
+    "required": ["authors"],
+    "additionalProperties": False,
+}
+
+
+@pkg_router.register(
+    PkgID.BULK_UPDATE_AUTHORS,
+    json_schema=bulk_update_authors_schema,
+    validator_callback=validator,
+    roles=[Role.UPDATE_AUTHOR],
+)
+@handle_ws_errors
+async def bulk_update_authors_handler(
+    request: RequestModel,
+) -> ResponseModel[dict[str, int]]:
+    """
+    WebSocket handler to rename many authors in one batch.
+
+    Uses the same BulkUpdateAuthorsCommand as PATCH /authors/bulk: one
+    existence query and one executemany UPDATE per batch.
+
+    Request Data:
+        {
+            "authors": list[{"id": int, "name": str}] (required,
+                1..MAX_BULK_SIZE entries)
+        }
+
+    Response Data: {"count": number of authors renamed}.
+    """
+    async with async_session() as session:
+        async with session.begin():
+            repo = AuthorRepository(session)
+            command = BulkUpdateAuthorsCommand(repo)
+            input_data = BulkUpdateAuthorsInput(**(request.data or {}))
+            result = await command.execute(input_data)
+
+            return ResponseModel(
+                pkg_id=request.pkg_id,
+                req_id=request.req_id,
+                data=result.model_dump(),
+            )
+
+
+# ============================================================================
+# BULK DELETE AUTHORS
+# ============================================================================
+
+bulk_delete_authors_schema: JsonSchemaType = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "ids": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "minItems": 1,
+            "maxItems": MAX_BULK_SIZE,
+        },
+    },
+    "required": ["ids"],
+    "additionalProperties": False,
+}
+
+
+@pkg_router.register(
+    PkgID.BULK_DELETE_AUTHORS,
+    json_schema=bulk_delete_authors_schema,
+    validator_callback=validator,
+    roles=[Role.DELETE_AUTHOR],
+)
+@handle_ws_errors
+async def bulk_delete_authors_handler(
+    request: RequestModel,
+) -> ResponseModel[dict[str, int]]:
+    """
+    WebSocket handler to delete many authors in one batch.
+
+    Uses the same BulkDeleteAuthorsCommand as POST /authors/bulk/delete;
+    IDs that do not exist are ignored.
+
+    Request Data:
+        {
+            "ids": list[int] (required, 1..MAX_BULK_SIZE IDs)
+        }
+
+    Response Data: {"count": number of authors deleted}.
+    """
+    async with async_session() as session:
+        async with session.begin():
+            repo = AuthorRepository(session)
+            command = BulkDeleteAuthorsCommand(repo)
+            input_data = BulkDeleteAuthorsInput(**(request.data or {}))
+            result = await command.execute(input_data)
+
+            return ResponseModel(
+                pkg_id=request.pkg_id,
+                req_id=request.req_id,
+                data=result.model_dump(),
+            )
+
+
+# ============================================================================
+# BULK UPSERT AUTHORS
+# ============================================================================
+
+
+@pkg_router.register(
+    PkgID.BULK_UPSERT_AUTHORS,
+    json_schema=bulk_create_authors_schema,
+    validator_callback=validator,
+    roles=[Role.CREATE_AUTHOR],
+)
+@handle_ws_errors
+async def bulk_upsert_authors_handler(
+    request: RequestModel,
+) -> ResponseModel[Author]:
+    """
+    WebSocket handler to create the missing ones of many authors.
+
+    Uses the same BulkUpsertAuthorsCommand as PUT /authors/bulk: one
+    INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING per batch.
+
+    Request Data:
+        {
+            "names": list[str] (required, 1..MAX_BULK_SIZE names)
+        }
+
+    Response Data: List of existing and created author objects, in
+    request order.
+    """
+    async with async_session() as session:
+        async with session.begin():
+            repo = AuthorRepository(session)
+            command = BulkUpsertAuthorsCommand(repo)
+            input_data = BulkUpsertAuthorsInput(**(request.data or {}))
+            authors = await command.execute(input_data)
+
+            return ResponseModel(
+                pkg_id=request.pkg_id,
+                req_id=request.req_id,
+                data=[author.model_dump() for author in authors],
+            )
+
+
+# ============================================================================
+# IMPORT AUTHORS
+# ============================================================================
+
+import_authors_schema: JsonSchemaType = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "names": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1},
+            "minItems": 1,
+            "maxItems": MAX_IMPORT_SIZE,
+        },
+    },
+    "required": ["names"],
+    "additionalProperties": False,
+}
+
+
+@pkg_router.register(
+    PkgID.IMPORT_AUTHORS,
+    json_schema=import_authors_schema,
+    validator_callback=validator,
+    roles=[Role.CREATE_AUTHOR],
+)
+@handle_ws_errors
+async def import_authors_handler(
+    request: RequestModel,
+) -> ResponseModel[dict[str, int]]:
+    """
+    WebSocket handler to import many authors with binary COPY.
+
+    Uses the same ImportAuthorsCommand as POST /authors/import; the
+    generated IDs are not returned.
+
+    Request Data:
+        {
+            "names": list[str] (required, 1..MAX_IMPORT_SIZE names)
+        }
+
+    Response Data: {"count": number of authors imported}.
+    """
+    async with async_session() as session:
+        async with session.begin():
+            repo = AuthorRepository(session)
+            command = ImportAuthorsCommand(repo)
+            input_data = ImportAuthorsInput(**(request.data or {}))
+            result = await command.execute(input_data)
+
+            return ResponseModel(
+                pkg_id=request.pkg_id,
+                req_id=request.req_id,
+                data=result.model_dump(),
+            )
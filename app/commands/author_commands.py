@@ -34,16 +34,19 @@ Example:
     ```
 """
 
-from typing import Any
+from collections import Counter
+from collections.abc import Sequence
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
 from app.commands.base import BaseCommand
+from app.constants import MAX_BULK_SIZE, MAX_IMPORT_SIZE, MAX_PAGE_SIZE
 from app.exceptions import ConflictError, NotFoundError
 from app.models.author import Author
 from app.protocols import Repository
 from app.repositories.author_repository import AuthorRepository
-from app.utils.pagination_cache import invalidate_count_cache
+from app.storage.search import SearchMode
 
 
 # ============================================================================
@@ -58,7 +61,17 @@ class GetAuthorsInput(BaseModel):  # type: ignore[misc]
     name: str | None = Field(default=None, description="Filter by author name")
     search_term: str | None = Field(
         default=None,
-        description="Search term for name (case-insensitive partial match)",
+        description="Text to search names for, best matches first",
+    )
+    search_mode: SearchMode = Field(
+        default="substring",
+        description="'substring' (contains) or 'similar' (typo-tolerant)",
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of search results",
     )
 
 
@@ -68,6 +81,17 @@ class CreateAuthorInput(BaseModel):  # type: ignore[misc]
     name: str = Field(..., min_length=1, description="Author name")
 
 
+class BulkCreateAuthorsInput(BaseModel):  # type: ignore[misc]
+    """Input model for creating many authors at once."""
+
+    names: list[Annotated[str, Field(min_length=1)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_SIZE,
+        description="Names of the authors to create",
+    )
+
+
 class UpdateAuthorInput(BaseModel):  # type: ignore[misc]
     """Input model for updating an author."""
 
@@ -75,6 +99,76 @@ class UpdateAuthorInput(BaseModel):  # type: ignore[misc]
     name: str = Field(..., min_length=1, description="New author name")
 
 
+class BulkUpdateAuthorsInput(BaseModel):  # type: ignore[misc]
+    """Input model for renaming many authors at once."""
+
+    authors: list[UpdateAuthorInput] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_SIZE,
+        description="Author IDs and their new names",
+    )
+
+
+class BulkDeleteAuthorsInput(BaseModel):  # type: ignore[misc]
+    """Input model for deleting many authors at once."""
+
+    ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_SIZE,
+        description="IDs of the authors to delete",
+    )
+
+
+class BulkUpsertAuthorsInput(BaseModel):  # type: ignore[misc]
+    """Input model for creating the missing ones of many authors."""
+
+    names: list[Annotated[str, Field(min_length=1)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_SIZE,
+        description="Names of the authors to create or look up",
+    )
+
+
+class ImportAuthorsInput(BaseModel):  # type: ignore[misc]
+    """Input model for importing authors with binary COPY."""
+
+    names: list[Annotated[str, Field(min_length=1)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_IMPORT_SIZE,
+        description="Names of the authors to import",
+    )
+
+
+class BulkWriteResult(BaseModel):  # type: ignore[misc]
+    """Output model of bulk writes that do not return entities."""
+
+    count: int = Field(..., description="Number of rows written")
+
+
+def reject_duplicates(values: Sequence[Any], label: str) -> None:
+    """
+    Reject values repeated within one bulk request.
+
+    Args:
+        values: Names or IDs of the request.
+        label: What the values are, for the error message.
+
+    Raises:
+        ConflictError: If a value appears more than once.
+    """
+    repeated = sorted(
+        str(value) for value, count in Counter(values).items() if count > 1
+    )
+    if repeated:
+        raise ConflictError(
+            f"Duplicate {label} in request: {', '.join(repeated)}"
+        )
+
+
 # ============================================================================
 # Commands
 # ============================================================================
@@ -118,13 +212,25 @@ class GetAuthorsCommand(BaseCommand[GetAuthorsInput, list[Author]]):
             # Get by ID
             result = await command.execute(GetAuthorsInput(id=1))
 
-            # Search by name pattern
-            result = await command.execute(GetAuthorsInput(search_term="John"))
+            # Top 10 names containing "john"
+            result = await command.execute(
+                GetAuthorsInput(search_term="john", limit=10)
+            )
             ```
         """
         # If search term provided, use search functionality
         if input_data.search_term:
-            return await self.repository.search_by_name(input_data.search_term)
+            return await self.repository.search_by_name(
+                input_data.search_term,
+                limit=input_data.limit,
+                mode=input_data.search_mode,
+            )
+
+        # By-ID lookups go through the entity cache, which also caches
+        # nonexistent IDs
+        if input_data.id is not None and input_data.name is None:
+            author = await self.repository.get_cached(input_data.id)
+            return [] if author is None else [author]
 
         # Otherwise, use exact filters
         filters: dict[str, Any] = {}
@@ -140,10 +246,9 @@ class CreateAuthorCommand(BaseCommand[CreateAuthorInput, Author]):
     """
     Command to create a new author.
 
-    Validates that author name doesn't already exist before creating.
-
-    Note: Uses concrete AuthorRepository type because it requires the
-    get_by_name() extension method.
+    Name uniqueness is enforced by the unique index on author.name: the
+    insert is a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING``, so
+    there is no check-then-insert race.
     """
 
     def __init__(self, repository: AuthorRepository):
@@ -175,28 +280,79 @@ class CreateAuthorCommand(BaseCommand[CreateAuthorInput, Author]):
             print(f"Created author with ID: {author.id}")
             ```
         """
-        # Business logic: Check if author with same name exists
-        existing = await self.repository.get_by_name(input_data.name)
-        if existing:
+        author = Author(name=input_data.name)
+        try:
+            # The repository increments cached pagination counts
+            return await self.repository.create(author)
+        except ConflictError:
             raise ConflictError(
                 f"Author with name '{input_data.name}' already exists"
-            )
+            ) from None
 
-        # Create author
-        author = Author(name=input_data.name)
-        result = await self.repository.create(author)
 
-        # Invalidate pagination count cache (total count changed)
-        await invalidate_count_cache("Author")
+class BulkCreateAuthorsCommand(
+    BaseCommand[BulkCreateAuthorsInput, list[Author]]
+):
+    """
+    Command to create many authors in one batch.
 
-        return result
+    Rejects names repeated within the request, then inserts the authors
+    with multi-row INSERT ... RETURNING. Names that already exist are
+    rejected by the unique index on author.name (no check-then-insert
+    race). Either every author is created or none is.
+    """
+
+    def __init__(self, repository: AuthorRepository):
+        """
+        Initialize command with repository.
+
+        Args:
+            repository: Author repository for data access.
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: BulkCreateAuthorsInput
+    ) -> list[Author]:
+        """
+        Execute command to create authors.
+
+        Args:
+            input_data: Names of the authors to create.
+
+        Returns:
+            Created authors with generated IDs, in input order.
+
+        Raises:
+            ConflictError: If a name is repeated in the request or
+                already belongs to an author.
+
+        Example:
+            ```python
+            input_data = BulkCreateAuthorsInput(names=["Ann", "Bob"])
+            authors = await command.execute(input_data)
+            ```
+        """
+        names = input_data.names
+        reject_duplicates(names, "author names")
+
+        try:
+            # The repository adjusts cached pagination counts once per batch
+            return await self.repository.create_many(
+                [Author(name=name) for name in names]
+            )
+        except ConflictError:
+            raise ConflictError(
+                "One or more authors with these names already exist"
+            ) from None
 
 
 class UpdateAuthorCommand(BaseCommand[UpdateAuthorInput, Author]):
     """
     Command to update an existing author.
 
-    Validates that the author exists and new name doesn't conflict.
+    Validates that the author exists; a name taken by another author is
+    rejected by the unique index on author.name.
     """
 
     def __init__(self, repository: AuthorRepository):
@@ -233,24 +389,15 @@ class UpdateAuthorCommand(BaseCommand[UpdateAuthorInput, Author]):
         if not author:
             raise NotFoundError(f"Author with ID {input_data.id} not found")
 
-        # Check if new name conflicts with another author
-        existing = await self.repository.get_by_name(input_data.name)
-        if existing and existing.id != input_data.id:
+        author.name = input_data.name
+        try:
+            # The repository moves the author between cached filtered
+            # counts (e.g. name filters) as needed
+            return await self.repository.update(author)
+        except ConflictError:
             raise ConflictError(
                 f"Author with name '{input_data.name}' already exists"
-            )
-
-        # Update author
-        author.name = input_data.name
-        result = await self.repository.update(author)
-
-        # Note: No cache invalidation needed for name updates
-        # (name is not a common filter field in pagination)
-        # If name was used in filters, we would invalidate here:
-        # await invalidate_count_cache("Author", filters={"name": old_name})
-        # await invalidate_count_cache("Author", filters={"name": input_data.name})
-
-        return result
+            ) from None
 
 
 class DeleteAuthorCommand(BaseCommand[int, None]):
@@ -292,7 +439,222 @@ class DeleteAuthorCommand(BaseCommand[int, None]):
         if not author:
             raise NotFoundError(f"Author with ID {author_id} not found")
 
+        # The repository decrements cached pagination counts
         await self.repository.delete(author)
 
-        # Invalidate pagination count cache (total count decreased)
-        await invalidate_count_cache("Author")
+
+class BulkUpdateAuthorsCommand(
+    BaseCommand[BulkUpdateAuthorsInput, BulkWriteResult]
+):
+    """
+    Command to rename many authors in one batch.
+
+    Checks that every author exists with one query, then writes the new
+    names with one executemany UPDATE per batch. Either every author is
+    renamed or none is.
+    """
+
+    def __init__(self, repository: AuthorRepository):
+        """
+        Initialize command with repository.
+
+        Args:
+            repository: Author repository for data access.
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: BulkUpdateAuthorsInput
+    ) -> BulkWriteResult:
+        """
+        Execute command to rename authors.
+
+        Args:
+            input_data: Author IDs and their new names.
+
+        Returns:
+            Number of authors renamed.
+
+        Raises:
+            NotFoundError: If an author does not exist.
+            ConflictError: If an ID or name is repeated in the request, or
+                a name belongs to another author.
+
+        Example:
+            ```python
+            input_data = BulkUpdateAuthorsInput(
+                authors=[{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bob"}]
+            )
+            result = await command.execute(input_data)
+            ```
+        """
+        ids = [author.id for author in input_data.authors]
+        reject_duplicates(ids, "author IDs")
+        reject_duplicates(
+            [author.name for author in input_data.authors], "author names"
+        )
+
+        found = {author.id for author in await self.repository.get_by_ids(ids)}
+        missing = [str(id) for id in ids if id not in found]
+        if missing:
+            raise NotFoundError(
+                f"Authors with these IDs not found: {', '.join(missing)}"
+            )
+
+        try:
+            # Renames can move authors between cached filtered counts, so
+            # the repository drops the model's cached counts
+            count = await self.repository.update_many(
+                [author.model_dump() for author in input_data.authors]
+            )
+        except ConflictError:
+            raise ConflictError(
+                "One or more authors with these names already exist"
+            ) from None
+        return BulkWriteResult(count=count)
+
+
+class BulkDeleteAuthorsCommand(
+    BaseCommand[BulkDeleteAuthorsInput, BulkWriteResult]
+):
+    """
+    Command to delete many authors in one batch.
+
+    Deletes with one DELETE ... RETURNING per batch; IDs that do not
+    exist are ignored, so the request can be retried safely.
+    """
+
+    def __init__(self, repository: AuthorRepository):
+        """
+        Initialize command with repository.
+
+        Args:
+            repository: Author repository for data access.
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: BulkDeleteAuthorsInput
+    ) -> BulkWriteResult:
+        """
+        Execute command to delete authors.
+
+        Args:
+            input_data: IDs of the authors to delete.
+
+        Returns:
+            Number of authors deleted.
+
+        Example:
+            ```python
+            input_data = BulkDeleteAuthorsInput(ids=[1, 2, 3])
+            result = await command.execute(input_data)
+            ```
+        """
+        # The repository decrements cached pagination counts once per batch
+        count = await self.repository.delete_many(
+            list(dict.fromkeys(input_data.ids))
+        )
+        return BulkWriteResult(count=count)
+
+
+class BulkUpsertAuthorsCommand(
+    BaseCommand[BulkUpsertAuthorsInput, list[Author]]
+):
+    """
+    Command to create the missing ones of many authors.
+
+    Runs one INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING per
+    batch: names that already exist are left as they are, the others are
+    created, and every author is returned.
+    """
+
+    def __init__(self, repository: AuthorRepository):
+        """
+        Initialize command with repository.
+
+        Args:
+            repository: Author repository for data access.
+        """
+        self.repository = repository
+
+    async def execute(
+        self, input_data: BulkUpsertAuthorsInput
+    ) -> list[Author]:
+        """
+        Execute command to create missing authors.
+
+        Args:
+            input_data: Names of the authors to create or look up.
+
+        Returns:
+            Existing and created authors, in input order.
+
+        Raises:
+            ConflictError: If a name is repeated in the request.
+
+        Example:
+            ```python
+            input_data = BulkUpsertAuthorsInput(names=["Ann", "Bob"])
+            authors = await command.execute(input_data)
+            ```
+        """
+        # One statement cannot update the same row twice
+        reject_duplicates(input_data.names, "author names")
+
+        return await self.repository.upsert_many(
+            [Author(name=name) for name in input_data.names],
+            conflict_columns=("name",),
+        )
+
+
+class ImportAuthorsCommand(BaseCommand[ImportAuthorsInput, BulkWriteResult]):
+    """
+    Command to import many authors with binary COPY.
+
+    The fastest path for large imports: rows are streamed with the
+    driver's COPY instead of INSERT statements, at the cost of not
+    returning the generated IDs. Either every author is imported or none
+    is.
+    """
+
+    def __init__(self, repository: AuthorRepository):
+        """
+        Initialize command with repository.
+
+        Args:
+            repository: Author repository for data access.
+        """
+        self.repository = repository
+
+    async def execute(self, input_data: ImportAuthorsInput) -> BulkWriteResult:
+        """
+        Execute command to import authors.
+
+        Args:
+            input_data: Names of the authors to import.
+
+        Returns:
+            Number of authors imported.
+
+        Raises:
+            ConflictError: If a name is repeated in the request or already
+                belongs to an author.
+
+        Example:
+            ```python
+            input_data = ImportAuthorsInput(names=["Ann", "Bob"])
+            result = await command.execute(input_data)
+            ```
+        """
+        reject_duplicates(input_data.names, "author names")
+
+        try:
+            count = await self.repository.copy_many(
+                [Author(name=name) for name in input_data.names]
+            )
+        except ConflictError:
+            raise ConflictError(
+                "One or more authors with these names already exist"
+            ) from None
+        return BulkWriteResult(count=count)
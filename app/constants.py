@@ -63,6 +63,13 @@ KC_SESSION_EXPIRY_BUFFER_SECONDS = 10
 # For default page size, see app/settings.py (DEFAULT_PAGE_SIZE)
 MAX_PAGE_SIZE = 1000
 
+# Maximum number of entities in one bulk write request (HTTP or WebSocket)
+MAX_BULK_SIZE = 1000
+
+# Maximum number of entities in one import request (binary COPY)
+# Larger imports should be split by the client or use copy_many() directly
+MAX_IMPORT_SIZE = 100_000
+
 
 # ============================================================================
 # Logging Constants
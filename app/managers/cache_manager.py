@@ -17,27 +17,116 @@ Trade-offs:
 
 Deployment considerations:
 - Single instance: Memory cache provides significant benefit
-- Horizontally scaled: Use with caution (cache coherence issues)
+- Horizontally scaled: Use with caution (cache coherence issues), or
+  enable Redis client tracking (``tracking="optin"`` / ``"bcast"``) so
+  Redis notifies every instance when a cached key changes
+  (see app.storage.redis_tracking)
+- Multiple worker processes per host: pass a ``SharedMemoryCache`` as
+  ``shared_memory`` so all workers share one L1 (see app.storage.shm_cache)
+
+Redis values are framed by a pluggable codec (see app.utils.cache_codecs)
+with optional compression above a size threshold.
+
+"Not found" results can be cached as negative entries with their own short
+TTL (``set_not_found`` / ``get_or_load``) so repeated lookups of missing
+keys stop reaching Redis and the database. Lookups, latency per tier and
+evictions are reported per namespace (key prefix before the first ":").
 """
 
 import asyncio
-import json
+import sys
 import time
 from collections import OrderedDict
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Final, Literal, TypeVar
+
+from redis.asyncio import Redis
 
 from app.logging import logger
+from app.settings import app_settings
 from app.storage.redis import RedisPool
+from app.storage.redis_tracking import RedisClientTracker
+from app.storage.shm_cache import SharedMemoryCache
+from app.utils.cache_codecs import (
+    DEFAULT_COMPRESS_THRESHOLD,
+    NEGATIVE_PAYLOAD,
+    CacheCodec,
+    CacheSerializer,
+    get_codec,
+)
+from app.utils.cache_keys import CacheKeyFactory
 from app.utils.metrics.redis import (
+    cache_codec_bytes_saved_total,
+    cache_codec_bytes_written_total,
+    cache_evictions_total,
+    cache_lookup_duration_seconds,
+    cache_lookups_total,
     memory_cache_evictions_total,
     memory_cache_hits_total,
     memory_cache_misses_total,
+    memory_cache_oversize_skips_total,
     memory_cache_size,
+    memory_cache_size_bytes,
 )
 from app.utils.redis_safe import redis_safe
 
 T = TypeVar("T")
 
+TrackingMode = Literal["optin", "bcast"]
+
+
+class _NotFound:
+    """Marker value for a cached "not found" (negative) entry."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NOT_FOUND"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# Stored for keys cached as missing (see CacheManager.set_not_found)
+NOT_FOUND: Final = _NotFound()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the in-memory footprint of a cached value in bytes.
+
+    Walks dicts, lists, tuples and sets recursively and sums
+    ``sys.getsizeof`` of every object. Shared objects are counted once.
+    The result is an estimate (interning and allocator overhead are
+    ignored) but scales with the real size, which is what the byte
+    budget needs.
+
+    Args:
+        value: Value to measure.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+    return total
+
 
 class CacheEntry:
     """
@@ -47,21 +136,26 @@ class CacheEntry:
         value: Cached value (any JSON-serializable type).
         expires_at: Unix timestamp when entry expires (None = no expiry).
         last_accessed: Unix timestamp of last access (for LRU eviction).
+        size: Approximate size of the value in bytes.
     """
 
-    __slots__ = ("value", "expires_at", "last_accessed")
+    __slots__ = ("value", "expires_at", "last_accessed", "size")
 
-    def __init__(self, value: Any, ttl: int | None = None) -> None:
+    def __init__(
+        self, value: Any, ttl: int | None = None, size: int | None = None
+    ) -> None:
         """
         Initialize cache entry.
 
         Args:
             value: Value to cache.
             ttl: Time-to-live in seconds (None = no expiry).
+            size: Precomputed size in bytes (None = estimate now).
         """
         self.value = value
         self.expires_at = time.time() + ttl if ttl is not None else None
         self.last_accessed = time.time()
+        self.size = size if size is not None else estimate_size(value)
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -80,10 +174,12 @@ class CacheManager:
 
     Features:
     - Two-tier caching: memory (fast) + Redis (shared)
-    - LRU eviction policy for memory cache
+    - LRU eviction policy for memory cache, bounded by entries and bytes
     - Automatic expiration handling
     - Thread-safe operations with asyncio locks
     - Prometheus metrics for monitoring
+    - Pluggable Redis value codecs with size-threshold compression
+    - Optional Redis client tracking to keep L1 coherent across instances
 
     Example:
         >>> cache = CacheManager(max_memory_entries=1000)
@@ -96,6 +192,14 @@ class CacheManager:
         self,
         max_memory_entries: int = 1000,
         default_ttl: int = 300,
+        codec: CacheCodec | None = None,
+        compress_threshold: int | None = DEFAULT_COMPRESS_THRESHOLD,
+        max_memory_bytes: int | None = None,
+        max_entry_bytes: int | None = None,
+        tracking: TrackingMode | None = None,
+        tracking_prefixes: Sequence[str] = (),
+        shared_memory: SharedMemoryCache | None = None,
+        negative_ttl: int = 30,
     ) -> None:
         """
         Initialize cache manager.
@@ -103,21 +207,138 @@ class CacheManager:
         Args:
             max_memory_entries: Maximum entries in memory cache (LRU eviction).
             default_ttl: Default TTL in seconds for cached entries.
+            codec: Codec for values written to Redis (default: the
+                ``CACHE_CODEC`` setting). Entries written with other
+                registered codecs still decode.
+            compress_threshold: Compress Redis payloads larger than this
+                many bytes (None disables compression).
+            max_memory_bytes: Approximate byte budget for the memory cache
+                (default: the ``CACHE_MEMORY_MAX_BYTES`` setting, where 0
+                means bounded by entry count only).
+            max_entry_bytes: Values larger than this skip the memory cache
+                and are stored in Redis only. Defaults to max_memory_bytes.
+            tracking: Keep L1 coherent via Redis client tracking.
+                ``"optin"`` tracks keys read by this instance (Redis's
+                default tracking mode: ``CLIENT TRACKING ON REDIRECT``,
+                not the ``OPTIN`` option, so every read is tracked);
+                ``"bcast"`` tracks every key under ``tracking_prefixes``.
+                With tracking, only Redis reads populate L1 (writes go
+                around it). None disables tracking.
+            tracking_prefixes: Key prefixes tracked in ``"bcast"`` mode
+                (empty = every key).
+            shared_memory: Use this host-wide shared-memory table as L1
+                instead of the per-process memory cache. Entry and byte
+                budgets are then set by the table's geometry.
+            negative_ttl: Default TTL in seconds for "not found" entries
+                (kept short so newly created records appear quickly).
+
+        Raises:
+            ValueError: If tracking is not a supported mode, or is
+                combined with shared_memory.
         """
         self.max_memory_entries = max_memory_entries
         self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        if max_memory_bytes is None:
+            max_memory_bytes = app_settings.CACHE_MEMORY_MAX_BYTES or None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_entry_bytes = (
+            max_entry_bytes
+            if max_entry_bytes is not None
+            else max_memory_bytes
+        )
+
+        # Redis (L2) value framing: codec header + optional compression
+        self._serializer = CacheSerializer(
+            codec=codec or get_codec(app_settings.CACHE_CODEC),
+            compress_threshold=compress_threshold,
+        )
 
         # In-memory cache (L1) - OrderedDict for LRU eviction
         self._memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
 
         # Lock for thread-safe memory cache access
         self._lock = asyncio.Lock()
 
+        # Redis client tracking (server-pushed L1 invalidation)
+        if tracking not in (None, "optin", "bcast"):
+            raise ValueError(
+                f"Invalid tracking mode '{tracking}'. "
+                "Use 'optin', 'bcast' or None"
+            )
+        if tracking is not None and shared_memory is not None:
+            # Tracked keys belong to one process's connections; a
+            # host-wide L1 would outlive that process's invalidations.
+            raise ValueError(
+                "Client tracking cannot be combined with shared_memory"
+            )
+        self.tracking = tracking
+        self._tracker: RedisClientTracker | None = None
+        if tracking is not None:
+            self._tracker = RedisClientTracker(
+                on_invalidate=self._on_tracking_invalidate,
+                bcast=tracking == "bcast",
+                prefixes=tracking_prefixes,
+            )
+        # Bumped on every tracking invalidation and local write/delete; a
+        # Redis read that raced with one must not back-fill L1 with a
+        # possibly stale value.
+        self._invalidation_seq = 0
+
+        # Host-wide shared-memory L1 (replaces the per-process cache)
+        self._shared = shared_memory
+
         logger.info(
             f"Initialized CacheManager: max_memory_entries={max_memory_entries}, "
-            f"default_ttl={default_ttl}s"
+            f"max_memory_bytes={max_memory_bytes}, "
+            f"default_ttl={default_ttl}s, codec={self._serializer.codec.name}, "
+            f"tracking={tracking}, "
+            f"shared_memory={shared_memory.path if shared_memory else None}"
         )
 
+    async def _get_redis(self) -> Redis:
+        """Get the binary Redis client (tracked when tracking is on)."""
+        if self._tracker is None:
+            return await RedisPool.get_binary_instance()
+
+        if not self._tracker.running:
+            await self._tracker.start()
+        return await RedisPool.get_tracking_instance(self._tracker)
+
+    def _l1_coherent(self, key: str) -> bool:
+        """
+        Check whether a value read from Redis may be kept in L1.
+
+        Under client tracking only keys Redis will report changes for are
+        cached: every key read in "optin" mode, keys under the tracked
+        prefixes in broadcast mode, and nothing while the listener is
+        down.
+        """
+        tracker = self._tracker
+        if tracker is None:
+            return True
+        if not tracker.connected:
+            return False
+        if tracker.bcast and tracker.prefixes:
+            return key.startswith(tracker.prefixes)
+        return True
+
+    async def _on_tracking_invalidate(self, keys: list[str] | None) -> None:
+        """Drop keys reported by Redis (None = flush all of L1)."""
+        async with self._lock:
+            self._invalidation_seq += 1
+            if keys is None:
+                self._clear_memory()
+                logger.debug("Memory cache flushed by client tracking")
+                return
+
+            removed = False
+            for key in keys:
+                removed |= self._remove_memory(key)
+            if removed:
+                self._update_size_metrics()
+
     async def get(self, key: str) -> Any | None:
         """
         Get value from cache (memory first, Redis fallback).
@@ -131,8 +352,30 @@ class CacheManager:
             key: Cache key to lookup.
 
         Returns:
-            Cached value if found and not expired, None otherwise.
+            Cached value if found and not expired, None otherwise. Keys
+            cached as missing (see :meth:`set_not_found`) also return
+            None; use :meth:`get_or_load` to skip the loader for them.
         """
+        value = await self._lookup(key)
+        return None if value is NOT_FOUND else value
+
+    async def _lookup(self, key: str) -> Any | None:
+        """Look up a key in both tiers; negative entries are NOT_FOUND."""
+        namespace = CacheKeyFactory.namespace(key)
+        start = time.perf_counter()
+
+        # Try shared-memory L1 (lock-free, shared by worker processes)
+        if self._shared is not None:
+            value = self._shared.get(key)
+            if value is not None:
+                memory_cache_hits_total.inc()
+                self._record_lookup(namespace, "memory", value, start)
+                logger.debug(f"Shared memory cache hit: {key}")
+                return value
+            memory_cache_misses_total.inc()
+            self._record_lookup(namespace, "memory", None, start)
+            return await self._get_from_redis(key, namespace)
+
         # Try memory cache first (L1)
         async with self._lock:
             if key in self._memory_cache:
@@ -141,39 +384,139 @@ class CacheManager:
                 # Check expiration
                 if entry.is_expired():
                     # Remove expired entry
-                    del self._memory_cache[key]
-                    memory_cache_size.set(len(self._memory_cache))
+                    self._remove_memory(key)
+                    self._update_size_metrics()
                     logger.debug(f"Memory cache expired: {key}")
                 else:
                     # Cache hit - update LRU order
                     entry.touch()
                     self._memory_cache.move_to_end(key)
                     memory_cache_hits_total.inc()
+                    self._record_lookup(
+                        namespace, "memory", entry.value, start
+                    )
                     logger.debug(f"Memory cache hit: {key}")
                     return entry.value
 
             memory_cache_misses_total.inc()
+            self._record_lookup(namespace, "memory", None, start)
 
         # Try Redis cache (L2)
-        return await self._get_from_redis(key)
+        return await self._get_from_redis(key, namespace)
+
+    @staticmethod
+    def _record_lookup(
+        namespace: str, tier: str, value: Any, start: float
+    ) -> None:
+        """Record per-namespace lookup result and latency for a tier."""
+        if value is None:
+            result = "miss"
+        elif value is NOT_FOUND:
+            result = "negative_hit"
+        else:
+            result = "hit"
+        cache_lookups_total.labels(
+            namespace=namespace, tier=tier, result=result
+        ).inc()
+        cache_lookup_duration_seconds.labels(
+            namespace=namespace, tier=tier
+        ).observe(time.perf_counter() - start)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+    ) -> Any | None:
+        """
+        Get a value, loading and caching it on miss.
+
+        A loader result of None is cached as a negative entry for
+        ``negative_ttl`` seconds, so repeated lookups of missing keys
+        (e.g. nonexistent IDs) do not reach the loader again. A result is
+        not cached if this instance saw an invalidation while the loader
+        ran: it may predate that write (e.g. a NOT_FOUND for a row being
+        created), and the next lookup loads again.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine function fetching the value (e.g. from DB).
+            ttl: TTL for found values (None = default_ttl).
+
+        Returns:
+            Cached or loaded value, or None if it does not exist.
+
+        Example:
+            >>> author = await cache.get_or_load(
+            ...     f"author:{author_id}",
+            ...     lambda: repo.get_by_id(author_id),
+            ... )
+        """
+        value = await self._lookup(key)
+        if value is NOT_FOUND:
+            return None
+        if value is not None:
+            return value
+
+        seq = self._invalidation_seq
+        value = await loader()
+        if self._invalidation_seq != seq:
+            return value
+        if value is None:
+            await self.set_not_found(key)
+        else:
+            await self.set(key, value, ttl=ttl)
+        return value
+
+    async def set_not_found(self, key: str, ttl: int | None = None) -> None:
+        """
+        Cache that a key does not exist (negative entry).
+
+        Until the TTL expires or the key is set/invalidated,
+        :meth:`get_or_load` returns None without calling its loader (and
+        :meth:`get` returns None, as for an uncached key).
+
+        Args:
+            key: Cache key.
+            ttl: TTL in seconds (None = negative_ttl).
+        """
+        await self.set(
+            key, NOT_FOUND, ttl=self.negative_ttl if ttl is None else ttl
+        )
 
     @redis_safe(fail_value=None, operation_name="cache_manager_get_redis")
-    async def _get_from_redis(self, key: str) -> Any | None:
+    async def _get_from_redis(
+        self, key: str, namespace: str | None = None
+    ) -> Any | None:
         """Fetch from Redis (L2) and back-fill memory cache on hit."""
-        redis = await RedisPool.get_instance()
+        redis = await self._get_redis()
         if redis is None:
             logger.warning("Redis unavailable, cache lookup failed")
             return None
 
+        if namespace is None:
+            namespace = CacheKeyFactory.namespace(key)
+        seq = self._invalidation_seq
+        start = time.perf_counter()
         cached_value = await redis.get(key)
-        if cached_value is not None:
-            value = json.loads(cached_value)
-            logger.debug(f"Redis cache hit: {key}")
-            await self._set_memory(key, value, ttl=self.default_ttl)
-            return value
 
-        logger.debug(f"Cache miss (both tiers): {key}")
-        return None
+        if cached_value is None:
+            self._record_lookup(namespace, "redis", None, start)
+            logger.debug(f"Cache miss (both tiers): {key}")
+            return None
+
+        if cached_value == NEGATIVE_PAYLOAD:
+            value = NOT_FOUND
+            ttl = self.negative_ttl
+        else:
+            value = self._serializer.decode(cached_value)
+            ttl = self.default_ttl
+        self._record_lookup(namespace, "redis", value, start)
+        logger.debug(f"Redis cache hit: {key}")
+
+        if self._l1_coherent(key):
+            await self._set_memory(key, value, ttl=ttl, seq=seq)
+        return value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """
@@ -181,14 +524,20 @@ class CacheManager:
 
         Args:
             key: Cache key.
-            value: Value to cache (must be JSON-serializable).
+            value: Value to cache (must be serializable by the codec).
             ttl: Time-to-live in seconds (None = use default_ttl).
         """
         if ttl is None:
             ttl = self.default_ttl
 
-        # Set in memory cache (L1)
-        await self._set_memory(key, value, ttl=ttl)
+        # Set in memory cache (L1). Under client tracking writes go
+        # around L1, which only holds values read from Redis. NOLOOP
+        # keeps Redis from reporting this connection's own writes, so
+        # the previous value is dropped here.
+        if self._tracker is None:
+            await self._set_memory(key, value, ttl=ttl)
+        else:
+            await self._discard_memory(key)
 
         # Set in Redis cache (L2)
         await self._set_in_redis(key, value, ttl)
@@ -196,14 +545,31 @@ class CacheManager:
     @redis_safe(fail_value=None, operation_name="cache_manager_set_redis")
     async def _set_in_redis(self, key: str, value: Any, ttl: int) -> None:
         """Persist value to Redis (L2)."""
-        redis = await RedisPool.get_instance()
+        redis = await self._get_redis()
         if redis is None:
             logger.warning("Redis unavailable, value cached in memory only")
             return
 
-        serialized = json.dumps(value)
-        await redis.setex(key, ttl, serialized)
-        logger.debug(f"Cached in both tiers: {key} (TTL: {ttl}s)")
+        if value is NOT_FOUND:
+            await redis.setex(key, ttl, NEGATIVE_PAYLOAD)
+            logger.debug(f"Cached negative entry: {key} (TTL: {ttl}s)")
+            return
+
+        payload, raw_size = self._serializer.encode(value)
+        await redis.setex(key, ttl, payload)
+
+        namespace = CacheKeyFactory.namespace(key)
+        cache_codec_bytes_written_total.labels(namespace=namespace).inc(
+            len(payload)
+        )
+        if raw_size > len(payload):
+            cache_codec_bytes_saved_total.labels(namespace=namespace).inc(
+                raw_size - len(payload)
+            )
+        logger.debug(
+            f"Cached in both tiers: {key} (TTL: {ttl}s, "
+            f"{len(payload)}/{raw_size} bytes)"
+        )
 
     async def invalidate(self, key: str) -> None:
         """
@@ -215,11 +581,8 @@ class CacheManager:
             key: Cache key to invalidate.
         """
         # Invalidate memory cache (L1)
-        async with self._lock:
-            if key in self._memory_cache:
-                del self._memory_cache[key]
-                memory_cache_size.set(len(self._memory_cache))
-                logger.debug(f"Invalidated memory cache: {key}")
+        if await self._discard_memory(key):
+            logger.debug(f"Invalidated memory cache: {key}")
 
         # Invalidate Redis cache (L2)
         await self._invalidate_in_redis(key)
@@ -229,7 +592,7 @@ class CacheManager:
     )
     async def _invalidate_in_redis(self, key: str) -> None:
         """Remove a single key from Redis (L2)."""
-        redis = await RedisPool.get_instance()
+        redis = await self._get_redis()
         if redis is None:
             logger.warning("Redis unavailable, memory cache invalidated only")
             return
@@ -238,6 +601,39 @@ class CacheManager:
         if deleted:
             logger.debug(f"Invalidated Redis cache: {key}")
 
+    async def invalidate_many(self, keys: Sequence[str]) -> None:
+        """
+        Invalidate several cache entries with one Redis round trip.
+
+        Args:
+            keys: Cache keys to invalidate.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        async with self._lock:
+            self._invalidation_seq += 1
+            removed = False
+            for key in keys:
+                removed = self._remove_memory(key) or removed
+            if removed:
+                self._update_size_metrics()
+
+        await self._invalidate_many_in_redis(keys)
+
+    @redis_safe(
+        fail_value=None, operation_name="cache_manager_invalidate_redis"
+    )
+    async def _invalidate_many_in_redis(self, keys: list[str]) -> None:
+        """Remove several keys from Redis (L2) in one DEL."""
+        redis = await self._get_redis()
+        if redis is None:
+            logger.warning("Redis unavailable, memory cache invalidated only")
+            return
+
+        deleted = await redis.delete(*keys)
+        logger.debug(f"Invalidated {deleted} of {len(keys)} Redis keys")
+
     async def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all cache entries matching pattern.
@@ -255,8 +651,8 @@ class CacheManager:
         """
         # Clear entire memory cache (cannot match pattern efficiently)
         async with self._lock:
-            self._memory_cache.clear()
-            memory_cache_size.set(0)
+            self._invalidation_seq += 1
+            self._clear_memory()
             logger.info("Cleared entire memory cache (pattern invalidation)")
 
         # Invalidate matching keys in Redis
@@ -267,7 +663,7 @@ class CacheManager:
     )
     async def _invalidate_pattern_in_redis(self, pattern: str) -> int:
         """SCAN and delete all Redis keys matching *pattern*."""
-        redis = await RedisPool.get_instance()
+        redis = await self._get_redis()
         if redis is None:
             logger.warning("Redis unavailable, pattern invalidation failed")
             return 0
@@ -292,39 +688,141 @@ class CacheManager:
         """Clear both memory and Redis caches entirely."""
         # Clear memory cache
         async with self._lock:
-            self._memory_cache.clear()
-            memory_cache_size.set(0)
+            self._clear_memory()
             logger.info("Cleared memory cache")
 
         # Note: Redis cache is shared across instances, so we don't clear it
         # Use invalidate_pattern("*") if you really need to clear Redis
 
-    async def _set_memory(self, key: str, value: Any, ttl: int) -> None:
+    async def _set_memory(
+        self, key: str, value: Any, ttl: int, seq: int | None = None
+    ) -> None:
         """
-        Set value in memory cache with LRU eviction.
+        Set value in memory cache with size-aware LRU eviction.
+
+        The value's size is estimated once at insert time. Values larger
+        than ``max_entry_bytes`` are not kept in memory (Redis only), and
+        least recently used entries are evicted until both the entry and
+        byte budgets are satisfied.
 
         Args:
             key: Cache key.
             value: Value to cache.
             ttl: Time-to-live in seconds.
+            seq: Invalidation sequence observed before reading the value;
+                the value is dropped if an invalidation or local write
+                happened since.
         """
-        async with self._lock:
-            # Add or update entry
-            entry = CacheEntry(value, ttl=ttl)
-            self._memory_cache[key] = entry
-            self._memory_cache.move_to_end(key)  # Mark as most recently used
+        if self._shared is not None:
+            if value is NOT_FOUND:
+                # Negative entries are kept in Redis only
+                self._shared.delete(key)
+                return
+            if not self._shared.set(key, value, ttl):
+                memory_cache_oversize_skips_total.inc()
+                logger.debug(f"Skipped shared memory cache for {key}")
+            return
+
+        size = estimate_size(value)
 
-            # Evict oldest entry if cache is full (LRU)
-            if len(self._memory_cache) > self.max_memory_entries:
+        async with self._lock:
+            if seq is not None and seq != self._invalidation_seq:
+                logger.debug(f"Skipped stale memory cache fill: {key}")
+                return
+
+            # Drop any previous entry first so byte accounting stays exact
+            self._remove_memory(key)
+
+            if (
+                self.max_entry_bytes is not None
+                and size > self.max_entry_bytes
+            ):
+                memory_cache_oversize_skips_total.inc()
+                self._update_size_metrics()
+                logger.debug(
+                    f"Skipped memory cache for {key}: {size} bytes "
+                    f"exceeds max_entry_bytes={self.max_entry_bytes}"
+                )
+                return
+
+            # Add entry as most recently used
+            self._memory_cache[key] = CacheEntry(value, ttl=ttl, size=size)
+            self._memory_bytes += size
+
+            # Evict LRU entries until within entry and byte budgets
+            while self._memory_cache and (
+                len(self._memory_cache) > self.max_memory_entries
+                or (
+                    self.max_memory_bytes is not None
+                    and self._memory_bytes > self.max_memory_bytes
+                )
+            ):
                 oldest_key = next(iter(self._memory_cache))
-                del self._memory_cache[oldest_key]
+                self._remove_memory(oldest_key)
                 memory_cache_evictions_total.inc()
+                cache_evictions_total.labels(
+                    namespace=CacheKeyFactory.namespace(oldest_key)
+                ).inc()
                 logger.debug(
                     f"Evicted LRU entry: {oldest_key} "
-                    f"(cache size: {len(self._memory_cache)})"
+                    f"(cache size: {len(self._memory_cache)}, "
+                    f"bytes: {self._memory_bytes})"
                 )
 
-            memory_cache_size.set(len(self._memory_cache))
+            self._update_size_metrics()
+
+    async def _discard_memory(self, key: str) -> bool:
+        """
+        Drop a key from the memory cache before it changes in Redis.
+
+        Also bumps the invalidation sequence, so a Redis read of the old
+        value still in flight does not put it back (see
+        :meth:`_set_memory`).
+
+        Returns:
+            True if the key was present.
+        """
+        async with self._lock:
+            self._invalidation_seq += 1
+            removed = self._remove_memory(key)
+            if removed:
+                self._update_size_metrics()
+        return removed
+
+    def _remove_memory(self, key: str) -> bool:
+        """
+        Remove a key from the memory cache and release its bytes.
+
+        Caller must hold ``self._lock``.
+
+        Returns:
+            True if the key was present.
+        """
+        if self._shared is not None:
+            return self._shared.delete(key)
+
+        entry = self._memory_cache.pop(key, None)
+        if entry is None:
+            return False
+        self._memory_bytes -= entry.size
+        return True
+
+    def _clear_memory(self) -> None:
+        """Empty the memory cache. Caller must hold ``self._lock``."""
+        if self._shared is not None:
+            self._shared.clear()
+            return
+        self._memory_cache.clear()
+        self._memory_bytes = 0
+        self._update_size_metrics()
+
+    def _update_size_metrics(self) -> None:
+        """Publish memory cache entry count and byte usage."""
+        if self._shared is not None:
+            # Shared table is sized by geometry; see get_stats() for usage
+            return
+        memory_cache_size.set(len(self._memory_cache))
+        memory_cache_size_bytes.set(self._memory_bytes)
 
     async def get_stats(self) -> dict[str, Any]:
         """
@@ -333,20 +831,48 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics.
         """
-        async with self._lock:
-            memory_size = len(self._memory_cache)
+        memory_max = self.max_memory_entries
+        if self._shared is not None:
+            shared_stats = self._shared.stats()
+            memory_size = shared_stats["entries"]
+            memory_bytes = shared_stats["bytes"]
+            memory_max = shared_stats["slots"]
+        else:
+            async with self._lock:
+                memory_size = len(self._memory_cache)
+                memory_bytes = self._memory_bytes
 
         return {
             "memory_cache_size": memory_size,
-            "memory_cache_max": self.max_memory_entries,
+            "memory_cache_max": memory_max,
             "memory_usage_percent": (
-                (memory_size / self.max_memory_entries) * 100
-                if self.max_memory_entries > 0
+                (memory_size / memory_max) * 100 if memory_max > 0 else 0
+            ),
+            "memory_cache_bytes": memory_bytes,
+            "memory_cache_max_bytes": self.max_memory_bytes,
+            "memory_bytes_usage_percent": (
+                (memory_bytes / self.max_memory_bytes) * 100
+                if self.max_memory_bytes
                 else 0
             ),
             "default_ttl": self.default_ttl,
+            "negative_ttl": self.negative_ttl,
+            "codec": self._serializer.codec.name,
+            "compress_threshold": self._serializer.compress_threshold,
+            "tracking": self.tracking,
+            "tracking_connected": (
+                self._tracker.connected if self._tracker else None
+            ),
+            "shared_memory": self._shared.path if self._shared else None,
         }
 
+    async def close(self) -> None:
+        """Stop the tracking listener and unmap shared memory (if used)."""
+        if self._tracker is not None:
+            await self._tracker.stop()
+        if self._shared is not None:
+            self._shared.close()
+
 
 # Global cache manager instance
 _cache_manager: CacheManager | None = None
@@ -355,6 +881,14 @@ _cache_manager: CacheManager | None = None
 def get_cache_manager(
     max_memory_entries: int = 1000,
     default_ttl: int = 300,
+    codec: CacheCodec | None = None,
+    compress_threshold: int | None = DEFAULT_COMPRESS_THRESHOLD,
+    max_memory_bytes: int | None = None,
+    max_entry_bytes: int | None = None,
+    tracking: TrackingMode | None = None,
+    tracking_prefixes: Sequence[str] = (),
+    shared_memory: SharedMemoryCache | None = None,
+    negative_ttl: int = 30,
 ) -> CacheManager:
     """
     Get or create global cache manager instance (singleton).
@@ -362,6 +896,15 @@ def get_cache_manager(
     Args:
         max_memory_entries: Maximum entries in memory cache.
         default_ttl: Default TTL in seconds.
+        codec: Codec for Redis values (default: ``CACHE_CODEC``).
+        compress_threshold: Compress Redis payloads above this size.
+        max_memory_bytes: Approximate byte budget for the memory cache
+            (default: ``CACHE_MEMORY_MAX_BYTES``).
+        max_entry_bytes: Values larger than this skip the memory cache.
+        tracking: Redis client tracking mode ("optin", "bcast" or None).
+        tracking_prefixes: Key prefixes tracked in "bcast" mode.
+        shared_memory: Host-wide shared-memory table used as L1.
+        negative_ttl: Default TTL in seconds for "not found" entries.
 
     Returns:
         Global CacheManager instance.
@@ -372,6 +915,14 @@ def get_cache_manager(
         _cache_manager = CacheManager(
             max_memory_entries=max_memory_entries,
             default_ttl=default_ttl,
+            codec=codec,
+            compress_threshold=compress_threshold,
+            max_memory_bytes=max_memory_bytes,
+            max_entry_bytes=max_entry_bytes,
+            tracking=tracking,
+            tracking_prefixes=tracking_prefixes,
+            shared_memory=shared_memory,
+            negative_ttl=negative_ttl,
         )
 
     return _cache_manager
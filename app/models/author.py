@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlmodel import Field
 
 from app.models.base import BaseModel
@@ -18,7 +19,25 @@ class Author(BaseModel, table=True):  # type: ignore[call-arg]
         name: Name of the author
     """
 
-    __table_args__ = {"extend_existing": True}  # for pydoc
+    __table_args__ = (
+        # Enforces unique names (create/update map violations to
+        # ConflictError) and serves equality and prefix filters
+        # (name LIKE 'x%') with a btree range scan
+        Index(
+            "uq_author_name",
+            "name",
+            unique=True,
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+        # Serves substring and similarity search (ILIKE '%x%', name % 'x')
+        Index(
+            "idx_author_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        {"extend_existing": True},  # for pydoc
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     name: str
@@ -3,17 +3,31 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Index, Text
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    Sequence,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
+# JSONB on PostgreSQL (containment operators, GIN); plain JSON elsewhere
+AUDIT_JSON = JSONB().with_variant(JSON(), "sqlite")
+
 
 class UserAction(SQLModel, table=True):  # type: ignore[misc,call-arg]
     """
     Audit log model for tracking user actions across the application.
 
     This model captures comprehensive information about user activities
-    for security, compliance, debugging, and analytics purposes.
+    for security, compliance, debugging, and analytics purposes. The table
+    is range-partitioned by month on ``timestamp``, so filtering on it
+    lets PostgreSQL skip whole partitions.
 
     Attributes:
         id: Primary key identifier for the log entry
@@ -31,39 +45,96 @@ class UserAction(SQLModel, table=True):  # type: ignore[misc,call-arg]
         response_status: HTTP status code or WebSocket response code
         error_message: Error details if the action failed
         duration_ms: Request processing duration in milliseconds
+        stream_id: Redis Streams entry id, for entries written by the
+            audit stream consumer
     """
 
     __tablename__ = "user_actions"
     __table_args__ = (
-        # Composite index for common query pattern (user timeline)
-        Index("idx_user_timestamp", "user_id", "timestamp"),
-        # Composite index for action type filtering by user
-        Index("idx_user_action", "user_id", "action_type"),
-        {"extend_existing": True},
+        # Skips redelivered stream entries (includes the partition key,
+        # as unique indexes on a partitioned table must)
+        Index(
+            "uq_user_actions_stream_id",
+            "stream_id",
+            "timestamp",
+            unique=True,
+        ),
+        # Listings, newest first (AUDIT_LOG_ORDER), and time ranges
+        Index("idx_user_actions_timestamp_id", "timestamp", "id"),
+        # User timeline, newest first (also serves user_id filters)
+        Index("idx_user_recent", "user_id", "timestamp", "id"),
+        # Non-success entries, newest first; a small share of the rows
+        Index(
+            "idx_user_actions_failures",
+            "timestamp",
+            "id",
+            postgresql_where=text("outcome <> 'success'"),
+        ),
+        # Serves resource prefix filters (resource LIKE 'x%')
+        Index(
+            "idx_resource_pattern",
+            "resource",
+            postgresql_ops={"resource": "text_pattern_ops"},
+        ),
+        # Serve contains filters (ILIKE '%x%') on username and resource
+        Index(
+            "idx_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_resource_trgm",
+            "resource",
+            postgresql_using="gin",
+            postgresql_ops={"resource": "gin_trgm_ops"},
+        ),
+        # Serves role filters (user_roles @> '["admin"]')
+        Index(
+            "idx_user_roles_gin",
+            "user_roles",
+            postgresql_using="gin",
+            postgresql_ops={"user_roles": "jsonb_path_ops"},
+        ),
+        {
+            "extend_existing": True,
+            # Monthly partitions, created and dropped past retention by
+            # app.tasks.audit_partition_task
+            "postgresql_partition_by": "RANGE (timestamp)",
+        },
     )
 
-    id: int | None = Field(default=None, primary_key=True)
+    # The primary key includes the partition key (id, timestamp); ids
+    # still come from the table's sequence
+    id: int | None = Field(
+        default=None,
+        sa_column=Column(
+            Integer, Sequence("user_actions_id_seq"), primary_key=True
+        ),
+    )
 
     # Temporal information
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
-        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+        sa_column=Column(
+            DateTime(timezone=True),
+            primary_key=True,
+            nullable=False,
+        ),
         description="UTC timestamp when the action occurred",
     )
 
     # User information
     user_id: str = Field(
-        index=True,
         max_length=255,
         description="Keycloak user ID (sub claim)",
     )
     username: str = Field(
-        index=True,
         max_length=255,
         description="Username (preferred_username claim)",
     )
     user_roles: list[str] = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(AUDIT_JSON, nullable=False),
         description="User roles at time of action",
     )
 
@@ -78,7 +149,6 @@ class UserAction(SQLModel, table=True):  # type: ignore[misc,call-arg]
         description="Resource accessed (URL path or entity identifier)",
     )
     outcome: str = Field(
-        index=True,
         max_length=50,
         description="Action outcome: success, error, permission_denied",
     )
@@ -104,7 +174,7 @@ class UserAction(SQLModel, table=True):  # type: ignore[misc,call-arg]
     # Optional details
     request_data: dict[str, Any] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(AUDIT_JSON),
         description="Sanitized request payload",
     )
     response_status: int | None = Field(
@@ -120,3 +190,8 @@ class UserAction(SQLModel, table=True):  # type: ignore[misc,call-arg]
         default=None,
         description="Request processing duration in milliseconds",
     )
+    stream_id: str | None = Field(
+        default=None,
+        max_length=32,
+        description="Redis Streams entry id (stream transport only)",
+    )
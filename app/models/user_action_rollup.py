@@ -0,0 +1,59 @@
+"""Per-minute audit log rollup model."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index
+from sqlmodel import Field, SQLModel
+
+
+class UserActionRollup(SQLModel, table=True):  # type: ignore[misc,call-arg]
+    """
+    Number of audit log entries per minute, action type, outcome and user.
+
+    Maintained by the audit writers, which upsert the counts of each batch
+    in the transaction that writes its ``user_actions`` rows, so the
+    counters always match the raw log. Dashboards read time series from
+    here instead of aggregating ``user_actions``. Rows past
+    ``AUDIT_LOG_RETENTION_DAYS`` are deleted by the partition maintenance
+    task.
+
+    Attributes:
+        minute: UTC start of the minute
+        action_type: Type of action (HTTP method or WebSocket PkgID)
+        outcome: Result of the action (success, error, permission_denied)
+        user_id: Keycloak user ID
+        count: Number of entries
+    """
+
+    __tablename__ = "user_action_rollups"
+    __table_args__ = (
+        # Per-user series; the primary key serves time-range scans
+        Index("idx_rollup_user_minute", "user_id", "minute"),
+        {"extend_existing": True},
+    )
+
+    minute: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True), primary_key=True, nullable=False
+        ),
+        description="UTC start of the minute",
+    )
+    action_type: str = Field(
+        primary_key=True,
+        max_length=100,
+        description="HTTP method (GET, POST) or WebSocket PkgID",
+    )
+    outcome: str = Field(
+        primary_key=True,
+        max_length=50,
+        description="Action outcome: success, error, permission_denied",
+    )
+    user_id: str = Field(
+        primary_key=True,
+        max_length=255,
+        description="Keycloak user ID (sub claim)",
+    )
+    count: int = Field(
+        default=0,
+        description="Number of audit log entries",
+    )
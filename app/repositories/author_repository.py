@@ -2,7 +2,7 @@
 Repository for Author entity with specialized query methods.
 
 This repository extends BaseRepository with Author-specific operations
-like searching by name pattern.
+like ranked name search.
 
 Example:
     ```python
@@ -22,6 +22,8 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.author import Author
 from app.repositories.base import BaseRepository
+from app.settings import app_settings
+from app.storage.search import SearchMode, ranked_search
 
 
 class AuthorRepository(BaseRepository[Author]):
@@ -55,23 +57,38 @@ class AuthorRepository(BaseRepository[Author]):
         result = await self.session.exec(stmt)
         return result.first()
 
-    async def search_by_name(self, name_pattern: str) -> list[Author]:
+    async def search_by_name(
+        self,
+        name_pattern: str,
+        limit: int | None = None,
+        mode: SearchMode = "substring",
+    ) -> list[Author]:
         """
-        Search authors by name pattern (case-insensitive).
+        Search authors by name, best matches first.
 
         Args:
-            name_pattern: Pattern to search for in author names.
-                Performs case-insensitive LIKE search.
+            name_pattern: Text to search for (case-insensitive).
+            limit: Maximum number of results (defaults to
+                ``SEARCH_RESULT_LIMIT``).
+            mode: "substring" matches names containing the text;
+                "similar" matches names with a high trigram similarity
+                (tolerates typos). Both use ``idx_author_name_trgm``.
 
         Returns:
-            List of authors matching the pattern.
+            Up to ``limit`` authors ranked by similarity to the text.
 
         Example:
             ```python
-            # Find all authors with "John" in their name
-            results = await repo.search_by_name("John")
+            # Top 5 authors whose name contains "john"
+            results = await repo.search_by_name("john", limit=5)
             ```
         """
-        stmt = select(Author).where(Author.name.ilike(f"%{name_pattern}%"))  # type: ignore[attr-defined]
+        stmt = ranked_search(
+            Author,
+            "name",
+            name_pattern,
+            limit=limit or app_settings.SEARCH_RESULT_LIMIT,
+            mode=mode,
+        )
         result = await self.session.exec(stmt)
         return list(result.all())
@@ -22,17 +22,54 @@ Example:
     ```
 """
 
-from typing import Any, Generic, Type, TypeVar
-
-from sqlalchemy.exc import SQLAlchemyError
+import json
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from functools import partial
+from typing import Any, Final, Generic, Type, TypeVar
+
+from asyncpg import PostgresError
+from sqlalchemy import JSON, delete, insert, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.exceptions import ConflictError, NotFoundError
 from app.logging import logger
+from app.managers.cache_manager import get_cache_manager
 from app.protocols import Repository
+from app.settings import app_settings
+from app.storage.after_commit import after_commit
+from app.storage.dataloader import get_loader
+from app.utils.entity_cache import (
+    entity_cache_key,
+    invalidate_entity_cache,
+    invalidate_model_entity_cache,
+)
+from app.utils.pagination_cache import (
+    adjust_cached_counts,
+    adjust_cached_counts_many,
+    invalidate_count_cache,
+    invalidate_page_cache,
+)
 
 T = TypeVar("T")
 
+# PostgreSQL accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMS: Final = 32767
+
+# SQLSTATE of a unique index violation
+UNIQUE_VIOLATION: Final = "23505"
+
+
+def is_unique_violation(error: SQLAlchemyError) -> bool:
+    """Whether a database error is a unique index violation."""
+    return (
+        isinstance(error, IntegrityError)
+        and getattr(error.orig, "sqlstate", None) == UNIQUE_VIOLATION
+    )
+
 
 class BaseRepository(Repository[T], Generic[T]):
     """
@@ -45,6 +82,20 @@ class BaseRepository(Repository[T], Generic[T]):
     Implements the Repository Protocol for structural subtyping, enabling
     flexible dependency injection and type-safe repository usage.
 
+    Writes keep tracked pagination counts current (INCR/DECR in Redis) and
+    invalidate the model's prefetched pagination pages. These cache
+    updates are queued on the session and applied once its transaction
+    commits (see :mod:`app.storage.after_commit`); a rolled-back write
+    leaves the caches untouched.
+
+    Bulk writes (``create_many``, ``copy_many``, ``update_many``,
+    ``delete_many``, ``upsert_many``) send one statement per batch of
+    ``BULK_BATCH_SIZE`` rows instead of one round trip per entity. Inserts
+    and deletes adjust tracked counts in one pipeline; bulk updates and
+    upserts cannot tell which counts a row moved between, so they drop the
+    model's cached counts instead. Every write also drops the by-ID cache
+    entries (see :meth:`get_cached`) of the rows it touched.
+
     Type Parameters:
         T: The SQLModel type this repository manages.
 
@@ -82,8 +133,88 @@ class BaseRepository(Repository[T], Generic[T]):
             ... else:
             ...     print("Not found")
         """
+        if self._use_loader():
+            row = await get_loader(self.model).load(id)
+            return None if row is None else await self._adopt(row)
         return await self.session.get(self.model, id)
 
+    async def get_by_ids(self, ids: Sequence[int]) -> list[T]:
+        """
+        Get entities by primary key IDs with a single query.
+
+        Args:
+            ids: Primary key values.
+
+        Returns:
+            The entities found, in the order of ``ids`` (missing ids are
+            skipped, duplicates returned once).
+
+        Examples:
+            >>> authors = await repo.get_by_ids([3, 1, 2])
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        if self._use_loader():
+            rows = await get_loader(self.model).load_many(ids)
+            return [await self._adopt(row) for row in rows if row is not None]
+
+        stmt = select(self.model).where(
+            self.model.id.in_(ids)  # type: ignore[attr-defined]
+        )
+        found = {
+            entity.id: entity  # type: ignore[attr-defined]
+            for entity in (await self.session.exec(stmt)).all()
+        }
+        return [found[id] for id in ids if id in found]
+
+    async def get_cached(self, id: int) -> T | None:
+        """
+        Get entity by primary key ID through the entity cache.
+
+        For read-only callers: the entity is rebuilt from the cached
+        column values and is not attached to this session. IDs that do
+        not exist are cached too, for the cache's ``negative_ttl``.
+
+        Args:
+            id: Primary key value.
+
+        Returns:
+            Entity if found, None otherwise.
+        """
+
+        async def load() -> dict[str, Any] | None:
+            entity = await self.get_by_id(id)
+            return None if entity is None else entity.model_dump(mode="json")
+
+        values = await get_cache_manager().get_or_load(
+            entity_cache_key(self.model.__name__, id), load
+        )
+        return None if values is None else self.model.model_validate(values)
+
+    def _use_loader(self) -> bool:
+        """
+        Whether by-ID reads may go through the shared DataLoader.
+
+        Only sessions that have not started a transaction are batched: the
+        loader reads in its own session, which would not see this
+        session's uncommitted writes.
+        """
+        return (
+            app_settings.DATALOADER_ENABLED
+            and not self.session.in_transaction()
+        )
+
+    def _after_commit(
+        self, update: Callable[..., Awaitable[Any]], *args: Any
+    ) -> None:
+        """Run ``update(*args)`` once the session's transaction commits."""
+        after_commit(self.session, partial(update, *args))
+
+    async def _adopt(self, row: T) -> T:
+        """Attach a detached loader row to this session (no SQL)."""
+        return await self.session.merge(row, load=False)
+
     async def get_all(self, **filters: Any) -> list[T]:
         """
         Get all entities matching the provided filters.
@@ -123,6 +254,11 @@ class BaseRepository(Repository[T], Generic[T]):
         """
         Create new entity in database.
 
+        Runs a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING``: the
+        generated fields come back with the insert, and a row violating a
+        unique index (e.g. a duplicate author name) is reported as a
+        conflict instead of aborting the transaction.
+
         Args:
             entity: The entity instance to create.
 
@@ -130,6 +266,7 @@ class BaseRepository(Repository[T], Generic[T]):
             The created entity with generated fields populated.
 
         Raises:
+            ConflictError: If the row conflicts with a unique index.
             SQLAlchemyError: If database operation fails.
 
         Examples:
@@ -138,20 +275,49 @@ class BaseRepository(Repository[T], Generic[T]):
             >>> created = await repo.create(new_author)
             >>> print(f"Created author with ID: {created.id}")
         """
+        stmt = (
+            pg_insert(self.model)
+            .values(**self._insert_values(entity))
+            .on_conflict_do_nothing()
+            .returning(self.model)
+        )
         try:
-            self.session.add(entity)
-            await self.session.flush()
-            await self.session.refresh(entity)
-            return entity
+            result = await self.session.exec(stmt)
+            created = result.scalars().one_or_none()
         except SQLAlchemyError as e:
             await self.session.rollback()
             logger.error(f"Error creating {self.model.__name__}: {e}")
             raise
 
+        if created is None:
+            raise ConflictError(
+                f"{self.model.__name__} conflicts with an existing row"
+            )
+
+        self._after_commit(
+            adjust_cached_counts,
+            self.model.__name__,
+            None,
+            self._row_values(created),
+        )
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache,
+            self.model.__name__,
+            [created.id],  # type: ignore[attr-defined]
+        )
+        return created
+
     async def update(self, entity: T) -> T:
         """
         Update existing entity in database.
 
+        Writes the changed columns with a single ``UPDATE ... RETURNING``
+        and refreshes the entity from the returned row. An entity without
+        changes is returned without a statement. A detached entity has no
+        change history: every column is written and the model's cached
+        counts are dropped instead of adjusted.
+
         Args:
             entity: The entity instance with updated values.
 
@@ -159,18 +325,72 @@ class BaseRepository(Repository[T], Generic[T]):
             The updated entity.
 
         Raises:
+            ConflictError: If the new values violate a unique index.
+            NotFoundError: If the row no longer exists.
             SQLAlchemyError: If database operation fails.
         """
-        try:
-            self.session.add(entity)
-            await self.session.flush()
-            await self.session.refresh(entity)
+        before = self._row_values(entity, previous=True)
+        after = self._row_values(entity)
+        state = sa_inspect(entity, raiseerr=False)
+        detached = state is None or not state.persistent
+        if not detached:
+            changed = {
+                key: value
+                for key, value in after.items()
+                if key != "id" and value != before.get(key)
+            }
+        else:
+            # Detached entity: no history, write every column
+            changed = {
+                key: value for key, value in after.items() if key != "id"
+            }
+        if not changed:
             return entity
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == after["id"])  # type: ignore[attr-defined]
+            .values(**changed)
+            .returning(self.model)
+        )
+        try:
+            # The statement writes the pending changes itself; an autoflush
+            # would send them a second time
+            with self.session.no_autoflush:
+                result = await self.session.exec(
+                    stmt, execution_options={"synchronize_session": "fetch"}
+                )
+                updated = result.scalars().one_or_none()
         except SQLAlchemyError as e:
             await self.session.rollback()
+            if is_unique_violation(e):
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
             logger.error(f"Error updating {self.model.__name__}: {e}")
             raise
 
+        if updated is None:
+            raise NotFoundError(
+                f"{self.model.__name__} with ID {after['id']} not found"
+            )
+
+        after = self._row_values(updated)
+        if detached:
+            # The previous values are unknown (``before`` already holds the
+            # new ones), so the row cannot be moved between counts
+            self._after_commit(invalidate_count_cache, self.model.__name__)
+            self._after_commit(invalidate_page_cache, self.model.__name__)
+        elif before != after:
+            self._after_commit(
+                adjust_cached_counts, self.model.__name__, before, after
+            )
+            self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache, self.model.__name__, [after["id"]]
+        )
+        return updated
+
     async def delete(self, entity: T) -> None:
         """
         Delete entity from database.
@@ -181,6 +401,7 @@ class BaseRepository(Repository[T], Generic[T]):
         Raises:
             SQLAlchemyError: If database operation fails.
         """
+        before = self._row_values(entity)
         try:
             await self.session.delete(entity)
             await self.session.flush()
@@ -189,6 +410,316 @@ class BaseRepository(Repository[T], Generic[T]):
             logger.error(f"Error deleting {self.model.__name__}: {e}")
             raise
 
+        self._after_commit(
+            adjust_cached_counts, self.model.__name__, before, None
+        )
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache, self.model.__name__, [before["id"]]
+        )
+
+    async def create_many(
+        self, entities: Sequence[T], batch_size: int | None = None
+    ) -> list[T]:
+        """
+        Create many entities with multi-row INSERT ... RETURNING.
+
+        Args:
+            entities: Entity instances to create.
+            batch_size: Rows per statement (defaults to
+                ``BULK_BATCH_SIZE``, capped by the bind parameter limit).
+
+        Returns:
+            The created entities with generated fields populated, in input
+            order.
+
+        Raises:
+            ConflictError: If a row violates a unique index.
+            SQLAlchemyError: If database operation fails.
+
+        Examples:
+            >>> repo = AuthorRepository(session)
+            >>> authors = await repo.create_many(
+            ...     [Author(name="Ann"), Author(name="Bob")]
+            ... )
+            >>> [a.id for a in authors]
+            [1, 2]
+        """
+        rows = [self._insert_values(entity) for entity in entities]
+        stmt = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        created: list[T] = []
+        try:
+            for batch in self._batches(rows, batch_size):
+                result = await self.session.exec(stmt, params=batch)
+                created.extend(result.scalars().all())
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            if is_unique_violation(e):
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
+            logger.error(f"Error bulk creating {self.model.__name__}: {e}")
+            raise
+
+        self._after_commit(
+            adjust_cached_counts_many,
+            self.model.__name__,
+            [(None, self._row_values(entity)) for entity in created],
+        )
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache,
+            self.model.__name__,
+            [entity.id for entity in created],  # type: ignore[attr-defined]
+        )
+        return created
+
+    async def copy_many(self, entities: Sequence[T]) -> int:
+        """
+        Insert many entities with the driver's binary COPY.
+
+        The fastest path for large imports, at the cost of not returning
+        generated fields. Runs in the session's transaction. Drivers
+        without COPY support fall back to batched multi-row INSERTs.
+
+        Args:
+            entities: Entity instances to insert.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            ConflictError: If a row violates a unique index.
+            SQLAlchemyError: If database operation fails.
+            PostgresError: If the COPY fails.
+        """
+        rows = [self._insert_values(entity) for entity in entities]
+        if not rows:
+            return 0
+        table = self.model.__table__  # type: ignore[attr-defined]
+        columns = list(rows[0])
+        try:
+            connection = await self.session.connection()
+            raw = await connection.get_raw_connection()
+            driver = raw.driver_connection
+            if hasattr(driver, "copy_records_to_table"):
+                json_columns = {
+                    name
+                    for name in columns
+                    if isinstance(table.c[name].type, JSON)
+                }
+                records = [
+                    tuple(
+                        json.dumps(row[name])
+                        if name in json_columns and row[name] is not None
+                        else row[name]
+                        for name in columns
+                    )
+                    for row in rows
+                ]
+                await driver.copy_records_to_table(
+                    table.name,
+                    records=records,
+                    columns=columns,
+                    schema_name=table.schema,
+                )
+            else:
+                for batch in self._batches(rows, None):
+                    await self.session.exec(insert(self.model), params=batch)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            if is_unique_violation(e):
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
+            logger.error(f"Error copying {self.model.__name__} rows: {e}")
+            raise
+        except PostgresError as e:
+            # Raised by the driver's COPY, outside SQLAlchemy
+            await self.session.rollback()
+            if e.sqlstate == UNIQUE_VIOLATION:
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
+            logger.error(f"Error copying {self.model.__name__} rows: {e}")
+            raise
+
+        self._after_commit(
+            adjust_cached_counts_many,
+            self.model.__name__,
+            [(None, row) for row in rows],
+        )
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        # Generated IDs are not returned: drop the model's cached entries
+        self._after_commit(invalidate_model_entity_cache, self.model.__name__)
+        return len(rows)
+
+    async def update_many(
+        self,
+        values: Sequence[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Update many rows by primary key with one executemany per batch.
+
+        Args:
+            values: Column values per row; each must include ``id`` and
+                all must set the same columns.
+            batch_size: Rows per batch (defaults to ``BULK_BATCH_SIZE``).
+
+        Returns:
+            Number of rows submitted for update.
+
+        Raises:
+            ValueError: If a row has no ``id``.
+            ConflictError: If the new values violate a unique index.
+            SQLAlchemyError: If database operation fails.
+
+        Examples:
+            >>> await repo.update_many(
+            ...     [{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bob"}]
+            ... )
+            2
+        """
+        if any(row.get("id") is None for row in values):
+            raise ValueError("update_many rows must include id")
+        try:
+            for batch in self._batches(list(values), batch_size):
+                await self.session.exec(update(self.model), params=batch)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            if is_unique_violation(e):
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
+            logger.error(f"Error bulk updating {self.model.__name__}: {e}")
+            raise
+
+        if values:
+            self._after_commit(invalidate_count_cache, self.model.__name__)
+            self._after_commit(invalidate_page_cache, self.model.__name__)
+            self._after_commit(
+                invalidate_entity_cache,
+                self.model.__name__,
+                [row["id"] for row in values],
+            )
+        return len(values)
+
+    async def delete_many(
+        self, ids: Sequence[int], batch_size: int | None = None
+    ) -> int:
+        """
+        Delete many rows by primary key with DELETE ... RETURNING.
+
+        Args:
+            ids: Primary keys to delete; unknown ids are ignored.
+            batch_size: Ids per statement (defaults to ``BULK_BATCH_SIZE``).
+
+        Returns:
+            Number of rows deleted.
+
+        Raises:
+            SQLAlchemyError: If database operation fails.
+        """
+        deleted: list[T] = []
+        try:
+            for batch in self._batches(list(ids), batch_size):
+                stmt = (
+                    delete(self.model)
+                    .where(self.model.id.in_(batch))  # type: ignore[attr-defined]
+                    .returning(self.model)
+                )
+                result = await self.session.exec(stmt)
+                deleted.extend(result.scalars().all())
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(f"Error bulk deleting {self.model.__name__}: {e}")
+            raise
+
+        self._after_commit(
+            adjust_cached_counts_many,
+            self.model.__name__,
+            [(self._row_values(entity), None) for entity in deleted],
+        )
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache,
+            self.model.__name__,
+            [entity.id for entity in deleted],  # type: ignore[attr-defined]
+        )
+        return len(deleted)
+
+    async def upsert_many(
+        self,
+        entities: Sequence[T],
+        conflict_columns: Sequence[str] = ("id",),
+        batch_size: int | None = None,
+    ) -> list[T]:
+        """
+        Insert or update many entities with INSERT ... ON CONFLICT.
+
+        Rows conflicting on ``conflict_columns`` (which need a unique index)
+        have their other columns overwritten. When there is no other column
+        to write, existing rows are left as they are and still returned.
+
+        Args:
+            entities: Entity instances to upsert.
+            conflict_columns: Columns identifying an existing row.
+            batch_size: Rows per statement (defaults to
+                ``BULK_BATCH_SIZE``, capped by the bind parameter limit).
+
+        Returns:
+            The inserted or updated entities, in input order.
+
+        Raises:
+            ConflictError: If a row violates another unique index.
+            SQLAlchemyError: If database operation fails.
+        """
+        rows = [self._insert_values(entity) for entity in entities]
+        if not rows:
+            return []
+        stmt = pg_insert(self.model)
+        set_ = {
+            name: stmt.excluded[name]
+            for name in rows[0]
+            if name not in conflict_columns and name != "id"
+        } or {
+            # DO NOTHING would not return existing rows; a no-op update does
+            name: stmt.excluded[name]
+            for name in conflict_columns
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns), set_=set_
+        ).returning(self.model, sort_by_parameter_order=True)
+        upserted: list[T] = []
+        try:
+            for batch in self._batches(rows, batch_size):
+                result = await self.session.exec(
+                    stmt,
+                    params=batch,
+                    execution_options={"populate_existing": True},
+                )
+                upserted.extend(result.scalars().all())
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            if is_unique_violation(e):
+                raise ConflictError(
+                    f"{self.model.__name__} conflicts with an existing row"
+                ) from e
+            logger.error(f"Error bulk upserting {self.model.__name__}: {e}")
+            raise
+
+        self._after_commit(invalidate_count_cache, self.model.__name__)
+        self._after_commit(invalidate_page_cache, self.model.__name__)
+        self._after_commit(
+            invalidate_entity_cache,
+            self.model.__name__,
+            [entity.id for entity in upserted],  # type: ignore[attr-defined]
+        )
+        return upserted
+
     async def exists(self, **filters: Any) -> bool:
         """
         Check if entity exists matching the provided filters.
@@ -214,3 +745,64 @@ class BaseRepository(Repository[T], Generic[T]):
                 f"Error checking existence of {self.model.__name__}: {e}"
             )
             raise
+
+    def _batches(
+        self, rows: list[Any], batch_size: int | None
+    ) -> Iterator[list[Any]]:
+        """
+        Split rows into batches that fit one statement.
+
+        Args:
+            rows: Parameter dicts (or ids) to split.
+            batch_size: Requested batch size (defaults to
+                ``BULK_BATCH_SIZE``).
+
+        Yields:
+            Consecutive slices of ``rows``.
+        """
+        size = batch_size or app_settings.BULK_BATCH_SIZE
+        if rows and isinstance(rows[0], dict):
+            size = min(size, MAX_BIND_PARAMS // max(len(rows[0]), 1))
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
+
+    @staticmethod
+    def _insert_values(entity: Any) -> dict[str, Any]:
+        """
+        Column values to insert for an entity.
+
+        An unset primary key is left out so the database generates it.
+
+        Args:
+            entity: Model instance.
+
+        Returns:
+            Mapping of column attribute name to value.
+        """
+        values = dict(entity.model_dump())
+        if values.get("id") is None:
+            values.pop("id", None)
+        return values
+
+    @staticmethod
+    def _row_values(entity: Any, previous: bool = False) -> dict[str, Any]:
+        """
+        Snapshot an entity's column values for count maintenance.
+
+        Args:
+            entity: Model instance.
+            previous: Return values as last loaded from the database
+                (before unflushed attribute changes).
+
+        Returns:
+            Mapping of column attribute name to value.
+        """
+        values = dict(entity.model_dump())
+        if previous:
+            state = sa_inspect(entity, raiseerr=False)
+            if state is not None:
+                for attr in state.mapper.column_attrs:
+                    history = state.attrs[attr.key].history
+                    if history.deleted:
+                        values[attr.key] = history.deleted[0]
+        return values
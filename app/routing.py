@@ -7,6 +7,7 @@ from typing import Any
 
 from fastapi import APIRouter
 
+from app.api.ws.audit_policy import AuditPolicy
 from app.api.ws.constants import PkgID, RSPCode
 from app.logging import logger
 from fastapi_keycloak_rbac.rbac import rbac_manager
@@ -19,6 +20,9 @@ from app.schemas.request import RequestModel
 from app.schemas.response import ResponseModel
 from fastapi_keycloak_rbac.models import UserModel
 
+# Policy of PkgIDs registered without one
+DEFAULT_AUDIT_POLICY = AuditPolicy.always()
+
 
 class PackageRouter:
     """
@@ -35,12 +39,14 @@ class PackageRouter:
         The `handlers_registry` dictionary maps package IDs to their corresponding handler functions (HandlerCallableType).
         The `validators_registry` dictionary maps package IDs to a tuple containing the JSON schema (JsonSchemaType) and a validator callback function (ValidatorType) for that package ID.
         The `permissions_registry` dictionary maps package IDs to their required roles for access control.
+        The `audit_registry` dictionary maps package IDs to the audit policy of their successful requests.
         """
         self.handlers_registry: dict[PkgID, HandlerCallableType] = {}
         self.validators_registry: dict[
             PkgID, tuple[JsonSchemaType, ValidatorType]
         ] = {}
         self.permissions_registry: dict[PkgID, list[str]] = {}
+        self.audit_registry: dict[PkgID, AuditPolicy] = {}
         self.rbac = rbac_manager
 
     def register(
@@ -49,6 +55,7 @@ class PackageRouter:
         json_schema: JsonSchemaType | None = None,
         validator_callback: ValidatorType | None = None,
         roles: list[str] | None = None,
+        audit: AuditPolicy | None = None,
     ) -> Callable[[HandlerCallableType], HandlerCallableType]:
         """
         Decorator function to register a handler and validator for a specific package ID (PkgID).
@@ -60,6 +67,7 @@ class PackageRouter:
             json_schema (JsonSchemaType | None): An optional JSON schema to validate the request data against.
             validator_callback (ValidatorType | None): An optional callback function to validate the request data against the provided JSON schema.
             roles (list[str] | None): Optional list of roles required to access this endpoint. If None, endpoint is public.
+            audit (AuditPolicy | None): Optional audit policy for successful requests. If None, every request is logged. Failures and permission denials are always logged.
 
         Returns:
             A decorator function that can be used to register a handler function.
@@ -115,6 +123,17 @@ class PackageRouter:
             ...         request.pkg_id, request.req_id, data={}
             ...     )
 
+            >>> # Read-only handler polled often: audit 10% of successes
+            >>> @pkg_router.register(
+            ...     PkgID.GET_STATUS, audit=AuditPolicy.sampled(0.1)
+            ... )
+            ... async def get_status_handler(
+            ...     request: RequestModel,
+            ... ) -> ResponseModel:
+            ...     return ResponseModel.ok_msg(
+            ...         request.pkg_id, request.req_id, data={"status": "ok"}
+            ...     )
+
             >>> # Register multiple PkgIDs to same handler
             >>> @pkg_router.register(PkgID.HEALTH_CHECK, PkgID.PING)
             ... async def health_handler(
@@ -140,9 +159,14 @@ class PackageRouter:
                 if roles:
                     self.permissions_registry[pkg_id] = roles
 
+                # Store audit policy if one is given
+                if audit is not None:
+                    self.audit_registry[pkg_id] = audit
+
                 logger.info(
                     f"Register {func.__module__}.{func.__name__} for PkgID: {pkg_id}"
                     + (f" with roles: {roles}" if roles else "")
+                    + (f" with audit: {audit.mode}" if audit else "")
                 )
 
             return func
@@ -177,6 +201,18 @@ class PackageRouter:
         """
         return self.permissions_registry.get(PkgID(pkg_id), [])
 
+    def get_audit_policy(self, pkg_id: PkgID | int) -> AuditPolicy:
+        """
+        Get the audit policy of a package ID.
+
+        Args:
+            pkg_id: The package ID to get the audit policy for.
+
+        Returns:
+            The registered policy, or the default policy (log every request).
+        """
+        return self.audit_registry.get(PkgID(pkg_id), DEFAULT_AUDIT_POLICY)
+
     def _check_permission(self, pkg_id: int, user: UserModel) -> bool:
         """Check if user has permission for the package ID."""
         return self.rbac.check_ws_permission(
@@ -311,6 +347,7 @@ def collect_subrouters() -> APIRouter:
     pkg_router.handlers_registry.clear()
     pkg_router.validators_registry.clear()
     pkg_router.permissions_registry.clear()
+    pkg_router.audit_registry.clear()
 
     # Initialize main router
     main_router: APIRouter = APIRouter()
@@ -6,7 +6,7 @@ type safety and data integrity before persisting to the database.
 """
 
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -125,3 +125,45 @@ class AuditLogInput(BaseModel):  # type: ignore[misc]
             ]
         }
     }
+
+
+# Rollup dimensions a time series can be split by or ranked on
+RollupDimension = Literal["action_type", "outcome", "user_id"]
+
+
+class AuditRollupPoint(BaseModel):  # type: ignore[misc]
+    """Number of audit log entries in one time bucket (and series)."""
+
+    bucket: datetime = Field(..., description="UTC start of the bucket")
+    key: str | None = Field(
+        None, description="Value of the group_by dimension (if grouped)"
+    )
+    count: int = Field(..., description="Number of audit log entries")
+
+
+class AuditTimeSeries(BaseModel):  # type: ignore[misc]
+    """Audit log counts over time, read from ``user_action_rollups``."""
+
+    bucket: Literal["minute", "hour", "day"] = Field(
+        ..., description="Bucket width"
+    )
+    group_by: RollupDimension | None = Field(
+        None, description="Dimension each series is keyed by"
+    )
+    start: datetime = Field(..., description="Start of the range")
+    end: datetime = Field(..., description="End of the range")
+    points: list[AuditRollupPoint] = Field(
+        ..., description="Points ordered by bucket, then key"
+    )
+    truncated: bool = Field(
+        False,
+        description="True if AUDIT_ROLLUP_MAX_POINTS points were returned "
+        "and more exist; narrow the range or widen the bucket",
+    )
+
+
+class AuditRollupTotal(BaseModel):  # type: ignore[misc]
+    """Number of audit log entries for one value of a dimension."""
+
+    key: str = Field(..., description="Value of the dimension")
+    count: int = Field(..., description="Number of audit log entries")
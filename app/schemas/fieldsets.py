@@ -0,0 +1,129 @@
+"""
+Sparse fieldsets: let clients request only the columns they need.
+
+List endpoints accept a ``fields`` parameter (a comma-separated string over
+HTTP, a list over WebSocket). The requested columns narrow both the SELECT
+(``load_only``, see ``get_paginated_results``) and the serialized items,
+so wide columns such as ``UserAction.request_data`` are neither read nor
+sent unless asked for.
+
+Only columns in the model's allow-list can be requested; the primary key
+is always included so items stay addressable and cursors can be built.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Final
+
+from sqlmodel import SQLModel
+
+from app.exceptions import ValidationError
+from app.schemas.response import MetadataModel
+
+# Columns clients may request, per model name
+SPARSE_FIELDS: Final[dict[str, frozenset[str]]] = {
+    "Author": frozenset({"id", "name"}),
+    "UserAction": frozenset(
+        {
+            "id",
+            "timestamp",
+            "user_id",
+            "username",
+            "user_roles",
+            "action_type",
+            "resource",
+            "outcome",
+            "ip_address",
+            "user_agent",
+            "request_id",
+            "request_data",
+            "response_status",
+            "error_message",
+            "duration_ms",
+        }
+    ),
+}
+
+# Always selected and serialized
+ALWAYS_INCLUDED: Final = "id"
+
+
+def parse_fields(
+    model_name: str, fields: str | Sequence[str] | None
+) -> tuple[str, ...] | None:
+    """
+    Validate a requested fieldset against the model's allow-list.
+
+    Args:
+        model_name: Name of the model being listed.
+        fields: Comma-separated string or list of column names; None or
+            empty requests every column.
+
+    Returns:
+        The requested columns (primary key first, duplicates removed), or
+        None for full rows.
+
+    Raises:
+        ValidationError: If a column is not in the allow-list.
+
+    Example:
+        >>> parse_fields("UserAction", "timestamp,username")
+        ('id', 'timestamp', 'username')
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    requested = [name.strip() for name in fields or () if name.strip()]
+    if not requested:
+        return None
+
+    allowed = SPARSE_FIELDS.get(model_name, frozenset())
+    invalid = sorted(set(requested) - allowed)
+    if invalid:
+        raise ValidationError(
+            f"Invalid fields for {model_name}: {', '.join(invalid)} "
+            f"(allowed: {', '.join(sorted(allowed))})"
+        )
+    return tuple(dict.fromkeys([ALWAYS_INCLUDED, *requested]))
+
+
+def dump_fields(
+    item: SQLModel, fields: Sequence[str] | None, mode: str = "python"
+) -> dict[str, Any]:
+    """
+    Serialize a model instance, restricted to a fieldset.
+
+    Args:
+        item: Model instance (possibly loaded with ``load_only``).
+        fields: Columns from :func:`parse_fields`; None dumps every column.
+        mode: Pydantic dump mode ("python" or "json").
+
+    Returns:
+        Dictionary of the requested columns.
+    """
+    if fields is None:
+        return item.model_dump(mode=mode)
+    return item.model_dump(mode=mode, include=set(fields))
+
+
+def dump_page(
+    items: Sequence[SQLModel],
+    meta: MetadataModel,
+    fields: Sequence[str] | None,
+) -> dict[str, Any]:
+    """
+    Build a JSON-ready paginated response body with sparse items.
+
+    Used instead of ``PaginatedResponseModel`` when a fieldset is
+    requested, since partial items do not validate as full models.
+
+    Args:
+        items: Page items.
+        meta: Pagination metadata.
+        fields: Columns from :func:`parse_fields`.
+
+    Returns:
+        ``{"items": [...], "meta": {...}}``.
+    """
+    return {
+        "items": [dump_fields(item, fields, mode="json") for item in items],
+        "meta": meta.model_dump(mode="json"),
+    }
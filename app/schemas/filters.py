@@ -10,35 +10,96 @@ Key benefits:
 - Runtime validation via Pydantic
 - Self-documenting filter options
 - Security via whitelisted filter fields
+- Index-friendly operators declared per field (see app.storage.filters)
+
+Fields declare their operator with ``FilterSpec`` metadata::
+
+    name_prefix: Annotated[str | None, FilterSpec("prefix", column="name")]
+
+``to_dict()`` then emits ``{"name__prefix": "Jo"}``, which
+``default_apply_filters`` compiles to ``name LIKE 'Jo%'``. Fields without
+a spec keep the legacy inference (strings match as substrings).
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import BaseModel, Field
 
+# Operators understood by app.storage.filters
+FilterOp = Literal["eq", "prefix", "in", "range", "contains", "has"]
+
+
+@dataclass(frozen=True, slots=True)
+class FilterSpec:
+    """
+    Operator of a filter field.
+
+    Attributes:
+        op: Operator applied to the column.
+        column: Model column, if it differs from the field name.
+        bound: For ``range`` fields, which end of the range this field
+            sets; fields sharing a column merge into one range.
+    """
+
+    op: FilterOp
+    column: str | None = None
+    bound: Literal["low", "high"] | None = None
+
 
 class BaseFilter(BaseModel):  # type: ignore[misc]
     """
     Base class for all filter schemas.
 
     Provides common utilities for converting filters to dictionaries
-    and excluding None values.
+    and excluding None values. Field operators are collected once per
+    subclass.
     """
 
+    __filter_specs__: ClassVar[dict[str, FilterSpec]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the FilterSpec of each field when the class is built."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__filter_specs__ = {
+            name: spec
+            for name, info in cls.model_fields.items()
+            for spec in info.metadata
+            if isinstance(spec, FilterSpec)
+        }
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert filter schema to dictionary, excluding None values.
 
+        Fields with a ``FilterSpec`` are keyed ``column__op``; range bounds
+        on the same column merge into one ``[low, high]`` value.
+
         Returns:
             Dictionary of non-None filter values ready for database queries.
 
         Example:
-            >>> filters = AuthorFilters(name="John", id=None)
+            >>> filters = AuthorFilters(name_prefix="John", id=None)
             >>> filters.to_dict()
-            {'name': 'John'}
+            {'name__prefix': 'John'}
         """
-        return {k: v for k, v in self.model_dump().items() if v is not None}
+        result: dict[str, Any] = {}
+        for name, value in self.model_dump().items():
+            if value is None:
+                continue
+            spec = self.__filter_specs__.get(name)
+            if spec is None:
+                result[name] = value
+                continue
+            key = f"{spec.column or name}__{spec.op}"
+            if spec.bound is None:
+                result[key] = value
+            else:
+                bounds = result.setdefault(key, [None, None])
+                bounds[0 if spec.bound == "low" else 1] = value
+        return result
 
     model_config = {
         "extra": "forbid",  # Reject unexpected fields
@@ -49,16 +110,24 @@ class AuthorFilters(BaseFilter):
     """
     Type-safe filters for Author model queries.
 
-    All fields are optional and use OR logic when multiple filters provided.
-    String filters use case-insensitive ILIKE pattern matching.
+    All fields are optional and are combined with AND. ``name`` matches
+    a case-insensitive substring (served by the trigram index on
+    ``author.name``); ``name_prefix`` matches a case-sensitive prefix
+    (served by its ``text_pattern_ops`` index).
 
     Example:
-        >>> # Filter by name (case-insensitive partial match)
+        >>> # Filter by name substring
         >>> filters = AuthorFilters(name="john")
         >>> authors, meta = await get_paginated_results(
         ...     Author, page=1, per_page=20, filters=filters
         ... )
         >>>
+        >>> # Filter by name prefix
+        >>> filters = AuthorFilters(name_prefix="John")
+        >>> authors, meta = await get_paginated_results(
+        ...     Author, page=1, per_page=20, filters=filters
+        ... )
+        >>>
         >>> # Filter by exact ID
         >>> filters = AuthorFilters(id=42)
         >>> authors, meta = await get_paginated_results(
@@ -66,22 +135,30 @@ class AuthorFilters(BaseFilter):
         ... )
     """
 
-    id: int | None = Field(
+    id: Annotated[int | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by exact author ID",
     )
-    name: str | None = Field(
+    name: Annotated[str | None, FilterSpec("contains")] = Field(
         default=None,
         description="Filter by author name (case-insensitive partial match)",
     )
+    name_prefix: Annotated[str | None, FilterSpec("prefix", column="name")] = (
+        Field(
+            default=None,
+            description="Filter by author name prefix (case-sensitive)",
+        )
+    )
 
 
 class UserActionFilters(BaseFilter):
     """
     Type-safe filters for UserAction audit log queries.
 
-    All fields are optional. String filters use case-insensitive ILIKE
-    pattern matching. Datetime filters support range queries.
+    All fields are optional and are combined with AND. Identifiers match
+    exactly, ``resource`` by prefix, ``username`` as a case-insensitive
+    substring, ``role`` as an element of ``user_roles``, and the timestamp
+    bounds form one inclusive range.
 
     Example:
         >>> # Filter by user and outcome
@@ -97,43 +174,53 @@ class UserActionFilters(BaseFilter):
         ... )
     """
 
-    id: int | None = Field(
+    id: Annotated[int | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by exact audit log ID",
     )
-    user_id: str | None = Field(
+    user_id: Annotated[str | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by Keycloak user ID",
     )
-    username: str | None = Field(
+    username: Annotated[str | None, FilterSpec("contains")] = Field(
         default=None,
         description="Filter by username (case-insensitive partial match)",
     )
-    action_type: str | None = Field(
+    action_type: Annotated[str | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by action type (GET, POST, WS:*)",
     )
-    resource: str | None = Field(
+    resource: Annotated[str | None, FilterSpec("prefix")] = Field(
         default=None,
-        description="Filter by resource path",
+        description="Filter by resource path prefix",
     )
-    outcome: str | None = Field(
+    outcome: Annotated[str | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by outcome (success, error, permission_denied)",
     )
-    ip_address: str | None = Field(
+    ip_address: Annotated[str | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by client IP address",
     )
-    request_id: str | None = Field(
+    request_id: Annotated[str | None, FilterSpec("eq")] = Field(
         default=None,
         description="Filter by request correlation ID",
     )
-    timestamp_after: datetime | None = Field(
+    role: Annotated[str | None, FilterSpec("has", column="user_roles")] = (
+        Field(
+            default=None,
+            description="Filter by a role the user had at the time",
+        )
+    )
+    timestamp_after: Annotated[
+        datetime | None, FilterSpec("range", column="timestamp", bound="low")
+    ] = Field(
         default=None,
         description="Filter actions after this timestamp (inclusive)",
     )
-    timestamp_before: datetime | None = Field(
+    timestamp_before: Annotated[
+        datetime | None, FilterSpec("range", column="timestamp", bound="high")
+    ] = Field(
         default=None,
         description="Filter actions before this timestamp (inclusive)",
     )
@@ -16,7 +16,11 @@ class MetadataModel(BaseModel):  # type: ignore[misc]
     next_cursor: str | None = (
         None  # Cursor for next page (cursor-based pagination)
     )
+    prev_cursor: str | None = (
+        None  # Cursor for previous page (keyset pagination)
+    )
     has_more: bool = False  # Whether there are more results available
+    estimated: bool = False  # Whether total is a planner estimate
 
 
 class BroadcastDataModel[GenericSQLModelType](BaseModel):  # type: ignore[misc]
@@ -94,6 +94,14 @@ class Settings(BaseSettings):  # type: ignore[misc]
     WS_MESSAGE_RATE_LIMIT: int = 100
     ALLOWED_WS_ORIGINS: list[str] = ["*"]
 
+    # Cache settings
+    # Codec of new Redis cache entries ("json" or "msgpack"); entries
+    # written by the other codec still decode
+    CACHE_CODEC: Literal["json", "msgpack"] = "json"
+    # Approximate byte budget of each process's in-memory (L1) cache;
+    # 0 bounds it by entry count only
+    CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+
     # Logging settings (flat - will be grouped into nested model)
     LOG_FILE_PATH: str = "logs/logging_errors.log"
     LOG_EXCLUDED_PATHS: list[str] = ["/metrics", "/health"]
@@ -103,10 +111,36 @@ class Settings(BaseSettings):  # type: ignore[misc]
     # Audit settings (flat - will be grouped into nested model)
     AUDIT_LOG_ENABLED: bool = True
     AUDIT_LOG_RETENTION_DAYS: int = 365
+    # Monthly user_actions partitions kept ready ahead of the current one
+    AUDIT_PARTITION_PREMAKE_MONTHS: int = 2
+    AUDIT_PARTITION_MAINTENANCE_INTERVAL: int = 3600
     AUDIT_QUEUE_MAX_SIZE: int = 10000
     AUDIT_BATCH_SIZE: int = 100
     AUDIT_BATCH_TIMEOUT: float = 1.0
     AUDIT_QUEUE_TIMEOUT: float = 1.0
+    # "copy": binary COPY from tuples; "orm": session.add_all + flush
+    AUDIT_WRITER: Literal["copy", "orm"] = "copy"
+    # Concurrent writer tasks draining the queue
+    AUDIT_WORKERS: int = 2
+    # Batches grow from AUDIT_BATCH_SIZE up to this while the queue backs up
+    AUDIT_MAX_BATCH_SIZE: int = 1000
+    # Pool connections audit writes may hold at once (capped at half the pool)
+    AUDIT_DB_CONNECTIONS: int = 2
+    # "queue": in-process queue; "redis": XADD to a Redis Stream consumed
+    # by a consumer group (in the app and/or `cli.py audit-consumer`)
+    AUDIT_TRANSPORT: Literal["queue", "redis"] = "queue"
+    AUDIT_STREAM_KEY: str = "audit:actions"
+    AUDIT_STREAM_GROUP: str = "audit-writers"
+    AUDIT_STREAM_MAXLEN: int = 1_000_000
+    AUDIT_STREAM_CONSUMER_IN_APP: bool = True
+    # Pending entries idle this long are claimed again (retry)
+    AUDIT_STREAM_CLAIM_IDLE_MS: int = 60_000
+    # Deliveries before an entry is moved to "<AUDIT_STREAM_KEY>:dead"
+    AUDIT_STREAM_MAX_DELIVERIES: int = 5
+    # Per-minute counters in user_action_rollups, upserted with each batch
+    AUDIT_ROLLUPS_ENABLED: bool = True
+    # Most rows a rollup time-series query returns
+    AUDIT_ROLLUP_MAX_POINTS: int = 10_000
 
     # Profiling settings (flat - will be grouped into nested model)
     PROFILING_ENABLED: bool = True
@@ -125,6 +159,31 @@ class Settings(BaseSettings):  # type: ignore[misc]
         r"^(/docs|/openapi.json|/health|/metrics)$"
     )
     DEFAULT_PAGE_SIZE: int = 20
+    # "estimated" pagination totals below this are counted exactly
+    PAGINATION_EXACT_COUNT_THRESHOLD: int = 10000
+    # Seconds between recounts of incrementally maintained pagination counts
+    PAGINATION_COUNT_RECONCILE_INTERVAL: int = 300
+    # Read-ahead of the next offset page into the cache (opt-in callers)
+    PAGINATION_PREFETCH_ENABLED: bool = False
+    PAGINATION_PREFETCH_MODELS: list[str] = ["Author"]
+    PAGINATION_PREFETCH_TTL: int = 30
+    PAGINATION_PREFETCH_CONCURRENCY: int = 4
+    # Default number of ranked matches returned by trigram search
+    SEARCH_RESULT_LIMIT: int = 20
+    # Rows per statement for bulk repository writes
+    BULK_BATCH_SIZE: int = 1000
+    # Rows fetched per round trip by streaming NDJSON exports
+    EXPORT_FETCH_SIZE: int = 1000
+    # zlib level of gzipped exports (1 = fastest, 9 = smallest)
+    EXPORT_GZIP_LEVEL: int = 6
+    # Pool connections running exports may hold at once (capped at a
+    # quarter of the pool); further exports wait for a slot
+    EXPORT_DB_CONNECTIONS: int = 2
+    # Batch concurrent get_by_id/get_by_ids lookups into one IN query
+    DATALOADER_ENABLED: bool = False
+    # 0 = dispatch on the next event loop iteration
+    DATALOADER_BATCH_WINDOW_MS: float = 0
+    DATALOADER_MAX_BATCH_SIZE: int = 1000
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize settings with environment-specific defaults."""
@@ -247,10 +306,27 @@ class Settings(BaseSettings):  # type: ignore[misc]
             audit=AuditSettings(
                 ENABLED=self.AUDIT_LOG_ENABLED,
                 RETENTION_DAYS=self.AUDIT_LOG_RETENTION_DAYS,
+                PARTITION_PREMAKE_MONTHS=self.AUDIT_PARTITION_PREMAKE_MONTHS,
+                PARTITION_MAINTENANCE_INTERVAL=(
+                    self.AUDIT_PARTITION_MAINTENANCE_INTERVAL
+                ),
                 QUEUE_MAX_SIZE=self.AUDIT_QUEUE_MAX_SIZE,
                 BATCH_SIZE=self.AUDIT_BATCH_SIZE,
                 BATCH_TIMEOUT=self.AUDIT_BATCH_TIMEOUT,
                 QUEUE_TIMEOUT=self.AUDIT_QUEUE_TIMEOUT,
+                WRITER=self.AUDIT_WRITER,
+                WORKERS=self.AUDIT_WORKERS,
+                MAX_BATCH_SIZE=self.AUDIT_MAX_BATCH_SIZE,
+                DB_CONNECTIONS=self.AUDIT_DB_CONNECTIONS,
+                TRANSPORT=self.AUDIT_TRANSPORT,
+                STREAM_KEY=self.AUDIT_STREAM_KEY,
+                STREAM_GROUP=self.AUDIT_STREAM_GROUP,
+                STREAM_MAXLEN=self.AUDIT_STREAM_MAXLEN,
+                STREAM_CONSUMER_IN_APP=self.AUDIT_STREAM_CONSUMER_IN_APP,
+                STREAM_CLAIM_IDLE_MS=self.AUDIT_STREAM_CLAIM_IDLE_MS,
+                STREAM_MAX_DELIVERIES=self.AUDIT_STREAM_MAX_DELIVERIES,
+                ROLLUPS_ENABLED=self.AUDIT_ROLLUPS_ENABLED,
+                ROLLUP_MAX_POINTS=self.AUDIT_ROLLUP_MAX_POINTS,
             ),
         )
 
@@ -90,10 +90,25 @@ class AuditSettings(BaseModel):  # type: ignore[misc]
 
     ENABLED: bool = True
     RETENTION_DAYS: int = 365
+    PARTITION_PREMAKE_MONTHS: int = 2
+    PARTITION_MAINTENANCE_INTERVAL: int = 3600
     QUEUE_MAX_SIZE: int = 10000
     BATCH_SIZE: int = 100
     BATCH_TIMEOUT: float = 1.0
     QUEUE_TIMEOUT: float = 1.0
+    WRITER: Literal["copy", "orm"] = "copy"
+    WORKERS: int = 2
+    MAX_BATCH_SIZE: int = 1000
+    DB_CONNECTIONS: int = 2
+    TRANSPORT: Literal["queue", "redis"] = "queue"
+    STREAM_KEY: str = "audit:actions"
+    STREAM_GROUP: str = "audit-writers"
+    STREAM_MAXLEN: int = 1_000_000
+    STREAM_CONSUMER_IN_APP: bool = True
+    STREAM_CLAIM_IDLE_MS: int = 60_000
+    STREAM_MAX_DELIVERIES: int = 5
+    ROLLUPS_ENABLED: bool = True
+    ROLLUP_MAX_POINTS: int = 10_000
 
 
 class LoggingSettings(BaseModel):  # type: ignore[misc]
@@ -0,0 +1,137 @@
+"""
+Cache updates deferred until a session's transaction commits.
+
+Repository writes adjust tracked pagination counts and drop cached pages
+and entities. Made right after the flush, those updates would already be
+visible while the transaction can still roll back (leaving a count off by
+one until reconciliation) and would race readers of the pre-commit rows.
+Instead, writes queue them on ``session.info`` with :func:`after_commit`:
+
+- when the transaction commits, the queued updates start in order in a
+  task, which :class:`AfterCommitSession` awaits before ``commit()``
+  returns or its ``async with`` block exits, so a read made after the
+  write returns sees the invalidated cache;
+- when it rolls back, they are discarded.
+
+Sessions of other classes leave the task running in the background. Other
+workers' memory caches are still invalidated asynchronously, by Redis
+client tracking once the keys are deleted.
+
+Rolling back to a savepoint does not discard updates queued inside it;
+the periodic count reconciliation corrects any resulting drift.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.logging import logger
+
+# session.info key of the updates queued by the current transaction
+PENDING_KEY: Final = "after_commit"
+
+# session.info key of the update tasks of committed transactions
+RUNNING_KEY: Final = "after_commit_tasks"
+
+CacheUpdate = Callable[[], Awaitable[Any]]
+
+# Holds references to running update tasks until they finish
+_tasks: set[asyncio.Task[None]] = set()
+
+
+def after_commit(session: Any, update: CacheUpdate) -> None:
+    """
+    Queue a cache update to run once the session commits.
+
+    Args:
+        session: Sync or async session whose transaction made the write.
+        update: Coroutine function to run after the commit.
+    """
+    session.info.setdefault(PENDING_KEY, []).append(update)
+
+
+async def apply_updates(updates: list[CacheUpdate]) -> None:
+    """
+    Run queued cache updates in order.
+
+    A failing update is logged and does not stop the following ones.
+
+    Args:
+        updates: Updates queued by one committed transaction.
+    """
+    for update in updates:
+        try:
+            await update()
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Error applying cache update after commit: {e}")
+
+
+async def wait_for_updates() -> None:
+    """Wait for the cache updates of committed transactions to finish."""
+    while _tasks:
+        await asyncio.gather(*_tasks)
+
+
+async def wait_for_session_updates(session: Any) -> None:
+    """
+    Wait for the cache updates of a session's committed transactions.
+
+    The tasks are not cancelled if the caller is.
+
+    Args:
+        session: Sync or async session that committed.
+    """
+    tasks = session.info.pop(RUNNING_KEY, None)
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+class AfterCommitSession(AsyncSession):
+    """
+    Async session that waits for its cache updates after each commit.
+
+    ``commit()`` returns, and ``async with`` exits (after a commit made
+    by ``session.begin()``), only once the updates queued by the
+    committed writes have run.
+    """
+
+    async def commit(self) -> None:
+        """Commit, then wait for the transaction's cache updates."""
+        await super().commit()
+        await wait_for_session_updates(self)
+
+    async def __aexit__(self, type_: Any, value: Any, traceback: Any) -> None:
+        """Close the session, then wait for pending cache updates."""
+        try:
+            await super().__aexit__(type_, value, traceback)
+        finally:
+            await wait_for_session_updates(self)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    """Start the transaction's queued updates."""
+    updates = session.info.pop(PENDING_KEY, None)
+    if not updates:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning(
+            f"No event loop after commit, dropped {len(updates)} cache updates"
+        )
+        return
+    task = loop.create_task(apply_updates(updates), name="after_commit")
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    session.info.setdefault(RUNNING_KEY, []).append(task)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    """Discard the updates of a rolled-back transaction."""
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,164 @@
+"""
+Batching of concurrent by-ID lookups (DataLoader pattern).
+
+Every handler runs its own session, so N connections asking for N authors
+in the same tick cost N ``SELECT ... WHERE id = :id`` queries and N pool
+checkouts. A :class:`DataLoader` collects the ids requested by concurrent
+callers within one event loop iteration (or ``DATALOADER_BATCH_WINDOW_MS``)
+and fetches them with a single ``WHERE id IN (...)`` query in its own
+session, then hands each caller its row.
+
+Loaders are process-wide, one per model (see :func:`get_loader`), because
+the callers being batched belong to different requests. Returned rows are
+detached and shared between callers; repositories merge them into their
+own session before use (see ``BaseRepository.get_by_id``).
+"""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Generic, Type, TypeVar
+
+from sqlmodel import select
+
+from app.logging import logger
+from app.settings import app_settings
+from app.utils.metrics.database import (
+    dataloader_batch_size,
+    dataloader_loads_total,
+    dataloader_queries_total,
+)
+
+T = TypeVar("T")
+
+
+class DataLoader(Generic[T]):
+    """
+    Coalesces concurrent primary-key lookups of one model into batches.
+
+    Concurrent loads of the same id share one future, so each id is
+    queried once per batch. A batch is dispatched on the next loop
+    iteration (or after the batch window), or as soon as it reaches
+    ``DATALOADER_MAX_BATCH_SIZE`` ids.
+    """
+
+    def __init__(self, model: Type[T]):
+        """
+        Initialize the loader.
+
+        Args:
+            model: The SQLModel class to load (must have an ``id`` column).
+        """
+        self.model = model
+        self._pending: dict[int, asyncio.Future[T | None]] = {}
+        self._handle: asyncio.Handle | None = None
+        # Holds references to running batches until they finish
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def load(self, id: int) -> T | None:
+        """
+        Load one row by primary key.
+
+        Args:
+            id: Primary key value.
+
+        Returns:
+            The detached row, or None if it does not exist.
+        """
+        dataloader_loads_total.labels(model=self.model.__name__).inc()
+        # Shielded: a cancelled caller must not cancel the shared future
+        return await asyncio.shield(self._future(id))
+
+    async def load_many(self, ids: Sequence[int]) -> list[T | None]:
+        """
+        Load rows by primary key.
+
+        Args:
+            ids: Primary key values.
+
+        Returns:
+            Detached rows aligned with ``ids`` (None where missing).
+        """
+        dataloader_loads_total.labels(model=self.model.__name__).inc(len(ids))
+        futures = [self._future(id) for id in ids]
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def _future(self, id: int) -> asyncio.Future[T | None]:
+        """Return the pending future of an id, queueing it if needed."""
+        future = self._pending.get(id)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[id] = future
+        if len(self._pending) >= app_settings.DATALOADER_MAX_BATCH_SIZE:
+            self._dispatch()
+        elif self._handle is None:
+            window = app_settings.DATALOADER_BATCH_WINDOW_MS / 1000
+            if window > 0:
+                self._handle = loop.call_later(window, self._dispatch)
+            else:
+                self._handle = loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        """Start a batch query for every pending id."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        task = asyncio.create_task(
+            self._run_batch(pending),
+            name=f"dataloader:{self.model.__name__}",
+        )
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, pending: dict[int, asyncio.Future[T | None]]
+    ) -> None:
+        """Fetch a batch in its own session and resolve its futures."""
+        from app.storage.db import async_session
+
+        model_name = self.model.__name__
+        dataloader_batch_size.labels(model=model_name).observe(len(pending))
+        dataloader_queries_total.labels(model=model_name).inc()
+        try:
+            stmt = select(self.model).where(
+                self.model.id.in_(list(pending))  # type: ignore[attr-defined]
+            )
+            async with async_session() as session:
+                rows = (await session.exec(stmt)).all()
+        except Exception as ex:  # noqa: BLE001
+            logger.error(f"Batched load of {model_name} failed: {ex}")
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        found = {row.id: row for row in rows}  # type: ignore[attr-defined]
+        for id, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(id))
+
+
+_loaders: dict[type, DataLoader] = {}  # type: ignore[type-arg]
+
+
+def get_loader(model: Type[T]) -> DataLoader[T]:
+    """
+    Get the process-wide loader of a model.
+
+    Args:
+        model: The SQLModel class to load.
+
+    Returns:
+        The model's DataLoader.
+    """
+    loader = _loaders.get(model)
+    if loader is None:
+        loader = _loaders[model] = DataLoader(model)
+    return loader
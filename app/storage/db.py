@@ -1,6 +1,7 @@
 import asyncio
 import base64
-from typing import Any, Callable, Type
+from collections.abc import Sequence
+from typing import Any, Callable, Literal, Type
 
 from pydantic import BaseModel as PydanticBaseModel
 from sqlalchemy import Select
@@ -17,6 +18,8 @@ from app.logging import logger
 from app.schemas.generic_typing import GenericSQLModelType
 from app.schemas.response import MetadataModel
 from app.settings import app_settings
+from app.storage.after_commit import AfterCommitSession
+from app.storage.filters import apply_filter_ops
 from app.utils.query_monitor import enable_query_monitoring
 
 # Enable database query performance monitoring
@@ -31,7 +34,7 @@ engine: AsyncEngine = create_async_engine(
     pool_pre_ping=app_settings.DB_POOL_PRE_PING,
 )
 async_session = sessionmaker(
-    engine, expire_on_commit=False, class_=AsyncSession
+    engine, expire_on_commit=False, class_=AfterCommitSession
 )
 
 
@@ -165,6 +168,10 @@ async def get_paginated_results(
     skip_count: bool = False,
     cursor: str | None = None,
     eager_load: list[str] | None = None,
+    order_by: list[str] | None = None,
+    count_mode: Literal["exact", "window", "estimated"] = "exact",
+    prefetch: bool = False,
+    fields: Sequence[str] | None = None,
 ) -> tuple[list[GenericSQLModelType], MetadataModel]:
     """
     Get paginated results from a SQLModel query with cursor and eager loading support.
@@ -193,6 +200,10 @@ async def get_paginated_results(
         skip_count (bool, optional): Skip the count query for performance. When True, total will be 0. Defaults to False.
         cursor (str | None, optional): Base64-encoded cursor for cursor-based pagination. When provided, page parameter is ignored.
         eager_load (list[str] | None, optional): List of relationship names to eager load to prevent N+1 queries.
+        order_by (list[str] | None, optional): Field names to order by, prefixed with ``-`` for descending (e.g. ``["-timestamp", "-id"]``). Combined with a cursor (``""`` for the first page) this uses keyset pagination, which seeks on these columns in both directions.
+        count_mode (Literal["exact", "window", "estimated"], optional): How the total is computed on a count cache miss. "exact" runs a separate COUNT query; "window" returns the page and ``COUNT(*) OVER ()`` in one statement; "estimated" uses table statistics (unfiltered) or the planner's EXPLAIN estimate (filtered), counting exactly only below ``PAGINATION_EXACT_COUNT_THRESHOLD``, and sets ``meta.estimated``. Defaults to "exact".
+        prefetch (bool, optional): Opt in to read-ahead for offset pages. When enabled via ``PAGINATION_PREFETCH_ENABLED`` and the read is eligible (model in ``PAGINATION_PREFETCH_MODELS``, default filters, exact count, no eager loading or ``fields``), the next page is fetched in the background and cached, and a cached page is served without querying. Leave False when the caller's session holds uncommitted writes. Defaults to False.
+        fields (Sequence[str] | None, optional): Sparse fieldset (validated with ``app.schemas.fieldsets.parse_fields``). Only these columns, the primary key and the ordering columns are loaded; the rest are left out of the SELECT and missing from ``model_dump()``. Serialize with ``dump_fields``. Defaults to None (full rows).
 
     Returns:
         tuple[list[GenericSQLModelType], MetadataModel]: A tuple containing the list of results and a `MetadataModel` instance with pagination metadata. When using cursor pagination, next_cursor and has_more fields will be populated.
@@ -218,8 +229,20 @@ async def get_paginated_results(
         ...     eager_load=["books"],  # Load books relationship
         ... )
         >>> # Use meta.next_cursor for next page
+
+        >>> # Keyset pagination on an arbitrary ordering
+        >>> logs, meta = await get_paginated_results(
+        ...     UserAction, cursor="", order_by=["-timestamp", "-id"]
+        ... )
+        >>> # meta.next_cursor / meta.prev_cursor page forward / backward
     """
     from app.storage.pagination.factory import select_strategy
+    from app.storage.pagination.keyset import apply_ordering, parse_order_by
+    from app.storage.pagination.prefetch import (
+        get_prefetched_page,
+        prefetch_eligible,
+        schedule_prefetch,
+    )
     from app.storage.pagination.query_builder import (
         build_query,
         convert_filters,
@@ -237,8 +260,40 @@ async def get_paginated_results(
     # Convert filters to dict
     filter_dict = convert_filters(filters)
 
+    # Serve a page read ahead by a previous request, then read ahead again
+    read_ahead = prefetch and prefetch_eligible(
+        model,
+        filter_dict,
+        cursor=cursor,
+        apply_filters=apply_filters,
+        eager_load=eager_load,
+        skip_count=skip_count,
+        count_mode=count_mode,
+        fields=fields,
+    )
+    if read_ahead:
+        cached = await get_prefetched_page(
+            model, page, per_page, filter_dict, order_by
+        )
+        if cached is not None:
+            if cached[1].has_more:
+                schedule_prefetch(
+                    model, page + 1, per_page, filter_dict, order_by
+                )
+            return cached
+
+    # Sparse fieldsets also load the columns cursors are built from
+    columns = None
+    if fields:
+        columns = {*fields, "id"}
+        columns.update(name.lstrip("-+") for name in order_by or ())
+
     # Build query with filters and eager loading
-    query = build_query(model, filter_dict, apply_filters, eager_load)
+    query = build_query(model, filter_dict, apply_filters, eager_load, columns)
+
+    # Offset pages honour the same ordering (keyset applies its own)
+    if order_by and cursor is None:
+        query = apply_ordering(query, parse_order_by(model, order_by))
 
     # Select and execute pagination strategy.
     # If the caller passes a session, reuse it so pagination runs in the same
@@ -254,14 +309,20 @@ async def get_paginated_results(
             skip_count=skip_count,
             filter_dict=filter_dict,
             apply_filters_func=apply_filters,
+            order_by=order_by,
+            count_mode=count_mode,
         )
         return await strategy.paginate(query, model, per_page)
 
     if session is not None:
-        return await _run(session)
+        items, meta = await _run(session)
+    else:
+        async with async_session() as new_session:
+            items, meta = await _run(new_session)
 
-    async with async_session() as new_session:
-        return await _run(new_session)
+    if read_ahead and meta.has_more:
+        schedule_prefetch(model, page + 1, per_page, filter_dict, order_by)
+    return items, meta
 
 
 def default_apply_filters(
@@ -270,8 +331,11 @@ def default_apply_filters(
     """
     Apply default filters to a SQLModel query.
 
-    String filters use case-insensitive ILIKE pattern matching with wildcards.
-    Other types use exact equality matching or IN clauses for lists/tuples.
+    Keys follow the operator grammar of :mod:`app.storage.filters`:
+    ``field__op`` applies an explicit operator (``eq``, ``prefix``, ``in``,
+    ``range``, ``contains``). Plain ``field`` keys keep the legacy
+    behaviour: string filters use case-insensitive ILIKE pattern matching,
+    other types use exact equality or IN clauses for lists/tuples.
 
     Args:
         query (Select): The SQLModel query to apply filters to.
@@ -282,23 +346,7 @@ def default_apply_filters(
         Select: The updated query with the filters applied.
 
     Raises:
-        ValueError: If a filter key is not an attribute of the SQLModel class.
+        ValueError: If a filter key is not an attribute of the SQLModel class
+            or names an unknown operator.
     """
-    for key, value in filters.items():
-        if hasattr(model, key):
-            attr = getattr(model, key)
-            if isinstance(value, (list, tuple)):
-                query = query.filter(attr.in_(value))
-            elif isinstance(value, str):
-                # Strip leading/trailing wildcards to prevent logical injection
-                # (e.g. "%a%b%" turning a cheap filter into a full-table scan)
-                # and enforce a max length to limit DB load.
-                sanitized = value.strip("%")[:255]
-                query = query.filter(attr.ilike(f"%{sanitized}%"))
-            else:
-                query = query.filter(attr == value)
-        else:
-            raise ValueError(
-                f"Invalid filter: {key} is not an attribute of {model.__name__}"
-            )
-    return query
+    return apply_filter_ops(query, model, filters)
@@ -0,0 +1,200 @@
+"""
+Streaming NDJSON exports.
+
+List endpoints return at most ``MAX_PAGE_SIZE`` rows per request; exports
+stream every matching row in one response instead. Rows are read through
+a server-side cursor (``AsyncSession.stream_scalars`` with ``yield_per``),
+``EXPORT_FETCH_SIZE`` at a time, serialized as one JSON object per line
+and sent in chunks of about ``EXPORT_CHUNK_BYTES`` (optionally gzipped on
+the fly). Only one fetch and one chunk are held at any time, so memory
+stays constant whatever the size of the export.
+
+An export holds a pool connection for as long as the client takes to
+download it, so at most :func:`export_connection_budget` exports read at
+once; further exports wait for a slot before their query runs.
+
+The status line and headers are sent before the first row is read: if the
+query fails mid-export the connection is closed and the client receives a
+truncated file.
+"""
+
+import asyncio
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Final, Type
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
+from sqlmodel import SQLModel, select
+
+from app.logging import logger
+from app.schemas.filters import BaseFilter
+from app.settings import app_settings
+from app.storage.db import async_session
+from app.storage.filters import apply_filter_ops
+from app.storage.pagination.keyset import apply_ordering, parse_order_by
+
+# Bytes of NDJSON buffered before a chunk is sent
+EXPORT_CHUNK_BYTES: Final = 64 * 1024
+
+NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
+GZIP_MEDIA_TYPE: Final = "application/gzip"
+
+# Connection budget shared by running exports (initialized lazily)
+_export_slots: asyncio.Semaphore | None = None
+
+
+def export_connection_budget() -> int:
+    """
+    Number of pool connections exports may hold at once.
+
+    ``EXPORT_DB_CONNECTIONS``, capped at a quarter of the engine's pool
+    (``DB_POOL_SIZE + DB_MAX_OVERFLOW``) so that slow downloads cannot
+    starve request handlers and audit writers of connections.
+
+    Returns:
+        The budget, at least 1.
+    """
+    pool = app_settings.DB_POOL_SIZE + app_settings.DB_MAX_OVERFLOW
+    return max(1, min(app_settings.EXPORT_DB_CONNECTIONS, pool // 4))
+
+
+def get_export_slots() -> asyncio.Semaphore:
+    """
+    Get or create the semaphore enforcing the export connection budget.
+
+    Returns:
+        Semaphore with :func:`export_connection_budget` slots.
+    """
+    global _export_slots
+    if _export_slots is None:
+        _export_slots = asyncio.Semaphore(export_connection_budget())
+    return _export_slots
+
+
+def export_query(
+    model: Type[SQLModel],
+    filters: BaseFilter | None = None,
+    fields: Sequence[str] | None = None,
+    order_by: Sequence[str] | None = None,
+) -> Select[Any]:
+    """
+    Build the query of an export, in primary key order by default.
+
+    Args:
+        model: Model to export.
+        filters: Filter schema, compiled like ``get_paginated_results``.
+        fields: Columns from ``parse_fields``; None loads every column.
+        order_by: Field names, ``-`` prefixed for descending, with ``id``
+            appended as a tie-breaker (see ``parse_order_by``); None
+            orders by the primary key.
+
+    Returns:
+        SELECT over the matching rows.
+    """
+    query = select(model)
+    if filters is not None:
+        query = apply_filter_ops(query, model, filters.to_dict())
+    if fields is not None:
+        query = query.options(
+            load_only(*(getattr(model, name) for name in fields))
+        )
+    if order_by is not None:
+        return apply_ordering(query, parse_order_by(model, order_by))
+    return query.order_by(*sa_inspect(model).primary_key)
+
+
+async def ndjson_lines(
+    query: Select[Any], fields: Sequence[str] | None = None
+) -> AsyncIterator[bytes]:
+    """
+    Stream query results as NDJSON chunks.
+
+    Holds one slot of the export connection budget, and its connection,
+    until the last row is read.
+
+    Args:
+        query: ORM query from :func:`export_query`.
+        fields: Columns to serialize; None serializes every column.
+
+    Yields:
+        Chunks of complete lines, about ``EXPORT_CHUNK_BYTES`` each.
+    """
+    include = set(fields) if fields is not None else None
+    buffer = bytearray()
+    rows = 0
+    async with get_export_slots(), async_session() as session:
+        try:
+            result = await session.stream_scalars(
+                query,
+                execution_options={
+                    "yield_per": app_settings.EXPORT_FETCH_SIZE
+                },
+            )
+            async for item in result:
+                buffer += item.model_dump_json(include=include).encode()
+                buffer += b"\n"
+                rows += 1
+                if len(buffer) >= EXPORT_CHUNK_BYTES:
+                    yield bytes(buffer)
+                    buffer.clear()
+        except SQLAlchemyError as ex:
+            logger.error(f"Export aborted after {rows} rows: {ex}")
+            raise
+    if buffer:
+        yield bytes(buffer)
+    logger.debug(f"Exported {rows} rows")
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Gzip a byte stream on the fly.
+
+    Args:
+        chunks: Uncompressed chunks.
+
+    Yields:
+        Chunks of one gzip member (empty compressor output is skipped).
+    """
+    compressor = zlib.compressobj(
+        app_settings.EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+    async for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def ndjson_response(
+    query: Select[Any],
+    filename: str,
+    fields: Sequence[str] | None = None,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """
+    Stream an export as an NDJSON file download.
+
+    Args:
+        query: ORM query from :func:`export_query`.
+        filename: Download name without extension.
+        fields: Columns to serialize; None serializes every column.
+        gzip: Compress the stream (``<filename>.ndjson.gz``).
+
+    Returns:
+        Response streaming the file.
+    """
+    body = ndjson_lines(query, fields)
+    filename = f"{filename}.ndjson"
+    media_type = NDJSON_MEDIA_TYPE
+    if gzip:
+        body = gzip_chunks(body)
+        filename = f"{filename}.gz"
+        media_type = GZIP_MEDIA_TYPE
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,198 @@
+"""
+Filter operator grammar compiled to index-friendly SQL predicates.
+
+Filter dicts map keys to values. A key is either a plain field name
+(legacy inference: strings match as case-insensitive substrings, lists as
+``IN``, anything else by equality) or ``field__op`` with an explicit
+operator:
+
+- ``eq``: ``column = value`` (btree)
+- ``prefix``: ``column LIKE 'value%'`` (btree with ``text_pattern_ops``)
+- ``in``: ``column IN (...)`` (btree)
+- ``range``: ``low <= column <= high``; ``[low, high]``, either bound may
+  be None (btree)
+- ``contains``: ``column ILIKE '%value%'`` (needs a trigram index)
+- ``has``: ``column @> '[value]'``, a JSONB array holding the value (GIN)
+
+Keys are resolved against the model once and cached, so applying filters
+on the request path does no attribute lookups or string parsing.
+``BaseFilter`` subclasses declare operators per field (see
+``app.schemas.filters``).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final, Type, get_args
+
+from sqlalchemy import ColumnElement, Select, and_, true
+from sqlalchemy import inspect as sa_inspect
+
+from app.schemas.filters import FilterOp
+from app.schemas.generic_typing import GenericSQLModelType
+
+# Separates the field name from the operator in filter keys
+OP_SEPARATOR: Final = "__"
+
+FILTER_OPS: Final[tuple[str, ...]] = get_args(FilterOp)
+
+# Longest text matched by prefix/contains filters (limits DB load)
+MAX_PATTERN_LENGTH: Final = 255
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFilter:
+    """A filter key resolved against a model."""
+
+    field: str
+    column: Any
+    op: FilterOp | None  # None = infer from the value (legacy keys)
+
+
+def parse_filter_key(key: str) -> tuple[str, FilterOp | None]:
+    """
+    Split a filter key into field name and operator.
+
+    Args:
+        key: ``field`` or ``field__op``.
+
+    Returns:
+        Tuple of (field, operator or None for plain keys).
+
+    Raises:
+        ValueError: If the operator is unknown.
+    """
+    field, separator, op = key.rpartition(OP_SEPARATOR)
+    if not separator:
+        return key, None
+    if op not in FILTER_OPS:
+        raise ValueError(
+            f"Invalid filter operator: {op} (expected one of "
+            f"{', '.join(FILTER_OPS)})"
+        )
+    return field, op  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=None)
+def _model_columns(model: type) -> dict[str, Any]:
+    """Map a model's column attribute names to their instrumented columns."""
+    return {
+        attr.key: getattr(model, attr.key)
+        for attr in sa_inspect(model).column_attrs
+    }
+
+
+@lru_cache(maxsize=1024)
+def compile_filter(
+    model: Type[GenericSQLModelType], key: str
+) -> CompiledFilter:
+    """
+    Resolve a filter key against a model (cached per model and key).
+
+    Args:
+        model: The SQLModel class being queried.
+        key: Filter key, ``field`` or ``field__op``.
+
+    Returns:
+        The compiled filter.
+
+    Raises:
+        ValueError: If the field is not a column of the model or the
+            operator is unknown.
+    """
+    field, op = parse_filter_key(key)
+    column = _model_columns(model).get(field)
+    if column is None:
+        raise ValueError(
+            f"Invalid filter: {field} is not an attribute of {model.__name__}"
+        )
+    return CompiledFilter(field, column, op)
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the value matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def filter_predicate(
+    compiled: CompiledFilter, value: Any
+) -> ColumnElement[bool]:
+    """
+    Build the SQL predicate of one compiled filter.
+
+    Args:
+        compiled: Filter resolved by :func:`compile_filter`.
+        value: Filter value.
+
+    Returns:
+        SQLAlchemy boolean expression.
+
+    Raises:
+        ValueError: If the value does not fit the operator.
+    """
+    column = compiled.column
+    op = compiled.op
+
+    if op is None:
+        if isinstance(value, (list, tuple)):
+            return column.in_(value)
+        if isinstance(value, str):
+            # Strip leading/trailing wildcards to prevent logical injection
+            # (e.g. "%a%b%" turning a cheap filter into a full-table scan)
+            # and enforce a max length to limit DB load.
+            sanitized = value.strip("%")[:MAX_PATTERN_LENGTH]
+            return column.ilike(f"%{sanitized}%")
+        return column == value
+
+    if op == "eq":
+        return column == value
+    if op == "in":
+        if not isinstance(value, (list, tuple)):
+            raise ValueError(f"Filter {compiled.field}__in expects a list")
+        return column.in_(value)
+    if op == "range":
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            raise ValueError(
+                f"Filter {compiled.field}__range expects [low, high]"
+            )
+        low, high = value
+        bounds = []
+        if low is not None:
+            bounds.append(column >= low)
+        if high is not None:
+            bounds.append(column <= high)
+        return and_(*bounds) if bounds else true()
+    if op == "has":
+        return column.contains([value])
+
+    pattern = escape_like(str(value)[:MAX_PATTERN_LENGTH])
+    if op == "prefix":
+        # Anchored, case-sensitive: a range scan on text_pattern_ops
+        return column.like(f"{pattern}%", escape="\\")
+    return column.ilike(f"%{pattern}%", escape="\\")
+
+
+def apply_filter_ops(
+    query: Select[Any],
+    model: Type[GenericSQLModelType],
+    filters: dict[str, Any],
+) -> Select[Any]:
+    """
+    Apply a filter dict to a query using the operator grammar.
+
+    Args:
+        query: The query to filter.
+        model: The SQLModel class being queried.
+        filters: Filter dict (see module docstring for the key grammar).
+
+    Returns:
+        The filtered query.
+
+    Raises:
+        ValueError: If a key names an unknown field or operator, or a
+            value does not fit its operator.
+    """
+    for key, value in filters.items():
+        query = query.where(
+            filter_predicate(compile_filter(model, key), value)
+        )
+    return query
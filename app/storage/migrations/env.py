@@ -5,6 +5,7 @@ import importlib
 import pkgutil
 from logging.config import fileConfig
 from pathlib import Path
+from typing import Any
 
 from alembic import context
 from sqlalchemy import pool
@@ -66,6 +67,23 @@ target_metadata = SQLModel.metadata
 # ... etc.
 
 
+def include_object(
+    object: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """
+    Exclude user_actions partitions from autogenerate.
+
+    Partitions are created and dropped at runtime by the audit partition
+    task and have no model, so autogenerate would otherwise drop them.
+    """
+    return not (
+        type_ == "table"
+        and reflected
+        and name is not None
+        and name.startswith("user_actions_")
+    )
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -82,6 +100,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -97,7 +116,11 @@ def do_run_migrations(connection: Connection) -> None:
     Args:
         connection: SQLAlchemy connection to use for migrations.
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
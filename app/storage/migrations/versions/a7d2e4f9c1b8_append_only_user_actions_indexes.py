@@ -0,0 +1,83 @@
+"""Append-only index layout for user_actions
+
+Revision ID: a7d2e4f9c1b8
+Revises: f3c8a1d5e7b2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e4f9c1b8"
+down_revision: Union[str, None] = "f3c8a1d5e7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Btrees covered by the new layout: timestamp ranges by the BRIN index,
+# user_id by idx_user_recent, username (only matched as a substring) by
+# idx_username_trgm, and outcome (three values) by the partial index
+REPLACED_INDEXES = (
+    ("idx_user_timestamp", ["user_id", "timestamp"]),
+    ("idx_user_action", ["user_id", "action_type"]),
+    ("ix_user_actions_timestamp", ["timestamp"]),
+    ("ix_user_actions_user_id", ["user_id"]),
+    ("ix_user_actions_username", ["username"]),
+    ("ix_user_actions_outcome", ["outcome"]),
+)
+
+
+def upgrade() -> None:
+    # Rewrites every partition; the GIN index below needs jsonb
+    op.execute(
+        """
+        ALTER TABLE user_actions
+            ALTER COLUMN user_roles TYPE JSONB USING user_roles::jsonb,
+            ALTER COLUMN request_data TYPE JSONB USING request_data::jsonb
+        """
+    )
+
+    for name, _ in REPLACED_INDEXES:
+        op.drop_index(name, table_name="user_actions")
+
+    # Rows are appended in timestamp order, so block ranges are tight
+    op.create_index(
+        "idx_user_actions_timestamp_brin",
+        "user_actions",
+        ["timestamp"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index("idx_user_recent", "user_actions", ["user_id", "id"])
+    op.execute(
+        "CREATE INDEX idx_user_actions_failures ON user_actions (id) "
+        "WHERE outcome <> 'success'"
+    )
+    op.create_index(
+        "idx_user_roles_gin",
+        "user_actions",
+        ["user_roles"],
+        postgresql_using="gin",
+        postgresql_ops={"user_roles": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_roles_gin", table_name="user_actions")
+    op.drop_index("idx_user_actions_failures", table_name="user_actions")
+    op.drop_index("idx_user_recent", table_name="user_actions")
+    op.drop_index("idx_user_actions_timestamp_brin", table_name="user_actions")
+
+    for name, columns in REPLACED_INDEXES:
+        op.create_index(name, "user_actions", columns)
+
+    op.execute(
+        """
+        ALTER TABLE user_actions
+            ALTER COLUMN user_roles TYPE JSON USING user_roles::json,
+            ALTER COLUMN request_data TYPE JSON USING request_data::json
+        """
+    )
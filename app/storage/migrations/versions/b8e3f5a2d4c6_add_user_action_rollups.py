@@ -0,0 +1,66 @@
+"""Add per-minute user_action_rollups table
+
+Revision ID: b8e3f5a2d4c6
+Revises: a7d2e4f9c1b8
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e3f5a2d4c6"
+down_revision: Union[str, None] = "a7d2e4f9c1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_action_rollups",
+        sa.Column("minute", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "action_type",
+            sqlmodel.sql.sqltypes.AutoString(length=100),
+            nullable=False,
+        ),
+        sa.Column(
+            "outcome",
+            sqlmodel.sql.sqltypes.AutoString(length=50),
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            sqlmodel.sql.sqltypes.AutoString(length=255),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("minute", "action_type", "outcome", "user_id"),
+    )
+    op.create_index(
+        "idx_rollup_user_minute",
+        "user_action_rollups",
+        ["user_id", "minute"],
+    )
+
+    # Backfill from the raw log; the audit writers keep it current
+    op.execute(
+        """
+        INSERT INTO user_action_rollups
+            (minute, action_type, outcome, user_id, count)
+        SELECT date_trunc('minute', "timestamp"), action_type, outcome,
+               user_id, count(*)
+        FROM user_actions
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_rollup_user_minute", table_name="user_action_rollups")
+    op.drop_table("user_action_rollups")
@@ -0,0 +1,40 @@
+"""Add text_pattern_ops indexes for prefix filters
+
+Revision ID: c41d7e2a9f10
+Revises: b857e3e16921
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e2a9f10"
+down_revision: Union[str, None] = "b857e3e16921"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # text_pattern_ops lets LIKE 'prefix%' use a btree range scan
+    # regardless of the database collation
+    op.create_index(
+        "idx_author_name_pattern",
+        "author",
+        ["name"],
+        postgresql_ops={"name": "text_pattern_ops"},
+    )
+    op.create_index(
+        "idx_resource_pattern",
+        "user_actions",
+        ["resource"],
+        postgresql_ops={"resource": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_resource_pattern", table_name="user_actions")
+    op.drop_index("idx_author_name_pattern", table_name="author")
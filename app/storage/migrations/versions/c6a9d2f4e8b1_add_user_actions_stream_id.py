@@ -0,0 +1,45 @@
+"""Add stream_id to user_actions for idempotent stream writes
+
+Revision ID: c6a9d2f4e8b1
+Revises: b8e3f5a2d4c6
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c6a9d2f4e8b1"
+down_revision: Union[str, None] = "b8e3f5a2d4c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: no table rewrite
+    op.add_column(
+        "user_actions",
+        sa.Column(
+            "stream_id",
+            sqlmodel.sql.sqltypes.AutoString(length=32),
+            nullable=True,
+        ),
+    )
+    # Unique indexes on a partitioned table must include the partition
+    # key; a redelivered entry keeps its timestamp, so it still conflicts
+    op.create_index(
+        "uq_user_actions_stream_id",
+        "user_actions",
+        ["stream_id", "timestamp"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_user_actions_stream_id", table_name="user_actions")
+    op.drop_column("user_actions", "stream_id")
@@ -0,0 +1,52 @@
+"""Add pg_trgm GIN indexes for substring search
+
+Revision ID: d7a3f5b8c2e4
+Revises: c41d7e2a9f10
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3f5b8c2e4"
+down_revision: Union[str, None] = "c41d7e2a9f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gin_trgm_ops serves ILIKE '%term%' and the similarity operator %,
+    # neither of which a btree can answer
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_author_name_trgm",
+        "author",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_username_trgm",
+        "user_actions",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_resource_trgm",
+        "user_actions",
+        ["resource"],
+        postgresql_using="gin",
+        postgresql_ops={"resource": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    op.drop_index("idx_resource_trgm", table_name="user_actions")
+    op.drop_index("idx_username_trgm", table_name="user_actions")
+    op.drop_index("idx_author_name_trgm", table_name="author")
@@ -0,0 +1,61 @@
+"""Btree indexes for user_actions listings ordered by (timestamp, id)
+
+The (timestamp, id) btree also serves time-range scans, which makes the
+BRIN index on timestamp redundant; it is dropped.
+
+Revision ID: d8b2f6a4c9e7
+Revises: c6a9d2f4e8b1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8b2f6a4c9e7"
+down_revision: Union[str, None] = "c6a9d2f4e8b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves listings and time ranges; the BRIN index only served ranges
+    op.create_index(
+        "idx_user_actions_timestamp_id",
+        "user_actions",
+        ["timestamp", "id"],
+    )
+    op.drop_index("idx_user_actions_timestamp_brin", table_name="user_actions")
+
+    # Id-ordered indexes replaced by timestamp-ordered ones
+    op.drop_index("idx_user_recent", table_name="user_actions")
+    op.create_index(
+        "idx_user_recent", "user_actions", ["user_id", "timestamp", "id"]
+    )
+    op.drop_index("idx_user_actions_failures", table_name="user_actions")
+    op.execute(
+        'CREATE INDEX idx_user_actions_failures ON user_actions ("timestamp", '
+        "id) WHERE outcome <> 'success'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_user_actions_failures", table_name="user_actions")
+    op.execute(
+        "CREATE INDEX idx_user_actions_failures ON user_actions (id) "
+        "WHERE outcome <> 'success'"
+    )
+    op.drop_index("idx_user_recent", table_name="user_actions")
+    op.create_index("idx_user_recent", "user_actions", ["user_id", "id"])
+
+    op.create_index(
+        "idx_user_actions_timestamp_brin",
+        "user_actions",
+        ["timestamp"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.drop_index("idx_user_actions_timestamp_id", table_name="user_actions")
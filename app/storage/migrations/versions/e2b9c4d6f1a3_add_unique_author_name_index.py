@@ -0,0 +1,78 @@
+"""Make author.name unique
+
+Revision ID: e2b9c4d6f1a3
+Revises: d7a3f5b8c2e4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b9c4d6f1a3"
+down_revision: Union[str, None] = "d7a3f5b8c2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Duplicate names listed in the error message
+DUPLICATES_SHOWN = 20
+
+
+def check_duplicate_names() -> None:
+    """Fail with the duplicate names instead of a bare unique violation."""
+    if context.is_offline_mode():
+        # --sql: nothing to query; the index creation fails on duplicates
+        return
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT name, count(*) AS copies, array_agg(id ORDER BY id) "
+                "AS ids FROM author GROUP BY name HAVING count(*) > 1 "
+                "ORDER BY copies DESC, name"
+            )
+        )
+        .all()
+    )
+    if not duplicates:
+        return
+    shown = "\n".join(
+        f"  {name!r}: {copies} rows (ids {list(ids)})"
+        for name, copies, ids in duplicates[:DUPLICATES_SHOWN]
+    )
+    more = len(duplicates) - DUPLICATES_SHOWN
+    raise RuntimeError(
+        f"Cannot make author.name unique: {len(duplicates)} names are "
+        f"duplicated. Rename or delete the extra rows, then rerun the "
+        f"migration.\n{shown}"
+        + (f"\n  ... and {more} more" if more > 0 else "")
+    )
+
+
+def upgrade() -> None:
+    # Replaces the non-unique prefix index: the unique index still serves
+    # LIKE 'x%' (text_pattern_ops) and lets inserts use ON CONFLICT DO
+    # NOTHING instead of a SELECT-then-INSERT name check.
+    check_duplicate_names()
+    op.create_index(
+        "uq_author_name",
+        "author",
+        ["name"],
+        unique=True,
+        postgresql_ops={"name": "text_pattern_ops"},
+    )
+    op.drop_index("idx_author_name_pattern", table_name="author")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_author_name_pattern",
+        "author",
+        ["name"],
+        postgresql_ops={"name": "text_pattern_ops"},
+    )
+    op.drop_index("uq_author_name", table_name="author")
@@ -0,0 +1,171 @@
+"""Partition user_actions by month on timestamp
+
+Revision ID: f3c8a1d5e7b2
+Revises: e2b9c4d6f1a3
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c8a1d5e7b2"
+down_revision: Union[str, None] = "e2b9c4d6f1a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('user_actions_id_seq'),
+    "timestamp" TIMESTAMP WITH TIME ZONE NOT NULL,
+    user_id VARCHAR(255) NOT NULL,
+    username VARCHAR(255) NOT NULL,
+    user_roles JSON NOT NULL,
+    action_type VARCHAR(100) NOT NULL,
+    resource VARCHAR(500) NOT NULL,
+    outcome VARCHAR(50) NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    request_id VARCHAR(100),
+    request_data JSON,
+    response_status INTEGER,
+    error_message TEXT,
+    duration_ms INTEGER
+"""
+
+COLUMN_NAMES = (
+    'id, "timestamp", user_id, username, user_roles, action_type, '
+    "resource, outcome, ip_address, user_agent, request_id, request_data, "
+    "response_status, error_message, duration_ms"
+)
+
+
+def create_indexes() -> None:
+    """Create the user_actions indexes (on every partition, if any)."""
+    for name, columns in (
+        ("idx_user_timestamp", ["user_id", "timestamp"]),
+        ("idx_user_action", ["user_id", "action_type"]),
+        ("ix_user_actions_timestamp", ["timestamp"]),
+        ("ix_user_actions_user_id", ["user_id"]),
+        ("ix_user_actions_username", ["username"]),
+        ("ix_user_actions_action_type", ["action_type"]),
+        ("ix_user_actions_outcome", ["outcome"]),
+        ("ix_user_actions_request_id", ["request_id"]),
+    ):
+        op.create_index(name, "user_actions", columns)
+    op.create_index(
+        "idx_resource_pattern",
+        "user_actions",
+        ["resource"],
+        postgresql_ops={"resource": "text_pattern_ops"},
+    )
+    op.create_index(
+        "idx_username_trgm",
+        "user_actions",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_resource_trgm",
+        "user_actions",
+        ["resource"],
+        postgresql_using="gin",
+        postgresql_ops={"resource": "gin_trgm_ops"},
+    )
+
+
+def upgrade() -> None:
+    # Partition bounds are whole months in UTC
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+
+    # Move the old table aside; its index names are freed when it is
+    # dropped, its id sequence is kept for the new table
+    op.execute("ALTER TABLE user_actions RENAME TO user_actions_unpartitioned")
+    op.execute(
+        "ALTER TABLE user_actions_unpartitioned "
+        "RENAME CONSTRAINT user_actions_pkey TO user_actions_unpartitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY NONE")
+
+    # The partition key must be part of the primary key
+    op.execute(
+        f"""
+        CREATE TABLE user_actions ({COLUMNS},
+            CONSTRAINT user_actions_pkey PRIMARY KEY (id, "timestamp")
+        ) PARTITION BY RANGE ("timestamp")
+        """
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY user_actions.id")
+
+    # One partition per month of existing data, through two months ahead;
+    # the partition maintenance task keeps creating them from there on.
+    # The default partition only catches rows if that task stops running.
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month timestamptz;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce(
+                        (SELECT min("timestamp")
+                         FROM user_actions_unpartitioned),
+                        now()
+                    )),
+                    date_trunc('month', now()) + interval '2 months',
+                    interval '1 month'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF user_actions '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'user_actions_p' || to_char(month, 'YYYYMM'),
+                    month,
+                    month + interval '1 month'
+                );
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute(
+        "CREATE TABLE user_actions_default PARTITION OF user_actions DEFAULT"
+    )
+
+    op.execute(
+        f"INSERT INTO user_actions ({COLUMN_NAMES}) "
+        f"SELECT {COLUMN_NAMES} FROM user_actions_unpartitioned"
+    )
+    op.execute("DROP TABLE user_actions_unpartitioned")
+
+    # Created on the parent, so every partition gets its own copy
+    create_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE user_actions RENAME TO user_actions_partitioned")
+    op.execute(
+        "ALTER TABLE user_actions_partitioned "
+        "RENAME CONSTRAINT user_actions_pkey TO user_actions_partitioned_pkey"
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY NONE")
+
+    op.execute(
+        f"""
+        CREATE TABLE user_actions ({COLUMNS},
+            CONSTRAINT user_actions_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE user_actions_id_seq OWNED BY user_actions.id")
+    op.execute(
+        f"INSERT INTO user_actions ({COLUMN_NAMES}) "
+        f"SELECT {COLUMN_NAMES} FROM user_actions_partitioned"
+    )
+    # Drops every partition with it
+    op.execute("DROP TABLE user_actions_partitioned")
+
+    create_indexes()
@@ -2,7 +2,7 @@
 Pagination strategies for database queries.
 
 This package implements the Strategy pattern for pagination, separating different
-pagination algorithms (offset-based, cursor-based) into distinct, testable classes.
+pagination algorithms (offset-based, cursor-based, keyset) into distinct, testable classes.
 
 Example:
     Using the facade function (backward compatible):
@@ -17,6 +17,11 @@ Example:
     items, meta = await get_paginated_results(
         Author, cursor="MTA=", per_page=20
     )
+
+    # Keyset pagination on any ordering (first page: cursor="")
+    items, meta = await get_paginated_results(
+        UserAction, cursor="", order_by=["-timestamp", "-id"]
+    )
     ```
 
     Using strategies directly (new code):
@@ -32,6 +37,7 @@ Example:
 
 from app.storage.pagination.cursor import CursorPaginationStrategy
 from app.storage.pagination.factory import select_strategy
+from app.storage.pagination.keyset import KeysetPaginationStrategy
 from app.storage.pagination.offset import OffsetPaginationStrategy
 from app.storage.pagination.protocol import PaginationStrategy
 
@@ -39,5 +45,6 @@ __all__ = [
     "PaginationStrategy",
     "OffsetPaginationStrategy",
     "CursorPaginationStrategy",
+    "KeysetPaginationStrategy",
     "select_strategy",
 ]
@@ -0,0 +1,109 @@
+"""
+Planner-based row count estimates for pagination totals.
+
+Exact ``COUNT(*)`` on very large tables scans every matching row. For
+listing UIs an approximate total is usually enough, and PostgreSQL already
+keeps one: ``pg_class.reltuples`` for whole tables and the planner's row
+estimate (``EXPLAIN``) for filtered queries.
+"""
+
+import json
+from typing import Any, Type
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.schemas.generic_typing import GenericSQLModelType
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper keeping the statement's bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_table_rows(
+    session: AsyncSession, model: Type[GenericSQLModelType]
+) -> int | None:
+    """
+    Read a table's row estimate from ``pg_class``.
+
+    The value is maintained by VACUUM/ANALYZE (and autovacuum), so it lags
+    recent writes slightly.
+
+    Args:
+        session: SQLModel async session.
+        model: The SQLModel table class.
+
+    Returns:
+        Estimated row count, or None if the table was never analyzed.
+    """
+    result = await session.execute(
+        text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table)"
+        ),
+        {"table": model.__tablename__},
+    )
+    reltuples = result.scalar_one_or_none()
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+async def estimate_query_rows(
+    session: AsyncSession, query: Select[Any]
+) -> int:
+    """
+    Ask the planner how many rows a query would return.
+
+    Args:
+        session: SQLModel async session.
+        query: Filtered query (ordering and limits are ignored).
+
+    Returns:
+        The planner's estimated row count for the top plan node.
+    """
+    statement = query.order_by(None).limit(None).offset(None)
+    result = await session.execute(Explain(statement))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def estimate_rows(
+    session: AsyncSession,
+    model: Type[GenericSQLModelType],
+    query: Select[Any],
+) -> int:
+    """
+    Estimate how many rows a pagination query matches.
+
+    Unfiltered queries use table statistics; filtered queries (or tables
+    without statistics yet) use the planner's estimate.
+
+    Args:
+        session: SQLModel async session.
+        model: The SQLModel table class.
+        query: The query being paginated.
+
+    Returns:
+        Estimated row count.
+    """
+    if query.whereclause is None:
+        estimate = await estimate_table_rows(session, model)
+        if estimate is not None:
+            return estimate
+    return await estimate_query_rows(session, query)
@@ -1,16 +1,17 @@
 """
 Strategy factory for selecting the appropriate pagination strategy.
 
-Encapsulates the logic for choosing between offset and cursor pagination
-based on request parameters.
+Encapsulates the logic for choosing between offset, cursor and keyset
+pagination based on request parameters.
 """
 
-from typing import Any
+from typing import Any, Sequence
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.storage.pagination.cursor import CursorPaginationStrategy
-from app.storage.pagination.offset import OffsetPaginationStrategy
+from app.storage.pagination.keyset import KeysetPaginationStrategy
+from app.storage.pagination.offset import CountMode, OffsetPaginationStrategy
 from app.storage.pagination.protocol import PaginationStrategy
 
 
@@ -21,11 +22,14 @@ def select_strategy(
     skip_count: bool,
     filter_dict: dict[str, Any] | None,
     apply_filters_func: Any = None,
+    order_by: Sequence[str] | None = None,
+    count_mode: CountMode = "exact",
 ) -> PaginationStrategy[Any]:
     """
     Select appropriate pagination strategy based on parameters.
 
     Decision logic:
+    - If cursor and order_by are provided → KeysetPaginationStrategy
     - If cursor is provided → CursorPaginationStrategy
     - Otherwise → OffsetPaginationStrategy
 
@@ -37,6 +41,10 @@ def select_strategy(
         skip_count: Whether to skip count query in offset pagination.
         filter_dict: Filter dictionary for count cache key generation.
         apply_filters_func: Custom filter function for count queries.
+        order_by: Field names to order by (``-`` prefix for descending).
+                 With a cursor, keyset pagination seeks on these columns.
+        count_mode: How offset pagination computes the total on a count
+                   cache miss ("exact", "window" or "estimated").
 
     Returns:
         Appropriate pagination strategy instance.
@@ -55,6 +63,17 @@ def select_strategy(
         )
         # Returns CursorPaginationStrategy
 
+        # Keyset pagination (cursor with an ordering; "" = first page)
+        strategy = select_strategy(
+            session=session,
+            cursor="",
+            page=1,
+            skip_count=False,
+            filter_dict=None,
+            order_by=["-timestamp", "-id"],
+        )
+        # Returns KeysetPaginationStrategy
+
         # Offset pagination (no cursor)
         strategy = select_strategy(
             session=session,
@@ -66,7 +85,10 @@ def select_strategy(
         # Returns OffsetPaginationStrategy
         ```
     """
-    if cursor is not None:
+    if cursor is not None and order_by:
+        # Seek on the requested ordering instead of OFFSET
+        return KeysetPaginationStrategy(session, cursor, order_by)
+    elif cursor is not None:
         # Use cursor pagination for stable, high-performance pagination
         return CursorPaginationStrategy(session, cursor)
     else:
@@ -77,4 +99,5 @@ def select_strategy(
             skip_count=skip_count,
             filter_dict=filter_dict,
             apply_filters_func=apply_filters_func,
+            count_mode=count_mode,
         )
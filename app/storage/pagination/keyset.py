@@ -0,0 +1,336 @@
+"""
+Keyset pagination strategy on arbitrary ordered columns.
+
+Generalizes cursor pagination from ``WHERE id > last_id`` to any ordered
+tuple of columns, e.g. ``(timestamp DESC, id DESC)`` for the audit log or
+``(name ASC, id ASC)`` for authors. The cursor carries the sort key of the
+boundary row, so every page is an index range scan regardless of depth.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Literal, Sequence, Type
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy import ColumnElement, Select, and_, literal, or_, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.schemas.generic_typing import GenericSQLModelType
+from app.schemas.response import MetadataModel
+
+Direction = Literal["next", "prev"]
+
+
+@dataclass(frozen=True, slots=True)
+class SortKey:
+    """One column of a keyset ordering."""
+
+    name: str
+    column: Any
+    descending: bool
+
+    @property
+    def spec(self) -> str:
+        """Return the ``-name``/``name`` form used in cursors."""
+        return f"-{self.name}" if self.descending else self.name
+
+
+def parse_order_by(
+    model: Type[GenericSQLModelType], order_by: Sequence[str]
+) -> list[SortKey]:
+    """
+    Resolve ``order_by`` field names into sort keys for a model.
+
+    A leading ``-`` sorts the field descending. The primary key ``id`` is
+    appended as a tie-breaker (in the direction of the last key) so the
+    ordering is total, which keyset pagination requires.
+
+    Args:
+        model: The SQLModel class being queried.
+        order_by: Field names, e.g. ``["-timestamp", "-id"]``.
+
+    Returns:
+        Sort keys in ordering precedence.
+
+    Raises:
+        ValueError: If ordering is empty or a field is not on the model.
+    """
+    if not order_by:
+        raise ValueError("order_by must contain at least one field")
+
+    keys: list[SortKey] = []
+    for spec in order_by:
+        descending = spec.startswith("-")
+        name = spec.lstrip("-+")
+        if not hasattr(model, name):
+            raise ValueError(
+                f"Invalid ordering: {name} is not an attribute of "
+                f"{model.__name__}"
+            )
+        keys.append(SortKey(name, getattr(model, name), descending))
+
+    if all(key.name != "id" for key in keys):
+        keys.append(SortKey("id", model.id, keys[-1].descending))
+    return keys
+
+
+def apply_ordering(query: Select[Any], keys: Sequence[SortKey]) -> Select[Any]:
+    """Replace any existing ORDER BY with the given sort keys."""
+    return query.order_by(None).order_by(
+        *(
+            key.column.desc() if key.descending else key.column.asc()
+            for key in keys
+        )
+    )
+
+
+def encode_keyset_cursor(
+    keys: Sequence[SortKey], values: Sequence[Any], direction: Direction
+) -> str:
+    """
+    Encode a boundary row's sort key into an opaque cursor.
+
+    Args:
+        keys: The ordering the cursor belongs to.
+        values: The boundary row's value for each key.
+        direction: ``"next"`` to read rows after the boundary,
+            ``"prev"`` to read rows before it.
+
+    Returns:
+        URL-safe base64 cursor string.
+    """
+    payload = {
+        "o": [key.spec for key in keys],
+        "v": to_jsonable_python(list(values)),
+        "d": direction,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_keyset_cursor(
+    keys: Sequence[SortKey], cursor: str
+) -> tuple[list[Any], Direction]:
+    """
+    Decode a keyset cursor for the given ordering.
+
+    Values are coerced back to each column's Python type (e.g. ISO strings
+    to ``datetime``) so they bind with the right SQL type.
+
+    Args:
+        keys: The ordering being paginated.
+        cursor: Cursor produced by :func:`encode_keyset_cursor`.
+
+    Returns:
+        Tuple of (boundary values, direction).
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a
+            different ordering.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor))
+        specs, raw_values, direction = payload["o"], payload["v"], payload["d"]
+    except (ValueError, TypeError, KeyError) as ex:
+        raise ValueError(f"Invalid cursor format: {ex}") from ex
+
+    if specs != [key.spec for key in keys]:
+        raise ValueError("Cursor does not match the requested ordering")
+    if direction not in ("next", "prev") or len(raw_values) != len(keys):
+        raise ValueError("Invalid cursor format: malformed key")
+
+    values = []
+    for key, value in zip(keys, raw_values):
+        try:
+            python_type = key.column.type.python_type
+        except (AttributeError, NotImplementedError):
+            values.append(value)
+            continue
+        try:
+            values.append(TypeAdapter(python_type).validate_python(value))
+        except ValueError as ex:
+            raise ValueError(f"Invalid cursor format: {ex}") from ex
+    return values, direction
+
+
+def keyset_predicate(
+    keys: Sequence[SortKey], values: Sequence[Any], backward: bool = False
+) -> ColumnElement[bool]:
+    """
+    Build the WHERE clause selecting rows past the boundary row.
+
+    When every key sorts the same way this is a single row-value
+    comparison, ``(a, b) < (:a, :b)``, which PostgreSQL satisfies with one
+    index range scan. Mixed directions expand to
+    ``a < :a OR (a = :a AND b > :b) ...``.
+
+    Args:
+        keys: The ordering being paginated.
+        values: Boundary row values, one per key.
+        backward: Select rows before the boundary instead of after it.
+
+    Returns:
+        SQLAlchemy boolean expression.
+    """
+    bound = [
+        literal(value, type_=key.column.type)
+        for key, value in zip(keys, values)
+    ]
+
+    def after(key: SortKey, left: Any, right: Any) -> ColumnElement[bool]:
+        return left < right if key.descending != backward else left > right
+
+    if len({key.descending for key in keys}) == 1:
+        if len(keys) == 1:
+            return after(keys[0], keys[0].column, bound[0])
+        return after(
+            keys[0], tuple_(*(key.column for key in keys)), tuple_(*bound)
+        )
+
+    clauses = []
+    for i, key in enumerate(keys):
+        equal = [keys[j].column == bound[j] for j in range(i)]
+        clauses.append(and_(*equal, after(key, key.column, bound[i])))
+    return or_(*clauses)
+
+
+class KeysetPaginationStrategy:
+    """
+    Keyset (seek) pagination over an arbitrary column ordering.
+
+    Pros:
+    - Constant cost per page for any ordering backed by an index
+    - Stable results (no duplicates/skips with concurrent changes)
+    - Navigates both forward (``next_cursor``) and backward
+      (``prev_cursor``)
+
+    Cons:
+    - Cannot jump to arbitrary pages
+    - No total count
+    - Sort columns must be non-nullable
+
+    Example:
+        ```python
+        from app.storage.pagination import KeysetPaginationStrategy
+        from sqlmodel import select
+        from app.models.user_action import UserAction
+
+        async with async_session() as session:
+            strategy = KeysetPaginationStrategy(
+                session, order_by=["-timestamp", "-id"]
+            )
+            items, meta = await strategy.paginate(
+                select(UserAction), UserAction, 50
+            )
+
+            # Older entries
+            strategy = KeysetPaginationStrategy(
+                session,
+                cursor=meta.next_cursor,
+                order_by=["-timestamp", "-id"],
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cursor: str | None = None,
+        order_by: Sequence[str] = ("id",),
+    ):
+        """
+        Initialize keyset pagination strategy.
+
+        Args:
+            session: SQLModel async session for database queries.
+            cursor: Cursor from a previous page's ``next_cursor`` or
+                ``prev_cursor``. If None or empty, starts from the
+                beginning of the ordering.
+            order_by: Field names in precedence order; prefix ``-`` for
+                descending. ``id`` is appended as a tie-breaker.
+        """
+        self.session = session
+        self.cursor = cursor
+        self.order_by = list(order_by)
+
+    async def paginate(
+        self,
+        query: Select[Any],
+        model: Type[GenericSQLModelType],
+        page_size: int,
+    ) -> tuple[list[GenericSQLModelType], MetadataModel]:
+        """
+        Execute keyset pagination on the query.
+
+        Any ORDER BY already on the query is replaced by the keyset
+        ordering.
+
+        Args:
+            query: SQLAlchemy Select query with filters and eager loading
+                  already applied.
+            model: The SQLModel class being queried.
+            page_size: Number of items per page.
+
+        Returns:
+            Tuple of (items, metadata) where metadata includes:
+            - page, total, pages: 1, 0, 0 (not meaningful for keysets)
+            - has_more: Whether rows exist after this page
+            - next_cursor: Cursor for the following page, or None
+            - prev_cursor: Cursor for the preceding page, or None
+
+        Raises:
+            ValueError: If ordering or cursor is invalid.
+            SQLAlchemyError: If database query fails.
+        """
+        keys = parse_order_by(model, self.order_by)
+        values: list[Any] | None = None
+        direction: Direction = "next"
+        if self.cursor:
+            values, direction = decode_keyset_cursor(keys, self.cursor)
+        backward = direction == "prev"
+
+        # Backward pages read the reversed ordering, then flip the rows
+        scan_keys = [
+            SortKey(key.name, key.column, key.descending != backward)
+            for key in keys
+        ]
+        query = apply_ordering(query, scan_keys)
+        if values is not None:
+            query = query.where(keyset_predicate(keys, values, backward))
+
+        results = await self.session.exec(query.limit(page_size + 1))
+        items = list(results.all())
+
+        has_extra = len(items) > page_size
+        items = items[:page_size]
+        if backward:
+            items.reverse()
+
+        def cursor_for(item: Any, to: Direction) -> str:
+            row_key = [getattr(item, key.name) for key in keys]
+            return encode_keyset_cursor(keys, row_key, to)
+
+        if backward:
+            # Came from a later page, so rows after this one exist
+            has_more = bool(items)
+            has_before = has_extra
+        else:
+            has_more = has_extra
+            has_before = values is not None
+
+        meta = MetadataModel(
+            page=1,
+            per_page=page_size,
+            total=0,
+            pages=0,
+            has_more=has_more,
+            next_cursor=cursor_for(items[-1], "next")
+            if items and has_more
+            else None,
+            prev_cursor=cursor_for(items[0], "prev")
+            if items and has_before
+            else None,
+        )
+        return items, meta
@@ -6,7 +6,7 @@ user-facing interfaces where users expect "Page 1, 2, 3..." navigation.
 """
 
 import math
-from typing import Any, Callable, Type
+from typing import Any, Callable, Literal, Type
 
 from sqlalchemy import Select
 from sqlmodel import func, select
@@ -14,9 +14,17 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.schemas.generic_typing import GenericSQLModelType
 from app.schemas.response import MetadataModel
+from app.settings import app_settings
 from app.storage.db import default_apply_filters
+from app.storage.pagination.estimate import estimate_rows
 from app.utils.pagination_cache import get_cached_count, set_cached_count
 
+# How the total is computed on a count cache miss:
+# - "exact": separate COUNT(*) query, then the page query
+# - "window": one query returning the page with COUNT(*) OVER ()
+# - "estimated": planner/statistics estimate; exact below a threshold
+CountMode = Literal["exact", "window", "estimated"]
+
 
 class OffsetPaginationStrategy:
     """
@@ -60,6 +68,7 @@ class OffsetPaginationStrategy:
             Select[Any],
         ]
         | None = None,
+        count_mode: CountMode = "exact",
     ):
         """
         Initialize offset pagination strategy.
@@ -73,12 +82,21 @@ class OffsetPaginationStrategy:
                         Pass the same filters used in query building.
             apply_filters_func: Custom filter function for count query.
                                If None, uses default_apply_filters.
+            count_mode: "exact" runs a separate COUNT query; "window"
+                       returns the total with the page rows in a single
+                       statement (COUNT(*) OVER ()), saving a round trip
+                       and a second scan on count cache misses.
+                       "estimated" reports the planner's row estimate
+                       (flagged in metadata) unless it is below
+                       PAGINATION_EXACT_COUNT_THRESHOLD, in which case
+                       an exact count is run.
         """
         self.session = session
         self.page = page
         self.skip_count = skip_count
         self.filter_dict = filter_dict
         self.apply_filters_func = apply_filters_func or default_apply_filters
+        self.count_mode = count_mode
 
     async def paginate(
         self,
@@ -100,6 +118,7 @@ class OffsetPaginationStrategy:
             - page: Current page number
             - per_page: Items per page
             - total: Total item count (0 if skip_count=True)
+            - estimated: Whether total is a planner estimate
             - pages: Total page count
             - has_more: Whether more results exist
             - next_cursor: None (not used in offset pagination)
@@ -109,36 +128,37 @@ class OffsetPaginationStrategy:
         """
         # Count logic with caching
         total = 0
+        estimated = False
+        cached_total = None
         if not self.skip_count:
-            # Try cache first
-            model_name = model.__name__
-            cached_total = await get_cached_count(model_name, self.filter_dict)
-
-            if cached_total is not None:
-                total = cached_total
-            else:
-                # Execute count query - build count query
-                count_query = select(func.count(model.id))
-
-                # Apply same filters as data query
-                if self.filter_dict:
-                    count_query = self.apply_filters_func(
-                        count_query, model, self.filter_dict
-                    )
-
-                total_result = await self.session.exec(count_query)
-                total = total_result.one()
-
-                # Cache the count for future requests
-                await set_cached_count(model_name, total, self.filter_dict)
+            cached_total = await get_cached_count(
+                model.__name__, self.filter_dict
+            )
 
         # Apply offset
         offset = (self.page - 1) * page_size
         data_query = query.offset(offset).limit(page_size + 1)
 
-        # Execute query
-        results = await self.session.exec(data_query)
-        items = results.all()
+        if self.skip_count:
+            items = await self._fetch(data_query)
+        elif cached_total is not None:
+            total = cached_total
+            items = await self._fetch(data_query)
+        elif self.count_mode == "estimated":
+            total, estimated = await self._estimate(model, query)
+            items = await self._fetch(data_query)
+        elif self.count_mode == "window":
+            items, window_total = await self._fetch_with_total(data_query)
+            # An empty page (beyond the end) carries no total: count it
+            if window_total is None:
+                window_total = await self._count(model)
+            total = window_total
+            await self._cache_count(model, total)
+        else:
+            total = await self._count(model)
+            # Cache the count for future requests
+            await self._cache_count(model, total)
+            items = await self._fetch(data_query)
 
         # Check for more results (fetched page_size + 1 to detect)
         has_more = len(items) > page_size
@@ -156,6 +176,82 @@ class OffsetPaginationStrategy:
             pages=pages,
             has_more=has_more,
             next_cursor=None,  # Not used in offset pagination
+            estimated=estimated,
         )
 
         return items, meta
+
+    async def _fetch(self, data_query: Select[Any]) -> list[Any]:
+        """Execute the page query."""
+        results = await self.session.exec(data_query)
+        return results.all()
+
+    async def _fetch_with_total(
+        self, data_query: Select[Any]
+    ) -> tuple[list[Any], int | None]:
+        """
+        Execute the page query with the filtered total as a window column.
+
+        The window is evaluated before OFFSET/LIMIT, so every row carries
+        the total number of matching rows.
+
+        Returns:
+            Tuple of (items, total); total is None when the page is empty.
+        """
+        # execute() rather than exec(): exec() would return only the
+        # model column of this two-column select
+        results = await self.session.execute(
+            data_query.add_columns(func.count().over().label("_total"))
+        )
+        rows = results.all()
+        if not rows:
+            return [], None
+        return [row[0] for row in rows], rows[0][1]
+
+    async def _estimate(
+        self, model: Type[GenericSQLModelType], query: Select[Any]
+    ) -> tuple[int, bool]:
+        """
+        Estimate the total, counting exactly when the estimate is small.
+
+        Estimates are not cached (they are cheap); exact counts are.
+
+        Returns:
+            Tuple of (total, estimated).
+        """
+        estimate = await estimate_rows(self.session, model, query)
+        if estimate >= app_settings.PAGINATION_EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+        total = await self._count(model)
+        await self._cache_count(model, total)
+        return total, False
+
+    async def _cache_count(
+        self, model: Type[GenericSQLModelType], total: int
+    ) -> None:
+        """
+        Cache an exact count.
+
+        Counts produced by the default filters are tracked, so repository
+        writes keep them current instead of invalidating them.
+        """
+        await set_cached_count(
+            model.__name__,
+            total,
+            self.filter_dict,
+            track=self.apply_filters_func is default_apply_filters,
+        )
+
+    async def _count(self, model: Type[GenericSQLModelType]) -> int:
+        """Execute a separate COUNT query with the same filters."""
+        count_query = select(func.count(model.id))
+
+        # Apply same filters as data query
+        if self.filter_dict:
+            count_query = self.apply_filters_func(
+                count_query, model, self.filter_dict
+            )
+
+        total_result = await self.session.exec(count_query)
+        return total_result.one()
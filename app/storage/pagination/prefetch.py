@@ -0,0 +1,253 @@
+"""
+Read-ahead of the next offset page into the cache.
+
+Clients mostly page forward. After serving page N, the next page is
+fetched in the background and stored in :class:`CacheManager`, so the
+request for page N+1 is answered from memory (or Redis) instead of a
+COUNT + OFFSET query.
+
+Only simple reads are prefetched: offset pagination of a model listed in
+``PAGINATION_PREFETCH_MODELS`` with ``default_apply_filters`` filters and
+an exact count, loading full rows, without eager loading or
+``skip_count``. Cached pages live for ``PAGINATION_PREFETCH_TTL`` seconds
+and their keys embed a per-model generation that every repository write
+increments (see ``invalidate_page_cache``), so a write makes all of the
+model's prefetched pages unreachable at once, on every instance.
+"""
+
+import asyncio
+from typing import Any, Callable, Sequence, Type
+
+from app.logging import logger
+from app.managers.cache_manager import get_cache_manager
+from app.schemas.generic_typing import GenericSQLModelType
+from app.schemas.response import MetadataModel
+from app.settings import app_settings
+from app.utils.cache_keys import CacheKeyFactory
+from app.utils.metrics.database import pagination_prefetch_total
+from app.utils.pagination_cache import get_page_generation
+
+PAGE_CACHE_PREFIX = "pagination:page"
+
+# Prefetches in flight, keyed by cache key (holds task references too)
+_in_flight: dict[str, asyncio.Task[None]] = {}
+
+
+def prefetch_eligible(
+    model: Type[GenericSQLModelType],
+    filter_dict: dict[str, Any] | None,
+    *,
+    cursor: str | None = None,
+    apply_filters: Callable[..., Any] | None = None,
+    eager_load: list[str] | None = None,
+    skip_count: bool = False,
+    count_mode: str = "exact",
+    fields: Sequence[str] | None = None,
+) -> bool:
+    """
+    Check whether a paginated read may be served from prefetched pages.
+
+    Args:
+        model: The SQLModel class being paginated.
+        filter_dict: Filters of the read.
+        cursor: Cursor of the read (cursor reads are never prefetched).
+        apply_filters: Custom filter function of the read, if any.
+        eager_load: Relationships to eager load (not cacheable).
+        skip_count: Whether the read skips the total (prefetched pages
+            always carry one).
+        count_mode: Count mode of the read (prefetched pages carry an
+            exact total).
+        fields: Sparse fieldset of the read (prefetched pages hold full
+            rows).
+
+    Returns:
+        True if the read is an eligible offset read.
+    """
+    if not app_settings.PAGINATION_PREFETCH_ENABLED:
+        return False
+    if model.__name__ not in app_settings.PAGINATION_PREFETCH_MODELS:
+        return False
+    if cursor is not None or apply_filters is not None or eager_load:
+        return False
+    if skip_count or count_mode != "exact" or fields:
+        return False
+    return all(_is_key_value(value) for value in (filter_dict or {}).values())
+
+
+def _is_key_value(value: Any) -> bool:
+    """Scalars and lists of scalars hash deterministically into keys."""
+    if isinstance(value, (list, tuple)):
+        return all(_is_key_value(item) for item in value)
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def page_cache_key(
+    model_name: str,
+    generation: int,
+    page: int,
+    per_page: int,
+    filter_dict: dict[str, Any] | None,
+    order_by: Sequence[str] | None,
+) -> str:
+    """
+    Build the cache key of one page of a paginated read.
+
+    Args:
+        model_name: Name of the SQLModel class.
+        generation: Current write generation of the model.
+        page: Page number.
+        per_page: Page size.
+        filter_dict: Filters of the read.
+        order_by: Ordering of the read.
+
+    Returns:
+        Cache key string.
+    """
+    return CacheKeyFactory.generate(
+        PAGE_CACHE_PREFIX,
+        model_name,
+        generation,
+        hash_dict={
+            "page": page,
+            "per_page": per_page,
+            "filters": filter_dict or {},
+            "order_by": list(order_by or []),
+        },
+    )
+
+
+async def get_prefetched_page(
+    model: Type[GenericSQLModelType],
+    page: int,
+    per_page: int,
+    filter_dict: dict[str, Any] | None,
+    order_by: Sequence[str] | None,
+) -> tuple[list[GenericSQLModelType], MetadataModel] | None:
+    """
+    Return a prefetched page if one is cached for the model's generation.
+
+    Args:
+        model: The SQLModel class being paginated.
+        page: Page number.
+        per_page: Page size.
+        filter_dict: Filters of the read.
+        order_by: Ordering of the read.
+
+    Returns:
+        Tuple of (items, metadata), or None on a miss.
+    """
+    generation = await get_page_generation(model.__name__)
+    if generation is None:
+        return None
+
+    key = page_cache_key(
+        model.__name__, generation, page, per_page, filter_dict, order_by
+    )
+    cached = await get_cache_manager().get(key)
+    if not cached:
+        pagination_prefetch_total.labels(
+            model=model.__name__, result="miss"
+        ).inc()
+        return None
+
+    pagination_prefetch_total.labels(model=model.__name__, result="hit").inc()
+    items = [model.model_validate(item) for item in cached["items"]]
+    return items, MetadataModel.model_validate(cached["meta"])
+
+
+def schedule_prefetch(
+    model: Type[GenericSQLModelType],
+    page: int,
+    per_page: int,
+    filter_dict: dict[str, Any] | None,
+    order_by: Sequence[str] | None,
+) -> None:
+    """
+    Fetch a page in the background and cache it.
+
+    At most ``PAGINATION_PREFETCH_CONCURRENCY`` prefetches run at once;
+    further requests are skipped rather than queued, so read-ahead never
+    competes with foreground queries for the connection pool. A page
+    already being prefetched is not fetched twice.
+
+    Args:
+        model: The SQLModel class being paginated.
+        page: Page number to prefetch.
+        per_page: Page size.
+        filter_dict: Filters of the read.
+        order_by: Ordering of the read.
+    """
+    # Generation is resolved by the task; dedupe on the generation-less key
+    key = page_cache_key(
+        model.__name__, -1, page, per_page, filter_dict, order_by
+    )
+    if key in _in_flight:
+        return
+    if len(_in_flight) >= app_settings.PAGINATION_PREFETCH_CONCURRENCY:
+        pagination_prefetch_total.labels(
+            model=model.__name__, result="skipped"
+        ).inc()
+        return
+
+    task = asyncio.create_task(
+        _prefetch_page(model, page, per_page, filter_dict, order_by),
+        name=f"prefetch:{model.__name__}:{page}",
+    )
+    _in_flight[key] = task
+    task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+
+async def _prefetch_page(
+    model: Type[GenericSQLModelType],
+    page: int,
+    per_page: int,
+    filter_dict: dict[str, Any] | None,
+    order_by: Sequence[str] | None,
+) -> None:
+    """Run the page query in its own session and cache the result."""
+    from app.storage.db import async_session
+    from app.storage.pagination.keyset import apply_ordering, parse_order_by
+    from app.storage.pagination.offset import OffsetPaginationStrategy
+    from app.storage.pagination.query_builder import build_query
+
+    try:
+        # Read before querying: a write during the query bumps the
+        # generation, leaving this page under a key nobody reads
+        generation = await get_page_generation(model.__name__)
+        if generation is None:
+            return
+        key = page_cache_key(
+            model.__name__, generation, page, per_page, filter_dict, order_by
+        )
+        cache = get_cache_manager()
+        if await cache.get(key):
+            return
+
+        query = build_query(model, filter_dict, None, None)
+        if order_by:
+            query = apply_ordering(query, parse_order_by(model, order_by))
+
+        async with async_session() as session:
+            strategy = OffsetPaginationStrategy(
+                session, page=page, filter_dict=filter_dict
+            )
+            items, meta = await strategy.paginate(query, model, per_page)
+
+        if not items:
+            return
+
+        await cache.set(
+            key,
+            {
+                "items": [item.model_dump(mode="json") for item in items],
+                "meta": meta.model_dump(mode="json"),
+            },
+            ttl=app_settings.PAGINATION_PREFETCH_TTL,
+        )
+        pagination_prefetch_total.labels(
+            model=model.__name__, result="stored"
+        ).inc()
+    except Exception as ex:  # noqa: BLE001
+        logger.warning(
+            f"Prefetch of {model.__name__} page {page} failed: {ex}"
+        )
@@ -5,11 +5,12 @@ Extracts filter conversion and query construction logic that is common across
 all pagination strategies.
 """
 
+from collections.abc import Collection
 from typing import Any, Callable, Type
 
 from pydantic import BaseModel as PydanticBaseModel
 from sqlalchemy import Select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 from sqlmodel import select
 
 from app.logging import logger
@@ -62,6 +63,7 @@ def build_query(
     ]
     | None,
     eager_load: list[str] | None,
+    columns: Collection[str] | None = None,
 ) -> Select[Any]:
     """
     Build SQLAlchemy Select query with filters and eager loading.
@@ -78,6 +80,8 @@ def build_query(
                       default_apply_filters from app.storage.db.
         eager_load: List of relationship names to eager load (prevents
                    N+1 queries).
+        columns: Column names to load (sparse fieldsets); other columns
+                 are left out of the SELECT. None loads full rows.
 
     Returns:
         SQLAlchemy Select query with filters and eager loading applied.
@@ -96,6 +100,12 @@ def build_query(
 
     query: Select[Any] = select(model)
 
+    # Sparse fieldsets: SELECT only the requested columns
+    if columns:
+        query = query.options(
+            load_only(*(getattr(model, name) for name in columns))
+        )
+
     # Apply eager loading for relationships (prevents N+1 queries)
     if eager_load:
         for relationship in eager_load:
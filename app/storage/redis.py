@@ -13,6 +13,10 @@ from fastapi_telemetry import CircuitBreakerMetricsListener
 from app.logging import logger
 from fastapi_keycloak_rbac.models import UserModel
 from app.settings import app_settings
+from app.storage.redis_tracking import (
+    RedisClientTracker,
+    TrackingConnectionPool,
+)
 from app.utils.metrics import (
     circuit_breaker_state,
     redis_pool_connections_available,
@@ -57,6 +61,10 @@ class RedisPool:
     __pools: dict[
         int, ConnectionPool
     ] = {}  # Store pools for metrics and shutdown
+    __binary_instances: dict[int, Redis] = {}
+    __binary_pools: dict[int, ConnectionPool] = {}
+    __tracking_instances: dict[tuple[int, int], Redis] = {}
+    __tracking_pools: dict[tuple[int, int], ConnectionPool] = {}
 
     @classmethod
     async def get_instance(cls, db: int = 1) -> Redis:
@@ -74,28 +82,103 @@ class RedisPool:
         return cls.__instances[db]
 
     @classmethod
-    async def _create_instance(cls, db: int) -> Redis:
+    async def get_binary_instance(cls, db: int = 1) -> Redis:
+        """
+        Get or create a Redis instance that returns raw ``bytes`` replies.
+
+        Used for binary payloads (e.g. compressed cache entries) that must
+        not be UTF-8 decoded. Uses a separate pool from :meth:`get_instance`.
+
+        Args:
+            db: Redis database index (default: 1)
+
+        Returns:
+            Redis: Redis instance with ``decode_responses=False``
+        """
+        if db not in cls.__binary_instances:
+            cls.__binary_instances[db] = await cls._create_instance(
+                db, decode_responses=False
+            )
+        return cls.__binary_instances[db]
+
+    @classmethod
+    async def get_tracking_instance(
+        cls, tracker: RedisClientTracker, db: int = 1
+    ) -> Redis:
+        """
+        Get or create a binary Redis instance whose reads are tracked.
+
+        Every connection of the underlying pool enables Redis client
+        tracking redirected to ``tracker``'s listener, so the server
+        notifies the tracker when keys read through it change. In
+        broadcast mode no per-connection state is needed and the shared
+        binary instance is returned.
+
+        Args:
+            tracker: Started client tracker receiving invalidations
+            db: Redis database index (default: 1)
+
+        Returns:
+            Redis: Redis instance with ``decode_responses=False``
+        """
+        if tracker.bcast:
+            return await cls.get_binary_instance(db)
+
+        key = (id(tracker), db)
+        if key not in cls.__tracking_instances:
+            cls.__tracking_instances[key] = await cls._create_instance(
+                db, decode_responses=False, tracker=tracker
+            )
+        return cls.__tracking_instances[key]
+
+    @classmethod
+    async def _create_instance(
+        cls,
+        db: int,
+        decode_responses: bool = True,
+        tracker: RedisClientTracker | None = None,
+    ) -> Redis:
         """
         Create a new Redis instance with connection pool.
 
         Args:
             db: Redis database index
+            decode_responses: Decode replies to ``str`` (default) or
+                return raw ``bytes``.
+            tracker: Enable client tracking on every pool connection,
+                redirecting invalidations to this tracker.
 
         Returns:
             Redis: Configured Redis instance
         """
-        pool = ConnectionPool.from_url(
+        pool_kwargs: dict[str, Any] = {}
+        pool_class: type[ConnectionPool] = ConnectionPool
+        if tracker is not None:
+            pool_class = TrackingConnectionPool
+            pool_kwargs["tracker"] = tracker
+
+        pool = pool_class.from_url(
             f"redis://{app_settings.REDIS_IP}:{app_settings.REDIS_PORT}",
             db=db,
             encoding="utf-8",
-            decode_responses=True,
+            decode_responses=decode_responses,
             max_connections=app_settings.REDIS_MAX_CONNECTIONS,
             socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT,
             socket_connect_timeout=app_settings.REDIS_CONNECT_TIMEOUT,
             health_check_interval=app_settings.REDIS_HEALTH_CHECK_INTERVAL,
             retry_on_timeout=app_settings.REDIS_RETRY_ON_TIMEOUT,
+            **pool_kwargs,
         )
 
+        # Tracking and binary pools are kept separately (shutdown only)
+        if tracker is not None:
+            cls.__tracking_pools[(id(tracker), db)] = pool
+            return await Redis.from_pool(pool)
+
+        if not decode_responses:
+            cls.__binary_pools[db] = pool
+            return await Redis.from_pool(pool)
+
         # Store pool for metrics and shutdown
         cls.__pools[db] = pool
 
@@ -142,8 +225,29 @@ class RedisPool:
                     f"Error closing Redis pool for database {db}: {ex}"
                 )
 
+        for db, pool in cls.__binary_pools.items():
+            try:
+                await pool.disconnect()
+            except (RedisError, ConnectionError, RuntimeError) as ex:
+                logger.error(
+                    f"Error closing binary Redis pool for database {db}: {ex}"
+                )
+
+        for (_, db), pool in cls.__tracking_pools.items():
+            try:
+                await pool.disconnect()
+            except (RedisError, ConnectionError, RuntimeError) as ex:
+                logger.error(
+                    f"Error closing tracking Redis pool for database {db}: "
+                    f"{ex}"
+                )
+
         cls.__pools.clear()
         cls.__instances.clear()
+        cls.__binary_pools.clear()
+        cls.__binary_instances.clear()
+        cls.__tracking_pools.clear()
+        cls.__tracking_instances.clear()
         logger.info("All Redis connection pools closed")
 
     @classmethod
@@ -0,0 +1,394 @@
+"""
+Redis server-assisted client-side caching (CLIENT TRACKING).
+
+Redis can remember which keys a client has read and push an invalidation
+message when any of them is modified by anyone. This lets an in-process
+cache (L1) serve reads with no Redis round trip while staying coherent
+across pods, without application-level invalidation messages.
+
+Invalidations are delivered with the ``REDIRECT`` form of tracking: a
+dedicated listener connection subscribes to ``__redis__:invalidate`` and
+every tracked client redirects its notifications there. This works with
+pooled connections, which cannot consume push messages themselves.
+
+Modes:
+- **per-key (default, ``tracking="optin"`` in CacheManager)**: every
+  connection of the tracking pool sends ``CLIENT TRACKING ON REDIRECT``
+  on connect (Redis's default mode, not its ``OPTIN`` option), so Redis
+  notifies about every key this process has read. See
+  :class:`TrackingConnectionPool`.
+- **broadcast** (``bcast=True``): one control connection subscribes to
+  key prefixes and Redis notifies about every write under them, whether
+  or not it was read here. Pool connections need no tracking state.
+
+Coherence rules:
+- Invalidations for keys read on a connection are lost if that connection
+  (or the listener) drops, so the L1 is flushed whenever either happens.
+- While the listener is down, :attr:`RedisClientTracker.connected` is
+  False and callers must not fill L1.
+- With ``noloop`` (default), writes made on a tracked connection are not
+  reported back to it; the writer must drop its own L1 copy.
+
+Note: tracking is keyspace-wide and ignores the selected database, so a
+write to the same key name in another db also invalidates.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from redis.asyncio import ConnectionPool
+from redis.asyncio.connection import AbstractConnection, Connection
+from redis.exceptions import RedisError
+
+from app.logging import logger
+from app.settings import app_settings
+from app.utils.metrics.redis import (
+    cache_tracking_connected,
+    cache_tracking_flushes_total,
+    cache_tracking_invalidations_total,
+)
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# Connection attribute holding the tracker generation it was enabled for
+_GENERATION_ATTR = "_tracking_generation"
+
+# Generation recorded when tracking could not be enabled (listener down)
+_NOT_TRACKED = -1
+
+# Callback receiving invalidated keys (None = flush everything)
+InvalidateCallback = Callable[[list[str] | None], Awaitable[None]]
+
+
+class RedisClientTracker:
+    """
+    Listens for Redis key invalidations and forwards them to a callback.
+
+    The callback is awaited with a list of invalidated keys, or with
+    ``None`` when every locally cached key must be dropped (listener
+    connection lost or re-established, tracked connection reconnected,
+    ``FLUSHALL``/``FLUSHDB`` on the server).
+
+    Example:
+        >>> tracker = RedisClientTracker(on_invalidate=drop_keys)
+        >>> await tracker.start()
+        >>> redis = await RedisPool.get_tracking_instance(tracker)
+        >>> await redis.get("user:1")  # now tracked by the server
+    """
+
+    def __init__(
+        self,
+        on_invalidate: InvalidateCallback,
+        bcast: bool = False,
+        prefixes: Sequence[str] = (),
+        noloop: bool = True,
+        reconnect_delay: float = 0.5,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            on_invalidate: Coroutine called with invalidated keys, or
+                ``None`` to flush everything.
+            bcast: Use broadcast mode instead of per-key tracking.
+            prefixes: Key prefixes to track in broadcast mode (empty =
+                every key).
+            noloop: Do not notify about writes made by the tracked
+                connection itself; the writer then invalidates its own
+                L1 copy.
+            reconnect_delay: Seconds to wait before reconnecting the
+                listener after a failure.
+        """
+        self.on_invalidate = on_invalidate
+        self.bcast = bcast
+        self.prefixes = tuple(prefixes)
+        self.noloop = noloop
+        self.reconnect_delay = reconnect_delay
+
+        # Incremented every time the listener (re)subscribes. Pool
+        # connections enabled for an older generation redirect to a
+        # client id that no longer exists and must be re-enabled.
+        self.generation = 0
+        self.client_id: int | None = None
+
+        self._listener: Connection | None = None
+        self._control: Connection | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        """True while invalidations are being received."""
+        return self.client_id is not None
+
+    @property
+    def running(self) -> bool:
+        """True while the listener task is alive."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self, timeout: float | None = None) -> None:
+        """
+        Start the listener task (idempotent).
+
+        Waits until the first connection attempt finished, so connections
+        checked out afterwards can redirect to the listener.
+
+        Args:
+            timeout: Seconds to wait for the first attempt
+                (default: ``REDIS_CONNECT_TIMEOUT``).
+        """
+        if not self.running:
+            self._ready.clear()
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            await asyncio.wait_for(
+                self._ready.wait(),
+                timeout or app_settings.REDIS_CONNECT_TIMEOUT,
+            )
+        except TimeoutError:
+            logger.warning("Redis invalidation listener not ready yet")
+
+    async def stop(self) -> None:
+        """Stop the listener task and close its connections."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+        self.client_id = None
+        cache_tracking_connected.set(0)
+
+    async def enable(self, connection: AbstractConnection) -> None:
+        """
+        Enable per-key tracking on a pooled connection.
+
+        Records the current generation on the connection. When the
+        listener is down, tracking is left off and the connection is
+        retried on its next checkout.
+
+        Args:
+            connection: Connected pool connection.
+        """
+        if self.bcast:
+            return
+
+        previous = getattr(connection, _GENERATION_ATTR, None)
+        if previous not in (None, _NOT_TRACKED):
+            # Redirect target changed, reset the server-side state first
+            await connection.send_command("CLIENT", "TRACKING", "OFF")
+            await connection.read_response()
+
+        if self.client_id is None:
+            setattr(connection, _GENERATION_ATTR, _NOT_TRACKED)
+            return
+
+        await connection.send_command(*self._tracking_command())
+        await connection.read_response()
+        setattr(connection, _GENERATION_ATTR, self.generation)
+
+    async def on_connect(self, connection: AbstractConnection) -> None:
+        """
+        Connect hook for tracking pool connections.
+
+        Runs the regular handshake, then enables tracking. A connection
+        that had been tracked before is reconnecting: the server forgot
+        which keys it read, so the L1 is flushed.
+
+        Args:
+            connection: Connection that just opened its socket.
+        """
+        await connection.on_connect()
+
+        previous = getattr(connection, _GENERATION_ATTR, None)
+        setattr(connection, _GENERATION_ATTR, None)
+        if previous not in (None, _NOT_TRACKED):
+            await self._flush("reconnect")
+
+        await self.enable(connection)
+
+    def is_current(self, connection: AbstractConnection) -> bool:
+        """Check whether a connection is tracked for the current listener."""
+        return self.bcast or (
+            getattr(connection, _GENERATION_ATTR, None) == self.generation
+        )
+
+    def _tracking_command(self) -> list[Any]:
+        """Build the CLIENT TRACKING ON command for this tracker."""
+        args: list[Any] = [
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "REDIRECT",
+            self.client_id,
+        ]
+        if self.bcast:
+            args.append("BCAST")
+            for prefix in self.prefixes:
+                args.extend(("PREFIX", prefix))
+        if self.noloop:
+            args.append("NOLOOP")
+        return args
+
+    def _new_connection(self) -> Connection:
+        """Create a dedicated (non-pooled) RESP2 connection."""
+        return Connection(
+            host=app_settings.REDIS_IP,
+            port=app_settings.REDIS_PORT,
+            protocol=2,
+            decode_responses=True,
+            socket_timeout=app_settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=app_settings.REDIS_CONNECT_TIMEOUT,
+        )
+
+    async def _connect(self) -> None:
+        """Open the listener (and control) connection and subscribe."""
+        listener = self._new_connection()
+        self._listener = listener
+        await listener.connect()
+
+        await listener.send_command("CLIENT", "ID")
+        client_id = int(await listener.read_response())
+
+        await listener.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await listener.read_response()
+
+        if self.bcast:
+            control = self._new_connection()
+            self._control = control
+            await control.connect()
+            self.client_id = client_id
+            await control.send_command(*self._tracking_command())
+            await control.read_response()
+        else:
+            self.client_id = client_id
+
+        self.generation += 1
+        cache_tracking_connected.set(1)
+        logger.info(
+            f"Redis invalidation listener connected "
+            f"(client_id={client_id}, "
+            f"mode={'bcast' if self.bcast else 'optin'})"
+        )
+
+    async def _close(self) -> None:
+        """Close dedicated connections, ignoring errors."""
+        for connection in (self._listener, self._control):
+            if connection is None:
+                continue
+            try:
+                await connection.disconnect(nowait=True)
+            except (RedisError, OSError, TimeoutError) as ex:
+                logger.debug(f"Error closing tracking connection: {ex}")
+        self._listener = None
+        self._control = None
+
+    async def _run(self) -> None:
+        """Listener loop: (re)connect, receive, flush L1 on any loss."""
+        while True:
+            try:
+                await self._connect()
+                # Anything cached before this point is unverified
+                await self._flush("reconnect")
+                self._ready.set()
+                await self._receive()
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError, TimeoutError, ValueError) as ex:
+                # RedisError/OSError: connection refused or dropped
+                # TimeoutError: no PING reply within socket timeout
+                # ValueError: unexpected CLIENT ID reply
+                was_connected = self.connected
+                self.client_id = None
+                cache_tracking_connected.set(0)
+                await self._close()
+                self._ready.set()
+                if was_connected:
+                    logger.warning(f"Redis invalidation listener lost: {ex}")
+                    await self._flush("connection_lost")
+                else:
+                    logger.debug(f"Redis invalidation listener down: {ex}")
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _receive(self) -> None:
+        """Read invalidation messages, health-checking idle connections."""
+        idle_timeout = app_settings.REDIS_HEALTH_CHECK_INTERVAL
+        while True:
+            message = await self._listener.read_response(  # type: ignore[union-attr]
+                timeout=idle_timeout
+            )
+            if message is None:
+                await self._ping()
+                continue
+            await self._handle(message)
+
+    async def _ping(self) -> None:
+        """Verify idle listener/control connections are still alive."""
+        listener = self._listener
+        await listener.send_command("PING")  # type: ignore[union-attr]
+        reply = await listener.read_response(  # type: ignore[union-attr]
+            timeout=app_settings.REDIS_SOCKET_TIMEOUT
+        )
+        if reply is None:
+            raise TimeoutError("No PING reply on invalidation channel")
+        await self._handle(reply)
+
+        if self._control is not None:
+            await self._control.send_command("PING")
+            await self._control.read_response()
+
+    async def _handle(self, message: Any) -> None:
+        """Dispatch one pub/sub message from the listener connection."""
+        if (
+            not isinstance(message, list)
+            or len(message) < 3
+            or message[0] != "message"
+        ):
+            return
+
+        keys = message[2]
+        if keys is None:
+            # Server flushed the keyspace (FLUSHALL/FLUSHDB)
+            await self._flush("server_flush")
+            return
+
+        if isinstance(keys, str):
+            keys = [keys]
+        cache_tracking_invalidations_total.inc(len(keys))
+        await self.on_invalidate(list(keys))
+
+    async def _flush(self, reason: str) -> None:
+        """Ask the owner to drop every cached key."""
+        cache_tracking_flushes_total.labels(reason=reason).inc()
+        logger.debug(f"Client tracking flush ({reason})")
+        await self.on_invalidate(None)
+
+
+class TrackingConnectionPool(ConnectionPool):
+    """
+    Connection pool whose connections are tracked by a Redis tracker.
+
+    Tracking is enabled by the connect hook on every new connection and
+    re-enabled on checkout when the listener reconnected since (new
+    redirect client id).
+    """
+
+    def __init__(self, *args: Any, tracker: RedisClientTracker, **kwargs: Any):
+        kwargs.setdefault("redis_connect_func", tracker.on_connect)
+        super().__init__(*args, **kwargs)
+        self.tracker = tracker
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        """Get a connection, refreshing its tracking if stale."""
+        connection = await super().get_connection(*args, **kwargs)
+        if not self.tracker.is_current(connection):
+            try:
+                await self.tracker.enable(connection)
+            except BaseException:
+                await self.release(connection)
+                raise
+        return connection
@@ -0,0 +1,93 @@
+"""
+Ranked substring search backed by pg_trgm GIN indexes.
+
+A leading-wildcard ``ILIKE '%term%'`` cannot use a btree index, but a
+``gin_trgm_ops`` index answers it by intersecting the trigrams of the
+term. The same index serves the similarity operator ``%``, which also
+tolerates typos. Results are ranked by ``similarity()`` so callers can ask
+for the top-k matches without reading every matching row.
+
+Searchable columns carry a ``gin_trgm_ops`` index (see the model
+``__table_args__`` and the pg_trgm migration).
+"""
+
+from typing import Any, Literal, Type
+
+from sqlalchemy import ColumnElement, Select, func
+from sqlmodel import select
+
+from app.schemas.generic_typing import GenericSQLModelType
+from app.storage.filters import MAX_PATTERN_LENGTH, escape_like
+
+# - "substring": rows containing the term (case-insensitive ILIKE)
+# - "similar": rows whose trigram similarity to the term exceeds
+#   pg_trgm.similarity_threshold (default 0.3); tolerates typos
+SearchMode = Literal["substring", "similar"]
+
+
+def search_predicate(
+    column: Any, term: str, mode: SearchMode = "substring"
+) -> ColumnElement[bool]:
+    """
+    Build the trigram-indexable match predicate for a search term.
+
+    Args:
+        column: Column with a ``gin_trgm_ops`` index.
+        term: Search term.
+        mode: "substring" or "similar".
+
+    Returns:
+        SQLAlchemy boolean expression.
+    """
+    term = term[:MAX_PATTERN_LENGTH]
+    if mode == "similar":
+        return column.op("%")(term)
+    return column.ilike(f"%{escape_like(term)}%", escape="\\")
+
+
+def ranked_search(
+    model: Type[GenericSQLModelType],
+    field: str,
+    term: str,
+    *,
+    limit: int,
+    mode: SearchMode = "substring",
+    query: Select[Any] | None = None,
+) -> Select[Any]:
+    """
+    Build a query returning the top ``limit`` matches for a search term.
+
+    Matches are ordered by trigram similarity to the term, then by the
+    shorter value and id, so exact and near-exact matches come first and
+    the order is stable.
+
+    Args:
+        model: The SQLModel class to search.
+        field: Name of the searched column.
+        term: Search term.
+        limit: Maximum number of results (top-k).
+        mode: "substring" or "similar".
+        query: Base query to narrow (defaults to ``select(model)``).
+
+    Returns:
+        The ranked, limited query.
+
+    Raises:
+        ValueError: If the field is not an attribute of the model.
+    """
+    if not hasattr(model, field):
+        raise ValueError(
+            f"Invalid search field: {field} is not an attribute of "
+            f"{model.__name__}"
+        )
+    column = getattr(model, field)
+    base = query if query is not None else select(model)
+    return (
+        base.where(search_predicate(column, term, mode))
+        .order_by(
+            func.similarity(column, term).desc(),
+            func.length(column),
+            model.id,
+        )
+        .limit(limit)
+    )
@@ -0,0 +1,463 @@
+"""
+Shared-memory L1 cache for worker processes on the same host.
+
+With several uvicorn workers per pod every process keeps its own
+in-memory cache, multiplying memory use and lowering the hit rate. This
+module provides a fixed-size hash table in a memory-mapped file
+(``/dev/shm`` when available) that all workers open by name, so a key
+fetched from Redis by one worker is an L1 hit for every other worker.
+
+Layout::
+
+    <64-byte header: magic, slot count, slot size>
+    <slot 0><slot 1>...<slot N-1>
+
+Each slot is ``slot_size`` bytes: a 32-byte slot header (seqlock counter,
+CRC32 of the value, 64-bit key hash, expiry, value/key lengths, state)
+followed by the key bytes and the codec-framed value. Keys are placed by
+open addressing with linear probing over at most ``max_probe`` slots; when
+the probe window is full the entry expiring first is replaced.
+
+Concurrency:
+- Readers are lock-free. They retry while the slot's sequence number is
+  odd or changed during the copy, and verify the key bytes and the value
+  CRC, so a torn read is reported as a miss.
+- Writers take a POSIX byte-range lock (``fcntl.lockf``) on the key's
+  whole probe window, so probing and claiming a slot is atomic across
+  processes (one slot per key). Each slot write bumps the sequence number
+  to odd, writes, then bumps it back to even. ``clear()`` locks every
+  slot. Window ranges are locked in ascending offset order.
+
+Values larger than the slot capacity are not cached here (Redis only).
+POSIX only (uses ``fcntl``).
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from app.logging import logger
+from app.utils.cache_codecs import (
+    DEFAULT_COMPRESS_THRESHOLD,
+    CacheCodec,
+    CacheSerializer,
+)
+
+MAGIC = b"L1SHM\x00\x00\x01"
+
+# magic, slot count, slot size (padded to _HEADER_SIZE)
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+
+# seq, crc32, key hash, expires_at, value length, key length, state
+_SLOT = struct.Struct("<IIQdIHH")
+_SEQ = struct.Struct("<I")
+_SEQ_MASK = 0xFFFFFFFF
+
+# Slot states
+_EMPTY = 0
+_USED = 1
+_DELETED = 2
+
+# Optimistic read attempts before treating a busy slot as a miss
+_READ_RETRIES = 4
+
+
+def _key_hash(key: bytes) -> int:
+    """Stable 64-bit key hash (``hash()`` is randomized per process)."""
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), "little"
+    )
+
+
+class SharedMemoryCache:
+    """
+    Fixed-size hash table in a memory-mapped segment shared by processes.
+
+    Every process that constructs the cache with the same ``name`` (and
+    geometry) maps the same segment. The first one creates it.
+
+    Example:
+        >>> shm = SharedMemoryCache("app_l1", slots=8192, slot_size=2048)
+        >>> shm.set("user:1", {"name": "John"}, ttl=60)
+        True
+        >>> shm.get("user:1")
+        {'name': 'John'}
+    """
+
+    def __init__(
+        self,
+        name: str = "cache_l1",
+        slots: int = 4096,
+        slot_size: int = 1024,
+        max_probe: int = 8,
+        codec: CacheCodec | None = None,
+        compress_threshold: int | None = DEFAULT_COMPRESS_THRESHOLD,
+        directory: str | None = None,
+    ) -> None:
+        """
+        Open (or create) the shared segment.
+
+        Args:
+            name: Segment name shared by all worker processes.
+            slots: Number of slots in the table.
+            slot_size: Bytes per slot, including the 32-byte slot header.
+            max_probe: Maximum slots probed per key.
+            codec: Codec used to serialize values (default: JSON).
+            compress_threshold: Compress values larger than this many
+                bytes so more of them fit in a slot (None disables).
+            directory: Directory for the backing file (default:
+                ``/dev/shm`` when present, else the temp directory).
+
+        Raises:
+            ValueError: If the geometry is invalid or an existing segment
+                with this name has a different geometry.
+        """
+        if slots <= 0 or slot_size <= _SLOT.size:
+            raise ValueError(
+                f"Invalid shared cache geometry: slots={slots}, "
+                f"slot_size={slot_size} (must exceed {_SLOT.size})"
+            )
+
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self.max_probe = min(max_probe, slots)
+        self.capacity = slot_size - _SLOT.size
+        self._serializer = CacheSerializer(
+            codec=codec, compress_threshold=compress_threshold
+        )
+
+        if directory is None:
+            directory = (
+                "/dev/shm"
+                if os.path.isdir("/dev/shm")
+                else tempfile.gettempdir()
+            )
+        self.path = os.path.join(directory, f"{name}.l1cache")
+        self._size = _HEADER_SIZE + slots * slot_size
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self._mm = self._map()
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        logger.info(
+            f"Opened shared memory cache {self.path}: slots={slots}, "
+            f"slot_size={slot_size}, size={self._size} bytes"
+        )
+
+    def _map(self) -> mmap.mmap:
+        """Create or validate the segment under an exclusive file lock."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            size = os.fstat(self._fd).st_size
+            if size == 0:
+                os.ftruncate(self._fd, self._size)
+            elif size != self._size:
+                raise ValueError(
+                    f"Shared cache {self.path} has size {size}, "
+                    f"expected {self._size} (geometry mismatch)"
+                )
+
+            mm = mmap.mmap(self._fd, self._size)
+            magic, slots, slot_size = _HEADER.unpack_from(mm, 0)
+            if magic == b"\x00" * len(MAGIC):
+                _HEADER.pack_into(mm, 0, MAGIC, self.slots, self.slot_size)
+            elif (magic, slots, slot_size) != (
+                MAGIC,
+                self.slots,
+                self.slot_size,
+            ):
+                mm.close()
+                raise ValueError(
+                    f"Shared cache {self.path} has incompatible header "
+                    f"(slots={slots}, slot_size={slot_size})"
+                )
+            return mm
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, index: int) -> int:
+        """Byte offset of a slot."""
+        return _HEADER_SIZE + index * self.slot_size
+
+    def _probe(self, key_hash: int) -> range:
+        """Slot indexes probed for a key (may wrap past the end)."""
+        start = key_hash % self.slots
+        return range(start, start + self.max_probe)
+
+    def _window(self, key_hash: int) -> list[tuple[int, int]]:
+        """Byte ranges (offset, length) of a probe window, ascending."""
+        start = key_hash % self.slots
+        end = start + self.max_probe
+        if end <= self.slots:
+            return [(self._offset(start), self.max_probe * self.slot_size)]
+        # Wraps past the last slot
+        return [
+            (self._offset(0), (end - self.slots) * self.slot_size),
+            (self._offset(start), (self.slots - start) * self.slot_size),
+        ]
+
+    @contextmanager
+    def _locked(self, ranges: list[tuple[int, int]]) -> Iterator[None]:
+        """Hold exclusive byte-range locks on ``ranges`` (in order)."""
+        held: list[tuple[int, int]] = []
+        try:
+            for offset, length in ranges:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+                held.append((offset, length))
+            yield
+        finally:
+            for offset, length in reversed(held):
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+
+    def _read_slot(
+        self, offset: int, key: bytes, key_hash: int
+    ) -> tuple[int, bytes | None]:
+        """
+        Read a slot consistently (seqlock).
+
+        Returns:
+            Tuple of (state, value payload if the slot holds ``key`` and
+            has not expired). State is ``-1`` if the slot stayed busy.
+        """
+        mm = self._mm
+        for _ in range(_READ_RETRIES):
+            seq, crc, slot_hash, expires_at, value_len, key_len, state = (
+                _SLOT.unpack_from(mm, offset)
+            )
+            if seq & 1:
+                continue
+
+            data = None
+            if (
+                state == _USED
+                and slot_hash == key_hash
+                and key_len == len(key)
+            ):
+                start = offset + _SLOT.size
+                data = mm[start : start + key_len + value_len]
+
+            if _SEQ.unpack_from(mm, offset)[0] != seq:
+                continue
+
+            if data is None or data[:key_len] != key:
+                return state, None
+            value = data[key_len:]
+            if expires_at < time.time() or zlib.crc32(value) != crc:
+                return state, None
+            return state, value
+
+        return -1, None
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value (lock-free).
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None on miss, expiry or concurrent write.
+        """
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+
+        for index in self._probe(key_hash):
+            offset = self._offset(index % self.slots)
+            state, payload = self._read_slot(offset, key_bytes, key_hash)
+            if payload is not None:
+                try:
+                    return self._serializer.decode(payload)
+                except ValueError:
+                    return None
+            if state == _EMPTY:
+                # End of the probe chain
+                return None
+        return None
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        """
+        Store a value, replacing the soonest-expiring entry if needed.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (must be serializable by the codec).
+            ttl: Time-to-live in seconds.
+
+        Returns:
+            False if the value does not fit in a slot, True otherwise.
+        """
+        key_bytes = key.encode()
+        payload, _ = self._serializer.encode(value)
+        if len(key_bytes) + len(payload) > self.capacity:
+            return False
+
+        key_hash = _key_hash(key_bytes)
+        with self._locked(self._window(key_hash)):
+            offset = self._claim(key_bytes, key_hash)
+            self._write_slot(
+                offset,
+                key_bytes,
+                key_hash,
+                payload,
+                time.time() + ttl,
+                _USED,
+            )
+        return True
+
+    def _claim(self, key: bytes, key_hash: int) -> int:
+        """
+        Pick the slot for a key. Caller must hold the window lock.
+
+        Returns:
+            Offset of the slot already holding the key, else the first
+            free or expired slot, else the soonest-expiring entry.
+        """
+        now = time.time()
+        free: int | None = None
+        victim = self._offset(key_hash % self.slots)
+        victim_expiry = float("inf")
+
+        for index in self._probe(key_hash):
+            offset = self._offset(index % self.slots)
+            _, _, slot_hash, expires_at, _, key_len, state = _SLOT.unpack_from(
+                self._mm, offset
+            )
+            if state == _USED and slot_hash == key_hash:
+                start = offset + _SLOT.size
+                if self._mm[start : start + key_len] == key:
+                    return offset
+            if state != _USED or expires_at < now:
+                if free is None:
+                    free = offset
+                if state == _EMPTY:
+                    break
+            elif expires_at < victim_expiry:
+                victim, victim_expiry = offset, expires_at
+
+        return free if free is not None else victim
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a key from every slot of its probe window.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if the key was present.
+        """
+        key_bytes = key.encode()
+        key_hash = _key_hash(key_bytes)
+        removed = False
+
+        with self._locked(self._window(key_hash)):
+            for index in self._probe(key_hash):
+                offset = self._offset(index % self.slots)
+                _, _, slot_hash, _, _, key_len, state = _SLOT.unpack_from(
+                    self._mm, offset
+                )
+                if state == _EMPTY:
+                    break
+                if state != _USED or slot_hash != key_hash:
+                    continue
+                start = offset + _SLOT.size
+                if self._mm[start : start + key_len] == key_bytes:
+                    self._write_slot(offset, b"", 0, b"", 0.0, _DELETED)
+                    removed = True
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry (for all processes sharing the segment)."""
+        with self._locked([(_HEADER_SIZE, self.slots * self.slot_size)]):
+            for index in range(self.slots):
+                offset = self._offset(index)
+                seq = _SEQ.unpack_from(self._mm, offset)[0]
+                busy = (seq + 1) & _SEQ_MASK
+                _SEQ.pack_into(self._mm, offset, busy)
+                _SLOT.pack_into(self._mm, offset, busy, 0, 0, 0.0, 0, 0, 0)
+                _SEQ.pack_into(self._mm, offset, (seq + 2) & _SEQ_MASK)
+
+    def _write_slot(
+        self,
+        offset: int,
+        key: bytes,
+        key_hash: int,
+        payload: bytes,
+        expires_at: float,
+        state: int,
+    ) -> None:
+        """
+        Write a slot (seqlock writer).
+
+        Caller must hold the lock of a range covering the slot.
+        """
+        mm = self._mm
+        seq = _SEQ.unpack_from(mm, offset)[0]
+        busy = (seq + 1) & _SEQ_MASK
+        _SEQ.pack_into(mm, offset, busy)
+        start = offset + _SLOT.size
+        mm[start : start + len(key) + len(payload)] = key + payload
+        _SLOT.pack_into(
+            mm,
+            offset,
+            busy,
+            zlib.crc32(payload),
+            key_hash,
+            expires_at,
+            len(payload),
+            len(key),
+            state,
+        )
+        _SEQ.pack_into(mm, offset, (seq + 2) & _SEQ_MASK)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Count live entries (scans the table).
+
+        Returns:
+            Dictionary with entry count, payload bytes and geometry.
+        """
+        now = time.time()
+        entries = 0
+        used_bytes = 0
+        for index in range(self.slots):
+            _, _, _, expires_at, value_len, key_len, state = _SLOT.unpack_from(
+                self._mm, self._offset(index)
+            )
+            if state == _USED and expires_at >= now:
+                entries += 1
+                used_bytes += key_len + value_len
+        return {
+            "entries": entries,
+            "bytes": used_bytes,
+            "slots": self.slots,
+            "slot_size": self.slot_size,
+            "segment_bytes": self._size,
+        }
+
+    def close(self) -> None:
+        """Unmap the segment in this process (data stays for others)."""
+        if not self._mm.closed:
+            self._mm.close()
+            os.close(self._fd)
+
+    def unlink(self) -> None:
+        """Close and delete the backing file."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
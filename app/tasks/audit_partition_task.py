@@ -0,0 +1,325 @@
+"""
+Audit log partition maintenance task.
+
+``user_actions`` is range-partitioned by month on ``timestamp`` (UTC
+bounds, partitions named ``user_actions_pYYYYMM``). This task keeps
+``AUDIT_PARTITION_PREMAKE_MONTHS`` future partitions in place so inserts
+never land in the default partition, and enforces
+``AUDIT_LOG_RETENTION_DAYS`` by dropping partitions whose whole month is
+past retention. Dropping a partition is a catalog operation: unlike a
+``DELETE``, it leaves no dead tuples behind and needs no vacuum. Rows of
+the much smaller ``user_action_rollups`` table past retention are deleted
+in the same run. Rows that reached the default partition anyway (the task
+stopped running for a while) are moved into monthly partitions.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.logging import logger
+from app.models.user_action import UserAction
+from app.models.user_action_rollup import UserActionRollup
+from app.settings import app_settings
+from app.storage.db import engine
+from app.utils.metrics import audit_default_partition_rows
+
+PARTITION_PREFIX = f"{UserAction.__tablename__}_p"
+DEFAULT_PARTITION = f"{UserAction.__tablename__}_default"
+
+COLUMN_NAMES = ", ".join(
+    f'"{column.name}"'
+    for column in UserAction.__table__.columns  # type: ignore[attr-defined]
+)
+
+# Serializes maintenance between app instances
+PARTITION_LOCK_ID = 0x75A5_0001
+
+# Bounds the wait for the parent table's lock, so maintenance does not
+# queue other queries behind it; a timed-out run is retried next time
+PARTITION_LOCK_TIMEOUT = "5s"
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the UTC month containing ``moment``."""
+    moment = moment.astimezone(UTC)
+    return datetime(moment.year, moment.month, 1, tzinfo=UTC)
+
+
+def add_months(start: datetime, months: int) -> datetime:
+    """Start of the month ``months`` after the month starting at ``start``."""
+    year, month = divmod(start.month - 1 + months, 12)
+    return start.replace(year=start.year + year, month=month + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition holding the month starting at ``start``."""
+    return f"{PARTITION_PREFIX}{start:%Y%m}"
+
+
+def partition_start(name: str) -> datetime | None:
+    """Month a partition holds, or None for other tables (e.g. default)."""
+    try:
+        return datetime.strptime(
+            name.removeprefix(PARTITION_PREFIX), "%Y%m"
+        ).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def plan_partitions(
+    existing: list[str], now: datetime
+) -> tuple[list[datetime], list[str]]:
+    """
+    Decide which partitions to create and which to drop.
+
+    Args:
+        existing: Names of the current partitions.
+        now: Current time.
+
+    Returns:
+        Months to create partitions for, and partitions to drop. A
+        partition is dropped once its month ended more than
+        ``AUDIT_LOG_RETENTION_DAYS`` ago (never if retention is <= 0).
+    """
+    current = month_start(now)
+    wanted = [
+        add_months(current, i)
+        for i in range(app_settings.AUDIT_PARTITION_PREMAKE_MONTHS + 1)
+    ]
+    create = [
+        start for start in wanted if partition_name(start) not in existing
+    ]
+
+    drop = []
+    if app_settings.AUDIT_LOG_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=app_settings.AUDIT_LOG_RETENTION_DAYS)
+        for name in existing:
+            start = partition_start(name)
+            if start is not None and add_months(start, 1) <= cutoff:
+                drop.append(name)
+    return create, sorted(drop)
+
+
+async def list_partitions(connection: AsyncConnection) -> dict[str, bool]:
+    """
+    Current partitions of ``user_actions``.
+
+    Returns:
+        Partition names, mapped to whether an interrupted
+        ``DETACH ... CONCURRENTLY`` left them pending detach.
+    """
+    rows = await connection.execute(
+        text(
+            "SELECT c.relname, i.inhdetachpending FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": UserAction.__tablename__},
+    )
+    return {name: pending for name, pending in rows.all()}
+
+
+async def default_partition_months(
+    connection: AsyncConnection,
+) -> dict[datetime, int] | None:
+    """
+    Rows in the default partition, per UTC month.
+
+    Returns:
+        Row counts by month start, or None if there is no default
+        partition table (attached or not).
+    """
+    exists = (
+        await connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"),
+            {"name": DEFAULT_PARTITION},
+        )
+    ).scalar_one()
+    if not exists:
+        return None
+    rows = await connection.execute(
+        text(
+            "SELECT date_trunc('month', \"timestamp\", 'UTC'), count(*) "
+            f"FROM {DEFAULT_PARTITION} GROUP BY 1"
+        )
+    )
+    return {month_start(month): count for month, count in rows.all()}
+
+
+async def maintain_audit_partitions(now: datetime | None = None) -> None:
+    """
+    Create upcoming partitions and drop expired ones and expired rollups.
+
+    Runs on an autocommit connection, as ``DETACH PARTITION ...
+    CONCURRENTLY`` cannot run in a transaction block:
+
+    1. In one transaction, partitions are created for the upcoming months
+       and for the months of any rows found in the default partition,
+       which are moved into them. The default partition is detached
+       meanwhile, so creating those partitions does not conflict with its
+       rows (and because ``CONCURRENTLY`` is not allowed while the table
+       has a default partition). Rollups past retention are deleted.
+    2. Expired partitions are detached with ``CONCURRENTLY`` (readers and
+       writers of other partitions are not blocked) and then dropped.
+    3. The default partition is attached again.
+
+    Rows found in the default partition are logged and reported in
+    ``audit_default_partition_rows``. Skipped when ``user_actions`` is
+    not partitioned (migration not applied) or another instance holds
+    the maintenance lock.
+
+    Args:
+        now: Current time (default: now).
+    """
+    now = now or datetime.now(UTC)
+    table = UserAction.__tablename__
+
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+        relkind = (
+            await connection.execute(
+                text(
+                    "SELECT relkind FROM pg_class "
+                    "WHERE oid = to_regclass(:table)"
+                ),
+                {"table": table},
+            )
+        ).scalar_one_or_none()
+        if relkind != "p":
+            logger.warning(
+                f"{table} is not partitioned, skipping partition "
+                f"maintenance (run the migrations)"
+            )
+            return
+
+        locked = (
+            await connection.execute(
+                text("SELECT pg_try_advisory_lock(:id)"),
+                {"id": PARTITION_LOCK_ID},
+            )
+        ).scalar_one()
+        if not locked:
+            return
+        try:
+            await _maintain(connection, now)
+        finally:
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(:id)"),
+                {"id": PARTITION_LOCK_ID},
+            )
+
+
+async def _maintain(connection: AsyncConnection, now: datetime) -> None:
+    """Run the maintenance steps while holding the maintenance lock."""
+    table = UserAction.__tablename__
+    partitions = await list_partitions(connection)
+    create, drop = plan_partitions(list(partitions), now)
+
+    stray = await default_partition_months(connection)
+    has_default = stray is not None
+    stray = stray or {}
+    audit_default_partition_rows.set(sum(stray.values()))
+    if stray:
+        logger.error(
+            f"Moving {sum(stray.values())} audit rows out of "
+            f"{DEFAULT_PARTITION}; partition maintenance fell behind"
+        )
+        create = sorted(
+            set(create)
+            | {
+                month
+                for month in stray
+                if partition_name(month) not in partitions
+            }
+        )
+
+    detach_default = has_default and bool(stray or drop)
+    async with engine.begin() as transaction:
+        await transaction.execute(
+            text(f"SET LOCAL lock_timeout = '{PARTITION_LOCK_TIMEOUT}'")
+        )
+        if detach_default and DEFAULT_PARTITION in partitions:
+            await transaction.execute(
+                text(
+                    f"ALTER TABLE {table} DETACH PARTITION {DEFAULT_PARTITION}"
+                )
+            )
+
+        for start in create:
+            # Names and bounds are generated here, not user input
+            await transaction.execute(
+                text(
+                    f"CREATE TABLE {partition_name(start)} "
+                    f"PARTITION OF {table} FOR VALUES "
+                    f"FROM ('{start.isoformat()}') "
+                    f"TO ('{add_months(start, 1).isoformat()}')"
+                )
+            )
+            logger.info(f"Created partition {partition_name(start)}")
+
+        if stray:
+            await transaction.execute(
+                text(
+                    f"INSERT INTO {table} ({COLUMN_NAMES}) "
+                    f"SELECT {COLUMN_NAMES} FROM {DEFAULT_PARTITION}"
+                )
+            )
+            await transaction.execute(text(f"TRUNCATE {DEFAULT_PARTITION}"))
+
+        if app_settings.AUDIT_LOG_RETENTION_DAYS > 0:
+            cutoff = now - timedelta(
+                days=app_settings.AUDIT_LOG_RETENTION_DAYS
+            )
+            await transaction.execute(
+                delete(UserActionRollup).where(
+                    UserActionRollup.minute < cutoff  # type: ignore[arg-type]
+                )
+            )
+
+    try:
+        for name in drop:
+            # FINALIZE completes a detach interrupted on an earlier run
+            mode = "FINALIZE" if partitions[name] else "CONCURRENTLY"
+            await connection.execute(
+                text(f"ALTER TABLE {table} DETACH PARTITION {name} {mode}")
+            )
+            await connection.execute(text(f"DROP TABLE {name}"))
+            logger.info(f"Dropped expired audit partition {name}")
+    finally:
+        # Also reattaches a default partition left detached by a failed run
+        if has_default and (
+            detach_default or DEFAULT_PARTITION not in partitions
+        ):
+            await connection.execute(
+                text(
+                    f"ALTER TABLE {table} "
+                    f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+                )
+            )
+
+
+async def audit_partition_task() -> None:
+    """
+    Periodically maintain the ``user_actions`` partitions.
+
+    Runs at startup and then every ``AUDIT_PARTITION_MAINTENANCE_INTERVAL``
+    seconds, handling errors gracefully to prevent disrupting other
+    background tasks.
+    """
+    logger.info("Starting audit partition maintenance task")
+
+    while True:
+        try:
+            await maintain_audit_partitions()
+        except Exception as ex:  # noqa: BLE001
+            # Retried on the next run; premade partitions leave time
+            logger.error(
+                f"Error in audit_partition_task: {ex}",
+                exc_info=True,
+            )
+        await asyncio.sleep(app_settings.AUDIT_PARTITION_MAINTENANCE_INTERVAL)
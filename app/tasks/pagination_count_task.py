@@ -0,0 +1,83 @@
+"""
+Pagination count reconciliation task.
+
+Tracked pagination counts are adjusted in place by repository writes
+(see ``app.utils.pagination_cache``). Adjustments can drift: a write that
+is rolled back after its flush, or a recount racing a concurrent insert.
+This task periodically recomputes every tracked count from the database
+and overwrites the cached value, bounding how long any drift can last.
+"""
+
+import asyncio
+from typing import Any
+
+from sqlmodel import SQLModel, func, select
+from sqlmodel.main import default_registry
+
+from app.constants import TASK_ERROR_BACKOFF_SECONDS
+from app.logging import logger
+from app.settings import app_settings
+from app.storage.db import async_session, default_apply_filters
+from app.utils.pagination_cache import get_tracked_counts, reset_tracked_count
+
+
+def _table_models() -> dict[str, type[SQLModel]]:
+    """Map model class names to SQLModel table classes."""
+    return {
+        mapper.class_.__name__: mapper.class_
+        for mapper in default_registry.mappers
+    }
+
+
+async def reconcile_pagination_counts() -> int:
+    """
+    Recompute all tracked pagination counts.
+
+    Returns:
+        Number of counts reconciled.
+    """
+    tracked = await get_tracked_counts()
+    if not tracked:
+        return 0
+
+    models = _table_models()
+    reconciled = 0
+    async with async_session() as session:
+        for model_name, counts in tracked.items():
+            model: Any = models.get(model_name)
+            if model is None:
+                logger.warning(f"Cannot reconcile counts for {model_name}")
+                continue
+            for cache_key, filters in counts.items():
+                query = select(func.count(model.id))
+                if filters:
+                    query = default_apply_filters(query, model, filters)
+                total = (await session.exec(query)).one()
+                await reset_tracked_count(cache_key, total)
+                reconciled += 1
+    return reconciled
+
+
+async def pagination_count_reconcile_task() -> None:
+    """
+    Periodically reconcile tracked pagination counts with the database.
+
+    Runs every ``PAGINATION_COUNT_RECONCILE_INTERVAL`` seconds and handles
+    errors gracefully to prevent disrupting other background tasks.
+    """
+    logger.info("Starting pagination count reconciliation task")
+
+    while True:
+        try:
+            await asyncio.sleep(
+                app_settings.PAGINATION_COUNT_RECONCILE_INTERVAL
+            )
+            reconciled = await reconcile_pagination_counts()
+            if reconciled:
+                logger.debug(f"Reconciled {reconciled} pagination counts")
+        except Exception as ex:  # noqa: BLE001
+            logger.error(
+                f"Error in pagination_count_reconcile_task: {ex}",
+                exc_info=True,
+            )
+            await asyncio.sleep(TASK_ERROR_BACKOFF_SECONDS)
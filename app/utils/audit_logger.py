@@ -4,18 +4,37 @@ Audit logging utilities for tracking user actions.
 This module provides utilities for logging user actions to the database
 for security, compliance, debugging, and analytics purposes.
 
-Uses an async queue and background worker for non-blocking audit log writes.
+Uses an async queue and background workers for non-blocking audit log
+writes. ``log_user_action`` only enqueues an :class:`AuditRecord` tuple;
+``AUDIT_WORKERS`` writer tasks drain the queue in batches that grow with
+its depth, validate and sanitize the records and write them, holding at
+most ``AUDIT_DB_CONNECTIONS`` pool connections between them. Batches are
+streamed into ``user_actions`` with the driver's binary COPY protocol from
+plain tuples (``AUDIT_WRITER="copy"``); the ORM path (``session.add_all``
++ flush) is kept as a fallback for drivers without COPY support and for
+``AUDIT_WRITER="orm"``. In the same transaction, each batch's per-minute
+counts are upserted into ``user_action_rollups``
+(``AUDIT_ROLLUPS_ENABLED``).
 """
 
 import asyncio
+import json
 import time
-from typing import Any
-
+from collections import Counter
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Final, NamedTuple
+
+from asyncpg import InterfaceError, PostgresError
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.requests import Request
 
 from app.logging import logger
 from app.models.user_action import UserAction
+from app.models.user_action_rollup import UserActionRollup
 from app.schemas.audit import AuditLogInput
 from app.settings import app_settings
 from app.storage.db import async_session
@@ -49,11 +68,70 @@ SENSITIVE_FIELDS = {
     "authorization",
 }
 
+
+class AuditRecord(NamedTuple):
+    """
+    Audit entry as queued by :func:`log_user_action`.
+
+    A plain tuple in ``user_actions`` column order (without the generated
+    id) holding references to the caller's values. Validation,
+    sanitization and model building are left to the background worker
+    (see :func:`prepare_audit_batch`), so queueing costs one tuple.
+    ``stream_id`` is only set on records read from the audit stream.
+    ``weight`` is not a column: it is the number of actions the record
+    stands for in ``user_action_rollups`` (the request count of a
+    WebSocket summary row, 1 otherwise).
+    """
+
+    timestamp: datetime
+    user_id: str
+    username: str
+    user_roles: list[str]
+    action_type: str
+    resource: str
+    outcome: str
+    ip_address: str | None
+    user_agent: str | None
+    request_id: str | None
+    request_data: dict[str, Any] | None
+    response_status: int | None
+    error_message: str | None
+    duration_ms: int | None
+    stream_id: str | None = None
+    weight: int = 1
+
+
+# user_actions columns written by COPY, in record order (all but weight)
+AUDIT_COLUMNS: Final[tuple[str, ...]] = AuditRecord._fields[:-1]
+
+# Rollup rows per upsert statement (4 parameters each, under the
+# driver's 32767 bind parameter limit)
+ROLLUP_CHUNK_SIZE: Final = 5000
+
+# Stream records per insert statement (15 parameters each)
+STREAM_INSERT_CHUNK_SIZE: Final = 2000
+
+# Errors a batch write may raise:
+# SQLAlchemyError: Database errors (ORM path)
+# PostgresError, InterfaceError: Driver errors (COPY path)
+# OSError: I/O errors (disk full, connection issues)
+# RuntimeError: Async context issues
+AUDIT_WRITE_ERRORS: Final = (
+    SQLAlchemyError,
+    PostgresError,
+    InterfaceError,
+    OSError,
+    RuntimeError,
+)
+
 # Global queue for audit logs (initialized lazily)
-_audit_queue: asyncio.Queue[UserAction] | None = None
+_audit_queue: asyncio.Queue[AuditRecord] | None = None
+
+# Connection budget shared by the writers (initialized lazily)
+_write_slots: asyncio.Semaphore | None = None
 
 
-def get_audit_queue() -> asyncio.Queue[UserAction]:
+def get_audit_queue() -> asyncio.Queue[AuditRecord]:
     """
     Get or create the global audit log queue.
 
@@ -66,68 +144,444 @@ def get_audit_queue() -> asyncio.Queue[UserAction]:
     return _audit_queue
 
 
-async def audit_log_worker() -> None:
+def audit_connection_budget() -> int:
+    """
+    Number of pool connections audit writes may hold at once.
+
+    ``AUDIT_DB_CONNECTIONS``, capped at half of the engine's pool
+    (``DB_POOL_SIZE + DB_MAX_OVERFLOW``) so that a burst of audit writes
+    cannot starve request handlers of connections.
+
+    Returns:
+        The budget, at least 1.
+    """
+    pool = app_settings.DB_POOL_SIZE + app_settings.DB_MAX_OVERFLOW
+    return max(1, min(app_settings.AUDIT_DB_CONNECTIONS, pool // 2))
+
+
+def get_audit_write_slots() -> asyncio.Semaphore:
+    """
+    Get or create the semaphore enforcing the audit connection budget.
+
+    Returns:
+        Semaphore with :func:`audit_connection_budget` slots.
+    """
+    global _write_slots
+    if _write_slots is None:
+        _write_slots = asyncio.Semaphore(audit_connection_budget())
+    return _write_slots
+
+
+def audit_batch_target(backlog: int) -> int:
+    """
+    Batch size for the current queue depth.
+
+    ``AUDIT_BATCH_SIZE`` while the queue is shallow. When it backs up,
+    each writer takes its share of the backlog, up to
+    ``AUDIT_MAX_BATCH_SIZE``, so bursts are written in fewer, larger
+    batches instead of being dropped.
+
+    Args:
+        backlog: Records waiting in the queue.
+
+    Returns:
+        Number of records to put in the next batch.
+    """
+    share = -(-backlog // max(1, app_settings.AUDIT_WORKERS))
+    return max(
+        app_settings.AUDIT_BATCH_SIZE,
+        min(share, app_settings.AUDIT_MAX_BATCH_SIZE),
+    )
+
+
+def drain_audit_queue(
+    queue: asyncio.Queue[AuditRecord], batch: list[AuditRecord], size: int
+) -> None:
+    """
+    Move queued records into a batch without waiting.
+
+    Args:
+        queue: The audit queue.
+        batch: Batch to extend in place.
+        size: Size the batch may grow to.
+    """
+    while len(batch) < size:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return
+
+
+async def collect_audit_batch(
+    queue: asyncio.Queue[AuditRecord],
+) -> list[AuditRecord]:
+    """
+    Take the next batch of records off the queue.
+
+    Waits up to ``AUDIT_BATCH_TIMEOUT`` for a first record, then drains
+    what is already queued up to :func:`audit_batch_target`. While the
+    batch is smaller than ``AUDIT_BATCH_SIZE`` it keeps waiting for more
+    records, draining the queue in bulk after each wake-up, until it is
+    full or ``AUDIT_BATCH_TIMEOUT`` has passed since its first record. A
+    burst is written as soon as it fills a batch, and a partial batch at
+    most that long after its first record.
+
+    Args:
+        queue: The audit queue.
+
+    Returns:
+        The batch, empty if nothing arrived within the timeout.
+    """
+    timeout = app_settings.AUDIT_BATCH_TIMEOUT
+    try:
+        batch = [await asyncio.wait_for(queue.get(), timeout=timeout)]
+    except asyncio.TimeoutError:
+        return []
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    drain_audit_queue(queue, batch, audit_batch_target(queue.qsize() + 1))
+    while len(batch) < app_settings.AUDIT_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+        drain_audit_queue(
+            queue, batch, audit_batch_target(queue.qsize() + len(batch))
+        )
+    return batch
+
+
+def prepare_audit_batch(batch: Sequence[AuditRecord]) -> list[AuditRecord]:
+    """
+    Validate and sanitize queued audit records.
+
+    Runs in the background worker. Records failing validation are dropped
+    and counted in ``audit_log_errors_total``.
+
+    Args:
+        batch: Records as queued by :func:`log_user_action`.
+
+    Returns:
+        The valid records, with request data sanitized.
+    """
+    prepared = []
+    for record in batch:
+        try:
+            validated = AuditLogInput(**record._asdict())
+            prepared.append(
+                AuditRecord(
+                    timestamp=validated.timestamp,
+                    user_id=validated.user_id,
+                    username=validated.username,
+                    user_roles=validated.user_roles,
+                    action_type=validated.action_type,
+                    resource=validated.resource,
+                    outcome=validated.outcome,
+                    ip_address=validated.ip_address,
+                    user_agent=validated.user_agent,
+                    request_id=(
+                        str(validated.request_id)
+                        if validated.request_id
+                        else None
+                    ),
+                    request_data=sanitize_data(validated.request_data),
+                    response_status=validated.response_status,
+                    error_message=validated.error_message,
+                    duration_ms=validated.duration_ms,
+                    stream_id=record.stream_id,
+                    weight=record.weight,
+                )
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            # ValueError: Failed validation (pydantic ValidationError)
+            # TypeError: Wrong data type
+            # AttributeError: Missing expected attributes
+            audit_log_errors_total.labels(error_type=type(e).__name__).inc()
+            logger.error(f"Dropping invalid audit record: {e}")
+    return prepared
+
+
+def audit_record(record: AuditRecord) -> tuple[Any, ...]:
+    """
+    Convert a prepared audit record into a COPY record.
+
+    Args:
+        record: Record from :func:`prepare_audit_batch`.
+
+    Returns:
+        Tuple of column values in ``AUDIT_COLUMNS`` order, JSON columns
+        encoded as text.
+    """
+    return record._replace(
+        user_roles=json.dumps(record.user_roles),
+        request_data=(
+            None
+            if record.request_data is None
+            else json.dumps(record.request_data)
+        ),
+    )[: len(AUDIT_COLUMNS)]
+
+
+def audit_row(record: AuditRecord) -> dict[str, Any]:
+    """
+    Column values of a prepared audit record, by column name.
+
+    Args:
+        record: Record from :func:`prepare_audit_batch`.
+
+    Returns:
+        ``user_actions`` values for an INSERT or a ``UserAction``.
+    """
+    return dict(zip(AUDIT_COLUMNS, record))
+
+
+async def copy_audit_batch(
+    session: AsyncSession, batch: Sequence[AuditRecord]
+) -> bool:
+    """
+    Stream a batch into user_actions with binary COPY.
+
+    Runs in the session's transaction and bypasses the unit of work: no
+    ORM state is tracked and no per-row INSERT parameters are bound.
+
+    Args:
+        session: Session whose transaction the rows are written in.
+        batch: Audit entries to write.
+
+    Returns:
+        True if the rows were copied, False if the driver has no COPY
+        support (the caller should use the ORM path).
+    """
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if not hasattr(driver, "copy_records_to_table"):
+        return False
+    await driver.copy_records_to_table(
+        UserAction.__tablename__,
+        records=[audit_record(record) for record in batch],
+        columns=AUDIT_COLUMNS,
+    )
+    return True
+
+
+async def insert_stream_batch(
+    session: AsyncSession, batch: Sequence[AuditRecord]
+) -> list[AuditRecord]:
+    """
+    Insert records read from the audit stream, skipping duplicates.
+
+    A stream entry is redelivered when its write commits but the
+    acknowledgement is lost, so entries are inserted with
+    ``ON CONFLICT (stream_id, timestamp) DO NOTHING`` and only the rows
+    actually inserted are returned (and counted into the rollups).
+
+    Args:
+        session: Session with an open transaction.
+        batch: Records with ``stream_id`` set.
+
+    Returns:
+        The records that were not written before.
+
+    Raises:
+        Any error in ``AUDIT_WRITE_ERRORS``.
+    """
+    table = UserAction.__table__  # type: ignore[attr-defined]
+    inserted: set[str] = set()
+    for start in range(0, len(batch), STREAM_INSERT_CHUNK_SIZE):
+        chunk = batch[start : start + STREAM_INSERT_CHUNK_SIZE]
+        stmt = (
+            insert(table)
+            .values([audit_row(record) for record in chunk])
+            .on_conflict_do_nothing(
+                index_elements=[table.c.stream_id, table.c.timestamp]
+            )
+            .returning(table.c.stream_id)
+        )
+        result = await session.execute(stmt)
+        inserted.update(result.scalars())
+    return [record for record in batch if record.stream_id in inserted]
+
+
+async def write_audit_batch(
+    session: AsyncSession, batch: Sequence[AuditRecord]
+) -> Sequence[AuditRecord]:
+    """
+    Write a batch of audit records in the session's transaction.
+
+    Uses binary COPY unless ``AUDIT_WRITER`` is "orm" or the driver does
+    not support it, in which case ``UserAction`` models are built, added
+    to the session and flushed. Records read from the audit stream are
+    inserted with :func:`insert_stream_batch` instead, so redelivered
+    entries are written once. With ``AUDIT_ROLLUPS_ENABLED`` the counts
+    of the written records are then added to the rollups
+    (:func:`write_audit_rollups`).
+
+    Args:
+        session: Session with an open transaction.
+        batch: Records from :func:`prepare_audit_batch`.
+
+    Returns:
+        The records written.
+
+    Raises:
+        Any error in ``AUDIT_WRITE_ERRORS``.
+    """
+    if any(record.stream_id for record in batch):
+        batch = await insert_stream_batch(session, batch)
+    elif not (
+        app_settings.AUDIT_WRITER == "copy"
+        and await copy_audit_batch(session, batch)
+    ):
+        session.add_all([UserAction(**audit_row(record)) for record in batch])
+        await session.flush()
+    if app_settings.AUDIT_ROLLUPS_ENABLED and batch:
+        await write_audit_rollups(session, batch)
+    return batch
+
+
+def rollup_audit_batch(batch: Sequence[AuditRecord]) -> list[dict[str, Any]]:
+    """
+    Count a batch per minute, action type, outcome and user.
+
+    Each record counts ``weight`` actions, so a WebSocket summary row adds
+    the requests it summarizes, in the minute its window started.
+
+    Args:
+        batch: Records from :func:`prepare_audit_batch`.
+
+    Returns:
+        ``user_action_rollups`` rows, sorted by key so concurrent writers
+        lock rows in the same order.
+    """
+    counts: Counter[tuple[datetime, str, str, str]] = Counter()
+    for record in batch:
+        key = (
+            record.timestamp.astimezone(UTC).replace(second=0, microsecond=0),
+            record.action_type,
+            record.outcome,
+            record.user_id,
+        )
+        counts[key] += record.weight
+    return [
+        {
+            "minute": minute,
+            "action_type": action_type,
+            "outcome": outcome,
+            "user_id": user_id,
+            "count": count,
+        }
+        for (minute, action_type, outcome, user_id), count in sorted(
+            counts.items()
+        )
+    ]
+
+
+async def write_audit_rollups(
+    session: AsyncSession, batch: Sequence[AuditRecord]
+) -> None:
+    """
+    Add a batch's counts to ``user_action_rollups``.
+
+    One ``INSERT ... ON CONFLICT DO UPDATE`` per ``ROLLUP_CHUNK_SIZE``
+    distinct keys, in the session's transaction, so the counters commit
+    or roll back together with the batch.
+
+    Args:
+        session: Session with an open transaction.
+        batch: Records from :func:`prepare_audit_batch`.
+
+    Raises:
+        Any error in ``AUDIT_WRITE_ERRORS``.
+    """
+    rows = rollup_audit_batch(batch)
+    table = UserActionRollup.__table__  # type: ignore[attr-defined]
+    for start in range(0, len(rows), ROLLUP_CHUNK_SIZE):
+        stmt = insert(table).values(rows[start : start + ROLLUP_CHUNK_SIZE])
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns),
+                set_={"count": table.c.count + stmt.excluded.count},
+            )
+        )
+
+
+async def persist_audit_batch(
+    batch: Sequence[AuditRecord], source: str = "worker"
+) -> bool:
+    """
+    Write a prepared batch in its own transaction and record metrics.
+
+    Holds one slot of the audit connection budget while writing. The
+    batch waits for a slot while the queue keeps filling, so the next
+    batch grows to absorb the backlog.
+
+    Args:
+        batch: Records from :func:`prepare_audit_batch`.
+        source: Writer name used in log messages.
+
+    Returns:
+        True if the batch was committed, False if the write failed (the
+        error is logged and counted in ``audit_log_errors_total``).
+    """
+    try:
+        async with get_audit_write_slots():
+            start_time = time.time()
+            async with async_session() as session:
+                async with session.begin():
+                    batch = await write_audit_batch(session, batch)
+    except AUDIT_WRITE_ERRORS as e:
+        # Record batch write error
+        audit_log_errors_total.labels(error_type=type(e).__name__).inc()
+        logger.error(f"Failed to write audit log batch: {e}")
+        return False
+
+    # Update metrics
+    duration = time.time() - start_time
+    audit_batch_size.observe(len(batch))
+    audit_logs_written_total.inc(len(batch))
+    audit_log_creation_duration_seconds.observe(duration)
+
+    # Update outcome counts
+    for log_entry in batch:
+        audit_logs_total.labels(outcome=log_entry.outcome).inc()
+
+    logger.debug(
+        f"{source.capitalize()} wrote {len(batch)} audit logs "
+        f"to database in {duration:.3f}s"
+    )
+    return True
+
+
+async def audit_log_worker(worker_id: int = 0) -> None:
     """
     Background worker that processes audit logs from queue in batches.
 
-    Collects audit log entries from the queue and writes them to the database
-    in batches to improve performance. Runs continuously until application
-    shutdown.
+    Several workers may run concurrently (``AUDIT_WORKERS``); each takes
+    batches sized to the queue depth (see :func:`collect_audit_batch`)
+    and writes them while holding one slot of the audit connection
+    budget. Runs continuously until application shutdown.
+
+    Args:
+        worker_id: Index of the worker, used in log messages.
     """
     queue = get_audit_queue()
-    logger.info("Audit log background worker started")
+    logger.info(f"Audit log background worker {worker_id} started")
 
     while True:
         try:
-            batch: list[UserAction] = []
-
-            # Collect batch of logs (up to AUDIT_BATCH_SIZE or timeout)
-            try:
-                for _ in range(app_settings.AUDIT_BATCH_SIZE):
-                    log_entry = await asyncio.wait_for(
-                        queue.get(),
-                        timeout=app_settings.AUDIT_BATCH_TIMEOUT,
-                    )
-                    batch.append(log_entry)
-            except asyncio.TimeoutError:
-                # Batch timeout reached, process what we have
-                pass
+            batch = await collect_audit_batch(queue)
+
+            # Validate and sanitize off the request path
+            batch = prepare_audit_batch(batch)
 
             # Write batch to database if we have any logs
             if batch:
-                start_time = time.time()
-
-                try:
-                    async with async_session() as session:
-                        async with session.begin():
-                            session.add_all(batch)
-                            await session.flush()
-
-                    # Update metrics
-                    duration = time.time() - start_time
-                    audit_batch_size.observe(len(batch))
-                    audit_logs_written_total.inc(len(batch))
-                    audit_log_creation_duration_seconds.observe(duration)
-
-                    # Update outcome counts
-                    for log_entry in batch:
-                        audit_logs_total.labels(
-                            outcome=log_entry.outcome
-                        ).inc()
-
-                    logger.debug(
-                        f"Wrote {len(batch)} audit logs to database in {duration:.3f}s"
-                    )
-
-                except (SQLAlchemyError, OSError, RuntimeError) as e:
-                    # SQLAlchemyError: Database errors
-                    # OSError: I/O errors (disk full, connection issues)
-                    # RuntimeError: Async context issues
-                    # Record batch write error
-                    audit_log_errors_total.labels(
-                        error_type=type(e).__name__
-                    ).inc()
-                    logger.error(f"Failed to write audit log batch: {e}")
+                await persist_audit_batch(batch, source=f"worker {worker_id}")
 
             # Update queue size metric
             audit_queue_size.set(queue.qsize())
@@ -138,7 +592,7 @@ async def audit_log_worker() -> None:
         except (RuntimeError, OSError) as e:
             # RuntimeError: Async loop issues
             # OSError: I/O errors
-            logger.error(f"Audit log worker error: {e}")
+            logger.error(f"Audit log worker {worker_id} error: {e}")
             await asyncio.sleep(1)  # Backoff on errors
 
 
@@ -152,41 +606,44 @@ async def flush_audit_queue() -> int:
         Number of logs flushed.
     """
     queue = get_audit_queue()
-    remaining_logs: list[UserAction] = []
+    remaining_logs: list[AuditRecord] = []
 
     logger.info(f"Flushing {queue.qsize()} remaining audit logs")
 
     # Collect all remaining logs from queue
-    while not queue.empty():
-        try:
-            log_entry = queue.get_nowait()
-            remaining_logs.append(log_entry)
-        except asyncio.QueueEmpty:
-            break
+    drain_audit_queue(queue, remaining_logs, queue.qsize())
 
     # Write to database
+    remaining_logs = prepare_audit_batch(remaining_logs)
     if remaining_logs:
         try:
             async with async_session() as session:
                 async with session.begin():
-                    session.add_all(remaining_logs)
-                    await session.flush()
+                    await write_audit_batch(session, remaining_logs)
 
             logger.info(
                 f"Flushed {len(remaining_logs)} audit logs to database"
             )
             return len(remaining_logs)
 
-        except (SQLAlchemyError, OSError, RuntimeError) as e:
-            # SQLAlchemyError: Database errors
-            # OSError: I/O errors
-            # RuntimeError: Async context issues
+        except AUDIT_WRITE_ERRORS as e:
             logger.error(f"Failed to flush audit logs: {e}")
             return 0
 
     return 0
 
 
+@lru_cache(maxsize=1024)
+def is_sensitive_key(key: str) -> bool:
+    """
+    Whether a request data key names a sensitive field.
+
+    Case-insensitive match against ``SENSITIVE_FIELDS``, memoized per key:
+    payloads repeat a small set of keys, so most lookups are one dict hit.
+    """
+    return key.lower() in SENSITIVE_FIELDS
+
+
 def sanitize_data(data: dict[str, Any] | None) -> dict[str, Any] | None:
     """
     Remove sensitive fields from data before logging.
@@ -204,7 +661,7 @@ def sanitize_data(data: dict[str, Any] | None) -> dict[str, Any] | None:
     sanitized = {}
     for key, value in data.items():
         # Check if key matches any sensitive field name (case-insensitive)
-        if key.lower() in SENSITIVE_FIELDS:
+        if is_sensitive_key(key):
             sanitized[key] = "[REDACTED]"
         elif isinstance(value, dict):
             # Recursively sanitize nested dictionaries
@@ -253,12 +710,23 @@ async def log_user_action(
     response_status: int | None = None,
     error_message: str | None = None,
     duration_ms: int | None = None,
-) -> UserAction | None:
+    weight: int = 1,
+    timestamp: datetime | None = None,
+) -> AuditRecord | None:
     """
     Queue a user action for asynchronous logging to the database.
 
-    This function is non-blocking - it adds the log entry to a queue for
-    background processing, allowing the request to complete immediately.
+    This function is non-blocking and runs on every request, so it only
+    packs its arguments into an :class:`AuditRecord` and enqueues it.
+    Validation, sanitization of ``request_data`` and model building happen
+    in the background worker; an invalid record is dropped there and
+    counted in ``audit_log_errors_total``. The record references the
+    caller's ``user_roles`` and ``request_data``, which must not be
+    mutated afterwards.
+
+    With ``AUDIT_TRANSPORT="redis"`` the record is appended to the audit
+    stream instead (see :mod:`app.utils.audit_stream`), falling back to
+    the queue if Redis is unavailable.
 
     Args:
         user_id: Keycloak user ID (sub claim) - type-safe UserId.
@@ -274,12 +742,14 @@ async def log_user_action(
         response_status: HTTP status code or WebSocket response code.
         error_message: Error details if action failed.
         duration_ms: Request processing duration in milliseconds.
+        weight: Number of actions the entry stands for in the rollups
+            (the request count of a summary row).
+        timestamp: When the action happened, if not now (the start of
+            the window a summary row covers).
 
     Returns:
-        The created UserAction instance (not yet persisted), or None if queueing failed.
-
-    Raises:
-        ValidationError: If any parameter fails Pydantic validation (type or value errors).
+        The queued or published record (not yet validated or persisted),
+        or None if the queue was full.
 
     Examples:
         >>> # Successful action
@@ -345,101 +815,67 @@ async def log_user_action(
         ...     duration_ms=32,
         ... )
     """
-    # Validate input parameters using Pydantic model
-    # This will raise ValidationError for invalid types or empty required fields
-    validated_input = AuditLogInput(
-        user_id=user_id,
-        username=username,
-        user_roles=user_roles,
-        action_type=action_type,
-        resource=resource,
-        outcome=outcome,
-        ip_address=ip_address,
-        user_agent=user_agent,
-        request_id=request_id,
-        request_data=request_data,
-        response_status=response_status,
-        error_message=error_message,
-        duration_ms=duration_ms,
+    action = AuditRecord(
+        timestamp or datetime.now(UTC),
+        user_id,
+        username,
+        user_roles,
+        action_type,
+        resource,
+        outcome,
+        ip_address,
+        user_agent,
+        request_id,
+        request_data,
+        response_status,
+        error_message,
+        duration_ms,
+        weight=weight,
     )
 
-    try:
-        # Sanitize request data to remove sensitive information
-        sanitized_data = sanitize_data(validated_input.request_data)
-
-        # Create audit log entry using validated input
-        action = UserAction(
-            timestamp=validated_input.timestamp,
-            user_id=validated_input.user_id,
-            username=validated_input.username,
-            user_roles=validated_input.user_roles,
-            action_type=validated_input.action_type,
-            resource=validated_input.resource,
-            outcome=validated_input.outcome,
-            ip_address=validated_input.ip_address,
-            user_agent=validated_input.user_agent,
-            request_id=(
-                str(validated_input.request_id)
-                if validated_input.request_id
-                else None
-            ),
-            request_data=sanitized_data,
-            response_status=validated_input.response_status,
-            error_message=validated_input.error_message,
-            duration_ms=validated_input.duration_ms,
-        )
+    if app_settings.AUDIT_TRANSPORT == "redis":
+        from app.utils.audit_stream import publish_audit_record
 
-        # Queue for background processing with backpressure
-        queue = get_audit_queue()
-        timeout = app_settings.AUDIT_QUEUE_TIMEOUT
+        if await publish_audit_record(action):
+            return action
+        # Redis unavailable - keep the entry in the in-process queue
+
+    # Queue for background processing with backpressure
+    queue = _audit_queue if _audit_queue is not None else get_audit_queue()
 
-        # Try non-blocking put first (fast path)
+    # Try non-blocking put first (fast path); the worker refreshes the
+    # queue size metric after every batch
+    try:
+        queue.put_nowait(action)
+        return action
+    except asyncio.QueueFull:
+        pass
+
+    # Queue is full - apply backpressure if timeout > 0
+    timeout = app_settings.AUDIT_QUEUE_TIMEOUT
+    if timeout > 0:
         try:
-            queue.put_nowait(action)
-            # Update queue size metric
+            # Wait up to AUDIT_QUEUE_TIMEOUT seconds for space
+            await asyncio.wait_for(queue.put(action), timeout=timeout)
             audit_queue_size.set(queue.qsize())
+            logger.debug(
+                f"Audit log queued after backpressure wait for {username}"
+            )
             return action
 
-        except asyncio.QueueFull:
-            # Queue is full - apply backpressure if timeout > 0
-            if timeout > 0:
-                try:
-                    # Wait up to AUDIT_QUEUE_TIMEOUT seconds for space
-                    await asyncio.wait_for(
-                        queue.put(action),
-                        timeout=timeout,
-                    )
-                    # Update queue size metric
-                    audit_queue_size.set(queue.qsize())
-                    logger.debug(
-                        f"Audit log queued after backpressure wait for {username}"
-                    )
-                    return action
-
-                except asyncio.TimeoutError:
-                    # Timeout exceeded - drop the log entry
-                    audit_logs_dropped_total.inc()
-                    logger.warning(
-                        f"Audit queue timeout after {timeout}s, "
-                        f"dropping log entry for {username}"
-                    )
-                    return None
-            else:
-                # No backpressure (timeout=0) - drop immediately
-                audit_logs_dropped_total.inc()
-                logger.warning(
-                    f"Audit queue full ({app_settings.AUDIT_QUEUE_MAX_SIZE}), "
-                    f"dropping log entry for {username}"
-                )
-                return None
-
-    except (ValueError, TypeError, AttributeError) as e:
-        # ValueError: Invalid data format
-        # TypeError: Wrong data type
-        # AttributeError: Missing expected attributes
-        # Record audit log error
-        audit_log_errors_total.labels(error_type=type(e).__name__).inc()
+        except asyncio.TimeoutError:
+            # Timeout exceeded - drop the log entry
+            audit_logs_dropped_total.inc()
+            logger.warning(
+                f"Audit queue timeout after {timeout}s, "
+                f"dropping log entry for {username}"
+            )
+            return None
 
-        # Log the error but don't fail the request
-        logger.error(f"Failed to queue user action: {e}")
-        return None
+    # No backpressure (timeout=0) - drop immediately
+    audit_logs_dropped_total.inc()
+    logger.warning(
+        f"Audit queue full ({app_settings.AUDIT_QUEUE_MAX_SIZE}), "
+        f"dropping log entry for {username}"
+    )
+    return None
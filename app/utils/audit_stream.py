@@ -0,0 +1,333 @@
+"""
+Redis Streams transport for audit logs.
+
+With ``AUDIT_TRANSPORT="redis"``, :func:`~app.utils.audit_logger.log_user_action`
+XADDs each entry to the ``AUDIT_STREAM_KEY`` stream instead of the
+in-process queue, so entries survive an app crash or restart, are not
+dropped when a pod's queue fills up, and request latency no longer depends
+on how fast PostgreSQL absorbs writes. If Redis is unavailable the entry
+falls back to the in-process queue.
+
+Entries are read by the ``AUDIT_STREAM_GROUP`` consumer group, either
+inside the app (``AUDIT_STREAM_CONSUMER_IN_APP``) or as a separate process
+(``python cli.py audit-consumer``). A consumer reads up to
+``AUDIT_MAX_BATCH_SIZE`` entries at a time, bulk-writes them with the
+regular audit writer and acknowledges them only after the transaction
+commits. Entries of a failed write stay pending and are claimed again
+after ``AUDIT_STREAM_CLAIM_IDLE_MS``; after ``AUDIT_STREAM_MAX_DELIVERIES``
+attempts they are moved to ``<AUDIT_STREAM_KEY>:dead``.
+
+Delivery is at least once: an entry whose write committed but whose
+acknowledgement was lost is delivered again. Its entry id is stored in
+``user_actions.stream_id`` under a unique index, so the redelivered entry
+is skipped (and not counted into the rollups twice).
+"""
+
+import asyncio
+import json
+import os
+import socket
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from app.logging import logger
+from app.settings import app_settings
+from app.storage.redis import get_redis_connection
+from app.utils.audit_logger import (
+    AuditRecord,
+    persist_audit_batch,
+    prepare_audit_batch,
+)
+from app.utils.metrics import (
+    audit_log_errors_total,
+    audit_stream_entries_total,
+)
+from app.utils.redis_safe import redis_safe
+
+# Stream field holding the encoded record
+RECORD_FIELD = "r"
+
+StreamEntry = tuple[str, dict[str, str]]
+
+
+def encode_audit_record(record: AuditRecord) -> str:
+    """
+    Encode a queued audit record as a compact stream value.
+
+    Args:
+        record: Record built by ``log_user_action``.
+
+    Returns:
+        JSON array of the record's values in field order. ``stream_id``
+        (the entry id, assigned by Redis) is set when the entry is read.
+    """
+    return json.dumps(
+        [record.timestamp.isoformat(), *record[1:]],
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def decode_audit_record(value: str) -> AuditRecord:
+    """
+    Decode a stream value written by :func:`encode_audit_record`.
+
+    Args:
+        value: The ``RECORD_FIELD`` value of a stream entry.
+
+    Returns:
+        The audit record (not yet validated).
+
+    Raises:
+        ValueError: If the value is not a valid encoded record.
+        TypeError: If it has the wrong number of fields.
+    """
+    timestamp, *values = json.loads(value)
+    return AuditRecord(datetime.fromisoformat(timestamp), *values)
+
+
+@redis_safe(fail_value=False, log_level="warning", operation_name="audit_xadd")
+async def publish_audit_record(record: AuditRecord) -> bool:
+    """
+    Append an audit record to the stream.
+
+    Args:
+        record: Record built by ``log_user_action``.
+
+    Returns:
+        True if the entry was added, False if Redis is unavailable (the
+        caller should use the in-process queue).
+    """
+    redis = await get_redis_connection()
+    if redis is None:
+        audit_stream_entries_total.labels(status="fallback").inc()
+        return False
+    await redis.xadd(
+        app_settings.AUDIT_STREAM_KEY,
+        {RECORD_FIELD: encode_audit_record(record)},
+        maxlen=app_settings.AUDIT_STREAM_MAXLEN,
+        approximate=True,
+    )
+    audit_stream_entries_total.labels(status="published").inc()
+    return True
+
+
+def default_consumer_name() -> str:
+    """Consumer name unique to this process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+async def ensure_audit_stream_group(redis: Redis) -> None:
+    """
+    Create the stream and its consumer group if they do not exist.
+
+    Args:
+        redis: Redis connection.
+    """
+    try:
+        await redis.xgroup_create(
+            app_settings.AUDIT_STREAM_KEY,
+            app_settings.AUDIT_STREAM_GROUP,
+            id="0",
+            mkstream=True,
+        )
+    except ResponseError as ex:
+        if "BUSYGROUP" not in str(ex):
+            raise
+
+
+async def write_stream_entries(
+    redis: Redis, entries: list[StreamEntry], consumer: str
+) -> bool:
+    """
+    Bulk-write stream entries to PostgreSQL and acknowledge them.
+
+    Each record carries its entry id as ``stream_id``, so entries already
+    written by an earlier delivery are skipped. Undecodable or invalid
+    entries are dropped (and acknowledged). If the write fails nothing is
+    acknowledged, so the entries stay pending and are retried by
+    :func:`reclaim_audit_entries`.
+
+    Args:
+        redis: Redis connection.
+        entries: ``(entry_id, fields)`` pairs read from the stream.
+        consumer: Consumer name, used in log messages.
+
+    Returns:
+        True if the entries were written and acknowledged.
+    """
+    records = []
+    for entry_id, fields in entries:
+        try:
+            record = decode_audit_record(fields[RECORD_FIELD])
+            records.append(record._replace(stream_id=entry_id))
+        except (KeyError, ValueError, TypeError) as e:
+            audit_log_errors_total.labels(error_type=type(e).__name__).inc()
+            logger.error(f"Dropping undecodable audit entry {entry_id}: {e}")
+
+    batch = prepare_audit_batch(records)
+    if batch and not await persist_audit_batch(
+        batch, source=f"stream consumer {consumer}"
+    ):
+        return False
+
+    await redis.xack(
+        app_settings.AUDIT_STREAM_KEY,
+        app_settings.AUDIT_STREAM_GROUP,
+        *(entry_id for entry_id, _ in entries),
+    )
+    audit_stream_entries_total.labels(status="acked").inc(len(entries))
+    return True
+
+
+async def dead_letter_audit_entries(
+    redis: Redis, consumer: str, entry_ids: list[str]
+) -> None:
+    """
+    Move entries that failed too often to the dead-letter stream.
+
+    Args:
+        redis: Redis connection.
+        consumer: Consumer claiming the entries.
+        entry_ids: Pending entry ids to move.
+    """
+    key = app_settings.AUDIT_STREAM_KEY
+    group = app_settings.AUDIT_STREAM_GROUP
+    claimed = await redis.xclaim(
+        key,
+        group,
+        consumer,
+        app_settings.AUDIT_STREAM_CLAIM_IDLE_MS,
+        entry_ids,
+    )
+    for entry_id, fields in claimed:
+        if fields:
+            await redis.xadd(f"{key}:dead", {**fields, "id": entry_id})
+    await redis.xack(key, group, *entry_ids)
+    audit_stream_entries_total.labels(status="dead_lettered").inc(
+        len(entry_ids)
+    )
+    logger.error(
+        f"Moved {len(entry_ids)} audit entries to {key}:dead after "
+        f"{app_settings.AUDIT_STREAM_MAX_DELIVERIES} failed deliveries"
+    )
+
+
+async def reclaim_audit_entries(
+    redis: Redis, consumer: str
+) -> list[StreamEntry]:
+    """
+    Claim entries left pending by failed writes or dead consumers.
+
+    Entries idle for ``AUDIT_STREAM_CLAIM_IDLE_MS`` are claimed by this
+    consumer for another attempt, except those already delivered
+    ``AUDIT_STREAM_MAX_DELIVERIES`` times, which are dead-lettered.
+
+    Args:
+        redis: Redis connection.
+        consumer: Consumer claiming the entries.
+
+    Returns:
+        The claimed entries to write again.
+    """
+    key = app_settings.AUDIT_STREAM_KEY
+    group = app_settings.AUDIT_STREAM_GROUP
+    idle = app_settings.AUDIT_STREAM_CLAIM_IDLE_MS
+    pending = await redis.xpending_range(
+        key,
+        group,
+        min="-",
+        max="+",
+        count=app_settings.AUDIT_MAX_BATCH_SIZE,
+        idle=idle,
+    )
+    retry, dead = [], []
+    for entry in pending:
+        exhausted = (
+            entry["times_delivered"]
+            >= app_settings.AUDIT_STREAM_MAX_DELIVERIES
+        )
+        (dead if exhausted else retry).append(entry["message_id"])
+
+    if dead:
+        await dead_letter_audit_entries(redis, consumer, dead)
+    if not retry:
+        return []
+
+    claimed = await redis.xclaim(key, group, consumer, idle, retry)
+    # Entries trimmed from the stream meanwhile come back without fields
+    entries = [(entry_id, fields) for entry_id, fields in claimed if fields]
+    audit_stream_entries_total.labels(status="retried").inc(len(entries))
+    return entries
+
+
+async def read_audit_entries(redis: Redis, consumer: str) -> list[StreamEntry]:
+    """
+    Read new entries for this consumer.
+
+    Blocks up to ``AUDIT_BATCH_TIMEOUT`` and returns up to
+    ``AUDIT_MAX_BATCH_SIZE`` entries, so batches grow with the backlog.
+
+    Args:
+        redis: Redis connection.
+        consumer: Consumer name.
+
+    Returns:
+        The entries, empty if none arrived.
+    """
+    response: Any = await redis.xreadgroup(
+        app_settings.AUDIT_STREAM_GROUP,
+        consumer,
+        {app_settings.AUDIT_STREAM_KEY: ">"},
+        count=app_settings.AUDIT_MAX_BATCH_SIZE,
+        block=int(app_settings.AUDIT_BATCH_TIMEOUT * 1000),
+    )
+    return [entry for _, entries in response or [] for entry in entries]
+
+
+async def audit_stream_consumer(consumer: str | None = None) -> None:
+    """
+    Consume the audit stream until cancelled.
+
+    Writes new entries as they arrive and, once per
+    ``AUDIT_STREAM_CLAIM_IDLE_MS``, retries entries left pending.
+
+    Args:
+        consumer: Consumer name within the group (default: host and pid).
+    """
+    consumer = consumer or default_consumer_name()
+    loop = asyncio.get_running_loop()
+    reclaim_interval = app_settings.AUDIT_STREAM_CLAIM_IDLE_MS / 1000
+    next_reclaim = loop.time()
+    group_ready = False
+    logger.info(f"Audit stream consumer {consumer} started")
+
+    while True:
+        try:
+            redis = await get_redis_connection()
+            if redis is None:
+                await asyncio.sleep(1)
+                continue
+            if not group_ready:
+                await ensure_audit_stream_group(redis)
+                group_ready = True
+
+            if loop.time() >= next_reclaim:
+                next_reclaim = loop.time() + reclaim_interval
+                entries = await reclaim_audit_entries(redis, consumer)
+                if entries:
+                    await write_stream_entries(redis, entries, consumer)
+
+            entries = await read_audit_entries(redis, consumer)
+            if entries:
+                await write_stream_entries(redis, entries, consumer)
+
+        except (asyncio.CancelledError, GeneratorExit, KeyboardInterrupt):
+            # Graceful shutdown signals - re-raise
+            raise
+        except (RedisError, ConnectionError, TimeoutError, OSError) as e:
+            logger.error(f"Audit stream consumer {consumer} error: {e}")
+            await asyncio.sleep(1)  # Backoff on errors
@@ -0,0 +1,315 @@
+"""
+Pluggable value codecs for Redis-tier cache entries.
+
+Every value written by :class:`~app.managers.cache_manager.CacheManager`
+to Redis is framed as::
+
+    <header byte><payload>
+
+The header byte holds the codec id in the low 7 bits and a "zlib
+compressed" flag in the high bit. Because the codec is recorded per entry,
+the configured codec can be changed without flushing Redis: old entries are
+still decoded by the codec that wrote them.
+
+Values written before framing was introduced (plain ``json.dumps`` text)
+are recognised because valid JSON text never starts with a control byte or
+a byte >= 0x80, and are decoded as legacy JSON.
+
+Available codecs:
+- ``JsonCodec`` (id 1): compact JSON via ``orjson``.
+- ``MsgPackCodec`` (id 2): binary, type-preserving (datetime, date, UUID,
+  Decimal round-trip).
+
+The codec of new entries is selected with the ``CACHE_CODEC`` setting.
+"""
+
+import json
+import uuid
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Protocol, runtime_checkable
+
+import msgpack
+import orjson
+
+# Header layout: low 7 bits = codec id, high bit = compressed payload
+COMPRESSED_FLAG = 0x80
+CODEC_ID_MASK = 0x7F
+
+# Codec id 0 is reserved: a lone 0x00 byte marks a cached "not found"
+# (negative) entry written by CacheManager.set_not_found()
+NEGATIVE_PAYLOAD = b"\x00"
+
+# Default size (bytes) above which encoded payloads are compressed
+DEFAULT_COMPRESS_THRESHOLD = 1024
+
+# JSON text may start with insignificant whitespace (RFC 8259)
+_JSON_WHITESPACE = frozenset(b" \t\n\r")
+
+
+@runtime_checkable
+class CacheCodec(Protocol):
+    """
+    Protocol for cache value codecs.
+
+    Attributes:
+        codec_id: Unique id stored in the entry header (1-31, excluding
+            JSON whitespace bytes 9, 10 and 13).
+        name: Human-readable codec name.
+    """
+
+    codec_id: int
+    name: str
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value to bytes."""
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize bytes produced by :meth:`dumps`."""
+        ...
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoder for types JSON cannot represent natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Compact JSON codec backed by ``orjson``.
+
+    Datetimes, UUIDs and Decimals are written as strings and come back as
+    strings. Use :class:`MsgPackCodec` when types must round-trip.
+    """
+
+    codec_id = 0x01
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value to compact JSON bytes."""
+        return orjson.dumps(
+            value, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize JSON bytes."""
+        return orjson.loads(data)
+
+
+# MessagePack extension type codes
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_UUID = 3
+_EXT_DECIMAL = 4
+
+
+class MsgPackCodec:
+    """
+    Binary MessagePack codec with type-preserving extension types.
+
+    ``datetime``, ``date``, ``UUID`` and ``Decimal`` values are encoded as
+    MessagePack extension types and decoded back to the original type.
+    Tuples are decoded as lists.
+    """
+
+    codec_id = 0x02
+    name = "msgpack"
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        """Encode non-native types as extension types."""
+        if isinstance(value, datetime):
+            return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+        if isinstance(value, date):
+            return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+        if isinstance(value, uuid.UUID):
+            return msgpack.ExtType(_EXT_UUID, value.bytes)
+        if isinstance(value, Decimal):
+            return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+        raise TypeError(
+            f"Type {type(value).__name__} is not MessagePack serializable"
+        )
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        """Decode extension types produced by :meth:`_default`."""
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == _EXT_DATE:
+            return date.fromisoformat(data.decode())
+        if code == _EXT_UUID:
+            return uuid.UUID(bytes=data)
+        if code == _EXT_DECIMAL:
+            return Decimal(data.decode())
+        return msgpack.ExtType(code, data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize value to MessagePack bytes."""
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize MessagePack bytes."""
+        return msgpack.unpackb(
+            data, ext_hook=self._ext_hook, raw=False, strict_map_key=False
+        )
+
+
+# Codec registry used to decode entries by header id
+_CODECS: dict[int, CacheCodec] = {}
+
+
+def register_codec(codec: CacheCodec) -> None:
+    """
+    Register a codec so entries it wrote can be decoded.
+
+    Args:
+        codec: Codec instance to register.
+
+    Raises:
+        ValueError: If the codec id is out of range, collides with JSON
+            whitespace, or is already taken by a different codec.
+    """
+    codec_id = codec.codec_id
+    if not 0 < codec_id < 0x20 or codec_id in _JSON_WHITESPACE:
+        raise ValueError(f"Invalid codec id {codec_id} for {codec.name}")
+
+    existing = _CODECS.get(codec_id)
+    if existing is not None and existing.name != codec.name:
+        raise ValueError(
+            f"Codec id {codec_id} already registered for {existing.name}"
+        )
+    _CODECS[codec_id] = codec
+
+
+def get_codec(name: str) -> CacheCodec:
+    """
+    Look up a registered codec by name.
+
+    Args:
+        name: Codec name (e.g. ``"json"``, ``"msgpack"``).
+
+    Returns:
+        Registered codec instance.
+
+    Raises:
+        ValueError: If no codec with that name is registered.
+    """
+    for codec in _CODECS.values():
+        if codec.name == name:
+            return codec
+    raise ValueError(
+        f"Unknown cache codec '{name}'. "
+        f"Available: {sorted(c.name for c in _CODECS.values())}"
+    )
+
+
+register_codec(JsonCodec())
+register_codec(MsgPackCodec())
+
+
+class CacheSerializer:
+    """
+    Frames values with a codec header and optional zlib compression.
+
+    Example:
+        >>> serializer = CacheSerializer(compress_threshold=512)
+        >>> payload, raw_size = serializer.encode({"items": list(range(500))})
+        >>> serializer.decode(payload)["items"][:3]
+        [0, 1, 2]
+    """
+
+    def __init__(
+        self,
+        codec: CacheCodec | None = None,
+        compress_threshold: int | None = DEFAULT_COMPRESS_THRESHOLD,
+        compress_level: int = 6,
+    ) -> None:
+        """
+        Initialize serializer.
+
+        Args:
+            codec: Codec used for new entries (default: ``JsonCodec``).
+            compress_threshold: Compress payloads larger than this many
+                bytes. ``None`` disables compression.
+            compress_level: zlib compression level (1-9).
+        """
+        self.codec = codec or _CODECS[JsonCodec.codec_id]
+        register_codec(self.codec)
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> tuple[bytes, int]:
+        """
+        Encode a value into a framed payload.
+
+        Compression is only applied above the threshold and only kept when
+        it actually makes the payload smaller.
+
+        Args:
+            value: Value to encode.
+
+        Returns:
+            Tuple of (framed payload, uncompressed encoded size in bytes).
+        """
+        raw = self.codec.dumps(value)
+        header = self.codec.codec_id
+
+        if (
+            self.compress_threshold is not None
+            and len(raw) > self.compress_threshold
+        ):
+            compressed = zlib.compress(raw, self.compress_level)
+            if len(compressed) < len(raw):
+                return (
+                    bytes((header | COMPRESSED_FLAG,)) + compressed,
+                    len(raw) + 1,
+                )
+
+        return bytes((header,)) + raw, len(raw) + 1
+
+    @staticmethod
+    def decode(data: bytes | str) -> Any:
+        """
+        Decode a framed payload (or a legacy unframed JSON value).
+
+        Args:
+            data: Raw value read from Redis.
+
+        Returns:
+            Decoded value.
+
+        Raises:
+            ValueError: If the header names an unregistered codec.
+        """
+        if isinstance(data, str):
+            # Written by the pre-codec CacheManager via a decoding client
+            return json.loads(data)
+
+        if not data:
+            raise ValueError("Empty cache payload")
+
+        header = data[0]
+        if 0x20 <= header < COMPRESSED_FLAG or header in _JSON_WHITESPACE:
+            # Legacy unframed JSON text
+            return json.loads(data)
+
+        codec = _CODECS.get(header & CODEC_ID_MASK)
+        if codec is None:
+            raise ValueError(
+                f"Unknown cache codec id {header & CODEC_ID_MASK}"
+            )
+
+        payload = data[1:]
+        if header & COMPRESSED_FLAG:
+            payload = zlib.decompress(payload)
+        return codec.loads(payload)
@@ -48,7 +48,8 @@ class CacheKeyFactory:
         if hash_dict is None:
             return base
 
-        serialised = json.dumps(hash_dict, sort_keys=True)
+        # default=str keeps datetime filter values (range bounds) hashable
+        serialised = json.dumps(hash_dict, sort_keys=True, default=str)
         digest = hashlib.sha256(serialised.encode()).hexdigest()
         return f"{base}:{digest}"
 
@@ -72,3 +73,24 @@ class CacheKeyFactory:
         """
         digest = hashlib.sha256(value.encode()).hexdigest()
         return f"{prefix}:{digest}"
+
+    @staticmethod
+    def namespace(key: str) -> str:
+        """
+        Return the namespace of a cache key (prefix before the first ":").
+
+        Used as a low-cardinality metrics label, so keys without a prefix
+        are grouped under ``"default"``.
+
+        Args:
+            key: Full cache key.
+
+        Returns:
+            Namespace string.
+
+        Example:
+            >>> CacheKeyFactory.namespace("author:42")
+            'author'
+        """
+        namespace, sep, _ = key.partition(":")
+        return namespace if sep and namespace else "default"
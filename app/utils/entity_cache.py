@@ -0,0 +1,61 @@
+"""
+By-ID entity caching.
+
+``BaseRepository.get_cached`` serves by-ID reads through the cache
+manager's ``get_or_load``: found rows are cached for the manager's default
+TTL, and missing IDs are cached as negative entries (``negative_ttl``) so
+repeated lookups of nonexistent IDs stop reaching the database.
+
+Repository writes invalidate the entries of the rows they touch, including
+negative entries of newly created IDs. Without client tracking, another
+worker's memory cache may keep serving its copy until the entry's TTL
+expires.
+"""
+
+from collections.abc import Iterable
+
+from app.managers.cache_manager import get_cache_manager
+from app.utils.cache_keys import CacheKeyFactory
+
+
+def entity_cache_key(model_name: str, id: int | str) -> str:
+    """
+    Cache key of one entity.
+
+    Args:
+        model_name: Name of the SQLModel class.
+        id: Primary key value.
+
+    Returns:
+        Cache key string, e.g. ``entity:Author:42``.
+    """
+    return CacheKeyFactory.generate("entity", model_name, id)
+
+
+async def invalidate_entity_cache(
+    model_name: str, ids: Iterable[int | None]
+) -> None:
+    """
+    Drop cached entries (found or negative) of the given IDs.
+
+    Args:
+        model_name: Name of the SQLModel class.
+        ids: Primary keys of written rows (None values are skipped).
+    """
+    keys = [entity_cache_key(model_name, id) for id in ids if id is not None]
+    if keys:
+        await get_cache_manager().invalidate_many(keys)
+
+
+async def invalidate_model_entity_cache(model_name: str) -> None:
+    """
+    Drop every cached entry of a model.
+
+    For writes that do not know the IDs they created (``copy_many``).
+
+    Args:
+        model_name: Name of the SQLModel class.
+    """
+    await get_cache_manager().invalidate_pattern(
+        entity_cache_key(model_name, "*")
+    )
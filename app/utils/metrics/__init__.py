@@ -24,12 +24,15 @@ from app.utils.metrics.collector import MetricsCollector
 # Import all metrics from submodules
 from app.utils.metrics.audit import (
     audit_batch_size,
+    audit_default_partition_rows,
     audit_log_creation_duration_seconds,
     audit_log_errors_total,
     audit_logs_dropped_total,
     audit_logs_total,
     audit_logs_written_total,
     audit_queue_size,
+    audit_stream_entries_total,
+    audit_ws_events_unlogged_total,
 )
 from fastapi_telemetry.circuit_breaker import (
     circuit_breaker_failures_total,
@@ -139,6 +142,9 @@ __all__ = [
     "audit_logs_written_total",
     "audit_logs_dropped_total",
     "audit_batch_size",
+    "audit_stream_entries_total",
+    "audit_default_partition_rows",
+    "audit_ws_events_unlogged_total",
     # Application metrics
     "app_errors_total",
     "app_info",
@@ -51,7 +51,26 @@ audit_logs_dropped_total = get_or_create_counter(
 audit_batch_size = get_or_create_histogram(
     "audit_batch_size",
     "Size of audit log batches written to database",
-    buckets=(1, 10, 25, 50, 100, 250, 500),
+    buckets=(1, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+
+audit_stream_entries_total = get_or_create_counter(
+    "audit_stream_entries_total",
+    "Audit entries handled by the Redis Streams pipeline",
+    ["status"],  # published, fallback, acked, retried, dead_lettered
+)
+
+audit_default_partition_rows = get_or_create_gauge(
+    "audit_default_partition_rows",
+    "Rows found in the user_actions default partition by the last "
+    "partition maintenance run (moved to monthly partitions)",
+    [],
+)
+
+audit_ws_events_unlogged_total = get_or_create_counter(
+    "audit_ws_events_unlogged_total",
+    "Successful WebSocket requests not written as their own audit row",
+    ["policy"],  # sampled, aggregate
 )
 
 __all__ = [
@@ -62,4 +81,7 @@ __all__ = [
     "audit_logs_written_total",
     "audit_logs_dropped_total",
     "audit_batch_size",
+    "audit_stream_entries_total",
+    "audit_default_partition_rows",
+    "audit_ws_events_unlogged_total",
 ]
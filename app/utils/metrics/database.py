@@ -72,6 +72,33 @@ db_pool_info = get_or_create_gauge(
     ["pool_name", "pool_size", "max_overflow", "timeout"],
 )
 
+# Pagination read-ahead metrics
+pagination_prefetch_total = get_or_create_counter(
+    "pagination_prefetch_total",
+    "Prefetched pagination pages by outcome",
+    ["model", "result"],  # hit, miss, stored, skipped
+)
+
+# By-ID lookup batching (DataLoader); queries saved = loads - queries
+dataloader_loads_total = get_or_create_counter(
+    "dataloader_loads_total",
+    "Primary-key lookups requested through the DataLoader",
+    ["model"],
+)
+
+dataloader_queries_total = get_or_create_counter(
+    "dataloader_queries_total",
+    "Batched queries issued by the DataLoader",
+    ["model"],
+)
+
+dataloader_batch_size = get_or_create_histogram(
+    "dataloader_batch_size",
+    "Distinct ids per DataLoader batch query",
+    ["model"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
 __all__ = [
     "db_query_duration_seconds",
     "db_connections_active",
@@ -83,4 +110,8 @@ __all__ = [
     "db_pool_connections_created_total",
     "db_pool_overflow_count",
     "db_pool_info",
+    "pagination_prefetch_total",
+    "dataloader_loads_total",
+    "dataloader_queries_total",
+    "dataloader_batch_size",
 ]
@@ -93,6 +93,67 @@ memory_cache_size = get_or_create_gauge(
     "Current number of entries in memory cache",
 )
 
+memory_cache_size_bytes = get_or_create_gauge(
+    "memory_cache_size_bytes",
+    "Approximate bytes held by entries in memory cache",
+)
+
+memory_cache_oversize_skips_total = get_or_create_counter(
+    "memory_cache_oversize_skips_total",
+    "Values not stored in memory cache because they exceed max_entry_bytes",
+)
+
+# Per-namespace CacheManager metrics (namespace = key prefix before ":")
+cache_lookups_total = get_or_create_counter(
+    "cache_lookups_total",
+    "CacheManager lookups by namespace, tier and result",
+    ["namespace", "tier", "result"],  # tier: memory, redis
+    # result: hit, miss, negative_hit (cached "not found")
+)
+
+cache_lookup_duration_seconds = get_or_create_histogram(
+    "cache_lookup_duration_seconds",
+    "CacheManager lookup latency per namespace and tier",
+    ["namespace", "tier"],
+    buckets=(0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.25),
+)
+
+cache_evictions_total = get_or_create_counter(
+    "cache_evictions_total",
+    "Memory cache LRU evictions by namespace",
+    ["namespace"],
+)
+
+# Cache codec metrics (Redis tier of CacheManager)
+cache_codec_bytes_saved_total = get_or_create_counter(
+    "cache_codec_bytes_saved_total",
+    "Bytes saved by compressing Redis cache entries",
+    ["namespace"],  # Cache key prefix before the first ":"
+)
+
+cache_codec_bytes_written_total = get_or_create_counter(
+    "cache_codec_bytes_written_total",
+    "Bytes written to Redis for cache entries (after compression)",
+    ["namespace"],
+)
+
+# Client-side caching (Redis CLIENT TRACKING) metrics
+cache_tracking_invalidations_total = get_or_create_counter(
+    "cache_tracking_invalidations_total",
+    "Memory cache keys invalidated by Redis tracking notifications",
+)
+
+cache_tracking_flushes_total = get_or_create_counter(
+    "cache_tracking_flushes_total",
+    "Full memory cache flushes triggered by client tracking",
+    ["reason"],  # connection_lost, reconnect, server_flush
+)
+
+cache_tracking_connected = get_or_create_gauge(
+    "cache_tracking_connected",
+    "Whether the Redis invalidation listener is connected (1) or not (0)",
+)
+
 __all__ = [
     "redis_operations_total",
     "redis_operation_duration_seconds",
@@ -106,4 +167,14 @@ __all__ = [
     "memory_cache_misses_total",
     "memory_cache_evictions_total",
     "memory_cache_size",
+    "memory_cache_size_bytes",
+    "memory_cache_oversize_skips_total",
+    "cache_lookups_total",
+    "cache_lookup_duration_seconds",
+    "cache_evictions_total",
+    "cache_codec_bytes_saved_total",
+    "cache_codec_bytes_written_total",
+    "cache_tracking_invalidations_total",
+    "cache_tracking_flushes_total",
+    "cache_tracking_connected",
 ]
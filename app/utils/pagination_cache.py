@@ -3,11 +3,23 @@ Pagination count caching for improved performance.
 
 Provides Redis-based caching of expensive COUNT queries used in pagination.
 Cache keys are based on model name and filter parameters.
+
+Counts for the unfiltered query and for simple filters (the ones
+``default_apply_filters`` applies and Python can evaluate) are *tracked*:
+repository writes adjust them in place with INCRBY instead of dropping
+them, and a background task reconciles them against the database.
+
+Prefetched pages (``app.storage.pagination.prefetch``) are invalidated by
+bumping a per-model generation that is part of their cache keys.
 """
 
+import json
+from collections.abc import Iterable
 from typing import Any
 
 from app.logging import logger
+from app.settings import app_settings
+from app.storage.filters import MAX_PATTERN_LENGTH, parse_filter_key
 from app.storage.redis import RedisPool
 from app.utils.cache_keys import CacheKeyFactory
 from app.utils.redis_safe import redis_safe
@@ -16,6 +28,17 @@ from app.utils.redis_safe import redis_safe
 # Default TTL for count caches (5 minutes)
 DEFAULT_COUNT_CACHE_TTL = 300
 
+# Tracked counts are kept correct by writes, so they can live longer
+TRACKED_COUNT_CACHE_TTL = 3600
+
+# Adjust a count only if it is still cached (never create one from a delta)
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return nil end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then redis.call('SET', KEYS[1], 0, 'KEEPTTL') end
+return value
+"""
+
 
 @redis_safe(
     fail_value=None, log_level="error", operation_name="get_cached_count"
@@ -60,6 +83,7 @@ async def set_cached_count(
     count: int,
     filters: dict[str, Any] | None = None,
     ttl: int = DEFAULT_COUNT_CACHE_TTL,
+    track: bool = False,
 ) -> None:
     """
     Cache a count result for a model query.
@@ -69,6 +93,10 @@ async def set_cached_count(
         count: The count value to cache.
         filters: Query filters (must be JSON-serializable).
         ttl: Time-to-live in seconds (default: 5 minutes).
+        track: Maintain this count incrementally on repository writes.
+            Ignored unless the filters are trackable (see
+            :func:`is_trackable`); tracked counts use
+            ``TRACKED_COUNT_CACHE_TTL``.
     """
     cache_key = _generate_count_cache_key(model_name, filters)
 
@@ -77,7 +105,18 @@ async def set_cached_count(
         logger.warning("Redis unavailable, skipping count cache storage")
         return
 
-    await redis.setex(cache_key, ttl, str(count))
+    if track and is_trackable(filters):
+        ttl = max(ttl, TRACKED_COUNT_CACHE_TTL)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.setex(cache_key, ttl, str(count))
+            pipe.hset(
+                _tracked_registry_key(model_name),
+                cache_key,
+                json.dumps(filters or {}, sort_keys=True),
+            )
+            await pipe.execute()
+    else:
+        await redis.setex(cache_key, ttl, str(count))
     logger.debug(
         f"Cached count for {model_name} (filters: {filters}): {count} (TTL: {ttl}s)"
     )
@@ -130,6 +169,269 @@ async def invalidate_count_cache(
             )
 
 
+def is_trackable(filters: dict[str, Any] | None) -> bool:
+    """
+    Check whether a filter dict can be maintained incrementally.
+
+    Trackable filters are those :func:`matches_filters` evaluates exactly
+    like ``default_apply_filters``: scalars, lists of scalars, substring
+    strings without LIKE wildcards, and the ``eq``, ``in``, ``prefix``,
+    ``contains`` and ``has`` operators. ``range`` filters are not tracked.
+
+    Args:
+        filters: Query filters (None = unfiltered, always trackable).
+
+    Returns:
+        True if writes can adjust the cached count.
+    """
+    if not filters:
+        return True
+    for key, value in filters.items():
+        try:
+            _, op = parse_filter_key(key)
+        except ValueError:
+            return False
+        if op == "range":
+            return False
+        if op in ("prefix", "contains"):
+            # Escaped by the SQL side, so a plain string test matches
+            if not isinstance(value, str):
+                return False
+        elif isinstance(value, (list, tuple)):
+            if not all(_is_scalar(item) for item in value):
+                return False
+        elif isinstance(value, str) and op is None:
+            # Inner wildcards would make ILIKE differ from a substring test
+            if any(char in value.strip("%") for char in "%_\\"):
+                return False
+        elif not _is_scalar(value):
+            return False
+    return True
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list, tuple, set))
+
+
+def matches_filters(row: dict[str, Any], filters: dict[str, Any]) -> bool:
+    """
+    Evaluate trackable filters against a row, mirroring the SQL filters.
+
+    Args:
+        row: Column values of one entity.
+        filters: Trackable filter dict (see :func:`is_trackable`).
+
+    Returns:
+        True if the row would be counted under these filters.
+    """
+    for key, expected in filters.items():
+        field, op = parse_filter_key(key)
+        actual = row.get(field)
+        if op == "prefix":
+            needle = expected[:MAX_PATTERN_LENGTH]
+            if not isinstance(actual, str) or not actual.startswith(needle):
+                return False
+        elif op == "contains":
+            needle = expected[:MAX_PATTERN_LENGTH].lower()
+            if actual is None or needle not in str(actual).lower():
+                return False
+        elif op == "has":
+            if not isinstance(actual, list) or expected not in actual:
+                return False
+        elif op == "in" or (
+            op is None and isinstance(expected, (list, tuple))
+        ):
+            if actual not in expected:
+                return False
+        elif op is None and isinstance(expected, str):
+            # Mirrors ILIKE '%value%' on the sanitized value
+            needle = expected.strip("%")[:MAX_PATTERN_LENGTH].lower()
+            if actual is None or needle not in str(actual).lower():
+                return False
+        elif actual != expected:
+            return False
+    return True
+
+
+async def adjust_cached_counts(
+    model_name: str,
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+) -> None:
+    """
+    Apply a row change to every tracked count of a model.
+
+    Called by repository write hooks: ``before=None`` for inserts,
+    ``after=None`` for deletes, both for updates. Counts that are no longer
+    cached are left alone (the next read recounts them).
+
+    Args:
+        model_name: Name of the SQLModel class.
+        before: Column values before the write, if the row existed.
+        after: Column values after the write, if the row still exists.
+    """
+    await adjust_cached_counts_many(model_name, [(before, after)])
+
+
+@redis_safe(
+    fail_value=None, log_level="warning", operation_name="adjust_cached_counts"
+)
+async def adjust_cached_counts_many(
+    model_name: str,
+    changes: Iterable[tuple[dict[str, Any] | None, dict[str, Any] | None]],
+) -> None:
+    """
+    Apply a batch of row changes to every tracked count of a model.
+
+    The deltas of all changes are summed per count, so a bulk write costs
+    one INCRBY per affected count instead of one per row.
+
+    Args:
+        model_name: Name of the SQLModel class.
+        changes: ``(before, after)`` column values per row, as for
+            :func:`adjust_cached_counts`.
+    """
+    redis = await RedisPool.get_instance()
+    if redis is None:
+        return
+
+    tracked = await redis.hgetall(_tracked_registry_key(model_name))
+    if not tracked:
+        return
+
+    filters_by_key = {
+        cache_key: json.loads(raw_filters)
+        for cache_key, raw_filters in tracked.items()
+    }
+    deltas = dict.fromkeys(filters_by_key, 0)
+    for before, after in changes:
+        for cache_key, filters in filters_by_key.items():
+            deltas[cache_key] += int(
+                after is not None and matches_filters(after, filters)
+            ) - int(before is not None and matches_filters(before, filters))
+
+    async with redis.pipeline(transaction=False) as pipe:
+        adjusted = 0
+        for cache_key, delta in deltas.items():
+            if delta:
+                pipe.eval(_INCR_IF_EXISTS, 1, cache_key, delta)
+                adjusted += 1
+        if adjusted:
+            await pipe.execute()
+
+    logger.debug(f"Adjusted {adjusted} tracked counts for {model_name}")
+
+
+@redis_safe(
+    fail_value={}, log_level="warning", operation_name="get_tracked_counts"
+)
+async def get_tracked_counts() -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    List tracked counts for reconciliation.
+
+    Registry entries whose count has expired are pruned.
+
+    Returns:
+        Mapping of model name to ``{cache_key: filters}``.
+    """
+    redis = await RedisPool.get_instance()
+    if redis is None:
+        return {}
+
+    result: dict[str, dict[str, dict[str, Any]]] = {}
+    async for registry in redis.scan_iter(
+        match="pagination:tracked:*", count=100
+    ):
+        model_name = registry.rsplit(":", 1)[-1]
+        tracked = await redis.hgetall(registry)
+        live = {}
+        for cache_key, raw_filters in tracked.items():
+            if await redis.exists(cache_key):
+                live[cache_key] = json.loads(raw_filters)
+            else:
+                await redis.hdel(registry, cache_key)
+        if live:
+            result[model_name] = live
+    return result
+
+
+@redis_safe(
+    fail_value=None, log_level="warning", operation_name="reset_tracked_count"
+)
+async def reset_tracked_count(cache_key: str, count: int) -> None:
+    """
+    Overwrite a tracked count with a freshly computed value.
+
+    The TTL is kept, so counts nobody reads still expire.
+
+    Args:
+        cache_key: Count cache key from :func:`get_tracked_counts`.
+        count: Exact count from the database.
+    """
+    redis = await RedisPool.get_instance()
+    if redis is None:
+        return
+    await redis.set(cache_key, str(count), xx=True, keepttl=True)
+
+
+@redis_safe(
+    fail_value=None, log_level="warning", operation_name="get_page_generation"
+)
+async def get_page_generation(model_name: str) -> int | None:
+    """
+    Get the write generation of a model's prefetched pages.
+
+    Args:
+        model_name: Name of the SQLModel class.
+
+    Returns:
+        Current generation (0 before any write), or None if Redis is
+        unavailable and pages must not be cached.
+    """
+    redis = await RedisPool.get_instance()
+    if redis is None:
+        return None
+    generation = await redis.get(_page_generation_key(model_name))
+    return int(generation or 0)
+
+
+@redis_safe(
+    fail_value=None,
+    log_level="warning",
+    operation_name="invalidate_page_cache",
+)
+async def invalidate_page_cache(model_name: str) -> None:
+    """
+    Make every prefetched page of a model unreachable.
+
+    A no-op unless the model's pages are prefetched, so writes to other
+    models cost no extra round trip.
+
+    Args:
+        model_name: Name of the SQLModel class.
+    """
+    if (
+        not app_settings.PAGINATION_PREFETCH_ENABLED
+        or model_name not in app_settings.PAGINATION_PREFETCH_MODELS
+    ):
+        return
+
+    redis = await RedisPool.get_instance()
+    if redis is None:
+        return
+    await redis.incr(_page_generation_key(model_name))
+
+
+def _page_generation_key(model_name: str) -> str:
+    """Counter embedded in a model's prefetched page keys."""
+    return f"pagination:generation:{model_name}"
+
+
+def _tracked_registry_key(model_name: str) -> str:
+    """Redis hash mapping a model's tracked count keys to their filters."""
+    return f"pagination:tracked:{model_name}"
+
+
 def _generate_count_cache_key(
     model_name: str, filters: dict[str, Any] | None
 ) -> str:
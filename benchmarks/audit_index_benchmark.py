@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmark the user_actions index layouts: per-column btrees vs append-only.
+
+Loads the same synthetic audit trail (ascending timestamps, as written by
+the audit workers) into two scratch tables, one per layout, and reports:
+
+- insert throughput (rows/sec, binary COPY in AUDIT_MAX_BATCH_SIZE batches
+  into the already indexed table)
+- total index size
+- median latency of the queries behind the /audit-logs filters
+
+Layouts:
+
+- btree:       JSON columns; btrees on timestamp, user_id, username,
+               outcome, (user_id, timestamp) and (user_id, action_type);
+               listings ordered by (timestamp, id)
+- append-only: JSONB columns; (timestamp, id), (user_id, timestamp, id),
+               a partial index on non-success outcomes and GIN on
+               user_roles; listings ordered by (timestamp, id)
+
+Indexes both layouts share (request_id, action_type, resource patterns and
+trigrams) and monthly partitioning are left out, as they cost the same in
+both. The scratch tables are dropped afterwards. Requires a reachable
+database (DB_* settings).
+
+Run with: python benchmarks/audit_index_benchmark.py [--events 500000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; only the database is used
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.settings import app_settings  # noqa: E402
+from app.storage.db import engine  # noqa: E402
+from app.utils.audit_logger import (  # noqa: E402
+    AUDIT_COLUMNS,
+    AuditRecord,
+    audit_record,
+    prepare_audit_batch,
+)
+
+COLUMNS = """
+    id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    "timestamp" TIMESTAMP WITH TIME ZONE NOT NULL,
+    user_id VARCHAR(255) NOT NULL,
+    username VARCHAR(255) NOT NULL,
+    user_roles {json} NOT NULL,
+    action_type VARCHAR(100) NOT NULL,
+    resource VARCHAR(500) NOT NULL,
+    outcome VARCHAR(50) NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    request_id VARCHAR(100),
+    request_data {json},
+    response_status INTEGER,
+    error_message TEXT,
+    duration_ms INTEGER,
+    stream_id VARCHAR(32)
+"""
+
+LAYOUTS: dict[str, dict[str, Any]] = {
+    "btree": {
+        "json": "JSON",
+        "order": '"timestamp" DESC, id DESC',
+        "roles": "user_roles::jsonb @> $1::jsonb",
+        "indexes": [
+            '("timestamp")',
+            "(user_id)",
+            "(username)",
+            "(outcome)",
+            '(user_id, "timestamp")',
+            "(user_id, action_type)",
+        ],
+    },
+    "append-only": {
+        "json": "JSONB",
+        "order": '"timestamp" DESC, id DESC',
+        "roles": "user_roles @> $1::jsonb",
+        "indexes": [
+            '("timestamp", id)',
+            '(user_id, "timestamp", id)',
+            "(\"timestamp\", id) WHERE outcome <> 'success'",
+            "USING gin (user_roles jsonb_path_ops)",
+        ],
+    },
+}
+
+USERS = 2_000
+PAGE_SIZE = 20
+
+
+def make_events(count: int, start: datetime, span: timedelta) -> list[Any]:
+    """Build COPY rows for ``count`` events spread evenly over ``span``."""
+    step = span / count
+    records = [
+        AuditRecord(
+            timestamp=start + step * i,
+            user_id=f"user-{i % USERS}",
+            username=f"user{i % USERS}",
+            user_roles=(
+                ["admin", "user"] if i % USERS < USERS // 20 else ["user"]
+            ),
+            action_type=("GET", "POST", "PUT", "DELETE", "WS:1")[i % 5],
+            resource=f"/api/authors/{i % 10_000}",
+            outcome=(
+                "error"
+                if i % 50 == 0
+                else "permission_denied"
+                if i % 101 == 0
+                else "success"
+            ),
+            ip_address="10.0.0.1",
+            user_agent="bench/1.0",
+            request_id=f"req-{i}",
+            request_data={"page": i % 10},
+            response_status=200,
+            error_message=None,
+            duration_ms=12,
+        )
+        for i in range(count)
+    ]
+    return [audit_record(record) for record in prepare_audit_batch(records)]
+
+
+def filter_queries(
+    end: datetime,
+) -> dict[str, tuple[str, list[Any]]]:
+    """/audit-logs filters as (WHERE clause, parameters)."""
+    return {
+        "latest page": ("TRUE", []),
+        "user_id": ("user_id = $1", ["user-42"]),
+        "outcome=error": ("outcome = $1", ["error"]),
+        "last day": ('"timestamp" >= $1', [end - timedelta(days=1)]),
+        "user + week": (
+            'user_id = $1 AND "timestamp" >= $2',
+            ["user-42", end - timedelta(days=7)],
+        ),
+        "role=admin": ("{roles}", [json.dumps(["admin"])]),
+    }
+
+
+async def run_layout(
+    driver: Any,
+    name: str,
+    rows: list[Any],
+    end: datetime,
+    repeat: int,
+) -> dict[str, float]:
+    """Load and query one layout; returns its measurements."""
+    layout = LAYOUTS[name]
+    table = f"bench_user_actions_{name.replace('-', '_')}"
+    await driver.execute(f"DROP TABLE IF EXISTS {table}")
+    await driver.execute(
+        f"CREATE TABLE {table} ({COLUMNS.format(json=layout['json'])})"
+    )
+    for i, index in enumerate(layout["indexes"]):
+        await driver.execute(f"CREATE INDEX {table}_{i} ON {table} {index}")
+
+    results: dict[str, float] = {}
+    batch = app_settings.AUDIT_MAX_BATCH_SIZE
+    try:
+        wall = time.perf_counter()
+        for start in range(0, len(rows), batch):
+            await driver.copy_records_to_table(
+                table,
+                records=rows[start : start + batch],
+                columns=AUDIT_COLUMNS,
+            )
+        results["rows/s"] = len(rows) / (time.perf_counter() - wall)
+
+        await driver.execute(f"ANALYZE {table}")
+        results["index MB"] = (
+            await driver.fetchval(
+                "SELECT pg_indexes_size($1::regclass)", table
+            )
+            / 2**20
+        )
+
+        for label, (where, params) in filter_queries(end).items():
+            query = (
+                f"SELECT * FROM {table} "
+                f"WHERE {where.format(roles=layout['roles'])} "
+                f"ORDER BY {layout['order']} LIMIT {PAGE_SIZE}"
+            )
+            await driver.fetch(query, *params)  # warm up
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                await driver.fetch(query, *params)
+                timings.append((time.perf_counter() - started) * 1000)
+            results[label] = statistics.median(timings)
+    finally:
+        await driver.execute(f"DROP TABLE IF EXISTS {table}")
+    return results
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run both layouts and print insert and filter measurements."""
+    print("Audit Index Layout Benchmark")
+    print("=" * 70)
+    print(f"events={args.events:,} days={args.days} repeat={args.repeat}")
+
+    end = datetime.now(UTC)
+    rows = make_events(
+        args.events, end - timedelta(days=args.days), timedelta(days=args.days)
+    )
+
+    async with engine.connect() as connection:
+        raw = await connection.get_raw_connection()
+        driver = raw.driver_connection
+        results = {
+            name: await run_layout(driver, name, rows, end, args.repeat)
+            for name in LAYOUTS
+        }
+    await engine.dispose()
+
+    metrics = ["rows/s", "index MB", *filter_queries(end)]
+    print(f"\n{'Metric':<16} {'btree':>14} {'append-only':>14}")
+    print("-" * 70)
+    for metric in metrics:
+        unit = "" if metric in ("rows/s", "index MB") else " ms"
+        values = [results[name][metric] for name in LAYOUTS]
+        print(
+            f"{metric + unit:<16} "
+            + " ".join(f"{value:>14,.2f}" for value in values)
+        )
+
+    speedup = results["append-only"]["rows/s"] / results["btree"]["rows/s"]
+    print(f"\nInsert throughput: {speedup:.2f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=500_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
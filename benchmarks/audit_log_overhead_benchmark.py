@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark the request-path cost of log_user_action.
+
+Times one call per simulated request, as made by AuditMiddleware and
+Web.on_receive, comparing:
+
+- eager:    the previous behavior, kept here for reference: validate an
+            AuditLogInput, sanitize request_data and build a UserAction
+            before enqueueing
+- deferred: the current log_user_action, which enqueues an AuditRecord
+            tuple and leaves that work to the background worker
+
+Also reports the worker-side cost of preparing the deferred records, to
+show where the work moved. No database is needed.
+
+Run with: python benchmarks/audit_log_overhead_benchmark.py [--calls 100000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; nothing is connected to
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.models.user_action import UserAction  # noqa: E402
+from app.schemas.audit import AuditLogInput  # noqa: E402
+from app.utils import audit_logger  # noqa: E402
+from app.utils.audit_logger import (  # noqa: E402
+    log_user_action,
+    prepare_audit_batch,
+    sanitize_data,
+)
+
+CALL: dict[str, Any] = {
+    "user_id": "0b6f6c1e-2d4b-4b59-9d55-7a1f0a3c9e21",
+    "username": "john.doe",
+    "user_roles": ["user", "get-authors", "create-author"],
+    "action_type": "WS:CREATE_AUTHOR",
+    "resource": "pkg_id=3",
+    "outcome": "success",
+    "ip_address": "10.0.0.1",
+    "user_agent": "websocket-client/1.0",
+    "request_id": "550e8400-e29b-41d4-a716-446655440000",
+    "request_data": {
+        "name": "Jane Doe",
+        "filters": {"name": "J", "token": "abc"},
+        "tags": [{"id": 1}, {"id": 2}],
+    },
+    "response_status": 0,
+    "duration_ms": 12,
+}
+
+
+async def eager_log_user_action(**kwargs: Any) -> UserAction:
+    """The previous request path: validate, sanitize, build, enqueue."""
+    validated = AuditLogInput(**kwargs)
+    action = UserAction(
+        timestamp=validated.timestamp,
+        user_id=validated.user_id,
+        username=validated.username,
+        user_roles=validated.user_roles,
+        action_type=validated.action_type,
+        resource=validated.resource,
+        outcome=validated.outcome,
+        ip_address=validated.ip_address,
+        user_agent=validated.user_agent,
+        request_id=str(validated.request_id),
+        request_data=sanitize_data(validated.request_data),
+        response_status=validated.response_status,
+        error_message=validated.error_message,
+        duration_ms=validated.duration_ms,
+    )
+    audit_logger.get_audit_queue().put_nowait(action)  # type: ignore[arg-type]
+    return action
+
+
+async def time_calls(fn: Any, calls: int, rounds: int) -> list[float]:
+    """Per-call microseconds for each round (queue drained between)."""
+    queue = audit_logger.get_audit_queue()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await fn(**CALL)
+            # Keep the queue from filling up; not part of the call cost
+            if queue.full():
+                queue._queue.clear()  # type: ignore[attr-defined]
+        timings.append((time.perf_counter() - start) / calls * 1e6)
+        queue._queue.clear()  # type: ignore[attr-defined]
+    return timings
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run both paths and print per-call overhead."""
+    print("log_user_action Overhead Benchmark")
+    print("=" * 70)
+    print(f"calls={args.calls:,} rounds={args.rounds}")
+
+    print(f"\n{'Path':<10} {'us/call (median)':>18} {'us/call (best)':>16}")
+    print("-" * 70)
+    results = {}
+    for name, fn in (
+        ("eager", eager_log_user_action),
+        ("deferred", log_user_action),
+    ):
+        timings = await time_calls(fn, args.calls, args.rounds)
+        results[name] = statistics.median(timings)
+        print(f"{name:<10} {results[name]:>18.2f} {min(timings):>16.2f}")
+
+    print(
+        f"\nRequest-path speedup: {results['eager'] / results['deferred']:.1f}x"
+    )
+
+    queue = audit_logger.get_audit_queue()
+    records = []
+    for _ in range(args.calls):
+        records.append(await log_user_action(**CALL))
+        queue.get_nowait()
+    start = time.perf_counter()
+    prepare_audit_batch(records)  # type: ignore[arg-type]
+    worker = (time.perf_counter() - start) / args.calls * 1e6
+    print(f"Worker preparation: {worker:.2f} us/record (off the request path)")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
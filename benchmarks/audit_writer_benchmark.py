@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the audit log batch writers: binary COPY vs ORM add_all.
+
+Writes batches of AUDIT_BATCH_SIZE audit entries into user_actions the way
+audit_log_worker does, once with AUDIT_WRITER="orm" (session.add_all +
+flush) and once with AUDIT_WRITER="copy" (binary COPY from tuples),
+reporting:
+
+- rows/sec (wall clock)
+- worker CPU time per 10k events (process time)
+
+Every batch runs in a transaction that is rolled back, so the table is
+left untouched. Requires a reachable, migrated database (DB_* settings).
+
+Run with: python benchmarks/audit_writer_benchmark.py [--events 50000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; only the database is used
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.settings import app_settings  # noqa: E402
+from app.storage.db import async_session, engine  # noqa: E402
+from app.utils.audit_logger import (  # noqa: E402
+    AuditRecord,
+    prepare_audit_batch,
+    write_audit_batch,
+)
+
+
+def make_events(count: int) -> list[AuditRecord]:
+    """Build prepared audit records shaped like typical HTTP requests."""
+    now = datetime.now(UTC)
+    return prepare_audit_batch(
+        [
+            AuditRecord(
+                timestamp=now,
+                user_id=f"user-{i % 500}",
+                username=f"user{i % 500}",
+                user_roles=["user", "get-authors"],
+                action_type="GET",
+                resource=f"/api/authors/{i}",
+                outcome="success",
+                ip_address="10.0.0.1",
+                user_agent="bench/1.0",
+                request_id=f"req-{i}",
+                request_data={"page": i % 10},
+                response_status=200,
+                error_message=None,
+                duration_ms=12,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+async def run(
+    writer: str, events: int, batch_size: int
+) -> tuple[float, float]:
+    """Write all events; returns (rows/sec, CPU seconds per 10k events)."""
+    batches = [
+        make_events(batch_size) for _ in range(max(1, events // batch_size))
+    ]
+    written = len(batches) * batch_size
+
+    with patch.object(app_settings, "AUDIT_WRITER", writer):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        for batch in batches:
+            async with async_session() as session:
+                transaction = await session.begin()
+                await write_audit_batch(session, batch)
+                await transaction.rollback()
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+
+    return written / wall, cpu / written * 10_000
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run both writers and print throughput and CPU cost."""
+    print("Audit Writer Benchmark")
+    print("=" * 70)
+    print(f"events={args.events:,} batch_size={args.batch_size}")
+
+    # Warm up connections and statement caches
+    await run("orm", args.batch_size, args.batch_size)
+    await run("copy", args.batch_size, args.batch_size)
+
+    print(f"\n{'Writer':<10} {'rows/s':>12} {'CPU ms/10k':>12}")
+    print("-" * 70)
+    results = {}
+    for writer in ("orm", "copy"):
+        rate, cpu = await run(writer, args.events, args.batch_size)
+        results[writer] = (rate, cpu)
+        print(f"{writer:<10} {rate:>12,.0f} {cpu * 1000:>12.1f}")
+
+    speedup = results["copy"][0] / results["orm"][0]
+    cpu_saving = 1 - results["copy"][1] / results["orm"][1]
+    print(f"\nThroughput speedup: {speedup:.2f}x")
+    print(f"CPU saved per event: {cpu_saving:.0%}")
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument(
+        "--batch-size", type=int, default=app_settings.AUDIT_BATCH_SIZE
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
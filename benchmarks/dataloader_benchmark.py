@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark by-ID lookups under fan-in load with and without the DataLoader.
+
+Fills a scratch table in the configured PostgreSQL database and runs waves
+of concurrent "handlers", each opening its own session and calling
+get_by_id for a random row, the way many WebSocket connections asking for
+individual rows in the same tick do. For each mode it reports:
+
+- lookups/sec
+- SQL queries issued against the scratch table
+- queries saved by batching (lookups - queries)
+
+Requires a reachable database (DB_* settings).
+
+Run with: python benchmarks/dataloader_benchmark.py [--concurrency 200]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; only the database is used
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlmodel import Field, SQLModel  # noqa: E402
+
+from app.repositories.base import BaseRepository  # noqa: E402
+from app.settings import app_settings  # noqa: E402
+from app.storage.db import async_session, engine  # noqa: E402
+
+TABLE = "bench_dataloader_items"
+
+
+class BenchLoaderItem(SQLModel, table=True):  # type: ignore[call-arg]
+    """Scratch table for the benchmark."""
+
+    __tablename__ = TABLE
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str
+
+
+async def setup_table(rows: int) -> None:
+    """Create and fill the scratch table (skipped if already filled)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchLoaderItem.__table__.create, checkfirst=True)
+        existing = (
+            await conn.execute(text(f"SELECT count(*) FROM {TABLE}"))
+        ).scalar_one()
+        if existing != rows:
+            await conn.execute(text(f"TRUNCATE {TABLE} RESTART IDENTITY"))
+            await conn.execute(
+                text(
+                    f"INSERT INTO {TABLE} (name) "
+                    "SELECT 'item ' || g FROM generate_series(1, :rows) AS g"
+                ),
+                {"rows": rows},
+            )
+
+
+async def handler(item_id: int) -> None:
+    """One request: own session, one lookup."""
+    async with async_session() as session:
+        repo = BaseRepository(session, BenchLoaderItem)
+        await repo.get_by_id(item_id)
+
+
+async def run(args: argparse.Namespace) -> tuple[float, int]:
+    """Run all waves; returns (lookups/sec, queries issued)."""
+    queries = 0
+
+    def count(conn, cursor, statement, *_):
+        nonlocal queries
+        if TABLE in statement:
+            queries += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        start = time.perf_counter()
+        for _ in range(args.waves):
+            await asyncio.gather(
+                *(
+                    handler(random.randint(1, args.rows))
+                    for _ in range(args.concurrency)
+                )
+            )
+        elapsed = time.perf_counter() - start
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return args.waves * args.concurrency / elapsed, queries
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run both modes and print throughput and query counts."""
+    print("DataLoader Fan-in Benchmark")
+    print("=" * 70)
+    lookups = args.waves * args.concurrency
+    print(
+        f"rows={args.rows:,} concurrency={args.concurrency} "
+        f"waves={args.waves} window={args.window_ms}ms"
+    )
+    await setup_table(args.rows)
+
+    print(f"\n{'Mode':<10} {'lookups/s':>12} {'queries':>10} {'saved':>10}")
+    print("-" * 70)
+    results = {}
+    for mode, enabled in (("off", False), ("batched", True)):
+        with (
+            patch.object(app_settings, "DATALOADER_ENABLED", enabled),
+            patch.object(
+                app_settings, "DATALOADER_BATCH_WINDOW_MS", args.window_ms
+            ),
+        ):
+            rate, queries = await run(args)
+        results[mode] = rate
+        print(
+            f"{mode:<10} {rate:>12,.0f} {queries:>10,} "
+            f"{lookups - queries:>10,}"
+        )
+
+    print(f"\nThroughput speedup: {results['batched'] / results['off']:.2f}x")
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                BenchLoaderItem.__table__.drop, checkfirst=True
+            )
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--waves", type=int, default=50)
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=0.0,
+        help="Batch window (0 = one event loop iteration)",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the scratch table"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
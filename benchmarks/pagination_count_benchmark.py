@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark offset pagination totals: COUNT query vs COUNT(*) OVER ().
+
+Fills a scratch table in the configured PostgreSQL database and pages
+through it with OffsetPaginationStrategy on a count cache miss, comparing:
+
+- exact:  SELECT count(...) then SELECT ... OFFSET/LIMIT (two round trips)
+- window: SELECT ..., count(*) OVER () ... OFFSET/LIMIT (one statement)
+
+Requires a reachable database (DB_* settings). The count cache is bypassed
+so every request pays for the total.
+
+Run with: python benchmarks/pagination_count_benchmark.py [--rows 1000000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; only the database is used
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from sqlalchemy import text  # noqa: E402
+from sqlmodel import Field, SQLModel, select  # noqa: E402
+
+from app.storage.db import async_session, engine  # noqa: E402
+from app.storage.pagination.offset import OffsetPaginationStrategy  # noqa: E402
+
+
+class BenchItem(SQLModel, table=True):  # type: ignore[call-arg]
+    """Scratch table for the benchmark."""
+
+    __tablename__ = "bench_pagination_items"
+
+    id: int | None = Field(default=None, primary_key=True)
+    category: int = Field(index=True)
+    name: str
+
+
+async def setup_table(rows: int) -> None:
+    """Create and fill the scratch table (skipped if already filled)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchItem.__table__.create, checkfirst=True)
+        existing = (
+            await conn.execute(
+                text("SELECT count(*) FROM bench_pagination_items")
+            )
+        ).scalar_one()
+        if existing != rows:
+            await conn.execute(text("TRUNCATE bench_pagination_items"))
+            await conn.execute(
+                text(
+                    "INSERT INTO bench_pagination_items (category, name) "
+                    "SELECT g % 10, 'item ' || g "
+                    "FROM generate_series(1, :rows) AS g"
+                ),
+                {"rows": rows},
+            )
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE bench_pagination_items"))
+
+
+async def run_case(
+    mode: str, page: int, per_page: int, filtered: bool, reps: int
+) -> list[float]:
+    """Time one (mode, page, filter) case; returns latencies in ms."""
+    filter_dict = {"category": 3} if filtered else None
+    query = select(BenchItem).order_by(BenchItem.id)
+    if filtered:
+        query = query.where(BenchItem.category == 3)
+
+    timings = []
+    async with async_session() as session:
+        for _ in range(reps):
+            strategy = OffsetPaginationStrategy(
+                session,
+                page=page,
+                filter_dict=filter_dict,
+                count_mode=mode,  # type: ignore[arg-type]
+            )
+            start = time.perf_counter()
+            await strategy.paginate(query, BenchItem, per_page)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run all cases and print a comparison table."""
+    print("Pagination Count Benchmark")
+    print("=" * 70)
+    print(f"rows={args.rows:,} per_page={args.per_page} reps={args.reps}")
+    await setup_table(args.rows)
+
+    pages = [1, 100, args.rows // args.per_page // 2]
+    print(
+        f"\n{'Filter':<10} {'Page':>8} {'exact p50':>12} "
+        f"{'window p50':>12} {'Speedup':>10}"
+    )
+    print("-" * 70)
+
+    async def no_cache(*_args, **_kwargs):
+        return None
+
+    with (
+        patch("app.storage.pagination.offset.get_cached_count", no_cache),
+        patch("app.storage.pagination.offset.set_cached_count", no_cache),
+    ):
+        for filtered in (False, True):
+            for page in pages:
+                results = {}
+                for mode in ("exact", "window"):
+                    # Warm-up run so both modes see a hot buffer cache
+                    await run_case(mode, page, args.per_page, filtered, 1)
+                    results[mode] = statistics.median(
+                        await run_case(
+                            mode, page, args.per_page, filtered, args.reps
+                        )
+                    )
+                print(
+                    f"{'category' if filtered else 'none':<10} "
+                    f"{page:>8} "
+                    f"{results['exact']:>10.2f}ms "
+                    f"{results['window']:>10.2f}ms "
+                    f"{results['exact'] / results['window']:>9.2f}x"
+                )
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.run_sync(BenchItem.__table__.drop, checkfirst=True)
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--reps", type=int, default=20)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the scratch table"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential offset paging with and without next-page prefetch.
+
+Fills a scratch table in the configured PostgreSQL database and walks
+pages 1..N through get_paginated_results, the way a client pages forward
+through GET_PAGINATED_AUTHORS, comparing per-page latency:
+
+- off:      every page runs its OFFSET query (count cached after page 1)
+- prefetch: page N+1 is fetched in the background while the client
+            "thinks", so it is served from CacheManager
+
+Requires a reachable database and Redis (DB_* / REDIS_* settings).
+
+Run with: python benchmarks/pagination_prefetch_benchmark.py [--pages 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; only the database and Redis are used
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from sqlalchemy import text  # noqa: E402
+from sqlmodel import Field, SQLModel  # noqa: E402
+
+from app.settings import app_settings  # noqa: E402
+from app.storage.db import engine, get_paginated_results  # noqa: E402
+from app.storage.pagination import prefetch  # noqa: E402
+
+
+class BenchPrefetchItem(SQLModel, table=True):  # type: ignore[call-arg]
+    """Scratch table for the benchmark."""
+
+    __tablename__ = "bench_prefetch_items"
+
+    id: int | None = Field(default=None, primary_key=True)
+    category: int = Field(index=True)
+    name: str
+
+
+async def setup_table(rows: int) -> None:
+    """Create and fill the scratch table (skipped if already filled)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            BenchPrefetchItem.__table__.create, checkfirst=True
+        )
+        existing = (
+            await conn.execute(
+                text("SELECT count(*) FROM bench_prefetch_items")
+            )
+        ).scalar_one()
+        if existing != rows:
+            await conn.execute(text("TRUNCATE bench_prefetch_items"))
+            await conn.execute(
+                text(
+                    "INSERT INTO bench_prefetch_items (category, name) "
+                    "SELECT g % 10, 'item ' || g "
+                    "FROM generate_series(1, :rows) AS g"
+                ),
+                {"rows": rows},
+            )
+
+
+async def walk(pages: int, per_page: int, think_ms: float) -> list[float]:
+    """Page forward from page 1; returns per-page latencies in ms."""
+    timings = []
+    for page in range(1, pages + 1):
+        start = time.perf_counter()
+        await get_paginated_results(
+            BenchPrefetchItem,
+            page=page,
+            per_page=per_page,
+            filters={"category": 3},
+            prefetch=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        # Time the client spends rendering before asking for the next page
+        await asyncio.sleep(think_ms / 1000)
+    # Let the last read-ahead finish before the next walk
+    await asyncio.gather(*prefetch._in_flight.values())
+    return timings
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run both modes and print p50/p95 per-page latency."""
+    print("Pagination Prefetch Benchmark")
+    print("=" * 70)
+    print(
+        f"rows={args.rows:,} pages={args.pages} per_page={args.per_page} "
+        f"think={args.think_ms}ms walks={args.walks}"
+    )
+    await setup_table(args.rows)
+
+    print(f"\n{'Mode':<10} {'p50':>10} {'p95':>10}")
+    print("-" * 70)
+    results = {}
+    for mode, enabled in (("off", False), ("prefetch", True)):
+        with (
+            patch.object(app_settings, "PAGINATION_PREFETCH_ENABLED", enabled),
+            patch.object(
+                app_settings,
+                "PAGINATION_PREFETCH_MODELS",
+                ["BenchPrefetchItem"],
+            ),
+        ):
+            timings: list[float] = []
+            for _ in range(args.walks):
+                # Every walk starts with a cold page cache
+                await prefetch.get_cache_manager().invalidate_pattern(
+                    "pagination:page:BenchPrefetchItem:*"
+                )
+                timings += await walk(args.pages, args.per_page, args.think_ms)
+        results[mode] = statistics.median(timings)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{mode:<10} {results[mode]:>8.2f}ms {p95:>8.2f}ms")
+
+    print(f"\np50 speedup: {results['off'] / results['prefetch']:.2f}x")
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                BenchPrefetchItem.__table__.drop, checkfirst=True
+            )
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--walks", type=int, default=5)
+    parser.add_argument(
+        "--think-ms",
+        type=float,
+        default=20.0,
+        help="Client delay between pages (gives read-ahead time to finish)",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the scratch table"
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-process L1 caches vs a shared-memory L1 across workers.
+
+Simulates several uvicorn workers on one host reading a Zipf-distributed
+key set. Each L1 miss costs a simulated Redis round trip. Compares:
+
+- local:  every worker keeps its own LRU (CacheManager's default L1)
+- shared: all workers use one SharedMemoryCache segment
+
+Both modes get the same total entry budget (workers x capacity).
+
+Run with: python benchmarks/shm_cache_benchmark.py [--workers 4]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# app settings are validated on import; the benchmark needs no services
+for _name, _value in {
+    "KEYCLOAK_REALM": "bench",
+    "KEYCLOAK_CLIENT_ID": "bench",
+    "KEYCLOAK_BASE_URL": "http://localhost:8080/",
+    "KEYCLOAK_ADMIN_USERNAME": "bench",
+    "KEYCLOAK_ADMIN_PASSWORD": "bench",
+    "DB_USER": "bench",
+    "DB_PASSWORD": "bench",
+    "LOG_LEVEL": "WARNING",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.storage.shm_cache import SharedMemoryCache  # noqa: E402
+from app.utils.cache_codecs import CacheSerializer  # noqa: E402
+
+SEGMENT_NAME = "shm_cache_benchmark"
+SLOT_SIZE = 512
+
+
+def make_value(key_id: int) -> dict:
+    """Typical cached entity (~200 bytes serialized)."""
+    return {
+        "id": key_id,
+        "name": f"Author {key_id}",
+        "email": f"author{key_id}@example.com",
+        "status": "active",
+        "tags": ["fiction", "bestseller"],
+        "rating": 4.5,
+    }
+
+
+def zipf_keys(num_keys: int, ops: int, seed: int, s: float = 1.1):
+    """Generate a Zipf-like access sequence over num_keys keys."""
+    rng = random.Random(seed)
+    weights = [1 / (rank**s) for rank in range(1, num_keys + 1)]
+    return rng.choices(range(num_keys), weights=weights, k=ops)
+
+
+def redis_fetch(
+    serializer: CacheSerializer, key_id: int, latency: float
+) -> dict:
+    """Simulated L2 round trip: network latency + encode/decode."""
+    time.sleep(latency)
+    payload, _ = serializer.encode(make_value(key_id))
+    return serializer.decode(payload)
+
+
+def run_worker(
+    mode: str,
+    worker_id: int,
+    args: argparse.Namespace,
+    directory: str,
+    results: multiprocessing.Queue,
+) -> None:
+    """Worker process: perform lookups and report hits/latency."""
+    serializer = CacheSerializer()
+    latency = args.l2_latency_ms / 1000
+    keys = zipf_keys(args.keys, args.ops, seed=worker_id)
+
+    shm = None
+    local: OrderedDict[str, dict] = OrderedDict()
+    if mode == "shared":
+        shm = SharedMemoryCache(
+            SEGMENT_NAME,
+            slots=args.capacity * args.workers,
+            slot_size=SLOT_SIZE,
+            directory=directory,
+        )
+
+    hits = 0
+    timings = []
+    start = time.perf_counter()
+    for key_id in keys:
+        key = f"author:{key_id}"
+        t0 = time.perf_counter()
+
+        if shm is not None:
+            value = shm.get(key)
+            if value is None:
+                value = redis_fetch(serializer, key_id, latency)
+                shm.set(key, value, ttl=300)
+            else:
+                hits += 1
+        else:
+            value = local.get(key)
+            if value is None:
+                value = redis_fetch(serializer, key_id, latency)
+                local[key] = value
+                if len(local) > args.capacity:
+                    local.popitem(last=False)
+            else:
+                local.move_to_end(key)
+                hits += 1
+
+        timings.append((time.perf_counter() - t0) * 1_000_000)
+
+    elapsed = time.perf_counter() - start
+    if shm is not None:
+        shm.close()
+
+    results.put(
+        {
+            "hits": hits,
+            "ops": len(keys),
+            "elapsed": elapsed,
+            "p50_us": statistics.median(timings),
+            "mean_us": statistics.mean(timings),
+        }
+    )
+
+
+def run_mode(mode: str, args: argparse.Namespace, directory: str) -> dict:
+    """Run all workers for one mode and aggregate their results."""
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=run_worker, args=(mode, i, args, directory, results)
+        )
+        for i in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    reports = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    ops = sum(r["ops"] for r in reports)
+    hits = sum(r["hits"] for r in reports)
+    wall = max(r["elapsed"] for r in reports)
+    if mode == "shared":
+        l1_bytes = args.capacity * args.workers * SLOT_SIZE
+    else:
+        l1_bytes = None
+    return {
+        "mode": mode,
+        "hit_rate": hits / ops * 100,
+        "l2_calls": ops - hits,
+        "throughput": ops / wall,
+        "p50_us": statistics.median(r["p50_us"] for r in reports),
+        "mean_us": statistics.mean(r["mean_us"] for r in reports),
+        "l1_bytes": l1_bytes,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--keys", type=int, default=5_000)
+    parser.add_argument(
+        "--capacity", type=int, default=500, help="L1 entries per worker"
+    )
+    parser.add_argument("--l2-latency-ms", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print("Shared-memory L1 Benchmark")
+    print("=" * 70)
+    print(
+        f"workers={args.workers} ops/worker={args.ops} keys={args.keys} "
+        f"capacity/worker={args.capacity} "
+        f"l2_latency={args.l2_latency_ms}ms"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            run_mode(mode, args, directory) for mode in ("local", "shared")
+        ]
+
+    print(
+        f"\n{'Mode':<10} {'Hit %':>8} {'L2 calls':>10} {'ops/s':>12} "
+        f"{'p50 (µs)':>10} {'mean (µs)':>10}"
+    )
+    print("-" * 70)
+    for r in results:
+        print(
+            f"{r['mode']:<10} "
+            f"{r['hit_rate']:>7.1f}% "
+            f"{r['l2_calls']:>10} "
+            f"{r['throughput']:>12,.0f} "
+            f"{r['p50_us']:>10.2f} "
+            f"{r['mean_us']:>10.2f}"
+        )
+
+    local, shared = results
+    print(f"\n{'=' * 70}")
+    print(" Summary")
+    print("=" * 70)
+    print(
+        f"L2 round trips saved: {local['l2_calls'] - shared['l2_calls']:,} "
+        f"({(1 - shared['l2_calls'] / local['l2_calls']) * 100:.1f}%)"
+    )
+    print(
+        f"Throughput ratio (shared/local): "
+        f"{shared['throughput'] / local['throughput']:.2f}x"
+    )
+    print(
+        f"Shared segment size: {shared['l1_bytes'] / 1024:.0f} KiB "
+        f"(one copy per host instead of one per worker)"
+    )
+
+
+if __name__ == "__main__":
+    main()
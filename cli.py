@@ -2,9 +2,12 @@
 CLI tool for WebSocket handler management.
 
 Provides commands for viewing registered handlers and generating new handlers
-using the f-string code generator with AST validation.
+using the f-string code generator with AST validation, and for running the
+Redis Streams audit consumer.
 """
 
+import asyncio
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -12,6 +15,7 @@ from rich.table import Table
 
 from app.api.ws.constants import PkgID
 from app.routing import pkg_router
+from app.settings import app_settings
 from generate_ws_handler import HandlerGenerator
 
 # Initialize Typer app with help text
@@ -378,5 +382,51 @@ def validate_handlers():
         console.print()
 
 
+@typer_app.command(name="audit-consumer")
+def audit_consumer(
+    name: str = typer.Option(
+        None,
+        "--name",
+        "-n",
+        help="Consumer name within the group (default: host and pid)",
+    ),
+):
+    """
+    Run the Redis Streams audit consumer.
+
+    Reads the audit entries app workers append to AUDIT_STREAM_KEY (with
+    AUDIT_TRANSPORT=redis) as a member of AUDIT_STREAM_GROUP, bulk-writes
+    them to PostgreSQL and acknowledges them. Run several to share the
+    load; set AUDIT_STREAM_CONSUMER_IN_APP=false to keep writes out of the
+    app processes.
+
+    Example:
+        python cli.py audit-consumer --name audit-1
+    """
+    from app.storage.db import engine
+    from app.storage.redis import RedisPool
+    from app.utils.audit_stream import audit_stream_consumer
+
+    async def run() -> None:
+        try:
+            await audit_stream_consumer(name)
+        finally:
+            await RedisPool.close_all()
+            await engine.dispose()
+
+    console.print(
+        Panel.fit(
+            "[bold cyan]Audit Stream Consumer[/bold cyan]\n\n"
+            f"Stream: {app_settings.AUDIT_STREAM_KEY}\n"
+            f"Group: {app_settings.AUDIT_STREAM_GROUP}",
+            border_style="cyan",
+        )
+    )
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        console.print("[yellow]Audit consumer stopped[/yellow]")
+
+
 if __name__ == "__main__":
     typer_app()
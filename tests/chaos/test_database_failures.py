@@ -49,9 +49,8 @@ class TestDatabaseConnectionFailures:
         """Test repository create when connection is lost mid-operation."""
         mock_session = AsyncMock()
 
-        # Simulate connection loss during flush
-        mock_session.add = AsyncMock()
-        mock_session.flush = AsyncMock(
+        # Simulate connection loss during the INSERT
+        mock_session.exec = AsyncMock(
             side_effect=DisconnectionError(
                 "connection lost", None, Exception("EOF")
             )
@@ -84,8 +83,7 @@ class TestDatabaseConnectionFailures:
     async def test_transaction_rollback_on_error(self):
         """Test that session rolls back on database errors."""
         mock_session = AsyncMock()
-        mock_session.add = AsyncMock()
-        mock_session.flush = AsyncMock(
+        mock_session.exec = AsyncMock(
             side_effect=OperationalError(
                 "deadlock detected", None, Exception()
             )
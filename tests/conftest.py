@@ -388,6 +388,41 @@ def postgres_container():
         container.stop()
 
 
+@pytest.fixture(scope="session")
+def redis_container():
+    """
+    Provides a real Redis container for integration testing.
+
+    Used by tests that depend on server behaviour mocks cannot reproduce
+    (e.g. client tracking invalidation messages).
+
+    Yields:
+        dict: Redis connection details with keys:
+            - host: Container host IP
+            - port: Mapped port
+
+    Example:
+        @pytest.mark.integration
+        async def test_with_real_redis(redis_container, monkeypatch):
+            monkeypatch.setattr(
+                app_settings, "REDIS_IP", redis_container["host"]
+            )
+            ...
+    """
+    from testcontainers.redis import RedisContainer
+
+    container = RedisContainer("redis:8.4.2-alpine")
+    container.start()
+
+    try:
+        yield {
+            "host": container.get_container_host_ip(),
+            "port": int(container.get_exposed_port(6379)),
+        }
+    finally:
+        container.stop()
+
+
 @pytest.fixture(scope="session")
 async def setup_test_db(postgres_container):
     """
@@ -409,6 +444,7 @@ async def setup_test_db(postgres_container):
             # app.storage.db.async_session now points to testcontainer
             await log_user_action(...)
     """
+    from sqlalchemy import text
     from sqlalchemy.ext.asyncio import create_async_engine
     from sqlalchemy.orm import sessionmaker
     from sqlmodel import SQLModel
@@ -440,8 +476,9 @@ async def setup_test_db(postgres_container):
     db_module.engine = test_engine
     db_module.async_session = test_session
 
-    # Create schema
+    # Create schema (trigram indexes need the pg_trgm extension)
     async with test_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(SQLModel.metadata.create_all)
 
     yield test_engine
@@ -6,18 +6,33 @@ functionality.
 """
 
 import asyncio
-from unittest.mock import MagicMock, patch
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from starlette.requests import Request
 
+from app.models.user_action import UserAction
 from app.utils.audit_logger import (
+    AUDIT_COLUMNS,
     SENSITIVE_FIELDS,
+    AuditRecord,
+    audit_batch_target,
+    audit_connection_budget,
+    audit_log_worker,
+    audit_record,
+    collect_audit_batch,
     extract_ip_address,
     flush_audit_queue,
     get_audit_queue,
     log_user_action,
+    prepare_audit_batch,
+    rollup_audit_batch,
     sanitize_data,
+    write_audit_batch,
 )
 
 
@@ -218,7 +233,7 @@ class TestLogUserAction:
 
     @pytest.mark.asyncio
     async def test_log_user_action_sanitizes_data(self):
-        """Test that request data is sanitized before logging."""
+        """Test that request data is sanitized before writing."""
         # Reset global queue
         import app.utils.audit_logger
 
@@ -227,6 +242,7 @@ class TestLogUserAction:
         with patch("app.utils.audit_logger.app_settings") as mock_settings:
             mock_settings.AUDIT_QUEUE_MAX_SIZE = 1000
 
+            request_data = {"username": "test", "password": "secret123"}
             action = await log_user_action(
                 user_id="user123",
                 username="testuser",
@@ -234,12 +250,18 @@ class TestLogUserAction:
                 action_type="POST",
                 resource="/api/login",
                 outcome="success",
-                request_data={"username": "test", "password": "secret123"},
+                request_data=request_data,
             )
 
+            # The request path only queues a reference to the raw data
             assert action is not None
-            assert action.request_data["username"] == "test"
-            assert action.request_data["password"] == "[REDACTED]"
+            assert action.request_data is request_data
+
+            # The worker redacts before writing
+            (prepared,) = prepare_audit_batch([action])
+            assert prepared.request_data["username"] == "test"
+            assert prepared.request_data["password"] == "[REDACTED]"
+            assert request_data["password"] == "secret123"
 
     @pytest.mark.asyncio
     async def test_log_user_action_queue_full_no_backpressure(self):
@@ -375,7 +397,11 @@ class TestLogUserAction:
 
     @pytest.mark.asyncio
     async def test_log_user_action_handles_exception(self):
-        """Test error handling in log_user_action."""
+        """Test a record failing preparation is dropped by the worker."""
+        import app.utils.audit_logger
+
+        app.utils.audit_logger._audit_queue = None
+
         with (
             patch(
                 "app.utils.audit_logger.sanitize_data",
@@ -392,7 +418,8 @@ class TestLogUserAction:
                 outcome="success",
             )
 
-            assert action is None
+            assert action is not None
+            assert prepare_audit_batch([action]) == []
             mock_logger.error.assert_called()
 
 
@@ -486,3 +513,345 @@ class TestFlushAuditQueue:
 
             assert count == 0
             mock_logger.error.assert_called()
+
+
+def make_action(**overrides) -> AuditRecord:
+    """Prepared audit record with every required column set."""
+    values = {
+        "timestamp": datetime(2026, 1, 1, tzinfo=UTC),
+        "user_id": "user1",
+        "username": "user1",
+        "user_roles": ["user"],
+        "action_type": "GET",
+        "resource": "/api/test",
+        "outcome": "success",
+        "ip_address": None,
+        "user_agent": None,
+        "request_id": None,
+        "request_data": {"q": 1},
+        "response_status": 200,
+        "error_message": None,
+        "duration_ms": None,
+    }
+    return AuditRecord(**(values | overrides))
+
+
+def session_with_driver(driver) -> MagicMock:
+    """Session whose raw connection exposes the given driver."""
+    raw = MagicMock()
+    raw.driver_connection = driver
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    session.flush = AsyncMock()
+    session.execute = AsyncMock()
+    return session
+
+
+class TestWriteAuditBatch:
+    """Tests for preparing and writing queued records."""
+
+    def test_prepare_drops_invalid_records(self):
+        """Test validation runs in the worker and skips bad records."""
+        batch = [make_action(user_id=12345), make_action(outcome="")]
+
+        assert prepare_audit_batch(batch + [make_action()]) == [make_action()]
+
+    def test_audit_record_matches_columns(self):
+        """Test records follow AUDIT_COLUMNS with JSON as text."""
+        record = audit_record(make_action())
+
+        assert len(record) == len(AUDIT_COLUMNS)
+        values = dict(zip(AUDIT_COLUMNS, record))
+        assert values["user_roles"] == '["user"]'
+        assert json.loads(values["request_data"]) == {"q": 1}
+        assert values["ip_address"] is None
+        assert "id" not in values
+
+    @pytest.mark.asyncio
+    async def test_copy_path(self):
+        """Test batches are copied as tuples without touching the ORM."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = session_with_driver(driver)
+        batch = [make_action(), make_action(user_id="user2")]
+
+        await write_audit_batch(session, batch)
+
+        driver.copy_records_to_table.assert_awaited_once()
+        call = driver.copy_records_to_table.call_args
+        assert call.args == ("user_actions",)
+        assert call.kwargs["columns"] == AUDIT_COLUMNS
+        assert [r[1] for r in call.kwargs["records"]] == ["user1", "user2"]
+        session.add_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_orm_fallback_without_copy_support(self):
+        """Test drivers without COPY use add_all + flush."""
+        session = session_with_driver(object())
+        batch = [make_action()]
+
+        await write_audit_batch(session, batch)
+
+        (actions,) = session.add_all.call_args.args
+        assert isinstance(actions[0], UserAction)
+        assert actions[0].request_data == {"q": 1}
+        session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_orm_writer_setting(self):
+        """Test AUDIT_WRITER=orm skips COPY."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = session_with_driver(driver)
+
+        with patch("app.settings.app_settings.AUDIT_WRITER", "orm"):
+            await write_audit_batch(session, [make_action()])
+
+        driver.copy_records_to_table.assert_not_called()
+        session.add_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_records_skip_duplicates(self):
+        """Test redelivered stream entries are neither written nor counted."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = session_with_driver(driver)
+        inserted = MagicMock()
+        inserted.scalars.return_value = ["1-1"]
+        session.execute.side_effect = [inserted, MagicMock()]
+        batch = [
+            make_action(stream_id="1-0"),
+            make_action(stream_id="1-1", outcome="error"),
+        ]
+
+        written = await write_audit_batch(session, batch)
+
+        assert written == [batch[1]]
+        driver.copy_records_to_table.assert_not_called()
+        insert_stmt, rollup_stmt = (
+            call.args[0] for call in session.execute.call_args_list
+        )
+        sql = str(insert_stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO user_actions")
+        assert "ON CONFLICT (stream_id, timestamp) DO NOTHING" in sql
+        rows = rollup_stmt.compile(dialect=postgresql.dialect()).params
+        assert rows["outcome_m0"] == "error"
+        assert "outcome_m1" not in rows
+
+
+class TestAuditRollups:
+    """Tests for the per-minute rollup counters."""
+
+    def test_counts_per_minute_and_key(self):
+        """Test records are counted per minute, action, outcome and user."""
+        minute = datetime(2026, 1, 1, 12, 30, tzinfo=UTC)
+        batch = [
+            make_action(timestamp=minute.replace(second=5)),
+            make_action(timestamp=minute.replace(second=59)),
+            make_action(timestamp=minute.replace(minute=31)),
+            make_action(timestamp=minute, outcome="error"),
+        ]
+
+        rows = rollup_audit_batch(batch)
+
+        assert [
+            (row["minute"], row["outcome"], row["count"]) for row in rows
+        ] == [
+            (minute, "error", 1),
+            (minute, "success", 2),
+            (minute.replace(minute=31), "success", 1),
+        ]
+
+    def test_summary_rows_count_their_requests(self):
+        """Test weighted records add their request count."""
+        batch = [make_action(weight=30), make_action()]
+
+        (row,) = rollup_audit_batch(batch)
+
+        assert row["count"] == 31
+
+    def test_weight_is_not_a_column(self):
+        """Test the weight is left out of the written row."""
+        assert "weight" not in AUDIT_COLUMNS
+        assert len(audit_record(make_action(weight=5))) == len(AUDIT_COLUMNS)
+
+    @pytest.mark.asyncio
+    async def test_upserted_with_the_batch(self):
+        """Test counts are added to existing rows in the same session."""
+        session = session_with_driver(object())
+
+        await write_audit_batch(session, [make_action(), make_action()])
+
+        (stmt,) = session.execute.call_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO user_action_rollups")
+        assert "ON CONFLICT (minute, action_type, outcome, user_id)" in sql
+        assert "count = (user_action_rollups.count + excluded.count)" in sql
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        """Test AUDIT_ROLLUPS_ENABLED=False writes only the raw rows."""
+        session = session_with_driver(object())
+
+        with patch("app.settings.app_settings.AUDIT_ROLLUPS_ENABLED", False):
+            await write_audit_batch(session, [make_action()])
+
+        session.execute.assert_not_called()
+
+
+@pytest.fixture
+def fresh_queue():
+    """Reset the global queue and write slots around a test."""
+    import app.utils.audit_logger
+
+    app.utils.audit_logger._audit_queue = None
+    app.utils.audit_logger._write_slots = None
+    yield
+    # Both are bound to this test's event loop once waited on
+    app.utils.audit_logger._audit_queue = None
+    app.utils.audit_logger._write_slots = None
+
+
+def fill_queue(count: int) -> asyncio.Queue:
+    """Audit queue holding count records."""
+    queue = get_audit_queue()
+    for i in range(count):
+        queue.put_nowait(make_action(user_id=f"user{i}"))
+    return queue
+
+
+@pytest.mark.usefixtures("fresh_queue")
+class TestAuditWorkers:
+    """Tests for adaptive batching and concurrent writers."""
+
+    def test_batch_target_adapts_to_backlog(self):
+        """Test batches grow with the queue depth up to the maximum."""
+        with (
+            patch("app.settings.app_settings.AUDIT_BATCH_SIZE", 100),
+            patch("app.settings.app_settings.AUDIT_MAX_BATCH_SIZE", 1000),
+            patch("app.settings.app_settings.AUDIT_WORKERS", 2),
+        ):
+            assert audit_batch_target(10) == 100
+            assert audit_batch_target(900) == 450
+            assert audit_batch_target(9000) == 1000
+
+    def test_connection_budget_capped_by_pool(self):
+        """Test audit writes never get more than half of the pool."""
+        with (
+            patch("app.settings.app_settings.DB_POOL_SIZE", 4),
+            patch("app.settings.app_settings.DB_MAX_OVERFLOW", 2),
+        ):
+            with patch("app.settings.app_settings.AUDIT_DB_CONNECTIONS", 2):
+                assert audit_connection_budget() == 2
+            with patch("app.settings.app_settings.AUDIT_DB_CONNECTIONS", 8):
+                assert audit_connection_budget() == 3
+
+    @pytest.mark.asyncio
+    async def test_collect_drains_backlog_in_bulk(self):
+        """Test a deep queue is drained without waiting per record."""
+        queue = fill_queue(250)
+
+        with (
+            patch("app.settings.app_settings.AUDIT_BATCH_SIZE", 100),
+            patch("app.settings.app_settings.AUDIT_WORKERS", 1),
+            patch(
+                "app.utils.audit_logger.asyncio.wait_for",
+                wraps=asyncio.wait_for,
+            ) as wait_for,
+        ):
+            batch = await collect_audit_batch(queue)
+
+        assert len(batch) == 250
+        assert queue.empty()
+        wait_for.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_collect_partial_batch_lingers(self):
+        """Test a small batch waits for more records until the timeout."""
+        queue = fill_queue(1)
+
+        async def late():
+            await asyncio.sleep(0.01)
+            queue.put_nowait(make_action(user_id="late"))
+
+        with patch("app.settings.app_settings.AUDIT_BATCH_TIMEOUT", 0.05):
+            batch, _ = await asyncio.gather(collect_audit_batch(queue), late())
+
+        assert [r.user_id for r in batch] == ["user0", "late"]
+
+    @pytest.mark.asyncio
+    async def test_collect_writes_burst_before_timeout(self):
+        """Test a batch filled by a burst is returned without lingering."""
+        queue = fill_queue(1)
+
+        async def burst():
+            await asyncio.sleep(0.01)
+            for i in range(10):
+                queue.put_nowait(make_action(user_id=f"burst{i}"))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with (
+            patch("app.settings.app_settings.AUDIT_BATCH_SIZE", 10),
+            patch("app.settings.app_settings.AUDIT_BATCH_TIMEOUT", 5.0),
+        ):
+            batch, _ = await asyncio.gather(
+                collect_audit_batch(queue), burst()
+            )
+
+        assert len(batch) == 10
+        assert loop.time() - started < 1.0
+        # The rest of the burst is left for the next batch
+        assert queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_collect_empty_queue(self):
+        """Test an idle queue yields an empty batch after the timeout."""
+        queue = fill_queue(0)
+
+        with patch("app.settings.app_settings.AUDIT_BATCH_TIMEOUT", 0.01):
+            assert await collect_audit_batch(queue) == []
+
+    @pytest.mark.asyncio
+    async def test_workers_share_connection_budget(self):
+        """Test concurrent workers hold at most the budgeted connections."""
+        fill_queue(40)
+        active = peak = 0
+
+        async def slow_write(session, batch):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return batch
+
+        @asynccontextmanager
+        async def fake_session():
+            session = MagicMock()
+            session.begin = asynccontextmanager(noop)
+            yield session
+
+        async def noop():
+            yield
+
+        with (
+            patch("app.settings.app_settings.AUDIT_BATCH_SIZE", 5),
+            patch("app.settings.app_settings.AUDIT_MAX_BATCH_SIZE", 5),
+            patch("app.settings.app_settings.AUDIT_BATCH_TIMEOUT", 0.01),
+            patch("app.settings.app_settings.AUDIT_DB_CONNECTIONS", 2),
+            patch("app.utils.audit_logger.async_session", fake_session),
+            patch("app.utils.audit_logger.write_audit_batch", slow_write),
+        ):
+            workers = [
+                asyncio.create_task(audit_log_worker(i)) for i in range(4)
+            ]
+            await asyncio.sleep(0.2)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        assert get_audit_queue().empty()
+        assert peak == 2
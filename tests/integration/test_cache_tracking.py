@@ -0,0 +1,144 @@
+"""
+Integration tests for CacheManager L1 coherence via Redis client tracking.
+
+Several CacheManager instances in one process stand in for separate
+workers/pods: each has its own invalidation listener and tracking pool,
+so Redis treats them as independent clients.
+
+Run with:
+    pytest -m integration tests/integration/test_cache_tracking.py
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+from redis.asyncio import Redis
+
+from app.managers.cache_manager import CacheManager
+from app.settings import app_settings
+from app.storage.redis import RedisPool
+
+WORKERS = 3
+
+
+async def wait_until(
+    condition: Callable[[], bool], timeout: float = 3.0
+) -> None:
+    """Poll until condition holds (invalidations arrive asynchronously)."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def redis_client(redis_container, monkeypatch) -> AsyncIterator[Redis]:
+    """Point RedisPool at the container and provide a raw client."""
+    monkeypatch.setattr(app_settings, "REDIS_IP", redis_container["host"])
+    monkeypatch.setattr(app_settings, "REDIS_PORT", redis_container["port"])
+
+    client = Redis(
+        host=redis_container["host"],
+        port=redis_container["port"],
+        db=1,
+    )
+    await client.flushall()
+    yield client
+
+    await client.aclose()
+    await RedisPool.close_all()
+
+
+@pytest.fixture
+async def workers(redis_client: Redis) -> AsyncIterator[list[CacheManager]]:
+    """Simulated workers using opt-in tracking."""
+    managers = [CacheManager(tracking="optin") for _ in range(WORKERS)]
+    yield managers
+    for manager in managers:
+        await manager.close()
+
+
+@pytest.mark.integration
+async def test_write_invalidates_other_workers(
+    workers: list[CacheManager],
+) -> None:
+    """Test a write by one worker evicts the key from every other L1."""
+    writer, *readers = workers
+    await writer.set("user:1", {"name": "John"})
+
+    for reader in readers:
+        assert await reader.get("user:1") == {"name": "John"}
+        assert "user:1" in reader._memory_cache
+
+    await writer.set("user:1", {"name": "Jane"})
+
+    await wait_until(
+        lambda: all("user:1" not in r._memory_cache for r in readers)
+    )
+    for reader in readers:
+        assert await reader.get("user:1") == {"name": "Jane"}
+
+
+@pytest.mark.integration
+async def test_external_write_invalidates(
+    workers: list[CacheManager], redis_client: Redis
+) -> None:
+    """Test writes by clients outside the cache manager are seen."""
+    reader = workers[0]
+    await workers[1].set("user:2", {"name": "John"})
+    await reader.get("user:2")
+
+    await redis_client.delete("user:2")
+
+    await wait_until(lambda: "user:2" not in reader._memory_cache)
+    assert await reader.get("user:2") is None
+
+
+@pytest.mark.integration
+async def test_listener_loss_flushes_and_recovers(
+    workers: list[CacheManager], redis_client: Redis
+) -> None:
+    """Test killing the listener flushes L1 and tracking resumes."""
+    reader, writer = workers[0], workers[1]
+    await writer.set("user:3", {"v": 1})
+    await reader.get("user:3")
+    tracker = reader._tracker
+    old_client_id = tracker.client_id
+
+    await redis_client.client_kill_filter(_id=old_client_id)
+
+    await wait_until(
+        lambda: tracker.connected and tracker.client_id != old_client_id
+    )
+    assert "user:3" not in reader._memory_cache
+
+    # Reads after recovery are tracked against the new listener
+    await reader.get("user:3")
+    assert "user:3" in reader._memory_cache
+    await writer.set("user:3", {"v": 2})
+    await wait_until(lambda: "user:3" not in reader._memory_cache)
+
+
+@pytest.mark.integration
+async def test_bcast_mode_invalidates_prefix(redis_client: Redis) -> None:
+    """Test broadcast mode tracks writes under the configured prefixes."""
+    workers = [
+        CacheManager(tracking="bcast", tracking_prefixes=["user:"])
+        for _ in range(WORKERS)
+    ]
+    try:
+        await workers[0].set("user:4", {"v": 1})
+        for worker in workers:
+            assert await worker.get("user:4") == {"v": 1}
+            assert "user:4" in worker._memory_cache
+
+        await redis_client.set("user:4", b"\x01{}")
+
+        await wait_until(
+            lambda: all("user:4" not in w._memory_cache for w in workers)
+        )
+    finally:
+        for worker in workers:
+            await worker.close()
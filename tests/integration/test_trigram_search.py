@@ -0,0 +1,71 @@
+"""
+Integration tests for trigram search against PostgreSQL.
+
+Verifies ranking, the similarity mode and that the pg_trgm GIN index can
+serve leading-wildcard searches.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.models.author import Author
+from app.repositories.author_repository import AuthorRepository
+
+NAMES = ["Johnson", "John", "Elton John", "Jon Snow", "Mary Shelley"]
+
+
+@pytest.fixture
+async def authors(setup_test_db):
+    """Insert a handful of authors, removed after the test."""
+    import app.storage.db as db_module
+
+    async with db_module.async_session() as session:
+        session.add_all([Author(name=name) for name in NAMES])
+        await session.commit()
+    yield db_module.async_session
+    async with db_module.async_session() as session:
+        await session.execute(text("DELETE FROM author"))
+        await session.commit()
+
+
+@pytest.mark.integration
+class TestTrigramSearch:
+    """Tests for AuthorRepository.search_by_name on a real database."""
+
+    async def test_substring_ranked_best_first(self, authors):
+        """Test the exact match ranks above longer names containing it."""
+        async with authors() as session:
+            results = await AuthorRepository(session).search_by_name("john")
+
+        # similarity: John 1.0, Elton John 0.45, Johnson 0.44
+        assert [a.name for a in results] == ["John", "Elton John", "Johnson"]
+
+    async def test_top_k(self, authors):
+        """Test limit returns only the best matches."""
+        async with authors() as session:
+            results = await AuthorRepository(session).search_by_name(
+                "john", limit=1
+            )
+
+        assert [a.name for a in results] == ["John"]
+
+    async def test_similar_tolerates_typos(self, authors):
+        """Test similarity search finds names the substring misses."""
+        async with authors() as session:
+            repo = AuthorRepository(session)
+            substring = await repo.search_by_name("jonson")
+            similar = await repo.search_by_name("jonson", mode="similar")
+
+        assert substring == []
+        assert similar[0].name == "Johnson"
+
+    async def test_gin_index_serves_substring(self, authors):
+        """Test the planner can answer ILIKE '%x%' from the GIN index."""
+        async with authors() as session:
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+            plan = await session.exec(
+                text("EXPLAIN SELECT * FROM author WHERE name ILIKE '%ohn%'")
+            )
+            plan_text = "\n".join(row[0] for row in plan)
+
+        assert "idx_author_name_trgm" in plan_text
@@ -6,14 +6,24 @@ and can be tested independently of HTTP/WebSocket handlers.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 from app.commands.author_commands import (
+    BulkCreateAuthorsCommand,
+    BulkCreateAuthorsInput,
+    BulkDeleteAuthorsCommand,
+    BulkDeleteAuthorsInput,
+    BulkUpdateAuthorsCommand,
+    BulkUpdateAuthorsInput,
+    BulkUpsertAuthorsCommand,
+    BulkUpsertAuthorsInput,
     CreateAuthorCommand,
     CreateAuthorInput,
     DeleteAuthorCommand,
     GetAuthorsCommand,
     GetAuthorsInput,
+    ImportAuthorsCommand,
+    ImportAuthorsInput,
     UpdateAuthorCommand,
     UpdateAuthorInput,
 )
@@ -46,9 +56,9 @@ class TestGetAuthorsCommand:
 
     @pytest.mark.asyncio
     async def test_get_authors_with_id_filter(self):
-        """Test getting authors filtered by ID."""
+        """Test by-ID lookups go through the entity cache."""
         mock_repo = AsyncMock()
-        mock_repo.get_all.return_value = [Author(id=1, name="Author 1")]
+        mock_repo.get_cached.return_value = Author(id=1, name="Author 1")
 
         command = GetAuthorsCommand(mock_repo)
         input_data = GetAuthorsInput(id=1)
@@ -57,7 +67,32 @@ class TestGetAuthorsCommand:
 
         assert len(result) == 1
         assert result[0].id == 1
-        mock_repo.get_all.assert_called_once_with(id=1)
+        mock_repo.get_cached.assert_awaited_once_with(1)
+        mock_repo.get_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_authors_with_missing_id(self):
+        """Test a nonexistent ID returns no authors."""
+        mock_repo = AsyncMock()
+        mock_repo.get_cached.return_value = None
+
+        command = GetAuthorsCommand(mock_repo)
+
+        assert await command.execute(GetAuthorsInput(id=404)) == []
+
+    @pytest.mark.asyncio
+    async def test_get_authors_with_id_and_name_filter(self):
+        """Test combined filters still query the database."""
+        mock_repo = AsyncMock()
+        mock_repo.get_all.return_value = []
+
+        command = GetAuthorsCommand(mock_repo)
+        input_data = GetAuthorsInput(id=1, name="Author 1")
+
+        await command.execute(input_data)
+
+        mock_repo.get_all.assert_called_once_with(id=1, name="Author 1")
+        mock_repo.get_cached.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_authors_with_name_filter(self):
@@ -89,7 +124,9 @@ class TestGetAuthorsCommand:
         result = await command.execute(input_data)
 
         assert len(result) == 2
-        mock_repo.search_by_name.assert_called_once_with("John")
+        mock_repo.search_by_name.assert_called_once_with(
+            "John", limit=None, mode="substring"
+        )
         # Should not call get_all when search_term is provided
         mock_repo.get_all.assert_not_called()
 
@@ -101,41 +138,34 @@ class TestCreateAuthorCommand:
     async def test_create_author_success(self):
         """Test successfully creating an author."""
         mock_repo = AsyncMock()
-        mock_repo.get_by_name.return_value = None  # No existing author
         mock_repo.create.return_value = Author(id=1, name="New Author")
 
         command = CreateAuthorCommand(mock_repo)
         input_data = CreateAuthorInput(name="New Author")
 
-        # Mock cache invalidation to avoid Redis connection issues
-        with patch(
-            "app.commands.author_commands.invalidate_count_cache",
-            new_callable=AsyncMock,
-        ):
-            result = await command.execute(input_data)
+        result = await command.execute(input_data)
 
         assert result.id == 1
         assert result.name == "New Author"
-        mock_repo.get_by_name.assert_called_once_with("New Author")
+        # Uniqueness is left to the insert; no SELECT beforehand
+        mock_repo.get_by_name.assert_not_called()
         mock_repo.create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_author_duplicate_name(self):
         """Test creating author with duplicate name raises error."""
         mock_repo = AsyncMock()
-        # Existing author with same name
-        mock_repo.get_by_name.return_value = Author(id=1, name="Existing")
+        # The unique name index rejects the insert
+        mock_repo.create.side_effect = ConflictError("conflict")
 
         command = CreateAuthorCommand(mock_repo)
         input_data = CreateAuthorInput(name="Existing")
 
-        with pytest.raises(ConflictError, match="already exists"):
+        with pytest.raises(
+            ConflictError, match="Author with name 'Existing' already exists"
+        ):
             await command.execute(input_data)
 
-        mock_repo.get_by_name.assert_called_once_with("Existing")
-        # Should not attempt to create
-        mock_repo.create.assert_not_called()
-
 
 class TestUpdateAuthorCommand:
     """Tests for UpdateAuthorCommand."""
@@ -146,7 +176,6 @@ class TestUpdateAuthorCommand:
         mock_repo = AsyncMock()
         existing_author = Author(id=1, name="Old Name")
         mock_repo.get_by_id.return_value = existing_author
-        mock_repo.get_by_name.return_value = None  # No conflict
         mock_repo.update.return_value = Author(id=1, name="New Name")
 
         command = UpdateAuthorCommand(mock_repo)
@@ -157,7 +186,7 @@ class TestUpdateAuthorCommand:
         assert result.id == 1
         assert result.name == "New Name"
         mock_repo.get_by_id.assert_called_once_with(1)
-        mock_repo.get_by_name.assert_called_once_with("New Name")
+        mock_repo.get_by_name.assert_not_called()
         mock_repo.update.assert_called_once()
 
     @pytest.mark.asyncio
@@ -181,25 +210,23 @@ class TestUpdateAuthorCommand:
         mock_repo = AsyncMock()
         # Author being updated
         mock_repo.get_by_id.return_value = Author(id=1, name="Old Name")
-        # Another author with the new name
-        mock_repo.get_by_name.return_value = Author(id=2, name="Conflict")
+        # Another author has the new name
+        mock_repo.update.side_effect = ConflictError("conflict")
 
         command = UpdateAuthorCommand(mock_repo)
         input_data = UpdateAuthorInput(id=1, name="Conflict")
 
-        with pytest.raises(ConflictError, match="already exists"):
+        with pytest.raises(
+            ConflictError, match="Author with name 'Conflict' already exists"
+        ):
             await command.execute(input_data)
 
-        mock_repo.update.assert_not_called()
-
     @pytest.mark.asyncio
     async def test_update_author_same_name_same_author(self):
         """Test updating author with its own name succeeds."""
         mock_repo = AsyncMock()
         existing_author = Author(id=1, name="Same Name")
         mock_repo.get_by_id.return_value = existing_author
-        # Same author returned by get_by_name
-        mock_repo.get_by_name.return_value = existing_author
         mock_repo.update.return_value = existing_author
 
         command = UpdateAuthorCommand(mock_repo)
@@ -222,12 +249,7 @@ class TestDeleteAuthorCommand:
 
         command = DeleteAuthorCommand(mock_repo)
 
-        # Mock cache invalidation to avoid Redis connection issues
-        with patch(
-            "app.commands.author_commands.invalidate_count_cache",
-            new_callable=AsyncMock,
-        ):
-            await command.execute(1)
+        await command.execute(1)
 
         mock_repo.get_by_id.assert_called_once_with(1)
         mock_repo.delete.assert_called_once()
@@ -245,3 +267,180 @@ class TestDeleteAuthorCommand:
 
         mock_repo.get_by_id.assert_called_once_with(999)
         mock_repo.delete.assert_not_called()
+
+
+class TestBulkCreateAuthorsCommand:
+    """Tests for BulkCreateAuthorsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create(self):
+        """Test all authors are created with one bulk insert."""
+        mock_repo = AsyncMock()
+        mock_repo.create_many.return_value = [
+            Author(id=1, name="Ann"),
+            Author(id=2, name="Bob"),
+        ]
+
+        command = BulkCreateAuthorsCommand(mock_repo)
+        result = await command.execute(
+            BulkCreateAuthorsInput(names=["Ann", "Bob"])
+        )
+
+        assert [a.id for a in result] == [1, 2]
+        created = mock_repo.create_many.call_args.args[0]
+        assert [a.name for a in created] == ["Ann", "Bob"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_names_in_request(self):
+        """Test names repeated within the request are rejected."""
+        mock_repo = AsyncMock()
+
+        command = BulkCreateAuthorsCommand(mock_repo)
+        with pytest.raises(ConflictError, match="Duplicate author names"):
+            await command.execute(
+                BulkCreateAuthorsInput(names=["Ann", "Bob", "Ann"])
+            )
+
+        mock_repo.create_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_existing_names(self):
+        """Test a unique index violation is reported as a conflict."""
+        mock_repo = AsyncMock()
+        mock_repo.create_many.side_effect = ConflictError(
+            "Author conflicts with an existing row"
+        )
+
+        command = BulkCreateAuthorsCommand(mock_repo)
+        with pytest.raises(ConflictError, match="already exist"):
+            await command.execute(BulkCreateAuthorsInput(names=["Ann", "Bob"]))
+
+        mock_repo.create_many.assert_awaited_once()
+
+
+class TestBulkUpdateAuthorsCommand:
+    """Tests for BulkUpdateAuthorsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(self):
+        """Test existing authors are renamed with one bulk update."""
+        mock_repo = AsyncMock()
+        mock_repo.get_by_ids.return_value = [
+            Author(id=1, name="A"),
+            Author(id=2, name="B"),
+        ]
+        mock_repo.update_many.return_value = 2
+
+        command = BulkUpdateAuthorsCommand(mock_repo)
+        result = await command.execute(
+            BulkUpdateAuthorsInput(
+                authors=[{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bob"}]
+            )
+        )
+
+        assert result.count == 2
+        mock_repo.get_by_ids.assert_awaited_once_with([1, 2])
+        mock_repo.update_many.assert_awaited_once_with(
+            [{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bob"}]
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_author(self):
+        """Test nothing is renamed when an author does not exist."""
+        mock_repo = AsyncMock()
+        mock_repo.get_by_ids.return_value = [Author(id=1, name="A")]
+
+        command = BulkUpdateAuthorsCommand(mock_repo)
+        with pytest.raises(NotFoundError, match="not found: 2"):
+            await command.execute(
+                BulkUpdateAuthorsInput(
+                    authors=[{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bo"}]
+                )
+            )
+
+        mock_repo.update_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_in_request(self):
+        """Test an ID repeated within the request is rejected."""
+        mock_repo = AsyncMock()
+
+        command = BulkUpdateAuthorsCommand(mock_repo)
+        with pytest.raises(ConflictError, match="Duplicate author IDs"):
+            await command.execute(
+                BulkUpdateAuthorsInput(
+                    authors=[{"id": 1, "name": "Ann"}, {"id": 1, "name": "Bo"}]
+                )
+            )
+
+        mock_repo.update_many.assert_not_called()
+
+
+class TestBulkDeleteAuthorsCommand:
+    """Tests for BulkDeleteAuthorsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self):
+        """Test repeated IDs are deleted once and the count returned."""
+        mock_repo = AsyncMock()
+        mock_repo.delete_many.return_value = 2
+
+        command = BulkDeleteAuthorsCommand(mock_repo)
+        result = await command.execute(BulkDeleteAuthorsInput(ids=[1, 2, 1]))
+
+        assert result.count == 2
+        mock_repo.delete_many.assert_awaited_once_with([1, 2])
+
+
+class TestBulkUpsertAuthorsCommand:
+    """Tests for BulkUpsertAuthorsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert(self):
+        """Test names are upserted on the name column."""
+        mock_repo = AsyncMock()
+        mock_repo.upsert_many.return_value = [
+            Author(id=5, name="Ann"),
+            Author(id=9, name="Bob"),
+        ]
+
+        command = BulkUpsertAuthorsCommand(mock_repo)
+        result = await command.execute(
+            BulkUpsertAuthorsInput(names=["Ann", "Bob"])
+        )
+
+        assert [a.id for a in result] == [5, 9]
+        call = mock_repo.upsert_many.call_args
+        assert [a.name for a in call.args[0]] == ["Ann", "Bob"]
+        assert call.kwargs["conflict_columns"] == ("name",)
+
+
+class TestImportAuthorsCommand:
+    """Tests for ImportAuthorsCommand."""
+
+    @pytest.mark.asyncio
+    async def test_import(self):
+        """Test authors are imported with COPY."""
+        mock_repo = AsyncMock()
+        mock_repo.copy_many.return_value = 2
+
+        command = ImportAuthorsCommand(mock_repo)
+        result = await command.execute(
+            ImportAuthorsInput(names=["Ann", "Bob"])
+        )
+
+        assert result.count == 2
+        copied = mock_repo.copy_many.call_args.args[0]
+        assert [a.name for a in copied] == ["Ann", "Bob"]
+
+    @pytest.mark.asyncio
+    async def test_existing_names(self):
+        """Test a unique index violation is reported as a conflict."""
+        mock_repo = AsyncMock()
+        mock_repo.copy_many.side_effect = ConflictError(
+            "Author conflicts with an existing row"
+        )
+
+        command = ImportAuthorsCommand(mock_repo)
+        with pytest.raises(ConflictError, match="already exist"):
+            await command.execute(ImportAuthorsInput(names=["Ann"]))
@@ -15,6 +15,7 @@ from app.utils.audit_logger import (
     flush_audit_queue,
     get_audit_queue,
     log_user_action,
+    prepare_audit_batch,
 )
 
 
@@ -199,40 +200,39 @@ class TestMalformedAuditEntries:
         """
         Test handling of invalid user_id type.
 
-        Pydantic validation should raise ValidationError for wrong types.
+        Validation runs in the worker: the record is queued, then dropped
+        when prepared for writing.
         """
-        from pydantic import ValidationError
+        action = await log_user_action(
+            user_id=12345,  # Invalid type (should be string)
+            username="testuser",
+            user_roles=["user"],
+            action_type="TEST",
+            resource="test",
+            outcome="success",
+        )
 
-        # user_id should be string, try with int
-        with pytest.raises(ValidationError):
-            await log_user_action(
-                user_id=12345,  # Invalid type (should be string)
-                username="testuser",
-                user_roles=["user"],
-                action_type="TEST",
-                resource="test",
-                outcome="success",
-            )
+        assert action is not None
+        assert prepare_audit_batch([action]) == []
 
     @pytest.mark.asyncio
     async def test_null_required_fields(self):
         """
         Test handling of None values in required fields.
 
-        Pydantic validation should raise ValidationError for missing fields.
+        The worker drops records missing required fields.
         """
-        from pydantic import ValidationError
+        action = await log_user_action(
+            user_id=None,  # Required field
+            username="testuser",
+            user_roles=["user"],
+            action_type="TEST",
+            resource="test",
+            outcome="success",
+        )
 
-        # Required fields should not be None
-        with pytest.raises(ValidationError):
-            await log_user_action(
-                user_id=None,  # Required field
-                username="testuser",
-                user_roles=["user"],
-                action_type="TEST",
-                resource="test",
-                outcome="success",
-            )
+        assert action is not None
+        assert prepare_audit_batch([action]) == []
 
     @pytest.mark.asyncio
     async def test_empty_user_roles_list(self):
@@ -0,0 +1,245 @@
+"""
+Tests for keyset pagination strategy.
+
+Tests seeking on arbitrary orderings with forward and backward cursors.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Field, SQLModel, select
+
+from app.storage.pagination.keyset import (
+    KeysetPaginationStrategy,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    keyset_predicate,
+    parse_order_by,
+)
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestKeysetModel(SQLModel, table=True):
+    """Test model for keyset pagination tests."""
+
+    __tablename__ = "test_keyset_model"
+
+    id: int = Field(default=None, primary_key=True)
+    name: str
+    timestamp: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+
+def make_rows(ids: range) -> list[TestKeysetModel]:
+    """Rows whose timestamp decreases as id increases."""
+    return [
+        TestKeysetModel(
+            id=i, name=f"Item {i}", timestamp=BASE_TIME - timedelta(hours=i)
+        )
+        for i in ids
+    ]
+
+
+def mock_session(rows: list[TestKeysetModel]) -> AsyncMock:
+    """Session whose exec() returns the given rows."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.exec = AsyncMock(return_value=result)
+    return session
+
+
+def compiled_sql(session: AsyncMock) -> str:
+    """SQL of the query passed to session.exec()."""
+    query = session.exec.call_args.args[0]
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestOrderingAndCursor:
+    """Tests for ordering parsing and cursor encoding."""
+
+    def test_id_appended_as_tiebreaker(self):
+        """Test ordering is made total by appending id."""
+        keys = parse_order_by(TestKeysetModel, ["-timestamp"])
+
+        assert [key.spec for key in keys] == ["-timestamp", "-id"]
+
+    def test_invalid_field_raises(self):
+        """Test unknown ordering fields are rejected."""
+        with pytest.raises(ValueError, match="Invalid ordering"):
+            parse_order_by(TestKeysetModel, ["missing"])
+
+    def test_cursor_round_trip_restores_types(self):
+        """Test datetimes survive encoding as datetimes."""
+        keys = parse_order_by(TestKeysetModel, ["-timestamp", "-id"])
+        cursor = encode_keyset_cursor(keys, [BASE_TIME, 5], "prev")
+
+        values, direction = decode_keyset_cursor(keys, cursor)
+
+        assert values == [BASE_TIME, 5]
+        assert isinstance(values[0], datetime)
+        assert direction == "prev"
+
+    def test_cursor_for_other_ordering_rejected(self):
+        """Test a cursor cannot be replayed against another ordering."""
+        by_name = parse_order_by(TestKeysetModel, ["name"])
+        cursor = encode_keyset_cursor(by_name, ["a", 1], "next")
+
+        with pytest.raises(ValueError, match="does not match"):
+            decode_keyset_cursor(
+                parse_order_by(TestKeysetModel, ["-name"]), cursor
+            )
+
+    def test_invalid_cursor_raises(self):
+        """Test garbage cursors raise ValueError."""
+        keys = parse_order_by(TestKeysetModel, ["name"])
+
+        with pytest.raises(ValueError, match="Invalid cursor format"):
+            decode_keyset_cursor(keys, "not-a-cursor!!!")
+
+    def test_uniform_direction_uses_row_comparison(self):
+        """Test same-direction keys compile to a row-value comparison."""
+        keys = parse_order_by(TestKeysetModel, ["-timestamp", "-id"])
+        sql = str(
+            keyset_predicate(keys, [BASE_TIME, 5]).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert sql.startswith(
+            "(test_keyset_model.timestamp, test_keyset_model.id) <"
+        )
+
+    def test_mixed_direction_expands(self):
+        """Test mixed directions expand into OR'ed equality prefixes."""
+        keys = parse_order_by(TestKeysetModel, ["name", "-id"])
+        sql = str(
+            keyset_predicate(keys, ["a", 5]).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "test_keyset_model.name >" in sql
+        assert "test_keyset_model.name =" in sql
+        assert "test_keyset_model.id <" in sql
+        assert " OR " in sql
+
+
+class TestKeysetPaginationStrategy:
+    """Tests for KeysetPaginationStrategy."""
+
+    ORDER = ["-timestamp", "-id"]
+
+    async def test_first_page(self):
+        """Test first page orders by the keys and issues a next cursor."""
+        session = mock_session(make_rows(range(1, 12)))
+        strategy = KeysetPaginationStrategy(session, "", self.ORDER)
+
+        items, meta = await strategy.paginate(
+            select(TestKeysetModel), TestKeysetModel, 10
+        )
+
+        assert [item.id for item in items] == list(range(1, 11))
+        assert meta.has_more is True
+        assert meta.prev_cursor is None
+        keys = parse_order_by(TestKeysetModel, self.ORDER)
+        assert decode_keyset_cursor(keys, meta.next_cursor) == (
+            [items[-1].timestamp, 10],
+            "next",
+        )
+
+        sql = compiled_sql(session)
+        assert "WHERE" not in sql
+        assert (
+            "ORDER BY test_keyset_model.timestamp DESC, "
+            "test_keyset_model.id DESC"
+        ) in sql
+
+    async def test_next_page(self):
+        """Test a next cursor seeks past the boundary row."""
+        session = mock_session(make_rows(range(11, 16)))
+        keys = parse_order_by(TestKeysetModel, self.ORDER)
+        cursor = encode_keyset_cursor(
+            keys, [BASE_TIME - timedelta(hours=10), 10], "next"
+        )
+        strategy = KeysetPaginationStrategy(session, cursor, self.ORDER)
+
+        items, meta = await strategy.paginate(
+            select(TestKeysetModel), TestKeysetModel, 10
+        )
+
+        assert [item.id for item in items] == list(range(11, 16))
+        assert meta.has_more is False
+        assert meta.next_cursor is None
+        assert decode_keyset_cursor(keys, meta.prev_cursor) == (
+            [items[0].timestamp, 11],
+            "prev",
+        )
+        sql = compiled_sql(session)
+        assert "(test_keyset_model.timestamp, test_keyset_model.id) <" in sql
+        assert "LIMIT" in sql
+
+    async def test_prev_page(self):
+        """Test a prev cursor scans backwards and restores row order."""
+        # Reversed scan returns rows nearest the boundary first
+        session = mock_session(make_rows(range(20, 9, -1)))
+        keys = parse_order_by(TestKeysetModel, self.ORDER)
+        cursor = encode_keyset_cursor(
+            keys, [BASE_TIME - timedelta(hours=21), 21], "prev"
+        )
+        strategy = KeysetPaginationStrategy(session, cursor, self.ORDER)
+
+        items, meta = await strategy.paginate(
+            select(TestKeysetModel), TestKeysetModel, 10
+        )
+
+        assert [item.id for item in items] == list(range(11, 21))
+        assert meta.has_more is True
+        assert decode_keyset_cursor(keys, meta.next_cursor)[0][1] == 20
+        assert decode_keyset_cursor(keys, meta.prev_cursor)[0][1] == 11
+
+        sql = compiled_sql(session)
+        assert "(test_keyset_model.timestamp, test_keyset_model.id) >" in sql
+        assert (
+            "ORDER BY test_keyset_model.timestamp ASC, "
+            "test_keyset_model.id ASC"
+        ) in sql
+
+    async def test_prev_page_reaching_start(self):
+        """Test no prev cursor once the first row is reached."""
+        session = mock_session(make_rows(range(3, 0, -1)))
+        keys = parse_order_by(TestKeysetModel, self.ORDER)
+        cursor = encode_keyset_cursor(
+            keys, [BASE_TIME - timedelta(hours=4), 4], "prev"
+        )
+        strategy = KeysetPaginationStrategy(session, cursor, self.ORDER)
+
+        items, meta = await strategy.paginate(
+            select(TestKeysetModel), TestKeysetModel, 10
+        )
+
+        assert [item.id for item in items] == [1, 2, 3]
+        assert meta.prev_cursor is None
+        assert meta.next_cursor is not None
+
+    async def test_existing_order_replaced(self):
+        """Test the query's own ORDER BY is replaced by the keyset order."""
+        session = mock_session([])
+        strategy = KeysetPaginationStrategy(session, None, ["name"])
+
+        await strategy.paginate(
+            select(TestKeysetModel).order_by(TestKeysetModel.id.desc()),
+            TestKeysetModel,
+            10,
+        )
+
+        sql = compiled_sql(session)
+        assert "DESC" not in sql
+        assert (
+            "ORDER BY test_keyset_model.name ASC, test_keyset_model.id ASC"
+        ) in sql
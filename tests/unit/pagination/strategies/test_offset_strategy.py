@@ -252,7 +252,7 @@ class TestOffsetPaginationStrategy:
 
             # Verify count was cached
             mock_set_cache.assert_called_once_with(
-                "TestOffsetModel", 75, filter_dict
+                "TestOffsetModel", 75, filter_dict, track=True
             )
 
     @pytest.mark.asyncio
@@ -450,3 +450,182 @@ class TestOffsetPaginationStrategy:
 
             # Should work with default filter function
             assert items is not None
+
+
+class TestOffsetWindowCount:
+    """Tests for count_mode="window" (page and total in one query)."""
+
+    @staticmethod
+    def _rows(ids: range, total: int) -> MagicMock:
+        result = MagicMock()
+        result.all.return_value = [
+            (TestOffsetModel(id=i, name=f"Item {i}"), total) for i in ids
+        ]
+        return result
+
+    async def test_single_query_returns_total(self):
+        """Test one statement yields both the page and the total."""
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(
+            return_value=self._rows(range(11, 22), 45)
+        )
+        set_cached = AsyncMock()
+
+        with (
+            patch(
+                "app.storage.pagination.offset.get_cached_count",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.offset.set_cached_count", set_cached
+            ),
+        ):
+            strategy = OffsetPaginationStrategy(
+                session=mock_session, page=2, count_mode="window"
+            )
+            query = select(TestOffsetModel).order_by(TestOffsetModel.id)
+            items, meta = await strategy.paginate(query, TestOffsetModel, 10)
+
+        assert [item.id for item in items] == list(range(11, 21))
+        assert meta.total == 45
+        assert meta.pages == 5
+        assert meta.has_more is True
+        mock_session.exec.assert_not_called()
+        mock_session.execute.assert_awaited_once()
+        set_cached.assert_awaited_once_with(
+            "TestOffsetModel", 45, None, track=True
+        )
+
+        sql = str(mock_session.execute.call_args.args[0])
+        assert "count(*) OVER () AS _total" in sql
+
+    async def test_empty_page_falls_back_to_count(self):
+        """Test a page beyond the end still reports the total."""
+        mock_session = AsyncMock()
+        mock_session.execute = AsyncMock(return_value=self._rows(range(0), 0))
+        mock_count_result = MagicMock()
+        mock_count_result.one.return_value = 30
+        mock_session.exec = AsyncMock(return_value=mock_count_result)
+
+        with (
+            patch(
+                "app.storage.pagination.offset.get_cached_count",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.offset.set_cached_count", AsyncMock()
+            ),
+        ):
+            strategy = OffsetPaginationStrategy(
+                session=mock_session, page=9, count_mode="window"
+            )
+            query = select(TestOffsetModel).order_by(TestOffsetModel.id)
+            items, meta = await strategy.paginate(query, TestOffsetModel, 10)
+
+        assert items == []
+        assert meta.total == 30
+        assert meta.has_more is False
+        mock_session.exec.assert_awaited_once()
+
+    async def test_cached_total_skips_window(self):
+        """Test a count cache hit runs the plain page query."""
+        mock_session = AsyncMock()
+        mock_data_result = MagicMock()
+        mock_data_result.all.return_value = [TestOffsetModel(id=1, name="A")]
+        mock_session.exec = AsyncMock(return_value=mock_data_result)
+
+        with patch(
+            "app.storage.pagination.offset.get_cached_count",
+            AsyncMock(return_value=1),
+        ):
+            strategy = OffsetPaginationStrategy(
+                session=mock_session, page=1, count_mode="window"
+            )
+            query = select(TestOffsetModel)
+            items, meta = await strategy.paginate(query, TestOffsetModel, 10)
+
+        assert meta.total == 1
+        mock_session.execute.assert_not_called()
+
+
+class TestOffsetEstimatedCount:
+    """Tests for count_mode="estimated"."""
+
+    @staticmethod
+    def _session(items: list[TestOffsetModel]) -> AsyncMock:
+        session = AsyncMock()
+        data_result = MagicMock()
+        data_result.all.return_value = items
+        session.exec = AsyncMock(return_value=data_result)
+        return session
+
+    async def test_large_estimate_is_reported(self):
+        """Test estimates above the threshold are returned as-is."""
+        mock_session = self._session(
+            [TestOffsetModel(id=i, name="x") for i in range(11)]
+        )
+        set_cached = AsyncMock()
+
+        with (
+            patch(
+                "app.storage.pagination.offset.get_cached_count",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.offset.set_cached_count", set_cached
+            ),
+            patch(
+                "app.storage.pagination.offset.estimate_rows",
+                AsyncMock(return_value=2_500_000),
+            ),
+        ):
+            strategy = OffsetPaginationStrategy(
+                session=mock_session, page=1, count_mode="estimated"
+            )
+            items, meta = await strategy.paginate(
+                select(TestOffsetModel), TestOffsetModel, 10
+            )
+
+        assert meta.total == 2_500_000
+        assert meta.pages == 250_000
+        assert meta.estimated is True
+        assert len(items) == 10
+        # Only the page query ran; estimates are not cached
+        mock_session.exec.assert_awaited_once()
+        set_cached.assert_not_called()
+
+    async def test_small_estimate_counts_exactly(self):
+        """Test estimates below the threshold trigger an exact count."""
+        mock_session = AsyncMock()
+        count_result = MagicMock()
+        count_result.one.return_value = 42
+        data_result = MagicMock()
+        data_result.all.return_value = [TestOffsetModel(id=1, name="x")]
+        mock_session.exec = AsyncMock(side_effect=[count_result, data_result])
+        set_cached = AsyncMock()
+
+        with (
+            patch(
+                "app.storage.pagination.offset.get_cached_count",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.offset.set_cached_count", set_cached
+            ),
+            patch(
+                "app.storage.pagination.offset.estimate_rows",
+                AsyncMock(return_value=40),
+            ),
+        ):
+            strategy = OffsetPaginationStrategy(
+                session=mock_session, page=1, count_mode="estimated"
+            )
+            _, meta = await strategy.paginate(
+                select(TestOffsetModel), TestOffsetModel, 10
+            )
+
+        assert meta.total == 42
+        assert meta.estimated is False
+        set_cached.assert_awaited_once_with(
+            "TestOffsetModel", 42, None, track=True
+        )
@@ -0,0 +1,87 @@
+"""
+Tests for planner-based row count estimates.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Field, SQLModel, select
+
+from app.storage.pagination.estimate import Explain, estimate_rows
+
+
+class EstimateModel(SQLModel, table=True):
+    """Test model for estimate tests."""
+
+    __tablename__ = "test_estimate_model"
+
+    id: int = Field(default=None, primary_key=True)
+    name: str
+
+
+def scalar_result(value: object) -> MagicMock:
+    """Result mock whose single scalar is value."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = value
+    result.scalar_one.return_value = value
+    return result
+
+
+class TestEstimateRows:
+    """Tests for estimate_rows."""
+
+    async def test_unfiltered_uses_table_statistics(self):
+        """Test whole-table queries read pg_class.reltuples."""
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=scalar_result(1_000_000))
+
+        estimate = await estimate_rows(
+            session, EstimateModel, select(EstimateModel)
+        )
+
+        assert estimate == 1_000_000
+        sql = str(session.execute.call_args.args[0])
+        assert "pg_class" in sql
+        assert session.execute.call_args.args[1] == {
+            "table": "test_estimate_model"
+        }
+
+    async def test_unanalyzed_table_falls_back_to_explain(self):
+        """Test reltuples of -1 (never analyzed) uses the planner."""
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                scalar_result(-1),
+                scalar_result([{"Plan": {"Plan Rows": 1234}}]),
+            ]
+        )
+
+        estimate = await estimate_rows(
+            session, EstimateModel, select(EstimateModel)
+        )
+
+        assert estimate == 1234
+        assert isinstance(session.execute.call_args.args[0], Explain)
+
+    async def test_filtered_uses_explain(self):
+        """Test filtered queries read the planner's row estimate."""
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            return_value=scalar_result('[{"Plan": {"Plan Rows": 77}}]')
+        )
+        query = (
+            select(EstimateModel)
+            .where(EstimateModel.name == "x")
+            .order_by(EstimateModel.id)
+            .limit(10)
+        )
+
+        estimate = await estimate_rows(session, EstimateModel, query)
+
+        assert estimate == 77
+        explain = session.execute.call_args.args[0]
+        sql = str(explain.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "test_estimate_model.name = %(name_1)s" in sql
+        assert "ORDER BY" not in sql
+        assert "LIMIT" not in sql
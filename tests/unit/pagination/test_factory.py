@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock
 
 from app.storage.pagination.cursor import CursorPaginationStrategy
 from app.storage.pagination.factory import select_strategy
+from app.storage.pagination.keyset import KeysetPaginationStrategy
 from app.storage.pagination.offset import OffsetPaginationStrategy
 
 
@@ -177,3 +178,48 @@ class TestSelectStrategy:
         assert isinstance(strategy, CursorPaginationStrategy)
         # Cursor strategy should only use cursor
         assert strategy.cursor == cursor
+
+    def test_select_keyset_strategy_with_cursor_and_ordering(self):
+        """Test keyset strategy is selected for a cursor with an ordering."""
+        mock_session = AsyncMock()
+
+        strategy = select_strategy(
+            session=mock_session,
+            cursor="",
+            page=1,
+            skip_count=False,
+            filter_dict=None,
+            order_by=["-timestamp", "-id"],
+        )
+
+        assert isinstance(strategy, KeysetPaginationStrategy)
+        assert strategy.order_by == ["-timestamp", "-id"]
+
+    def test_ordering_without_cursor_uses_offset(self):
+        """Test an ordering alone keeps offset pagination."""
+        mock_session = AsyncMock()
+
+        strategy = select_strategy(
+            session=mock_session,
+            cursor=None,
+            page=2,
+            skip_count=False,
+            filter_dict=None,
+            order_by=["name"],
+        )
+
+        assert isinstance(strategy, OffsetPaginationStrategy)
+
+    def test_offset_strategy_receives_count_mode(self):
+        """Test count_mode is passed through to offset pagination."""
+        strategy = select_strategy(
+            session=AsyncMock(),
+            cursor=None,
+            page=1,
+            skip_count=False,
+            filter_dict=None,
+            count_mode="window",
+        )
+
+        assert isinstance(strategy, OffsetPaginationStrategy)
+        assert strategy.count_mode == "window"
@@ -0,0 +1,116 @@
+"""
+Tests for the filter operator grammar.
+
+Tests key parsing, per-model compilation and the SQL each operator
+compiles to.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.models.author import Author
+from app.models.user_action import UserAction
+from app.storage.filters import (
+    apply_filter_ops,
+    compile_filter,
+    parse_filter_key,
+)
+
+
+def where_sql(filters: dict) -> str:
+    """WHERE clause of an Author query filtered with the grammar."""
+    query = apply_filter_ops(select(Author), Author, filters)
+    sql = str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    return sql.split("WHERE ", 1)[1]
+
+
+class TestFilterKeys:
+    """Tests for key parsing and compilation."""
+
+    def test_plain_and_operator_keys(self):
+        """Test plain keys carry no operator."""
+        assert parse_filter_key("name") == ("name", None)
+        assert parse_filter_key("name__prefix") == ("name", "prefix")
+
+    def test_unknown_operator_rejected(self):
+        """Test operators outside the grammar raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid filter operator"):
+            parse_filter_key("name__regex")
+
+    def test_unknown_field_rejected(self):
+        """Test keys naming non-columns raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid filter: missing"):
+            compile_filter(Author, "missing__eq")
+
+    def test_compiled_once_per_model_and_key(self):
+        """Test repeated lookups reuse the compiled filter."""
+        first = compile_filter(Author, "name__prefix")
+
+        assert compile_filter(Author, "name__prefix") is first
+        assert first.column is Author.name
+
+
+class TestOperators:
+    """Tests for the SQL produced by each operator."""
+
+    def test_prefix_is_anchored_like(self):
+        """Test prefix compiles to an index-usable LIKE 'x%'."""
+        assert where_sql({"name__prefix": "Jo"}) == (
+            "author.name LIKE 'Jo%%' ESCAPE '\\'"
+        )
+
+    def test_prefix_escapes_wildcards(self):
+        """Test user wildcards match literally instead of widening."""
+        sql = where_sql({"name__prefix": "50%_off"})
+
+        assert "'50\\%%\\_off%%'" in sql
+
+    def test_eq_and_in(self):
+        """Test eq and in compile to equality and IN."""
+        sql = where_sql({"id__eq": 1, "name__in": ["a", "b"]})
+
+        assert "author.id = 1" in sql
+        assert "author.name IN ('a', 'b')" in sql
+
+    def test_in_requires_list(self):
+        """Test in rejects scalar values."""
+        with pytest.raises(ValueError, match="expects a list"):
+            where_sql({"id__in": 1})
+
+    def test_range_bounds(self):
+        """Test range is inclusive and skips missing bounds."""
+        assert where_sql({"id__range": [1, 10]}) == (
+            "author.id >= 1 AND author.id <= 10"
+        )
+        assert where_sql({"id__range": [None, 10]}) == "author.id <= 10"
+
+    def test_range_requires_pair(self):
+        """Test range rejects values other than [low, high]."""
+        with pytest.raises(ValueError, match=r"expects \[low, high\]"):
+            where_sql({"id__range": [1]})
+
+    def test_contains_is_case_insensitive_substring(self):
+        """Test contains compiles to an escaped ILIKE '%x%'."""
+        assert where_sql({"name__contains": "a_b"}) == (
+            "author.name ILIKE '%%a\\_b%%' ESCAPE '\\'"
+        )
+
+    def test_has_is_jsonb_containment(self):
+        """Test has compiles to @> with a one-element array."""
+        query = apply_filter_ops(
+            select(UserAction), UserAction, {"user_roles__has": "admin"}
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "user_actions.user_roles @> " in sql
+        assert query.compile().params == {"user_roles_1": ["admin"]}
+
+    def test_plain_keys_keep_legacy_inference(self):
+        """Test plain string keys still match as substrings."""
+        assert where_sql({"name": "%jo%"}) == "author.name ILIKE '%%jo%%'"
@@ -5,15 +5,21 @@ This module tests Redis-based count caching for pagination performance
 optimization.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.utils.pagination_cache import (
     DEFAULT_COUNT_CACHE_TTL,
+    TRACKED_COUNT_CACHE_TTL,
     _generate_count_cache_key,
+    adjust_cached_counts,
     get_cached_count,
+    get_page_generation,
     invalidate_count_cache,
+    invalidate_page_cache,
+    is_trackable,
+    matches_filters,
     set_cached_count,
 )
 
@@ -283,3 +289,201 @@ class TestInvalidateCountCache:
         ):
             # Should not raise exception
             await invalidate_count_cache("Author", {"status": "active"})
+
+
+def mock_redis_with_pipeline() -> tuple[AsyncMock, MagicMock]:
+    """Redis mock whose pipeline() is an async context manager."""
+    redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=pipe)
+    context.__aexit__ = AsyncMock(return_value=False)
+    redis.pipeline = MagicMock(return_value=context)
+    return redis, pipe
+
+
+class TestTrackedCounts:
+    """Tests for incrementally maintained counts."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [None, {}, {"id": 5}, {"id": [1, 2]}, {"name": "john"}],
+    )
+    def test_trackable_filters(self, filters):
+        """Test simple filters can be maintained incrementally."""
+        assert is_trackable(filters)
+
+    @pytest.mark.parametrize(
+        "filters",
+        [{"name": "jo_n"}, {"name": "a%b"}, {"meta": {"k": 1}}],
+    )
+    def test_untrackable_filters(self, filters):
+        """Test wildcard and nested filters are not tracked."""
+        assert not is_trackable(filters)
+
+    def test_matches_filters_mirrors_sql(self):
+        """Test Python matching follows default_apply_filters semantics."""
+        row = {"id": 3, "name": "John Smith", "status": "active"}
+
+        assert matches_filters(row, {})
+        assert matches_filters(row, {"name": "john"})  # ILIKE substring
+        assert matches_filters(row, {"id": [1, 3]})
+        assert not matches_filters(row, {"id": 4})
+        assert not matches_filters(row, {"name": "jane"})
+
+    async def test_set_tracked_count_registers_filters(self):
+        """Test tracked counts are registered with their filters."""
+        redis, pipe = mock_redis_with_pipeline()
+
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=redis,
+        ):
+            await set_cached_count("Author", 10, {"name": "john"}, track=True)
+
+        key = _generate_count_cache_key("Author", {"name": "john"})
+        pipe.setex.assert_called_once_with(key, TRACKED_COUNT_CACHE_TTL, "10")
+        pipe.hset.assert_called_once_with(
+            "pagination:tracked:Author", key, '{"name": "john"}'
+        )
+
+    async def test_untrackable_count_not_registered(self):
+        """Test track=True falls back to a plain TTL for complex filters."""
+        redis, pipe = mock_redis_with_pipeline()
+
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=redis,
+        ):
+            await set_cached_count("Author", 10, {"name": "a_b"}, track=True)
+
+        redis.setex.assert_awaited_once()
+        pipe.hset.assert_not_called()
+
+    async def test_adjust_applies_deltas_to_matching_counts(self):
+        """Test writes INCR/DECR only the counts the row moves between."""
+        redis, pipe = mock_redis_with_pipeline()
+        redis.hgetall = AsyncMock(
+            return_value={
+                "pagination:count:Author:all": "{}",
+                "key:john": '{"name": "john"}',
+                "key:jane": '{"name": "jane"}',
+            }
+        )
+
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=redis,
+        ):
+            # Insert matching the unfiltered and "john" counts
+            await adjust_cached_counts("Author", None, {"name": "John"})
+            inserted = [c.args[2:] for c in pipe.eval.call_args_list]
+            pipe.eval.reset_mock()
+
+            # Rename John -> Jane: total unchanged, moves between filters
+            await adjust_cached_counts(
+                "Author", {"name": "John"}, {"name": "Jane"}
+            )
+            renamed = [c.args[2:] for c in pipe.eval.call_args_list]
+
+        assert inserted == [
+            ("pagination:count:Author:all", 1),
+            ("key:john", 1),
+        ]
+        assert renamed == [("key:john", -1), ("key:jane", 1)]
+
+    async def test_adjust_without_tracked_counts(self):
+        """Test no pipeline is used when nothing is tracked."""
+        redis, _ = mock_redis_with_pipeline()
+        redis.hgetall = AsyncMock(return_value={})
+
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=redis,
+        ):
+            await adjust_cached_counts("Author", {"id": 1}, None)
+
+        redis.pipeline.assert_not_called()
+
+
+class TestOperatorFilterTracking:
+    """Tests for tracking counts of operator-grammar filters."""
+
+    def test_operator_filters_trackable(self):
+        """Test eq/in/prefix/contains are tracked, range is not."""
+        assert is_trackable({"id__eq": 1, "name__prefix": "50%"}) is True
+        assert is_trackable({"name__contains": "a_b"}) is True
+        assert is_trackable({"id__in": [1, 2]}) is True
+        assert is_trackable({"id__range": [1, 5]}) is False
+        assert is_trackable({"name__regex": "x"}) is False
+
+    def test_operator_filters_match_rows(self):
+        """Test operators are evaluated like their SQL predicates."""
+        row = {"id": 3, "name": "John_Smith"}
+
+        assert matches_filters(row, {"name__prefix": "John_"}) is True
+        assert matches_filters(row, {"name__prefix": "john"}) is False
+        assert matches_filters(row, {"name__contains": "N_s"}) is True
+        assert matches_filters(row, {"id__in": [1, 3]}) is True
+        assert matches_filters(row, {"id__eq": 4}) is False
+
+    def test_has_matches_array_elements(self):
+        """Test has mirrors JSONB containment of one element."""
+        row = {"id": 3, "user_roles": ["user", "admin"]}
+
+        assert matches_filters(row, {"user_roles__has": "admin"}) is True
+        assert matches_filters(row, {"user_roles__has": "adm"}) is False
+        assert matches_filters({"id": 4}, {"user_roles__has": "x"}) is False
+
+
+class TestPageGeneration:
+    """Tests for the prefetched page generation counter."""
+
+    async def test_generation_defaults_to_zero(self):
+        """Test a model never written has generation 0."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=redis,
+        ):
+            assert await get_page_generation("Author") == 0
+
+        redis.get.assert_awaited_once_with("pagination:generation:Author")
+
+    async def test_generation_none_without_redis(self):
+        """Test pages are not cached when Redis is unavailable."""
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance",
+            return_value=None,
+        ):
+            assert await get_page_generation("Author") is None
+
+    async def test_invalidate_bumps_prefetched_model(self):
+        """Test writes to a prefetched model bump its generation."""
+        redis = AsyncMock()
+
+        with (
+            patch(
+                "app.utils.pagination_cache.RedisPool.get_instance",
+                return_value=redis,
+            ),
+            patch(
+                "app.settings.app_settings.PAGINATION_PREFETCH_ENABLED", True
+            ),
+        ):
+            await invalidate_page_cache("Author")
+            await invalidate_page_cache("UserAction")
+
+        redis.incr.assert_awaited_once_with("pagination:generation:Author")
+
+    async def test_invalidate_noop_when_disabled(self):
+        """Test writes cost no round trip while prefetch is disabled."""
+        with patch(
+            "app.utils.pagination_cache.RedisPool.get_instance"
+        ) as get_instance:
+            await invalidate_page_cache("Author")
+
+        get_instance.assert_not_called()
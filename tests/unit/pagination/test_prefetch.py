@@ -0,0 +1,309 @@
+"""
+Tests for next-page read-ahead.
+
+Tests eligibility, cache keys, serving prefetched pages and the bounded
+background prefetch.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.author import Author
+from app.schemas.response import MetadataModel
+from app.storage.db import get_paginated_results
+from app.storage.pagination import prefetch
+from app.storage.pagination.prefetch import (
+    get_prefetched_page,
+    page_cache_key,
+    prefetch_eligible,
+    schedule_prefetch,
+)
+
+
+def make_meta(page: int, has_more: bool = True) -> MetadataModel:
+    """Offset metadata for a 2-per-page listing of 10 authors."""
+    return MetadataModel(
+        page=page, per_page=2, total=10, pages=5, has_more=has_more
+    )
+
+
+@pytest.fixture
+def enabled():
+    """Enable prefetching for Author."""
+    with patch("app.settings.app_settings.PAGINATION_PREFETCH_ENABLED", True):
+        yield
+
+
+@pytest.fixture
+def cache():
+    """Mocked CacheManager returned by get_cache_manager()."""
+    manager = MagicMock()
+    manager.get = AsyncMock(return_value=None)
+    manager.set = AsyncMock()
+    with patch(
+        "app.storage.pagination.prefetch.get_cache_manager",
+        return_value=manager,
+    ):
+        yield manager
+
+
+@pytest.fixture
+def generation():
+    """Fix the model's page generation at 3."""
+    with patch(
+        "app.storage.pagination.prefetch.get_page_generation",
+        AsyncMock(return_value=3),
+    ) as mock:
+        yield mock
+
+
+class TestEligibility:
+    """Tests for prefetch_eligible."""
+
+    def test_disabled_by_default(self):
+        """Test nothing is prefetched unless enabled."""
+        assert prefetch_eligible(Author, None) is False
+
+    def test_simple_offset_read(self, enabled):
+        """Test a filtered offset read of an allowed model is eligible."""
+        assert prefetch_eligible(Author, {"name": "john"}) is True
+        assert prefetch_eligible(Author, {"id": [1, 2]}) is True
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"cursor": ""},
+            {"apply_filters": lambda q, m, f: q},
+            {"eager_load": ["books"]},
+            {"skip_count": True},
+            {"count_mode": "estimated"},
+            {"count_mode": "window"},
+            {"fields": ("id", "name")},
+        ],
+    )
+    def test_ineligible_reads(self, enabled, kwargs):
+        """Test cursor, custom filter, eager, countless and sparse reads."""
+        assert prefetch_eligible(Author, None, **kwargs) is False
+
+    def test_model_not_allowed(self, enabled):
+        """Test models outside PAGINATION_PREFETCH_MODELS."""
+        from app.models.user_action import UserAction
+
+        assert prefetch_eligible(UserAction, None) is False
+
+    def test_unhashable_filter_value(self, enabled):
+        """Test filter values that do not key deterministically."""
+        assert prefetch_eligible(Author, {"name": object()}) is False
+
+    def test_key_depends_on_generation_and_query(self):
+        """Test a write (new generation) or another query changes the key."""
+        key = page_cache_key("Author", 3, 2, 20, {"name": "a"}, None)
+
+        assert key.startswith("pagination:page:Author:3:")
+        assert key != page_cache_key("Author", 4, 2, 20, {"name": "a"}, None)
+        assert key != page_cache_key("Author", 3, 3, 20, {"name": "a"}, None)
+        assert key != page_cache_key(
+            "Author", 3, 2, 20, {"name": "a"}, ["-name"]
+        )
+
+
+class TestPrefetchedPages:
+    """Tests for reading and writing prefetched pages."""
+
+    async def test_hit_rebuilds_models(self, cache, generation):
+        """Test a cached page is returned as model instances."""
+        cache.get.return_value = {
+            "items": [{"id": 3, "name": "C"}, {"id": 4, "name": "D"}],
+            "meta": make_meta(2).model_dump(mode="json"),
+        }
+
+        items, meta = await get_prefetched_page(Author, 2, 2, None, None)
+
+        assert [item.id for item in items] == [3, 4]
+        assert isinstance(items[0], Author)
+        assert meta == make_meta(2)
+        cache.get.assert_awaited_once_with(
+            page_cache_key("Author", 3, 2, 2, None, None)
+        )
+
+    async def test_miss(self, cache, generation):
+        """Test None is returned for pages not prefetched."""
+        assert await get_prefetched_page(Author, 2, 2, None, None) is None
+
+    async def test_no_lookup_without_redis(self, cache):
+        """Test no page is served when the generation is unknown."""
+        with patch(
+            "app.storage.pagination.prefetch.get_page_generation",
+            AsyncMock(return_value=None),
+        ):
+            assert await get_prefetched_page(Author, 2, 2, None, None) is None
+
+        cache.get.assert_not_called()
+
+    async def test_prefetch_stores_page(self, cache, generation):
+        """Test the background task caches the page with a short TTL."""
+        strategy = MagicMock()
+        strategy.paginate = AsyncMock(
+            return_value=([Author(id=5, name="E")], make_meta(3))
+        )
+
+        with (
+            patch("app.storage.db.async_session", MagicMock()),
+            patch(
+                "app.storage.pagination.offset.OffsetPaginationStrategy",
+                return_value=strategy,
+            ),
+        ):
+            await prefetch._prefetch_page(Author, 3, 2, None, None)
+
+        key, value = cache.set.call_args.args
+        assert key == page_cache_key("Author", 3, 3, 2, None, None)
+        assert value["items"] == [{"id": 5, "name": "E"}]
+        assert cache.set.call_args.kwargs == {"ttl": 30}
+
+    async def test_prefetch_skips_cached_page(self, cache, generation):
+        """Test a page already cached is not queried again."""
+        cache.get.return_value = {"items": [], "meta": {}}
+
+        with patch(
+            "app.storage.pagination.offset.OffsetPaginationStrategy"
+        ) as strategy_cls:
+            await prefetch._prefetch_page(Author, 3, 2, None, None)
+
+        strategy_cls.assert_not_called()
+        cache.set.assert_not_called()
+
+
+class TestScheduling:
+    """Tests for bounded, de-duplicated scheduling."""
+
+    async def test_concurrency_bound(self):
+        """Test prefetches beyond the limit are dropped, duplicates merged."""
+        release = asyncio.Event()
+
+        async def slow(*_args):
+            await release.wait()
+
+        with (
+            patch.object(prefetch, "_prefetch_page", slow),
+            patch(
+                "app.settings.app_settings.PAGINATION_PREFETCH_CONCURRENCY", 2
+            ),
+        ):
+            for page in (2, 2, 3, 4):
+                schedule_prefetch(Author, page, 20, None, None)
+
+            assert len(prefetch._in_flight) == 2
+            release.set()
+            await asyncio.gather(*prefetch._in_flight.values())
+
+        assert prefetch._in_flight == {}
+
+
+class TestGetPaginatedResultsPrefetch:
+    """Tests for read-ahead through get_paginated_results."""
+
+    async def test_cached_page_served_and_next_scheduled(self, enabled):
+        """Test a prefetched page skips the database."""
+        page = ([Author(id=3, name="C")], make_meta(2))
+
+        with (
+            patch(
+                "app.storage.pagination.prefetch.get_prefetched_page",
+                AsyncMock(return_value=page),
+            ),
+            patch(
+                "app.storage.pagination.prefetch.schedule_prefetch"
+            ) as schedule,
+            patch("app.storage.db.async_session") as session_factory,
+        ):
+            result = await get_paginated_results(
+                Author, page=2, per_page=2, prefetch=True
+            )
+
+        assert result == page
+        session_factory.assert_not_called()
+        schedule.assert_called_once_with(Author, 3, 2, None, None)
+
+    async def test_miss_queries_and_schedules_next(self, enabled):
+        """Test a miss runs the query, then reads ahead."""
+        strategy = MagicMock()
+        strategy.paginate = AsyncMock(return_value=([], make_meta(1)))
+
+        with (
+            patch(
+                "app.storage.pagination.prefetch.get_prefetched_page",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.prefetch.schedule_prefetch"
+            ) as schedule,
+            patch(
+                "app.storage.pagination.factory.select_strategy",
+                return_value=strategy,
+            ),
+        ):
+            await get_paginated_results(
+                Author, page=1, per_page=2, session=MagicMock(), prefetch=True
+            )
+
+        schedule.assert_called_once_with(Author, 2, 2, None, None)
+
+    async def test_last_page_not_read_ahead(self, enabled):
+        """Test nothing is scheduled after the last page."""
+        strategy = MagicMock()
+        strategy.paginate = AsyncMock(
+            return_value=([], make_meta(5, has_more=False))
+        )
+
+        with (
+            patch(
+                "app.storage.pagination.prefetch.get_prefetched_page",
+                AsyncMock(return_value=None),
+            ),
+            patch(
+                "app.storage.pagination.prefetch.schedule_prefetch"
+            ) as schedule,
+            patch(
+                "app.storage.pagination.factory.select_strategy",
+                return_value=strategy,
+            ),
+        ):
+            await get_paginated_results(
+                Author, page=5, per_page=2, session=MagicMock(), prefetch=True
+            )
+
+        schedule.assert_not_called()
+
+    async def test_sparse_read_not_served_from_cache(self, enabled):
+        """Test a fieldset read queries instead of serving full rows."""
+        strategy = MagicMock()
+        strategy.paginate = AsyncMock(return_value=([], make_meta(2)))
+        cached = AsyncMock(return_value=([Author(id=3, name="C")], None))
+
+        with (
+            patch(
+                "app.storage.pagination.prefetch.get_prefetched_page", cached
+            ),
+            patch(
+                "app.storage.pagination.prefetch.schedule_prefetch"
+            ) as schedule,
+            patch(
+                "app.storage.pagination.factory.select_strategy",
+                return_value=strategy,
+            ),
+        ):
+            await get_paginated_results(
+                Author,
+                page=2,
+                per_page=2,
+                session=MagicMock(),
+                prefetch=True,
+                fields=("id",),
+            )
+
+        cached.assert_not_called()
+        schedule.assert_not_called()
+        strategy.paginate.assert_awaited_once()
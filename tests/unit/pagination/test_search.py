@@ -0,0 +1,53 @@
+"""
+Tests for ranked trigram search.
+
+Tests the match predicate of each mode and the ranking and top-k limit of
+the search query.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.author import Author
+from app.storage.search import ranked_search
+
+
+def search_sql(term: str, **kwargs) -> str:
+    """SQL of a ranked Author name search."""
+    query = ranked_search(Author, "name", term, limit=5, **kwargs)
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class TestRankedSearch:
+    """Tests for ranked_search."""
+
+    def test_substring_mode(self):
+        """Test substring search is an escaped, case-insensitive ILIKE."""
+        sql = search_sql("a_b")
+
+        assert "author.name ILIKE '%%a\\_b%%' ESCAPE '\\'" in sql
+
+    def test_similar_mode(self):
+        """Test similar search uses the trigram similarity operator."""
+        sql = search_sql("jhon", mode="similar")
+
+        assert "author.name %% 'jhon'" in sql
+
+    def test_ranked_and_limited(self):
+        """Test best matches come first and only the top k are returned."""
+        sql = search_sql("jo")
+
+        assert sql.endswith(
+            "ORDER BY similarity(author.name, 'jo') DESC, "
+            "length(author.name), author.id \n LIMIT 5"
+        )
+
+    def test_unknown_field_rejected(self):
+        """Test searching a missing attribute raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid search field: missing"):
+            ranked_search(Author, "missing", "x", limit=5)
@@ -0,0 +1,105 @@
+"""Tests for cache updates deferred until commit."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.storage.after_commit import (
+    PENDING_KEY,
+    RUNNING_KEY,
+    AfterCommitSession,
+    after_commit,
+    apply_updates,
+    wait_for_updates,
+)
+
+
+@pytest.fixture
+def session():
+    """Session on an in-memory SQLite database."""
+    with Session(create_engine("sqlite://")) as session:
+        session.execute(text("SELECT 1"))
+        yield session
+
+
+class TestAfterCommit:
+    """Tests for the session commit and rollback hooks."""
+
+    @pytest.mark.asyncio
+    async def test_updates_run_after_commit(self, session):
+        """Test queued updates run once the transaction commits."""
+        update = AsyncMock()
+        after_commit(session, update)
+        update.assert_not_called()
+
+        session.commit()
+        await wait_for_updates()
+
+        update.assert_awaited_once()
+        assert PENDING_KEY not in session.info
+
+    @pytest.mark.asyncio
+    async def test_updates_discarded_on_rollback(self, session):
+        """Test a rolled-back transaction's updates never run."""
+        update = AsyncMock()
+        after_commit(session, update)
+
+        session.rollback()
+        session.execute(text("SELECT 1"))
+        session.commit()
+        await wait_for_updates()
+
+        update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failing_update_does_not_stop_others(self):
+        """Test later updates run after one fails."""
+        failing = AsyncMock(side_effect=RuntimeError("redis down"))
+        update = AsyncMock()
+
+        await apply_updates([failing, update])
+
+        update.assert_awaited_once()
+
+
+class TestAfterCommitSession:
+    """Tests for sessions that wait for their cache updates."""
+
+    @staticmethod
+    def invalidate(cache, key):
+        """Cache update that drops ``key`` after a round trip."""
+
+        async def update():
+            await asyncio.sleep(0.01)
+            cache.pop(key, None)
+
+        return update
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_sees_invalidation(self):
+        """Test the cache is invalidated once the session block exits."""
+        cache = {"entity:Author:1": "NOT_FOUND"}
+
+        async with AfterCommitSession() as session:
+            async with session.begin():
+                after_commit(
+                    session, self.invalidate(cache, "entity:Author:1")
+                )
+
+        # No wait_for_updates(): the write has returned
+        assert "entity:Author:1" not in cache
+        assert RUNNING_KEY not in session.info
+
+    @pytest.mark.asyncio
+    async def test_commit_waits_for_updates(self):
+        """Test commit() returns after the transaction's updates ran."""
+        cache = {"entity:Author:1": "NOT_FOUND"}
+
+        async with AfterCommitSession() as session:
+            after_commit(session, self.invalidate(cache, "entity:Author:1"))
+            await session.commit()
+
+            assert "entity:Author:1" not in cache
@@ -6,11 +6,13 @@ database session and provides the expected CRUD operations using mocks.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.exceptions import ConflictError, NotFoundError
 from app.models.author import Author
 from app.repositories.author_repository import AuthorRepository
+from app.storage.after_commit import PENDING_KEY, apply_updates
 
 
 @pytest.fixture
@@ -29,37 +31,76 @@ def mock_session():
     session.exec = AsyncMock()
     session.get = AsyncMock()
     session.delete = AsyncMock()
+    session.info = {}
     return session
 
 
+async def commit(session):
+    """Apply the cache updates a commit of the mock session would run."""
+    await apply_updates(session.info.pop(PENDING_KEY, []))
+
+
+def returning_result(entity):
+    """Mock result of a single-row INSERT/UPDATE ... RETURNING."""
+    result = MagicMock()
+    result.scalars.return_value.one_or_none.return_value = entity
+    return result
+
+
+def unique_violation():
+    """IntegrityError as raised for a duplicate key."""
+    from sqlalchemy.exc import IntegrityError
+
+    orig = Exception("duplicate key value violates unique constraint")
+    orig.sqlstate = "23505"
+    return IntegrityError("INSERT ...", {}, orig)
+
+
 class TestAuthorRepositoryCreate:
     """Tests for repository create operations."""
 
     @pytest.mark.asyncio
     async def test_create_author(self, mock_session):
-        """Test creating an author."""
+        """Test create is a single INSERT ... RETURNING."""
+        stored = Author(id=1, name="Test Author")
+        mock_session.exec.return_value = returning_result(stored)
         repo = AuthorRepository(mock_session)
-        author = Author(name="Test Author")
 
-        created = await repo.create(author)
+        created = await repo.create(Author(name="Test Author"))
 
-        assert created == author
-        mock_session.add.assert_called_once_with(author)
-        mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once_with(author)
+        assert created is stored
+        mock_session.exec.assert_awaited_once()
+        sql = str(mock_session.exec.call_args.args[0])
+        assert "ON CONFLICT DO NOTHING RETURNING" in sql
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_multiple_authors(self, mock_session):
         """Test creating multiple authors."""
+        mock_session.exec.side_effect = [
+            returning_result(Author(id=1, name="Author 1")),
+            returning_result(Author(id=2, name="Author 2")),
+        ]
         repo = AuthorRepository(mock_session)
 
         author1 = await repo.create(Author(name="Author 1"))
         author2 = await repo.create(Author(name="Author 2"))
 
-        assert author1.name == "Author 1"
-        assert author2.name == "Author 2"
-        assert mock_session.add.call_count == 2
-        assert mock_session.flush.call_count == 2
+        assert (author1.id, author1.name) == (1, "Author 1")
+        assert (author2.id, author2.name) == (2, "Author 2")
+        assert mock_session.exec.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_conflict_raises(self, mock_session):
+        """Test a row skipped by ON CONFLICT raises ConflictError."""
+        mock_session.exec.return_value = returning_result(None)
+        repo = AuthorRepository(mock_session)
+
+        with pytest.raises(ConflictError):
+            await repo.create(Author(name="Taken"))
+
+        mock_session.rollback.assert_not_called()
 
 
 class TestAuthorRepositoryRead:
@@ -173,6 +214,11 @@ class TestAuthorRepositoryRead:
         assert "John Doe" in names
         assert "John Smith" in names
         mock_session.exec.assert_called_once()
+        # Ranked substring match, served by the trigram index
+        stmt = str(mock_session.exec.call_args.args[0])
+        assert "lower(author.name) LIKE lower" in stmt
+        assert "ORDER BY similarity(author.name" in stmt
+        assert "LIMIT" in stmt
 
 
 class TestAuthorRepositoryUpdate:
@@ -180,16 +226,39 @@ class TestAuthorRepositoryUpdate:
 
     @pytest.mark.asyncio
     async def test_update_author(self, mock_session):
-        """Test updating an author."""
+        """Test update is a single UPDATE ... RETURNING."""
+        stored = Author(id=1, name="Updated Name")
+        mock_session.exec.return_value = returning_result(stored)
         repo = AuthorRepository(mock_session)
-        author = Author(id=1, name="Updated Name")
 
-        updated = await repo.update(author)
+        updated = await repo.update(Author(id=1, name="Updated Name"))
 
-        assert updated == author
-        mock_session.add.assert_called_once_with(author)
-        mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once_with(author)
+        assert updated is stored
+        stmt = mock_session.exec.call_args.args[0]
+        assert str(stmt).startswith("UPDATE author SET name=")
+        assert "RETURNING" in str(stmt)
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_missing_row_raises(self, mock_session):
+        """Test updating a deleted row raises NotFoundError."""
+        mock_session.exec.return_value = returning_result(None)
+        repo = AuthorRepository(mock_session)
+
+        with pytest.raises(NotFoundError):
+            await repo.update(Author(id=1, name="Gone"))
+
+    @pytest.mark.asyncio
+    async def test_update_unique_violation_raises_conflict(self, mock_session):
+        """Test a duplicate key on update maps to ConflictError."""
+        mock_session.exec.side_effect = unique_violation()
+        repo = AuthorRepository(mock_session)
+
+        with pytest.raises(ConflictError):
+            await repo.update(Author(id=1, name="Taken"))
+
+        mock_session.rollback.assert_awaited_once()
 
 
 class TestAuthorRepositoryDelete:
@@ -237,3 +306,347 @@ class TestAuthorRepositoryExists:
 
         assert exists is False
         mock_session.exec.assert_called_once()
+
+
+class TestAuthorRepositoryCountMaintenance:
+    """Tests for pagination count hooks on writes."""
+
+    @pytest.mark.asyncio
+    async def test_create_increments_counts(self, mock_session):
+        """Test create reports the new row for count maintenance."""
+        repo = AuthorRepository(mock_session)
+
+        mock_session.exec.return_value = returning_result(
+            Author(id=7, name="New")
+        )
+
+        with patch(
+            "app.repositories.base.adjust_cached_counts", AsyncMock()
+        ) as adjust:
+            await repo.create(Author(name="New"))
+            adjust.assert_not_called()
+            await commit(mock_session)
+
+        adjust.assert_awaited_once_with(
+            "Author", None, {"id": 7, "name": "New"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_decrements_counts(self, mock_session):
+        """Test delete reports the removed row for count maintenance."""
+        repo = AuthorRepository(mock_session)
+
+        with patch(
+            "app.repositories.base.adjust_cached_counts", AsyncMock()
+        ) as adjust:
+            await repo.delete(Author(id=7, name="Old"))
+            await commit(mock_session)
+
+        adjust.assert_awaited_once_with(
+            "Author", {"id": 7, "name": "Old"}, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_create_leaves_counts(self, mock_session):
+        """Test counts are not adjusted when the insert fails."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        mock_session.exec.side_effect = SQLAlchemyError("boom")
+        repo = AuthorRepository(mock_session)
+
+        with (
+            patch(
+                "app.repositories.base.adjust_cached_counts", AsyncMock()
+            ) as adjust,
+            pytest.raises(SQLAlchemyError),
+        ):
+            await repo.create(Author(name="New"))
+
+        adjust.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_detached_update_drops_counts(self, mock_session):
+        """Test a detached update drops counts it cannot adjust."""
+        mock_session.exec.return_value = returning_result(
+            Author(id=7, name="New")
+        )
+        repo = AuthorRepository(mock_session)
+
+        with (
+            patch(
+                "app.repositories.base.adjust_cached_counts", AsyncMock()
+            ) as adjust,
+            patch(
+                "app.repositories.base.invalidate_count_cache", AsyncMock()
+            ) as invalidate_counts,
+            patch(
+                "app.repositories.base.invalidate_page_cache", AsyncMock()
+            ) as invalidate_pages,
+        ):
+            await repo.update(Author(id=7, name="New"))
+            invalidate_counts.assert_not_called()
+            await commit(mock_session)
+
+        adjust.assert_not_called()
+        invalidate_counts.assert_awaited_once_with("Author")
+        invalidate_pages.assert_awaited_once_with("Author")
+
+
+class TestAuthorRepositoryEntityCache:
+    """Tests for cached by-ID reads."""
+
+    @pytest.fixture
+    def cache_manager(self):
+        """Cache manager with an empty mocked Redis."""
+        from app.managers.cache_manager import CacheManager
+
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        with (
+            patch(
+                "app.managers.cache_manager.RedisPool.get_binary_instance",
+                return_value=redis,
+            ),
+            patch(
+                "app.managers.cache_manager._cache_manager", CacheManager()
+            ) as cache_manager,
+        ):
+            yield cache_manager
+
+    @pytest.mark.asyncio
+    async def test_get_cached_loads_once(self, mock_session, cache_manager):
+        """Test a found author is read from the database once."""
+        mock_session.get.return_value = Author(id=1, name="Cached")
+        repo = AuthorRepository(mock_session)
+
+        first = await repo.get_cached(1)
+        second = await repo.get_cached(1)
+
+        assert first == second == Author(id=1, name="Cached")
+        mock_session.get.assert_awaited_once_with(Author, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_cached_caches_missing_id(
+        self, mock_session, cache_manager
+    ):
+        """Test a nonexistent ID is read from the database once."""
+        mock_session.get.return_value = None
+        repo = AuthorRepository(mock_session)
+
+        assert await repo.get_cached(404) is None
+        assert await repo.get_cached(404) is None
+        mock_session.get.assert_awaited_once_with(Author, 404)
+
+    @pytest.mark.asyncio
+    async def test_create_drops_negative_entry(
+        self, mock_session, cache_manager
+    ):
+        """Test creating a row makes a cached missing ID visible."""
+        mock_session.get.return_value = None
+        repo = AuthorRepository(mock_session)
+        assert await repo.get_cached(7) is None
+
+        mock_session.exec.return_value = returning_result(
+            Author(id=7, name="New")
+        )
+        with patch(
+            "app.repositories.base.invalidate_entity_cache", AsyncMock()
+        ) as invalidate:
+            await repo.create(Author(name="New"))
+            await commit(mock_session)
+
+        invalidate.assert_awaited_once_with("Author", [7])
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_entry(self, mock_session, cache_manager):
+        """Test a deleted author is no longer served from the cache."""
+        mock_session.get.return_value = Author(id=7, name="Old")
+        repo = AuthorRepository(mock_session)
+        assert await repo.get_cached(7) is not None
+
+        await repo.delete(Author(id=7, name="Old"))
+        await commit(mock_session)
+        mock_session.get.return_value = None
+
+        assert await repo.get_cached(7) is None
+        assert mock_session.get.await_count == 2
+
+
+def bulk_result(entities):
+    """Mock result of an INSERT/DELETE ... RETURNING statement."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = entities
+    return result
+
+
+@pytest.fixture
+def bulk_hooks():
+    """Patch the cache hooks bulk writes call."""
+    with (
+        patch(
+            "app.repositories.base.adjust_cached_counts_many", AsyncMock()
+        ) as adjust,
+        patch(
+            "app.repositories.base.invalidate_count_cache", AsyncMock()
+        ) as invalidate_counts,
+        patch("app.repositories.base.invalidate_page_cache", AsyncMock()),
+    ):
+        yield adjust, invalidate_counts
+
+
+class TestAuthorRepositoryBulk:
+    """Tests for bulk write operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_batches_returning(
+        self, mock_session, bulk_hooks
+    ):
+        """Test one multi-row INSERT ... RETURNING per batch."""
+        adjust, _ = bulk_hooks
+        created = [Author(id=i, name=f"A{i}") for i in range(1, 6)]
+        mock_session.exec.side_effect = [
+            bulk_result(created[:2]),
+            bulk_result(created[2:4]),
+            bulk_result(created[4:]),
+        ]
+        repo = AuthorRepository(mock_session)
+
+        result = await repo.create_many(
+            [Author(name=f"A{i}") for i in range(1, 6)], batch_size=2
+        )
+        await commit(mock_session)
+
+        assert result == created
+        assert mock_session.exec.await_count == 3
+        stmt = mock_session.exec.call_args_list[0].args[0]
+        assert "RETURNING" in str(stmt)
+        assert mock_session.exec.call_args_list[0].kwargs["params"] == [
+            {"name": "A1"},
+            {"name": "A2"},
+        ]
+        # Counts are adjusted once for the whole batch
+        adjust.assert_awaited_once()
+        assert len(adjust.call_args.args[1]) == 5
+
+    @pytest.mark.asyncio
+    async def test_delete_many_reports_deleted_rows(
+        self, mock_session, bulk_hooks
+    ):
+        """Test deleted rows come from RETURNING; unknown ids are skipped."""
+        adjust, _ = bulk_hooks
+        mock_session.exec.return_value = bulk_result([Author(id=1, name="A")])
+        repo = AuthorRepository(mock_session)
+
+        deleted = await repo.delete_many([1, 99])
+        await commit(mock_session)
+
+        assert deleted == 1
+        adjust.assert_awaited_once_with(
+            "Author", [({"id": 1, "name": "A"}, None)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_many_drops_counts(self, mock_session, bulk_hooks):
+        """Test bulk updates run per batch and drop cached counts."""
+        _, invalidate_counts = bulk_hooks
+        repo = AuthorRepository(mock_session)
+
+        updated = await repo.update_many(
+            [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        )
+        await commit(mock_session)
+
+        assert updated == 2
+        mock_session.exec.assert_awaited_once()
+        invalidate_counts.assert_awaited_once_with("Author")
+
+    @pytest.mark.asyncio
+    async def test_update_many_requires_id(self, mock_session):
+        """Test rows without a primary key are rejected."""
+        repo = AuthorRepository(mock_session)
+
+        with pytest.raises(ValueError, match="must include id"):
+            await repo.update_many([{"name": "A"}])
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_on_conflict(self, mock_session, bulk_hooks):
+        """Test upserts compile to INSERT ... ON CONFLICT DO UPDATE."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_session.exec.return_value = bulk_result([Author(id=1, name="A")])
+        repo = AuthorRepository(mock_session)
+
+        await repo.upsert_many([Author(id=1, name="A")])
+
+        stmt = mock_session.exec.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name" in sql
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_without_columns_to_set(
+        self, mock_session, bulk_hooks
+    ):
+        """Test upserting on the only column still returns existing rows."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_session.exec.return_value = bulk_result([Author(id=1, name="A")])
+        repo = AuthorRepository(mock_session)
+
+        await repo.upsert_many([Author(name="A")], conflict_columns=("name",))
+
+        stmt = mock_session.exec.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (name) DO UPDATE SET name = excluded.name" in sql
+
+    @pytest.mark.asyncio
+    async def test_copy_many_conflict(self, mock_session, bulk_hooks):
+        """Test a unique violation raised by COPY becomes a conflict."""
+        from asyncpg.exceptions import UniqueViolationError
+
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock(
+            side_effect=UniqueViolationError("duplicate key")
+        )
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver)
+        )
+        mock_session.connection = AsyncMock(return_value=connection)
+        repo = AuthorRepository(mock_session)
+
+        with pytest.raises(ConflictError):
+            await repo.copy_many([Author(name="A")])
+
+        mock_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_copy_many_uses_driver_copy(self, mock_session, bulk_hooks):
+        """Test COPY sends records through the asyncpg connection."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver)
+        )
+        mock_session.connection = AsyncMock(return_value=connection)
+        repo = AuthorRepository(mock_session)
+
+        copied = await repo.copy_many([Author(name="A"), Author(name="B")])
+
+        assert copied == 2
+        driver.copy_records_to_table.assert_awaited_once_with(
+            "author",
+            records=[("A",), ("B",)],
+            columns=["name"],
+            schema_name=None,
+        )
+
+    def test_batches_respect_bind_parameter_limit(self, mock_session):
+        """Test wide rows get smaller batches than BULK_BATCH_SIZE."""
+        repo = AuthorRepository(mock_session)
+        rows = [{f"c{i}": 0 for i in range(100)}] * 1000
+
+        batches = list(repo._batches(rows, None))
+
+        assert max(len(batch) for batch in batches) == 327
+        assert sum(len(batch) for batch in batches) == 1000
@@ -0,0 +1,172 @@
+"""
+Tests for batched by-ID lookups.
+
+Tests that concurrent loads share one IN query, batch limits, error
+propagation and the repository's use of the loader.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.author import Author
+from app.repositories.author_repository import AuthorRepository
+from app.storage.dataloader import DataLoader
+
+AUTHORS = {i: Author(id=i, name=f"Author {i}") for i in range(1, 6)}
+
+
+@pytest.fixture
+def db():
+    """Loader session returning the stored authors; records queries."""
+    session = MagicMock()
+    queries = []
+
+    async def exec_(stmt):
+        queries.append(stmt)
+        result = MagicMock()
+        result.all.return_value = list(AUTHORS.values())
+        return result
+
+    session.exec = exec_
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    with patch("app.storage.db.async_session", factory):
+        yield queries
+
+
+class TestDataLoader:
+    """Tests for the batching loader."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_query(self, db):
+        """Test loads issued in one tick become one IN query."""
+        loader = DataLoader(Author)
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(3), loader.load(1), loader.load(9)
+        )
+
+        assert [r and r.id for r in results] == [1, 3, 1, None]
+        assert len(db) == 1
+        sql = str(db[0])
+        assert "author.id IN" in sql
+
+    @pytest.mark.asyncio
+    async def test_load_many_aligns_with_ids(self, db):
+        """Test load_many returns rows in id order with None gaps."""
+        loader = DataLoader(Author)
+
+        rows = await loader.load_many([5, 42, 2])
+
+        assert [r and r.id for r in rows] == [5, None, 2]
+        assert len(db) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_dispatches_early(self, db):
+        """Test a full batch is sent without waiting for the tick."""
+        loader = DataLoader(Author)
+
+        with patch("app.settings.app_settings.DATALOADER_MAX_BATCH_SIZE", 2):
+            await asyncio.gather(*(loader.load(i) for i in range(1, 6)))
+
+        assert len(db) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_window(self, db):
+        """Test loads within the window join the same batch."""
+        loader = DataLoader(Author)
+
+        async def late(id):
+            await asyncio.sleep(0.001)
+            return await loader.load(id)
+
+        with patch("app.settings.app_settings.DATALOADER_BATCH_WINDOW_MS", 20):
+            await asyncio.gather(loader.load(1), late(2))
+
+        assert len(db) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises_for_every_caller(self):
+        """Test a query error reaches each waiting caller."""
+        loader = DataLoader(Author)
+
+        @asynccontextmanager
+        async def broken():
+            raise RuntimeError("db down")
+            yield
+
+        with patch("app.storage.db.async_session", broken):
+            results = await asyncio.gather(
+                loader.load(1), loader.load(2), return_exceptions=True
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.fixture
+def session():
+    """Caller session outside any transaction."""
+    session = AsyncMock(spec=AsyncSession)
+    session.in_transaction = MagicMock(return_value=False)
+    session.merge = AsyncMock(side_effect=lambda row, load: row)
+    return session
+
+
+class TestRepositoryBatching:
+    """Tests for get_by_id/get_by_ids routing through the loader."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_batched_when_enabled(self, db, session):
+        """Test concurrent get_by_id calls share one query."""
+        repos = [AuthorRepository(session) for _ in range(3)]
+
+        with patch("app.settings.app_settings.DATALOADER_ENABLED", True):
+            found = await asyncio.gather(
+                *(repo.get_by_id(i + 1) for i, repo in enumerate(repos))
+            )
+
+        assert [a.id for a in found] == [1, 2, 3]
+        assert len(db) == 1
+        session.get.assert_not_called()
+        # Rows are attached to the caller's session without SQL
+        session.merge.assert_awaited_with(found[-1], load=False)
+
+    @pytest.mark.asyncio
+    async def test_session_in_transaction_not_batched(self, db, session):
+        """Test a session with a transaction keeps its own reads."""
+        session.in_transaction.return_value = True
+        session.get.return_value = AUTHORS[1]
+
+        with patch("app.settings.app_settings.DATALOADER_ENABLED", True):
+            author = await AuthorRepository(session).get_by_id(1)
+
+        assert author is AUTHORS[1]
+        assert db == []
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_batched(self, db, session):
+        """Test get_by_ids skips missing ids and keeps input order."""
+        with patch("app.settings.app_settings.DATALOADER_ENABLED", True):
+            authors = await AuthorRepository(session).get_by_ids([4, 7, 2, 4])
+
+        assert [a.id for a in authors] == [4, 2]
+        assert len(db) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_without_loader(self, session):
+        """Test get_by_ids is one IN query on the caller's session."""
+        result = MagicMock()
+        result.all.return_value = [AUTHORS[2], AUTHORS[4]]
+        session.exec.return_value = result
+
+        authors = await AuthorRepository(session).get_by_ids([4, 7, 2])
+
+        assert [a.id for a in authors] == [4, 2]
+        session.exec.assert_awaited_once()
@@ -0,0 +1,142 @@
+"""
+Tests for sparse fieldsets.
+
+Tests fieldset validation against the per-model allow-list, sparse
+serialization and the SELECT narrowing in get_paginated_results.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.exceptions import ValidationError
+from app.models.user_action import UserAction
+from app.schemas.fieldsets import dump_fields, dump_page, parse_fields
+from app.schemas.response import MetadataModel
+from app.storage.db import get_paginated_results
+from app.storage.pagination.query_builder import build_query
+
+
+def make_action() -> UserAction:
+    """A full audit log row."""
+    return UserAction(
+        id=7,
+        timestamp=datetime(2026, 1, 2, tzinfo=UTC),
+        user_id="u1",
+        username="alice",
+        user_roles=["admin"],
+        action_type="GET",
+        resource="/authors",
+        outcome="success",
+        user_agent="curl/8.0",
+        request_data={"large": "payload"},
+    )
+
+
+class TestParseFields:
+    """Tests for parse_fields."""
+
+    def test_no_fields_means_full_rows(self):
+        """Test None, empty list and empty string request every column."""
+        assert parse_fields("UserAction", None) is None
+        assert parse_fields("UserAction", []) is None
+        assert parse_fields("UserAction", " , ") is None
+
+    def test_comma_separated_and_list(self):
+        """Test HTTP strings and WS lists give the same fieldset."""
+        expected = ("id", "timestamp", "username")
+
+        assert parse_fields("UserAction", "timestamp, username") == expected
+        assert parse_fields("UserAction", ["timestamp", "username"]) == (
+            expected
+        )
+
+    def test_primary_key_first_without_duplicates(self):
+        """Test id is always included exactly once."""
+        assert parse_fields("UserAction", "username,id,username") == (
+            "id",
+            "username",
+        )
+
+    def test_column_outside_allow_list(self):
+        """Test columns not in the allow-list are rejected."""
+        with pytest.raises(ValidationError, match="Invalid fields"):
+            parse_fields("UserAction", "username,__table__")
+
+    def test_unknown_model_allows_nothing(self):
+        """Test models without an allow-list accept no fieldset."""
+        with pytest.raises(ValidationError):
+            parse_fields("Unlisted", "id")
+
+
+class TestDumpFields:
+    """Tests for sparse serialization."""
+
+    def test_dump_restricted_to_fieldset(self):
+        """Test only the requested columns are serialized."""
+        data = dump_fields(make_action(), ("id", "username"))
+
+        assert data == {"id": 7, "username": "alice"}
+
+    def test_dump_full_row(self):
+        """Test no fieldset serializes every column."""
+        assert "request_data" in dump_fields(make_action(), None)
+
+    def test_dump_page_is_json_ready(self):
+        """Test the sparse page body has JSON-encoded values."""
+        meta = MetadataModel(page=1, per_page=20, total=1, pages=1)
+
+        body = dump_page([make_action()], meta, ("id", "timestamp"))
+
+        assert body["items"] == [
+            {"id": 7, "timestamp": "2026-01-02T00:00:00Z"}
+        ]
+        assert body["meta"]["total"] == 1
+
+
+class TestSparseSelect:
+    """Tests for narrowing the SELECT to the fieldset."""
+
+    def test_load_only_columns(self):
+        """Test unrequested columns are left out of the SELECT."""
+        query = build_query(
+            UserAction, None, None, None, columns={"id", "username"}
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        select_list = sql.split(" FROM ", 1)[0]
+
+        assert "user_actions.username" in select_list
+        assert "request_data" not in select_list
+        assert "user_agent" not in select_list
+
+    async def test_ordering_columns_loaded(self):
+        """Test keyset ordering columns are loaded for cursor building."""
+        strategy = MagicMock()
+        strategy.paginate = AsyncMock(
+            return_value=(
+                [],
+                MetadataModel(page=1, per_page=20, total=0, pages=0),
+            )
+        )
+
+        with (
+            patch(
+                "app.storage.pagination.query_builder.build_query",
+                wraps=build_query,
+            ) as build,
+            patch(
+                "app.storage.pagination.factory.select_strategy",
+                return_value=strategy,
+            ),
+        ):
+            await get_paginated_results(
+                UserAction,
+                session=MagicMock(),
+                cursor="",
+                order_by=["-timestamp", "-id"],
+                fields=("id", "username"),
+            )
+
+        assert build.call_args.args[4] == {"id", "username", "timestamp"}
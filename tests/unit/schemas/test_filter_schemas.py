@@ -26,8 +26,8 @@ class TestBaseFilter:
         filters = AuthorFilters(name="John", id=None)
         result = filters.to_dict()
 
-        assert result == {"name": "John"}
-        assert "id" not in result
+        assert result == {"name__contains": "John"}
+        assert "id__eq" not in result
 
     def test_to_dict_all_none_values(self):
         """Test to_dict() with all None values returns empty dict."""
@@ -41,7 +41,16 @@ class TestBaseFilter:
         filters = AuthorFilters(id=42, name="John")
         result = filters.to_dict()
 
-        assert result == {"id": 42, "name": "John"}
+        assert result == {"id__eq": 42, "name__contains": "John"}
+
+    def test_name_prefix_targets_name_column(self):
+        """Test name_prefix compiles to a prefix match on name."""
+        filters = AuthorFilters(name="oh", name_prefix="Jo")
+
+        assert filters.to_dict() == {
+            "name__contains": "oh",
+            "name__prefix": "Jo",
+        }
 
     def test_extra_fields_forbidden(self):
         """
@@ -137,8 +146,28 @@ class TestUserActionFilters:
         filters = UserActionFilters(timestamp_after=start)
         result = filters.to_dict()
 
-        assert "timestamp_after" in result
-        assert result["timestamp_after"] == start
+        assert result == {"timestamp__range": [start, None]}
+
+    def test_to_dict_merges_range_bounds(self):
+        """Test both timestamp bounds merge into one range filter."""
+        from datetime import UTC, datetime
+
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+        end = datetime(2025, 1, 31, tzinfo=UTC)
+        filters = UserActionFilters(
+            username="john", timestamp_after=start, timestamp_before=end
+        )
+
+        assert filters.to_dict() == {
+            "username__contains": "john",
+            "timestamp__range": [start, end],
+        }
+
+    def test_to_dict_role_targets_user_roles(self):
+        """Test role filters JSONB containment on user_roles."""
+        filters = UserActionFilters(role="admin")
+
+        assert filters.to_dict() == {"user_roles__has": "admin"}
 
     def test_invalid_user_id_type(self):
         """Test that invalid user_id type raises ValidationError."""
@@ -0,0 +1,184 @@
+"""
+Tests for user_actions partition maintenance.
+
+Tests cover:
+- Month arithmetic and partition naming
+- Premaking upcoming partitions
+- Retention-based partition drops
+- Moving stray default-partition rows and concurrent detaches
+"""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.tasks.audit_partition_task import (
+    _maintain,
+    add_months,
+    month_start,
+    partition_name,
+    partition_start,
+    plan_partitions,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+class TestPartitionNames:
+    """Tests for month bounds and names."""
+
+    def test_month_start_is_utc(self):
+        """Test month bounds are taken in UTC."""
+        assert month_start(NOW) == datetime(2026, 10, 1, tzinfo=UTC)
+
+    def test_add_months_across_years(self):
+        """Test month arithmetic wraps into the next year."""
+        start = datetime(2026, 11, 1, tzinfo=UTC)
+
+        assert add_months(start, 2) == datetime(2027, 1, 1, tzinfo=UTC)
+        assert add_months(start, -11) == datetime(2025, 12, 1, tzinfo=UTC)
+
+    def test_name_round_trip(self):
+        """Test partition names map back to their month."""
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+
+        assert partition_name(start) == "user_actions_p202603"
+        assert partition_start("user_actions_p202603") == start
+        assert partition_start("user_actions_default") is None
+
+
+class TestPlanPartitions:
+    """Tests for deciding which partitions to create and drop."""
+
+    def test_premakes_missing_months(self):
+        """Test the current and upcoming months are created if missing."""
+        with patch(
+            "app.settings.app_settings.AUDIT_PARTITION_PREMAKE_MONTHS", 2
+        ):
+            create, drop = plan_partitions(["user_actions_p202610"], NOW)
+
+        assert [partition_name(start) for start in create] == [
+            "user_actions_p202611",
+            "user_actions_p202612",
+        ]
+        assert drop == []
+
+    def test_drops_months_past_retention(self):
+        """Test only partitions whose whole month expired are dropped."""
+        existing = [
+            "user_actions_default",
+            "user_actions_p202607",
+            "user_actions_p202608",
+            "user_actions_p202609",
+        ]
+
+        with patch("app.settings.app_settings.AUDIT_LOG_RETENTION_DAYS", 60):
+            _, drop = plan_partitions(existing, NOW)
+
+        # Cutoff 2026-08-19: August still holds retained rows
+        assert drop == ["user_actions_p202607"]
+
+    def test_retention_disabled(self):
+        """Test nothing is dropped when retention is not positive."""
+        with patch("app.settings.app_settings.AUDIT_LOG_RETENTION_DAYS", 0):
+            _, drop = plan_partitions(["user_actions_p200001"], NOW)
+
+        assert drop == []
+
+
+class TestMaintain:
+    """Tests for the statements of one maintenance run."""
+
+    @staticmethod
+    async def run(partitions, stray):
+        """Run maintenance and return the executed SQL, in order."""
+        statements = []
+
+        async def execute(stmt, *args):
+            statements.append(str(stmt))
+
+        connection = MagicMock()
+        connection.execute = AsyncMock(side_effect=execute)
+
+        @asynccontextmanager
+        async def begin():
+            yield connection
+
+        engine = MagicMock()
+        engine.begin = begin
+
+        with (
+            patch(
+                "app.tasks.audit_partition_task.list_partitions",
+                AsyncMock(return_value=partitions),
+            ),
+            patch(
+                "app.tasks.audit_partition_task.default_partition_months",
+                AsyncMock(return_value=stray),
+            ),
+            patch("app.tasks.audit_partition_task.engine", engine),
+            patch(
+                "app.settings.app_settings.AUDIT_PARTITION_PREMAKE_MONTHS", 0
+            ),
+            patch("app.settings.app_settings.AUDIT_LOG_RETENTION_DAYS", 60),
+        ):
+            await _maintain(connection, NOW)
+        return [" ".join(stmt.split()) for stmt in statements]
+
+    @pytest.mark.asyncio
+    async def test_moves_default_rows_and_detaches_concurrently(self):
+        """Test stray rows get a partition and expired ones detach."""
+        partitions = {
+            "user_actions_default": False,
+            "user_actions_p202607": False,
+            "user_actions_p202610": False,
+        }
+        stray = {datetime(2026, 12, 1, tzinfo=UTC): 3}
+
+        with patch(
+            "app.tasks.audit_partition_task.audit_default_partition_rows"
+        ) as gauge:
+            sql = await self.run(partitions, stray)
+
+        gauge.set.assert_called_once_with(3)
+        assert sql[1] == (
+            "ALTER TABLE user_actions DETACH PARTITION user_actions_default"
+        )
+        assert sql[2].startswith(
+            "CREATE TABLE user_actions_p202612 PARTITION OF user_actions"
+        )
+        assert sql[3].startswith("INSERT INTO user_actions (")
+        assert sql[4] == "TRUNCATE user_actions_default"
+        assert sql[6:] == [
+            "ALTER TABLE user_actions DETACH PARTITION "
+            "user_actions_p202607 CONCURRENTLY",
+            "DROP TABLE user_actions_p202607",
+            "ALTER TABLE user_actions ATTACH PARTITION "
+            "user_actions_default DEFAULT",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_default_stays_attached(self):
+        """Test nothing is detached when there is nothing to move or drop."""
+        sql = await self.run(
+            {"user_actions_default": False, "user_actions_p202610": False},
+            {},
+        )
+
+        assert not any("DETACH" in stmt or "ATTACH" in stmt for stmt in sql)
+
+    @pytest.mark.asyncio
+    async def test_finalizes_interrupted_detach(self):
+        """Test a partition left pending detach is finalized."""
+        sql = await self.run(
+            {"user_actions_p202607": True, "user_actions_p202610": False},
+            None,
+        )
+
+        assert sql[-2:] == [
+            "ALTER TABLE user_actions DETACH PARTITION "
+            "user_actions_p202607 FINALIZE",
+            "DROP TABLE user_actions_p202607",
+        ]
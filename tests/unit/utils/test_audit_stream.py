@@ -0,0 +1,203 @@
+"""
+Tests for the Redis Streams audit transport.
+
+Tests cover:
+- Compact record encoding
+- Publishing from log_user_action and queue fallback
+- Acknowledgement only after a committed write
+- Retry and dead-lettering of pending entries
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import app.utils.audit_logger
+from app.utils.audit_logger import (
+    AuditRecord,
+    get_audit_queue,
+    log_user_action,
+)
+from app.utils.audit_stream import (
+    RECORD_FIELD,
+    decode_audit_record,
+    encode_audit_record,
+    read_audit_entries,
+    reclaim_audit_entries,
+    write_stream_entries,
+)
+
+RECORD = AuditRecord(
+    timestamp=datetime(2026, 1, 1, 12, 30, tzinfo=UTC),
+    user_id="user1",
+    username="user1",
+    user_roles=["user"],
+    action_type="GET",
+    resource="/api/test",
+    outcome="success",
+    ip_address="10.0.0.1",
+    user_agent=None,
+    request_id=None,
+    request_data={"q": 1},
+    response_status=200,
+    error_message=None,
+    duration_ms=5,
+)
+
+
+def entry(entry_id: str, record: AuditRecord = RECORD):
+    """Stream entry as returned by XREADGROUP/XCLAIM."""
+    return entry_id, {RECORD_FIELD: encode_audit_record(record)}
+
+
+@pytest.fixture
+def redis() -> AsyncMock:
+    """Mock Redis connection."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def persist():
+    """Mock batch writer, succeeding by default."""
+    with patch(
+        "app.utils.audit_stream.persist_audit_batch",
+        AsyncMock(return_value=True),
+    ) as persist:
+        yield persist
+
+
+class TestEncoding:
+    """Tests for stream values."""
+
+    def test_round_trip(self):
+        """Test a record survives encoding unchanged."""
+        assert decode_audit_record(encode_audit_record(RECORD)) == RECORD
+
+    def test_compact(self):
+        """Test values are positional, without field names."""
+        assert "user_id" not in encode_audit_record(RECORD)
+
+    def test_weight_round_trip(self):
+        """Test a summary row keeps its rollup weight."""
+        record = RECORD._replace(weight=30)
+
+        assert decode_audit_record(encode_audit_record(record)).weight == 30
+
+    def test_wrong_arity(self):
+        """Test truncated values are rejected."""
+        with pytest.raises(TypeError):
+            decode_audit_record('["2026-01-01T00:00:00+00:00","user1"]')
+
+
+class TestPublish:
+    """Tests for log_user_action with the redis transport."""
+
+    @pytest.fixture(autouse=True)
+    def transport(self):
+        """Enable the redis transport with an empty local queue."""
+        app.utils.audit_logger._audit_queue = None
+        with patch("app.settings.app_settings.AUDIT_TRANSPORT", "redis"):
+            yield
+        app.utils.audit_logger._audit_queue = None
+
+    @pytest.mark.asyncio
+    async def test_xadd(self, redis):
+        """Test entries are appended to the stream, not queued."""
+        with patch(
+            "app.utils.audit_stream.get_redis_connection",
+            AsyncMock(return_value=redis),
+        ):
+            record = await log_user_action(*RECORD[1:7], request_data={"q": 1})
+
+        redis.xadd.assert_awaited_once()
+        key, fields = redis.xadd.call_args.args
+        assert key == "audit:actions"
+        assert decode_audit_record(fields[RECORD_FIELD]) == record
+        assert get_audit_queue().empty()
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_queue(self):
+        """Test entries are queued locally when Redis is unavailable."""
+        with patch(
+            "app.utils.audit_stream.get_redis_connection",
+            AsyncMock(return_value=None),
+        ):
+            record = await log_user_action(*RECORD[1:7])
+
+        assert get_audit_queue().get_nowait() == record
+
+
+class TestConsumer:
+    """Tests for writing, acknowledging and retrying entries."""
+
+    @pytest.mark.asyncio
+    async def test_ack_after_write(self, redis, persist):
+        """Test entries are acknowledged once the batch is written."""
+        entries = [entry("1-0"), entry("1-1")]
+
+        assert await write_stream_entries(redis, entries, "c1")
+
+        (batch,) = persist.call_args.args
+        assert [record.stream_id for record in batch] == ["1-0", "1-1"]
+        redis.xack.assert_awaited_once_with(
+            "audit:actions", "audit-writers", "1-0", "1-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_write_left_pending(self, redis, persist):
+        """Test a failed write acknowledges nothing."""
+        persist.return_value = False
+
+        assert not await write_stream_entries(redis, [entry("1-0")], "c1")
+
+        redis.xack.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_entries_acknowledged(self, redis, persist):
+        """Test undecodable and invalid entries are dropped for good."""
+        entries = [
+            ("1-0", {RECORD_FIELD: "not json"}),
+            entry("1-1", RECORD._replace(outcome="")),
+        ]
+
+        assert await write_stream_entries(redis, entries, "c1")
+
+        persist.assert_not_awaited()
+        redis.xack.assert_awaited_once_with(
+            "audit:actions", "audit-writers", "1-0", "1-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_flattens_streams(self, redis):
+        """Test XREADGROUP replies become a flat entry list."""
+        redis.xreadgroup.return_value = [
+            ["audit:actions", [entry("1-0"), entry("1-1")]]
+        ]
+
+        entries = await read_audit_entries(redis, "c1")
+
+        assert [entry_id for entry_id, _ in entries] == ["1-0", "1-1"]
+        assert redis.xreadgroup.call_args.args[2] == {"audit:actions": ">"}
+
+    @pytest.mark.asyncio
+    async def test_reclaim_retries_and_dead_letters(self, redis):
+        """Test stale entries are retried until max deliveries."""
+        redis.xpending_range.return_value = [
+            {"message_id": "1-0", "times_delivered": 1},
+            {"message_id": "1-1", "times_delivered": 5},
+        ]
+        redis.xclaim.side_effect = [
+            [entry("1-1")],  # dead-lettered
+            [entry("1-0"), ("0-9", None)],  # retried; 0-9 was trimmed
+        ]
+
+        entries = await reclaim_audit_entries(redis, "c1")
+
+        assert [entry_id for entry_id, _ in entries] == ["1-0"]
+        dead_key, dead_fields = redis.xadd.call_args.args
+        assert dead_key == "audit:actions:dead"
+        assert dead_fields["id"] == "1-1"
+        redis.xack.assert_awaited_once_with(
+            "audit:actions", "audit-writers", "1-1"
+        )
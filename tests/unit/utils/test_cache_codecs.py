@@ -0,0 +1,160 @@
+"""
+Tests for cache value codecs and payload framing.
+
+Tests cover:
+- Header byte framing and codec dispatch on decode
+- Size-threshold compression
+- Legacy (unframed JSON) values
+- Type-preserving MessagePack codec
+- Codec registry validation
+"""
+
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.utils.cache_codecs import (
+    COMPRESSED_FLAG,
+    CacheSerializer,
+    JsonCodec,
+    MsgPackCodec,
+    get_codec,
+    register_codec,
+)
+
+
+class TestCacheSerializer:
+    """Tests for CacheSerializer framing and compression."""
+
+    def test_small_value_not_compressed(self) -> None:
+        """Test values under the threshold are stored uncompressed."""
+        serializer = CacheSerializer(compress_threshold=1024)
+
+        payload, raw_size = serializer.encode({"name": "John"})
+
+        assert payload[0] == JsonCodec.codec_id
+        assert len(payload) == raw_size
+        assert serializer.decode(payload) == {"name": "John"}
+
+    def test_large_value_compressed(self) -> None:
+        """Test values over the threshold are compressed and round-trip."""
+        serializer = CacheSerializer(compress_threshold=128)
+        value = [{"id": i, "name": f"Author {i}"} for i in range(200)]
+
+        payload, raw_size = serializer.encode(value)
+
+        assert payload[0] == JsonCodec.codec_id | COMPRESSED_FLAG
+        assert len(payload) < raw_size
+        assert serializer.decode(payload) == value
+
+    def test_compression_disabled(self) -> None:
+        """Test compress_threshold=None never compresses."""
+        serializer = CacheSerializer(compress_threshold=None)
+        value = ["x" * 100] * 100
+
+        payload, raw_size = serializer.encode(value)
+
+        assert not payload[0] & COMPRESSED_FLAG
+        assert len(payload) == raw_size
+
+    def test_incompressible_value_kept_raw(self) -> None:
+        """Test compression is skipped when it would not save bytes."""
+        serializer = CacheSerializer(compress_threshold=1)
+
+        payload, _ = serializer.encode(uuid.uuid4().hex)
+
+        assert not payload[0] & COMPRESSED_FLAG
+
+    @pytest.mark.parametrize(
+        "legacy",
+        ['{"name": "John"}', b'{"name": "John"}', b' {"name": "John"}'],
+    )
+    def test_decode_legacy_json(self, legacy: str | bytes) -> None:
+        """Test unframed values written before codecs still decode."""
+        assert CacheSerializer.decode(legacy) == {"name": "John"}
+
+    def test_decode_unknown_codec_id(self) -> None:
+        """Test decoding a header for an unregistered codec fails."""
+        with pytest.raises(ValueError, match="Unknown cache codec id"):
+            CacheSerializer.decode(bytes((0x1F,)) + b"payload")
+
+    def test_json_codec_stringifies_rich_types(self) -> None:
+        """Test JSON codec writes datetime/UUID/Decimal as strings."""
+        serializer = CacheSerializer()
+        value_id = uuid.uuid4()
+
+        payload, _ = serializer.encode(
+            {"id": value_id, "price": Decimal("1.50")}
+        )
+
+        assert serializer.decode(payload) == {
+            "id": str(value_id),
+            "price": "1.50",
+        }
+
+
+class TestMsgPackCodec:
+    """Tests for the type-preserving MessagePack codec."""
+
+    @pytest.fixture
+    def serializer(self) -> CacheSerializer:
+        """Create serializer using MsgPackCodec."""
+        return CacheSerializer(codec=MsgPackCodec(), compress_threshold=64)
+
+    def test_rich_types_round_trip(self, serializer: CacheSerializer) -> None:
+        """Test datetime, date, UUID and Decimal keep their types."""
+        value = {
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "day": date(2025, 1, 2),
+            "id": uuid.uuid4(),
+            "price": Decimal("9.99"),
+            "tags": ["a", "b"],
+        }
+
+        payload, _ = serializer.encode(value)
+
+        assert serializer.decode(payload) == value
+
+    def test_codec_switch_without_flush(
+        self, serializer: CacheSerializer
+    ) -> None:
+        """Test entries from a previous codec still decode after a switch."""
+        json_payload, _ = CacheSerializer().encode({"v": 1})
+        msgpack_payload, _ = serializer.encode({"v": 2})
+
+        assert serializer.decode(json_payload) == {"v": 1}
+        assert CacheSerializer.decode(msgpack_payload) == {"v": 2}
+
+
+class TestCodecRegistry:
+    """Tests for codec registration and lookup."""
+
+    def test_get_codec_by_name(self) -> None:
+        """Test looking up the built-in JSON codec."""
+        assert get_codec("json").codec_id == JsonCodec.codec_id
+
+    def test_get_unknown_codec(self) -> None:
+        """Test looking up an unknown codec name."""
+        with pytest.raises(ValueError, match="Unknown cache codec"):
+            get_codec("does-not-exist")
+
+    def test_register_rejects_whitespace_id(self) -> None:
+        """Test ids that collide with JSON whitespace are rejected."""
+
+        class BadCodec(JsonCodec):
+            codec_id = 0x0A
+            name = "bad"
+
+        with pytest.raises(ValueError, match="Invalid codec id"):
+            register_codec(BadCodec())
+
+    def test_register_rejects_duplicate_id(self) -> None:
+        """Test a different codec cannot take an existing id."""
+
+        class OtherCodec(JsonCodec):
+            name = "other"
+
+        with pytest.raises(ValueError, match="already registered"):
+            register_codec(OtherCodec())
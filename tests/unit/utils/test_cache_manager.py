@@ -8,6 +8,9 @@ Tests cover:
 - TTL expiration
 - Pattern-based invalidation
 - Cache statistics
+- Byte-bounded memory budget
+- Redis client tracking coherence
+- Negative caching and per-namespace metrics
 - Singleton pattern
 """
 
@@ -18,10 +21,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.managers.cache_manager import (
+    NOT_FOUND,
     CacheEntry,
     CacheManager,
+    estimate_size,
     get_cache_manager,
 )
+from app.utils.cache_codecs import NEGATIVE_PAYLOAD
 
 
 class TestCacheEntry:
@@ -95,7 +101,7 @@ class TestCacheManager:
     ) -> None:
         """Test setting and getting from memory cache (L1)."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set value
@@ -116,7 +122,7 @@ class TestCacheManager:
         mock_redis.get = AsyncMock(return_value='{"name": "John"}')
 
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Get value (memory miss, Redis hit)
@@ -131,7 +137,7 @@ class TestCacheManager:
     ) -> None:
         """Test cache miss in both memory and Redis."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Get non-existent key
@@ -146,7 +152,7 @@ class TestCacheManager:
     ) -> None:
         """Test LRU eviction when cache is full."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set 3 entries (max capacity)
@@ -183,7 +189,7 @@ class TestCacheManager:
     ) -> None:
         """Test TTL expiration in memory cache."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set value with 1 second TTL
@@ -206,7 +212,7 @@ class TestCacheManager:
     ) -> None:
         """Test cache invalidation (both tiers)."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set value
@@ -237,7 +243,7 @@ class TestCacheManager:
         mock_redis.delete = AsyncMock(return_value=2)
 
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set some values in memory cache
@@ -260,7 +266,7 @@ class TestCacheManager:
     ) -> None:
         """Test clearing memory cache."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set multiple values
@@ -280,7 +286,7 @@ class TestCacheManager:
     ) -> None:
         """Test cache statistics."""
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Initially empty
@@ -307,7 +313,7 @@ class TestCacheManager:
         """Test graceful degradation when Redis is unavailable."""
         # Mock RedisPool to return None (Redis unavailable)
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=None,
         ):
             # Set should still work (memory only)
@@ -337,7 +343,7 @@ class TestCacheManager:
         )
 
         with patch(
-            "app.managers.cache_manager.RedisPool.get_instance",
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
             return_value=mock_redis,
         ):
             # Set should not crash (memory cache still works)
@@ -351,6 +357,451 @@ class TestCacheManager:
             value = await cache_manager.get("key2")
             assert value is None
 
+    async def test_redis_value_compressed_and_round_trips(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test large values are framed, compressed and decoded from Redis."""
+        from app.utils.cache_codecs import COMPRESSED_FLAG
+
+        cache_manager = CacheManager(
+            max_memory_entries=3, compress_threshold=64
+        )
+        value = [{"id": i, "name": f"Author {i}"} for i in range(100)]
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            await cache_manager.set("authors:list", value)
+
+            payload = mock_redis.setex.call_args.args[2]
+            assert isinstance(payload, bytes)
+            assert payload[0] & COMPRESSED_FLAG
+
+            # Read back through Redis (L2) after clearing memory (L1)
+            await cache_manager.clear()
+            mock_redis.get = AsyncMock(return_value=payload)
+            assert await cache_manager.get("authors:list") == value
+
+    def test_codec_selected_by_setting(self) -> None:
+        """Test new entries use the CACHE_CODEC codec by default."""
+        with patch("app.settings.app_settings.CACHE_CODEC", "msgpack"):
+            cache_manager = CacheManager()
+
+        assert cache_manager._serializer.codec.name == "msgpack"
+
+
+class TestCacheManagerByteBudget:
+    """Tests for byte-bounded memory cache accounting."""
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        """Create mock Redis connection."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        redis.setex = AsyncMock()
+        redis.delete = AsyncMock(return_value=1)
+        return redis
+
+    def test_estimate_size_scales_with_value(self) -> None:
+        """Test size estimate grows with nested content."""
+        small = estimate_size([1])
+        large = estimate_size([{"name": f"{i}" * 1000} for i in range(100)])
+
+        assert large > 100 * 1000 > small
+        assert CacheEntry("x" * 1000).size == estimate_size("x" * 1000)
+
+    def test_byte_budget_from_setting(self) -> None:
+        """Test the memory budget defaults to CACHE_MEMORY_MAX_BYTES."""
+        with patch("app.settings.app_settings.CACHE_MEMORY_MAX_BYTES", 4096):
+            assert CacheManager().max_memory_bytes == 4096
+        with patch("app.settings.app_settings.CACHE_MEMORY_MAX_BYTES", 0):
+            assert CacheManager().max_memory_bytes is None
+
+    async def test_evicts_until_within_byte_budget(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test LRU entries are evicted when the byte budget is exceeded."""
+        entry_size = estimate_size("x" * 1000)
+        cache_manager = CacheManager(
+            max_memory_entries=100, max_memory_bytes=entry_size * 2
+        )
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            await cache_manager.set("key1", "x" * 1000)
+            await cache_manager.set("key2", "y" * 1000)
+            await cache_manager.set("key3", "z" * 1000)
+
+            stats = await cache_manager.get_stats()
+            assert stats["memory_cache_size"] == 2
+            assert stats["memory_cache_bytes"] <= entry_size * 2
+            assert "key1" not in cache_manager._memory_cache
+
+    async def test_oversize_value_skips_memory(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test values above max_entry_bytes are written to Redis only."""
+        cache_manager = CacheManager(
+            max_memory_bytes=1_000_000, max_entry_bytes=500
+        )
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            await cache_manager.set("big", "x" * 1000)
+
+            assert "big" not in cache_manager._memory_cache
+            mock_redis.setex.assert_called_once()
+
+    async def test_byte_accounting_on_overwrite_and_invalidate(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test byte usage tracks overwrites, invalidation and clear."""
+        cache_manager = CacheManager(max_memory_bytes=1_000_000)
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            await cache_manager.set("key", "x" * 1000)
+            await cache_manager.set("key", "x" * 10)
+            stats = await cache_manager.get_stats()
+            assert stats["memory_cache_bytes"] == estimate_size("x" * 10)
+
+            await cache_manager.invalidate("key")
+            stats = await cache_manager.get_stats()
+            assert stats["memory_cache_bytes"] == 0
+
+            await cache_manager.set("key", "value")
+            await cache_manager.clear()
+            stats = await cache_manager.get_stats()
+            assert stats["memory_cache_bytes"] == 0
+
+
+class TestCacheManagerTracking:
+    """Tests for L1 coherence via Redis client tracking."""
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        """Create mock Redis connection returning a JSON value."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=b'{"name": "John"}')
+        redis.setex = AsyncMock()
+        return redis
+
+    @pytest.fixture
+    def tracked_redis(self, mock_redis: AsyncMock):
+        """Patch the tracking pool and listener start-up."""
+        with (
+            patch(
+                "app.managers.cache_manager.RedisPool.get_tracking_instance",
+                return_value=mock_redis,
+            ),
+            patch(
+                "app.managers.cache_manager.RedisClientTracker.start",
+                new=AsyncMock(),
+            ),
+        ):
+            yield mock_redis
+
+    def test_invalid_tracking_mode(self) -> None:
+        """Test unsupported tracking modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid tracking mode"):
+            CacheManager(tracking="always")  # type: ignore[arg-type]
+
+    async def test_memory_filled_from_reads_only(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test tracked mode caches Redis reads but not local writes."""
+        cache_manager = CacheManager(tracking="optin")
+        cache_manager._tracker.client_id = 7
+
+        await cache_manager.set("user:1", {"name": "Jane"})
+        assert "user:1" not in cache_manager._memory_cache
+        tracked_redis.setex.assert_called_once()
+
+        assert await cache_manager.get("user:2") == {"name": "John"}
+        assert "user:2" in cache_manager._memory_cache
+
+    async def test_own_write_not_served_stale(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test a read after this worker's own write sees the new value."""
+        cache_manager = CacheManager(tracking="optin")
+        cache_manager._tracker.client_id = 7
+
+        assert await cache_manager.get("user:1") == {"name": "John"}
+        assert "user:1" in cache_manager._memory_cache
+
+        # NOLOOP: Redis sends no invalidation for our own write
+        await cache_manager.set("user:1", {"name": "Jane"})
+        tracked_redis.get = AsyncMock(return_value=b'{"name": "Jane"}')
+
+        assert await cache_manager.get("user:1") == {"name": "Jane"}
+
+    async def test_read_racing_own_write_not_cached(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test a Redis read overtaken by a local write is not kept."""
+        cache_manager = CacheManager(tracking="optin")
+        cache_manager._tracker.client_id = 7
+
+        async def get_then_write(key: str) -> bytes:
+            await cache_manager.set(key, {"name": "Jane"})
+            return b'{"name": "Old"}'
+
+        tracked_redis.get = AsyncMock(side_effect=get_then_write)
+
+        assert await cache_manager.get("user:1") == {"name": "Old"}
+        assert "user:1" not in cache_manager._memory_cache
+
+    async def test_listener_down_bypasses_memory(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test nothing is cached in L1 while the listener is down."""
+        cache_manager = CacheManager(tracking="optin")
+
+        assert await cache_manager.get("user:1") == {"name": "John"}
+        assert "user:1" not in cache_manager._memory_cache
+
+    async def test_bcast_caches_tracked_prefixes(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test broadcast mode only caches keys under tracked prefixes."""
+        cache_manager = CacheManager(
+            tracking="bcast", tracking_prefixes=["user:"]
+        )
+        cache_manager._tracker.client_id = 7
+
+        await cache_manager.get("user:1")
+        await cache_manager.get("author:1")
+
+        assert "user:1" in cache_manager._memory_cache
+        assert "author:1" not in cache_manager._memory_cache
+
+    async def test_invalidation_removes_keys(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test server invalidations drop keys, None flushes everything."""
+        cache_manager = CacheManager(tracking="optin")
+        cache_manager._tracker.client_id = 7
+        await cache_manager.get("user:1")
+        await cache_manager.get("user:2")
+
+        await cache_manager._on_tracking_invalidate(["user:1"])
+        assert list(cache_manager._memory_cache) == ["user:2"]
+
+        await cache_manager._on_tracking_invalidate(None)
+        assert len(cache_manager._memory_cache) == 0
+        assert cache_manager._memory_bytes == 0
+
+    async def test_read_racing_invalidation_not_cached(
+        self, tracked_redis: AsyncMock
+    ) -> None:
+        """Test a value read before an invalidation is not kept in L1."""
+        cache_manager = CacheManager(tracking="optin")
+        cache_manager._tracker.client_id = 7
+
+        async def get_then_invalidate(key: str) -> bytes:
+            await cache_manager._on_tracking_invalidate([key])
+            return b'{"name": "Old"}'
+
+        tracked_redis.get = AsyncMock(side_effect=get_then_invalidate)
+
+        assert await cache_manager.get("user:1") == {"name": "Old"}
+        assert "user:1" not in cache_manager._memory_cache
+
+
+class TestCacheManagerNegativeCaching:
+    """Tests for cached "not found" entries."""
+
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        """Create mock Redis connection."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        redis.setex = AsyncMock()
+        return redis
+
+    async def test_set_not_found_uses_negative_ttl(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test negative entries are stored with the short TTL."""
+        cache_manager = CacheManager(default_ttl=300, negative_ttl=15)
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            await cache_manager.set_not_found("author:404")
+
+            assert await cache_manager._lookup("author:404") is NOT_FOUND
+            mock_redis.setex.assert_called_once_with(
+                "author:404", 15, NEGATIVE_PAYLOAD
+            )
+
+    async def test_negative_entry_read_from_redis(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test another instance's negative entry is honoured."""
+        mock_redis.get = AsyncMock(return_value=NEGATIVE_PAYLOAD)
+        cache_manager = CacheManager(negative_ttl=15)
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            assert await cache_manager._lookup("author:404") is NOT_FOUND
+            entry = cache_manager._memory_cache["author:404"]
+            assert entry.expires_at - time.time() <= 15
+
+    async def test_get_returns_none_for_negative_entry(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test get() keeps returning None for keys cached as missing."""
+        mock_redis.get = AsyncMock(return_value=NEGATIVE_PAYLOAD)
+        cache_manager = CacheManager()
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            assert await cache_manager.get("author:404") is None
+            # Now served from L1
+            assert await cache_manager.get("author:404") is None
+
+    async def test_get_or_load_caches_missing(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test the loader runs once for a missing key."""
+        cache_manager = CacheManager()
+        loader = AsyncMock(return_value=None)
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            assert (
+                await cache_manager.get_or_load("author:404", loader) is None
+            )
+            assert (
+                await cache_manager.get_or_load("author:404", loader) is None
+            )
+
+        loader.assert_awaited_once()
+
+    async def test_get_or_load_skips_result_raced_by_invalidation(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test a miss loaded while the key was created is not cached."""
+        cache_manager = CacheManager()
+
+        async def racing_loader() -> None:
+            # The row is created and its key invalidated mid-load
+            await cache_manager.invalidate_many(["author:7"])
+            return None
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            assert (
+                await cache_manager.get_or_load("author:7", racing_loader)
+                is None
+            )
+            loader = AsyncMock(return_value={"id": 7})
+            assert await cache_manager.get_or_load("author:7", loader) == {
+                "id": 7
+            }
+
+        mock_redis.setex.assert_awaited_once()
+        loader.assert_awaited_once()
+
+    async def test_get_or_load_caches_value(
+        self, mock_redis: AsyncMock
+    ) -> None:
+        """Test found values are cached with the regular TTL."""
+        cache_manager = CacheManager()
+        loader = AsyncMock(return_value={"id": 1})
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=mock_redis,
+        ):
+            assert await cache_manager.get_or_load("author:1", loader) == {
+                "id": 1
+            }
+            assert await cache_manager.get_or_load("author:1", loader) == {
+                "id": 1
+            }
+
+        loader.assert_awaited_once()
+
+
+class TestCacheManagerNamespaceMetrics:
+    """Tests for per-namespace cache metrics."""
+
+    async def test_lookups_recorded_per_tier(self) -> None:
+        """Test hits/misses are counted per namespace and tier."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        cache_manager = CacheManager()
+
+        with (
+            patch(
+                "app.managers.cache_manager.RedisPool.get_binary_instance",
+                return_value=redis,
+            ),
+            patch(
+                "app.managers.cache_manager.cache_lookups_total"
+            ) as mock_lookups,
+            patch(
+                "app.managers.cache_manager.cache_lookup_duration_seconds"
+            ) as mock_duration,
+        ):
+            await cache_manager.get("author:1")
+            await cache_manager.set("author:2", "value")
+            await cache_manager.get("author:2")
+            await cache_manager.set_not_found("author:3")
+            await cache_manager.get("author:3")
+
+        labels = [c.kwargs for c in mock_lookups.labels.call_args_list]
+        assert labels == [
+            {"namespace": "author", "tier": "memory", "result": "miss"},
+            {"namespace": "author", "tier": "redis", "result": "miss"},
+            {"namespace": "author", "tier": "memory", "result": "hit"},
+            {
+                "namespace": "author",
+                "tier": "memory",
+                "result": "negative_hit",
+            },
+        ]
+        mock_duration.labels.assert_any_call(namespace="author", tier="redis")
+
+    async def test_evictions_recorded_per_namespace(self) -> None:
+        """Test LRU evictions are attributed to the evicted key's namespace."""
+        redis = AsyncMock()
+        cache_manager = CacheManager(max_memory_entries=1)
+
+        with (
+            patch(
+                "app.managers.cache_manager.RedisPool.get_binary_instance",
+                return_value=redis,
+            ),
+            patch(
+                "app.managers.cache_manager.cache_evictions_total"
+            ) as mock_evictions,
+        ):
+            await cache_manager.set("author:1", "a")
+            await cache_manager.set("book:1", "b")
+
+        mock_evictions.labels.assert_called_once_with(namespace="author")
+        mock_evictions.labels.return_value.inc.assert_called_once()
+
 
 class TestCacheManagerSingleton:
     """Tests for CacheManager singleton pattern."""
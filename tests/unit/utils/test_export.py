@@ -0,0 +1,220 @@
+"""
+Tests for streaming NDJSON exports.
+
+Tests cover:
+- Export queries (filters, fieldsets, primary key order)
+- Server-side cursor streaming and chunking
+- On-the-fly gzip
+- Download headers
+- Connection budget of concurrent exports
+"""
+
+import asyncio
+import gzip
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.http.audit_logs import AUDIT_EXPORT_ORDER
+from app.models.author import Author
+from app.models.user_action import UserAction
+from app.schemas.filters import AuthorFilters, UserActionFilters
+import app.storage.export
+from app.storage.export import (
+    export_connection_budget,
+    export_query,
+    gzip_chunks,
+    ndjson_lines,
+    ndjson_response,
+)
+
+
+def sql(query) -> str:
+    """Query compiled for PostgreSQL with inlined parameters."""
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class FakeSession:
+    """Session whose stream_scalars yields the given items."""
+
+    def __init__(self, items):
+        self.items = items
+        self.options = None
+
+    async def stream_scalars(self, query, execution_options=None):
+        self.options = execution_options
+
+        async def rows():
+            for item in self.items:
+                yield item
+
+        return rows()
+
+
+@pytest.fixture
+def session():
+    """Patch the export session factory with a FakeSession of authors."""
+    fake = FakeSession([Author(id=i, name=f"Author {i}") for i in range(5)])
+
+    @asynccontextmanager
+    async def factory():
+        yield fake
+
+    app.storage.export._export_slots = None
+    with patch("app.storage.export.async_session", factory):
+        yield fake
+    app.storage.export._export_slots = None
+
+
+async def collect(chunks) -> list[bytes]:
+    """Drain an async byte stream."""
+    return [chunk async for chunk in chunks]
+
+
+class TestExportQuery:
+    """Tests for export query building."""
+
+    def test_filtered_in_primary_key_order(self):
+        """Test filters compile like list endpoints, ordered by the key."""
+        query = export_query(Author, AuthorFilters(name_prefix="Jo"))
+
+        assert sql(query).endswith(
+            "WHERE author.name LIKE 'Jo%%' ESCAPE '\\' ORDER BY author.id"
+        )
+
+    def test_composite_key_and_fieldset(self):
+        """Test fieldsets narrow the SELECT of partitioned audit logs."""
+        query = export_query(
+            UserAction, UserActionFilters(outcome="error"), ("id", "outcome")
+        )
+        compiled = sql(query)
+
+        assert "request_data" not in compiled.split("FROM")[0]
+        assert compiled.endswith(
+            "ORDER BY user_actions.id, user_actions.timestamp"
+        )
+
+    def test_explicit_order(self):
+        """Test audit exports run oldest first by (timestamp, id)."""
+        query = export_query(
+            UserAction, UserActionFilters(), order_by=AUDIT_EXPORT_ORDER
+        )
+
+        assert sql(query).endswith(
+            "ORDER BY user_actions.timestamp ASC, user_actions.id ASC"
+        )
+
+
+class TestNdjsonLines:
+    """Tests for streaming rows as NDJSON."""
+
+    @pytest.mark.asyncio
+    async def test_one_object_per_line(self, session):
+        """Test each row becomes one JSON line, fetched in batches."""
+        chunks = await collect(ndjson_lines(export_query(Author)))
+
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": i, "name": f"Author {i}"} for i in range(5)
+        ]
+        assert session.options == {"yield_per": 1000}
+
+    @pytest.mark.asyncio
+    async def test_fieldset(self, session):
+        """Test only the requested columns are serialized."""
+        chunks = await collect(ndjson_lines(export_query(Author), ("id",)))
+
+        assert b"".join(chunks).splitlines()[0] == b'{"id":0}'
+
+    @pytest.mark.asyncio
+    async def test_chunks_hold_whole_lines(self, session):
+        """Test chunks are flushed at the size limit on line boundaries."""
+        with patch("app.storage.export.EXPORT_CHUNK_BYTES", 40):
+            chunks = await collect(ndjson_lines(export_query(Author)))
+
+        assert len(chunks) == 3
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+
+class TestExportBudget:
+    """Tests for the connections held by running exports."""
+
+    @pytest.mark.parametrize(
+        ("setting", "pool", "overflow", "expected"),
+        [(2, 20, 10, 2), (50, 20, 10, 7), (5, 2, 0, 1)],
+    )
+    def test_budget_capped_at_a_quarter_of_the_pool(
+        self, setting, pool, overflow, expected
+    ):
+        with (
+            patch("app.settings.app_settings.EXPORT_DB_CONNECTIONS", setting),
+            patch("app.settings.app_settings.DB_POOL_SIZE", pool),
+            patch("app.settings.app_settings.DB_MAX_OVERFLOW", overflow),
+        ):
+            assert export_connection_budget() == expected
+
+    @pytest.mark.asyncio
+    async def test_exports_wait_for_a_slot(self, session):
+        """Test an export over budget starts once a running one ends."""
+        with (
+            patch("app.settings.app_settings.EXPORT_DB_CONNECTIONS", 1),
+            patch("app.storage.export.EXPORT_CHUNK_BYTES", 1),
+        ):
+            first = ndjson_lines(export_query(Author))
+            await anext(first)
+            second = asyncio.create_task(
+                collect(ndjson_lines(export_query(Author)))
+            )
+            await asyncio.sleep(0.01)
+            assert not second.done()
+
+            await collect(first)
+            assert b"".join(await second).count(b"\n") == 5
+
+
+class TestGzip:
+    """Tests for on-the-fly compression."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test the compressed stream is one valid gzip file."""
+
+        async def chunks():
+            for i in range(100):
+                yield f'{{"id":{i}}}\n'.encode()
+
+        compressed = b"".join(await collect(gzip_chunks(chunks())))
+
+        lines = gzip.decompress(compressed).splitlines()
+        assert len(lines) == 100
+        assert lines[-1] == b'{"id":99}'
+
+
+class TestResponse:
+    """Tests for the download response."""
+
+    def test_ndjson_download(self):
+        """Test plain exports are served as .ndjson attachments."""
+        response = ndjson_response(export_query(Author), "authors")
+
+        assert response.media_type == "application/x-ndjson"
+        assert response.headers["content-disposition"] == (
+            'attachment; filename="authors.ndjson"'
+        )
+
+    def test_gzip_download(self):
+        """Test gzipped exports are served as .ndjson.gz attachments."""
+        response = ndjson_response(export_query(Author), "authors", gzip=True)
+
+        assert response.media_type == "application/gzip"
+        assert response.headers["content-disposition"].endswith(
+            'filename="authors.ndjson.gz"'
+        )
@@ -0,0 +1,186 @@
+"""
+Tests for Redis client tracking (server-assisted client-side caching).
+
+Tests cover:
+- CLIENT TRACKING command construction (opt-in and broadcast)
+- Per-connection enable/refresh across listener generations
+- Invalidation message dispatch
+- L1 flush on tracked connection reconnect and listener loss
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.storage.redis_tracking import INVALIDATE_CHANNEL, RedisClientTracker
+
+
+@pytest.fixture
+def on_invalidate() -> AsyncMock:
+    """Callback receiving invalidated keys."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def connection() -> MagicMock:
+    """Mock pool connection without tracking state."""
+    conn = MagicMock(spec=["send_command", "read_response", "on_connect"])
+    conn.send_command = AsyncMock()
+    conn.read_response = AsyncMock(return_value="OK")
+    conn.on_connect = AsyncMock()
+    return conn
+
+
+class TestTrackingCommand:
+    """Tests for per-connection tracking setup."""
+
+    async def test_enable_optin(
+        self, on_invalidate: AsyncMock, connection: MagicMock
+    ) -> None:
+        """Test opt-in tracking redirects to the listener client id."""
+        tracker = RedisClientTracker(on_invalidate)
+        tracker.client_id = 42
+        tracker.generation = 1
+
+        await tracker.enable(connection)
+
+        connection.send_command.assert_awaited_once_with(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", 42, "NOLOOP"
+        )
+        assert tracker.is_current(connection)
+
+    async def test_enable_while_listener_down(
+        self, on_invalidate: AsyncMock, connection: MagicMock
+    ) -> None:
+        """Test no tracking is enabled without a listener to redirect to."""
+        tracker = RedisClientTracker(on_invalidate)
+
+        await tracker.enable(connection)
+
+        connection.send_command.assert_not_awaited()
+        assert not tracker.is_current(connection)
+
+    async def test_refresh_after_listener_reconnect(
+        self, on_invalidate: AsyncMock, connection: MagicMock
+    ) -> None:
+        """Test stale connections reset tracking before re-enabling it."""
+        tracker = RedisClientTracker(on_invalidate)
+        tracker.client_id, tracker.generation = 42, 1
+        await tracker.enable(connection)
+
+        tracker.client_id, tracker.generation = 43, 2
+        assert not tracker.is_current(connection)
+        connection.send_command.reset_mock()
+        await tracker.enable(connection)
+
+        calls = [c.args for c in connection.send_command.await_args_list]
+        assert calls == [
+            ("CLIENT", "TRACKING", "OFF"),
+            ("CLIENT", "TRACKING", "ON", "REDIRECT", 43, "NOLOOP"),
+        ]
+        assert tracker.is_current(connection)
+
+    def test_bcast_command_with_prefixes(
+        self, on_invalidate: AsyncMock
+    ) -> None:
+        """Test broadcast mode subscribes to every configured prefix."""
+        tracker = RedisClientTracker(
+            on_invalidate, bcast=True, prefixes=["user:", "author:"]
+        )
+        tracker.client_id = 42
+
+        assert tracker._tracking_command() == [
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "REDIRECT",
+            42,
+            "BCAST",
+            "PREFIX",
+            "user:",
+            "PREFIX",
+            "author:",
+            "NOLOOP",
+        ]
+
+    async def test_reconnect_flushes_memory(
+        self, on_invalidate: AsyncMock, connection: MagicMock
+    ) -> None:
+        """Test a tracked connection reconnecting flushes L1."""
+        tracker = RedisClientTracker(on_invalidate)
+        tracker.client_id, tracker.generation = 42, 1
+
+        await tracker.on_connect(connection)
+        on_invalidate.assert_not_awaited()
+
+        await tracker.on_connect(connection)
+        on_invalidate.assert_awaited_once_with(None)
+
+
+class TestInvalidationMessages:
+    """Tests for listener message dispatch."""
+
+    async def test_keys_forwarded(self, on_invalidate: AsyncMock) -> None:
+        """Test invalidated keys are passed to the callback."""
+        tracker = RedisClientTracker(on_invalidate)
+
+        await tracker._handle(
+            ["message", INVALIDATE_CHANNEL, ["user:1", "user:2"]]
+        )
+
+        on_invalidate.assert_awaited_once_with(["user:1", "user:2"])
+
+    async def test_server_flush(self, on_invalidate: AsyncMock) -> None:
+        """Test a null key list (FLUSHALL) flushes everything."""
+        tracker = RedisClientTracker(on_invalidate)
+
+        await tracker._handle(["message", INVALIDATE_CHANNEL, None])
+
+        on_invalidate.assert_awaited_once_with(None)
+
+    @pytest.mark.parametrize(
+        "message",
+        [["pong", ""], ["subscribe", INVALIDATE_CHANNEL, 1], "OK"],
+    )
+    async def test_other_replies_ignored(
+        self, on_invalidate: AsyncMock, message: object
+    ) -> None:
+        """Test PING and subscribe replies are not invalidations."""
+        tracker = RedisClientTracker(on_invalidate)
+
+        await tracker._handle(message)
+
+        on_invalidate.assert_not_awaited()
+
+
+class TestListenerLoop:
+    """Tests for listener connection loss handling."""
+
+    async def test_connection_loss_flushes_memory(
+        self, on_invalidate: AsyncMock
+    ) -> None:
+        """Test L1 is flushed on connect and again when the link drops."""
+        tracker = RedisClientTracker(on_invalidate, reconnect_delay=60)
+        lost = asyncio.Event()
+
+        async def connect() -> None:
+            tracker.client_id = 42
+
+        async def receive() -> None:
+            lost.set()
+            raise RedisConnectionError("Connection reset by peer")
+
+        tracker._connect = AsyncMock(side_effect=connect)
+        tracker._receive = AsyncMock(side_effect=receive)
+
+        await tracker.start(timeout=1)
+        await asyncio.wait_for(lost.wait(), 1)
+        await asyncio.sleep(0)
+
+        assert not tracker.connected
+        assert on_invalidate.await_args_list == [((None,),), ((None,),)]
+
+        await tracker.stop()
+        assert not tracker.running
@@ -0,0 +1,262 @@
+"""
+Tests for the shared-memory L1 cache.
+
+Tests cover:
+- Basic get/set/delete/clear and TTL expiry
+- Probe-window eviction and oversize values
+- Segment geometry validation
+- Visibility, torn-read safety and slot claiming across processes
+- CacheManager using the shared table as L1
+"""
+
+import multiprocessing
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.managers.cache_manager import CacheManager
+from app.storage.shm_cache import SharedMemoryCache
+
+
+@pytest.fixture
+def shm(tmp_path: Path) -> SharedMemoryCache:
+    """Create a small shared cache in a temporary directory."""
+    cache = SharedMemoryCache(
+        "test", slots=64, slot_size=256, directory=str(tmp_path)
+    )
+    yield cache
+    cache.unlink()
+
+
+def _writer(directory: str, key: str, values: list[dict], rounds: int):
+    """Child process: repeatedly overwrite a key."""
+    cache = SharedMemoryCache(
+        "test", slots=64, slot_size=256, directory=directory
+    )
+    for i in range(rounds):
+        cache.set(key, values[i % len(values)], ttl=60)
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    """Tests for single-process table operations."""
+
+    def test_set_get_delete(self, shm: SharedMemoryCache) -> None:
+        """Test basic round trip and deletion."""
+        assert shm.set("user:1", {"name": "John"}, ttl=60)
+        assert shm.get("user:1") == {"name": "John"}
+
+        assert shm.delete("user:1")
+        assert shm.get("user:1") is None
+        assert not shm.delete("user:1")
+
+    def test_overwrite_keeps_single_entry(
+        self, shm: SharedMemoryCache
+    ) -> None:
+        """Test setting an existing key replaces it in place."""
+        shm.set("user:1", {"v": 1}, ttl=60)
+        shm.set("user:1", {"v": 2}, ttl=60)
+
+        assert shm.get("user:1") == {"v": 2}
+        assert shm.stats()["entries"] == 1
+
+    def test_expired_entry_is_miss(self, shm: SharedMemoryCache) -> None:
+        """Test entries past their TTL are not returned."""
+        shm.set("user:1", {"v": 1}, ttl=-1)
+
+        assert shm.get("user:1") is None
+        assert shm.stats()["entries"] == 0
+
+    def test_oversize_value_rejected(self, shm: SharedMemoryCache) -> None:
+        """Test values larger than a slot are not stored."""
+        assert not shm.set("big", {"data": "x" * 300}, ttl=60)
+        assert shm.get("big") is None
+
+    def test_full_window_evicts_soonest_expiry(self, tmp_path: Path) -> None:
+        """Test a full probe window replaces the entry expiring first."""
+        cache = SharedMemoryCache(
+            "tiny", slots=2, slot_size=128, directory=str(tmp_path)
+        )
+        try:
+            cache.set("a", 1, ttl=10)
+            cache.set("b", 2, ttl=1000)
+            cache.set("c", 3, ttl=1000)
+
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+            assert cache.get("c") == 3
+        finally:
+            cache.unlink()
+
+    def test_clear(self, shm: SharedMemoryCache) -> None:
+        """Test clear removes every entry."""
+        for i in range(10):
+            shm.set(f"user:{i}", i, ttl=60)
+
+        shm.clear()
+
+        assert shm.stats()["entries"] == 0
+        assert shm.get("user:1") is None
+
+    def test_geometry_mismatch(
+        self, shm: SharedMemoryCache, tmp_path: Path
+    ) -> None:
+        """Test reopening a segment with a different geometry fails."""
+        with pytest.raises(ValueError, match="geometry mismatch"):
+            SharedMemoryCache(
+                "test", slots=128, slot_size=256, directory=str(tmp_path)
+            )
+
+
+def _churner(directory: str, keys: list[str], rounds: int, seed: int):
+    """Child process: insert and delete colliding keys, leaving holes."""
+    cache = SharedMemoryCache(
+        "test", slots=64, slot_size=256, directory=directory
+    )
+    for i in range(seed, seed + rounds):
+        key = keys[i % len(keys)]
+        cache.set(key, {"v": i}, ttl=60)
+        if i % 30 == 0:
+            cache.delete(key)
+    cache.close()
+
+
+def _colliding_keys(cache: SharedMemoryCache, count: int) -> list[str]:
+    """Keys sharing the home slot of ``"hot"`` (same probe window)."""
+    from app.storage.shm_cache import _key_hash
+
+    home = _key_hash(b"hot") % cache.slots
+    keys = ["hot"]
+    i = 0
+    while len(keys) < count:
+        i += 1
+        if _key_hash(f"k{i}".encode()) % cache.slots == home:
+            keys.append(f"k{i}")
+    return keys
+
+
+def _slots_holding(cache: SharedMemoryCache, key: str) -> int:
+    """Count live slots whose key bytes equal ``key``."""
+    from app.storage.shm_cache import _SLOT, _USED
+
+    count = 0
+    for index in range(cache.slots):
+        offset = cache._offset(index)
+        *_, key_len, state = _SLOT.unpack_from(cache._mm, offset)
+        start = offset + _SLOT.size
+        if (
+            state == _USED
+            and cache._mm[start : start + key_len] == key.encode()
+        ):
+            count += 1
+    return count
+
+
+class TestSharedMemoryAcrossProcesses:
+    """Tests for sharing the table between processes."""
+
+    def test_value_visible_to_other_process(
+        self, shm: SharedMemoryCache, tmp_path: Path
+    ) -> None:
+        """Test a value written by a child process is read by the parent."""
+        ctx = multiprocessing.get_context("fork")
+        child = ctx.Process(
+            target=_writer, args=(str(tmp_path), "user:1", [{"v": 7}], 1)
+        )
+        child.start()
+        child.join(10)
+
+        assert child.exitcode == 0
+        assert shm.get("user:1") == {"v": 7}
+
+    def test_concurrent_writes_never_torn(
+        self, shm: SharedMemoryCache, tmp_path: Path
+    ) -> None:
+        """Test reads during concurrent writes return whole values."""
+        values = [{"v": "a" * 100}, {"v": "b" * 150}, {"v": "c"}]
+        shm.set("hot", values[0], ttl=60)
+
+        ctx = multiprocessing.get_context("fork")
+        child = ctx.Process(
+            target=_writer, args=(str(tmp_path), "hot", values, 20_000)
+        )
+        child.start()
+
+        deadline = time.monotonic() + 10
+        while child.is_alive() and time.monotonic() < deadline:
+            assert shm.get("hot") in (*values, None)
+        child.join(10)
+
+        assert child.exitcode == 0
+
+    def test_concurrent_writers_claim_one_slot(
+        self, shm: SharedMemoryCache, tmp_path: Path
+    ) -> None:
+        """Test racing set/delete in several processes never duplicates."""
+        keys = _colliding_keys(shm, 6)
+        ctx = multiprocessing.get_context("fork")
+        for _ in range(3):
+            children = [
+                ctx.Process(
+                    target=_churner, args=(str(tmp_path), keys, 3_000, seed)
+                )
+                for seed in range(8)
+            ]
+            for child in children:
+                child.start()
+            for child in children:
+                child.join(30)
+
+            assert all(child.exitcode == 0 for child in children)
+            assert all(_slots_holding(shm, key) <= 1 for key in keys)
+
+    def test_clear_during_writes(
+        self, shm: SharedMemoryCache, tmp_path: Path
+    ) -> None:
+        """Test clear() does not race concurrent slot writes."""
+        keys = _colliding_keys(shm, 3)
+        ctx = multiprocessing.get_context("fork")
+        child = ctx.Process(
+            target=_churner, args=(str(tmp_path), keys, 5_000, 0)
+        )
+        child.start()
+        while child.is_alive():
+            shm.clear()
+        child.join(30)
+
+        assert child.exitcode == 0
+        assert all(_slots_holding(shm, key) <= 1 for key in keys)
+
+
+class TestCacheManagerSharedMemory:
+    """Tests for CacheManager with a shared-memory L1."""
+
+    async def test_workers_share_l1(self, shm: SharedMemoryCache) -> None:
+        """Test a value cached by one manager is an L1 hit for another."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+        worker_a = CacheManager(shared_memory=shm)
+        worker_b = CacheManager(shared_memory=shm)
+
+        with patch(
+            "app.managers.cache_manager.RedisPool.get_binary_instance",
+            return_value=redis,
+        ):
+            await worker_a.set("user:1", {"name": "John"})
+
+            assert await worker_b.get("user:1") == {"name": "John"}
+            redis.get.assert_not_called()
+
+            await worker_b.invalidate("user:1")
+            assert await worker_a.get("user:1") is None
+
+        stats = await worker_a.get_stats()
+        assert stats["shared_memory"] == shm.path
+        assert stats["memory_cache_max"] == shm.slots
+
+    def test_tracking_not_combined(self, shm: SharedMemoryCache) -> None:
+        """Test client tracking cannot be used with a shared L1."""
+        with pytest.raises(ValueError, match="shared_memory"):
+            CacheManager(tracking="optin", shared_memory=shm)
@@ -540,6 +540,8 @@ class TestAuditLoggingEdgeCases:
             patch(
                 "app.api.ws.consumers.web.log_user_action"
             ) as mock_log_action,
+            # GET_AUTHORS successes are sampled; select this one
+            patch("app.api.ws.audit_policy.random.random", return_value=0.0),
         ):
             mock_rate_limiter.check_rate_limit = AsyncMock(
                 return_value=(True, 100)
@@ -0,0 +1,298 @@
+"""Tests for per-PkgID audit policies of WebSocket requests."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.api.ws.audit_policy import AuditAggregator, AuditPolicy
+from app.api.ws.constants import PkgID, RSPCode
+from app.api.ws.consumers.web import Web
+from app.routing import DEFAULT_AUDIT_POLICY, PackageRouter, pkg_router
+from app.schemas.response import ResponseModel
+from tests.mocks.websocket_mocks import create_mock_websocket
+
+
+class TestAuditPolicy:
+    """Test policy construction and success sampling."""
+
+    def test_always_logs_every_success(self):
+        assert all(AuditPolicy.always().should_log() for _ in range(100))
+
+    def test_unknown_mode_rejected(self):
+        # The former "errors" mode behaved exactly like "aggregate"
+        with pytest.raises(ValueError, match="Unknown audit mode"):
+            AuditPolicy(mode="errors")  # type: ignore[arg-type]
+
+    def test_sampled_uses_rate(self):
+        policy = AuditPolicy.sampled(0.25)
+
+        with patch("app.api.ws.audit_policy.random.random", return_value=0.2):
+            assert policy.should_log()
+        with patch("app.api.ws.audit_policy.random.random", return_value=0.3):
+            assert not policy.should_log()
+
+    def test_aggregate_successes_are_not_logged_individually(self):
+        assert not AuditPolicy.aggregate(30).should_log()
+
+    @pytest.mark.parametrize("rate", [0, -0.1, 1.5])
+    def test_invalid_rate_rejected(self, rate):
+        with pytest.raises(ValueError, match="sample rate"):
+            AuditPolicy.sampled(rate)
+
+    def test_invalid_interval_rejected(self):
+        with pytest.raises(ValueError, match="interval"):
+            AuditPolicy.aggregate(0)
+
+
+class TestAuditAggregator:
+    """Test per-connection aggregation windows."""
+
+    def test_window_expires_after_interval(self):
+        aggregator = AuditAggregator()
+
+        with patch(
+            "app.api.ws.audit_policy.time.monotonic",
+            side_effect=[100.0, 159.0, 160.0],
+        ):
+            aggregator.add("WS:GET_AUTHORS", 4, 60)
+            aggregator.add("WS:GET_AUTHORS", 6, 60)
+            assert aggregator.expire() == {}
+            aggregator.add("WS:GET_AUTHORS", 2, 60)
+            windows = aggregator.expire()
+
+        window = windows["WS:GET_AUTHORS"]
+        assert window.count == 3
+        assert window.summary()["aggregated"] == 3
+        assert window.summary()["total_duration_ms"] == 12
+        assert aggregator.windows == {}
+
+    def test_expire_keeps_windows_within_their_interval(self):
+        aggregator = AuditAggregator()
+
+        with patch(
+            "app.api.ws.audit_policy.time.monotonic",
+            side_effect=[100.0, 100.0, 130.0],
+        ):
+            aggregator.add("WS:GET_AUTHORS", 1, 30)
+            aggregator.add("WS:GET_PAGINATED_AUTHORS", 1, 60)
+            windows = aggregator.expire()
+
+        assert list(windows) == ["WS:GET_AUTHORS"]
+        assert list(aggregator.windows) == ["WS:GET_PAGINATED_AUTHORS"]
+
+    def test_windows_are_per_action_type(self):
+        aggregator = AuditAggregator()
+        aggregator.add("WS:GET_AUTHORS", 1, 60)
+        aggregator.add("WS:GET_PAGINATED_AUTHORS", 1, 60)
+        aggregator.add("WS:GET_AUTHORS", 1, 60)
+
+        windows = aggregator.drain()
+
+        assert windows["WS:GET_AUTHORS"].count == 2
+        assert windows["WS:GET_PAGINATED_AUTHORS"].count == 1
+        assert aggregator.windows == {}
+
+
+class TestRegisterAuditPolicy:
+    """Test audit policies declared in PackageRouter.register."""
+
+    def test_register_stores_policy(self):
+        router = PackageRouter()
+        policy = AuditPolicy.sampled(0.1)
+
+        @router.register(PkgID.UNREGISTERED_HANDLER, audit=policy)
+        async def test_handler(request):
+            return ResponseModel.ok_msg(request.pkg_id, request.req_id)
+
+        assert router.get_audit_policy(PkgID.UNREGISTERED_HANDLER) is policy
+
+    def test_default_policy_logs_everything(self):
+        router = PackageRouter()
+
+        @router.register(PkgID.UNREGISTERED_HANDLER)
+        async def test_handler(request):
+            return ResponseModel.ok_msg(request.pkg_id, request.req_id)
+
+        assert PkgID.UNREGISTERED_HANDLER not in router.audit_registry
+        assert (
+            router.get_audit_policy(PkgID.UNREGISTERED_HANDLER)
+            is DEFAULT_AUDIT_POLICY
+        )
+        assert DEFAULT_AUDIT_POLICY.mode == "always"
+
+    @pytest.mark.parametrize(
+        "pkg_id", [PkgID.GET_AUTHORS, PkgID.GET_PAGINATED_AUTHORS]
+    )
+    def test_polled_author_reads_are_sampled(self, pkg_id):
+        assert pkg_router.get_audit_policy(pkg_id).mode == "sampled"
+
+    def test_author_writes_log_everything(self):
+        assert pkg_router.get_audit_policy(PkgID.CREATE_AUTHOR).mode == (
+            "always"
+        )
+
+
+class TestWebAuditPolicy:
+    """Test how the Web consumer applies audit policies."""
+
+    @pytest.fixture
+    def consumer(self, mock_user):
+        consumer = Web(
+            scope={"type": "websocket", "user": mock_user},
+            receive=None,
+            send=None,
+        )
+        consumer.user = mock_user
+        consumer.correlation_id = "test-1234"
+        return consumer
+
+    async def receive(self, consumer, policy, responses):
+        """Send one GET_AUTHORS request per response under ``policy``."""
+        websocket = create_mock_websocket()
+        with (
+            patch("app.api.ws.consumers.web.rate_limiter") as mock_limiter,
+            patch("app.api.ws.consumers.web.pkg_router") as mock_router,
+            patch(
+                "app.api.ws.consumers.web.log_user_action",
+                new_callable=AsyncMock,
+            ) as mock_log_action,
+        ):
+            mock_limiter.check_rate_limit = AsyncMock(return_value=(True, 1))
+            mock_router.get_audit_policy.return_value = policy
+            mock_router.handle_request = AsyncMock(side_effect=responses)
+            for _ in responses:
+                await consumer.on_receive(
+                    websocket,
+                    {
+                        "pkg_id": PkgID.GET_AUTHORS,
+                        "req_id": str(uuid.uuid4()),
+                        "data": {},
+                    },
+                )
+        return websocket, mock_log_action
+
+    @staticmethod
+    def response(status_code=RSPCode.OK):
+        if status_code == RSPCode.OK:
+            return ResponseModel.ok_msg(PkgID.GET_AUTHORS, uuid.uuid4())
+        return ResponseModel.err_msg(
+            PkgID.GET_AUTHORS,
+            uuid.uuid4(),
+            msg="failed",
+            status_code=status_code,
+        )
+
+    async def disconnect(self, consumer, websocket):
+        """Close the connection; return the audit calls it made."""
+        with (
+            patch(
+                "app.api.ws.consumers.web.log_user_action",
+                new_callable=AsyncMock,
+            ) as mock_log_action,
+            patch(
+                "app.api.ws.websocket.PackageAuthWebSocketEndpoint.on_disconnect",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await consumer.on_disconnect(websocket, 1000)
+        return mock_log_action
+
+    @pytest.mark.asyncio
+    async def test_aggregate_summarizes_successes(self, consumer):
+        websocket, mock_log_action = await self.receive(
+            consumer,
+            AuditPolicy.aggregate(),
+            [self.response(), self.response()],
+        )
+        mock_log_action.assert_not_called()
+
+        mock_log_action = await self.disconnect(consumer, websocket)
+
+        mock_log_action.assert_called_once()
+        assert mock_log_action.call_args.kwargs["weight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_always_logged_in_full(self, consumer):
+        _, mock_log_action = await self.receive(
+            consumer,
+            AuditPolicy.aggregate(),
+            [
+                self.response(RSPCode.ERROR),
+                self.response(RSPCode.PERMISSION_DENIED),
+            ],
+        )
+
+        outcomes = [
+            call.kwargs["outcome"] for call in mock_log_action.call_args_list
+        ]
+        assert outcomes == ["error", "permission_denied"]
+        assert mock_log_action.call_args.kwargs["request_data"] == {}
+
+    @pytest.mark.asyncio
+    async def test_sampled_logs_selected_successes(self, consumer):
+        with patch(
+            "app.api.ws.audit_policy.random.random",
+            side_effect=[0.05, 0.5, 0.9],
+        ):
+            websocket, mock_log_action = await self.receive(
+                consumer,
+                AuditPolicy.sampled(0.1),
+                [self.response() for _ in range(3)],
+            )
+
+        mock_log_action.assert_called_once()
+        assert mock_log_action.call_args.kwargs["outcome"] == "success"
+
+        # The two sampled-out successes are summarized
+        mock_log_action = await self.disconnect(consumer, websocket)
+        call_kwargs = mock_log_action.call_args.kwargs
+        assert call_kwargs["request_data"]["aggregated"] == 2
+        assert call_kwargs["weight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_aggregate_writes_summary_on_disconnect(self, consumer):
+        websocket, mock_log_action = await self.receive(
+            consumer,
+            AuditPolicy.aggregate(60),
+            [self.response() for _ in range(5)],
+        )
+        mock_log_action.assert_not_called()
+        window = consumer.audit_aggregator.windows["WS:GET_AUTHORS"]
+
+        mock_log_action = await self.disconnect(consumer, websocket)
+
+        mock_log_action.assert_called_once()
+        call_kwargs = mock_log_action.call_args.kwargs
+        assert call_kwargs["action_type"] == "WS:GET_AUTHORS"
+        assert call_kwargs["outcome"] == "success"
+        assert call_kwargs["request_data"]["aggregated"] == 5
+        assert call_kwargs["weight"] == 5
+        assert call_kwargs["timestamp"] == window.since
+
+    @pytest.mark.asyncio
+    async def test_expired_window_written_on_next_message(self, consumer):
+        with patch(
+            "app.api.ws.audit_policy.time.monotonic", return_value=100.0
+        ):
+            await self.receive(
+                consumer,
+                AuditPolicy.aggregate(60),
+                [self.response(), self.response()],
+            )
+
+        # A failure a minute later closes the window before it is logged
+        with patch(
+            "app.api.ws.audit_policy.time.monotonic", return_value=160.0
+        ):
+            websocket, mock_log_action = await self.receive(
+                consumer,
+                AuditPolicy.aggregate(60),
+                [self.response(RSPCode.ERROR)],
+            )
+
+        summary, failure = mock_log_action.call_args_list
+        assert summary.kwargs["outcome"] == "success"
+        assert summary.kwargs["weight"] == 2
+        assert failure.kwargs["outcome"] == "error"
+        assert consumer.audit_aggregator.windows == {}